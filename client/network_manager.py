@@ -26,6 +26,10 @@ class NetworkManager:
         self.thread = None
         self.loop = None
         self.should_stop = False
+        self.server_url = None
+        # Session tokens from authorize_success, keyed by (server_url, username).
+        # Sent on reconnect so the server can skip password hashing.
+        self.session_tokens = {}
 
     def connect(self, server_url, username, password):
         """
@@ -44,6 +48,7 @@ class NetworkManager:
                 self.thread.join(timeout=2.0)
 
             self.username = username
+            self.server_url = server_url
             self.should_stop = False
 
             # Start async thread
@@ -94,18 +99,19 @@ class NetworkManager:
                 self.connected = True
 
                 # Send authorization packet
-                await websocket.send(
-                    json.dumps(
-                        {
-                            "type": "authorize",
-                            "username": username,
-                            "password": password,
-                            "major": 11,
-                            "minor": 0,
-                            "patch": 0,
-                        }
-                    )
-                )
+                authorize = {
+                    "type": "authorize",
+                    "username": username,
+                    "password": password,
+                    "major": 11,
+                    "minor": 0,
+                    "patch": 0,
+                }
+                # Tokens are single use; a new one arrives with authorize_success
+                session_token = self.session_tokens.pop((server_url, username), None)
+                if session_token:
+                    authorize["session_token"] = session_token
+                await websocket.send(json.dumps(authorize))
 
                 # Listen for messages
                 while not self.should_stop:
@@ -189,7 +195,14 @@ class NetworkManager:
         """
         packet_type = packet.get("type")
 
-        if packet_type == "authorize_success":
+        if packet_type == "frame":
+            # Batched packets from one server tick, handled in order
+            for inner_packet in packet.get("packets", []):
+                self._handle_packet(inner_packet)
+        elif packet_type == "authorize_success":
+            if packet.get("session_token"):
+                key = (self.server_url, packet.get("username", self.username))
+                self.session_tokens[key] = packet["session_token"]
             self.main_window.on_authorize_success(packet)
         elif packet_type == "speak":
             self.main_window.on_server_speak(packet)
@@ -211,6 +224,8 @@ class NetworkManager:
             self.main_window.on_server_get_playlist_duration(packet)
         elif packet_type == "menu":
             self.main_window.on_server_menu(packet)
+        elif packet_type == "menu_diff":
+            self.main_window.on_server_menu_diff(packet)
         elif packet_type == "request_input":
             self.main_window.on_server_request_input(packet)
         elif packet_type == "clear_ui":
@@ -82,6 +82,7 @@ class MainWindow(wx.Frame):
         self.current_menu_id = None  # Track which menu is currently displayed
         self.current_menu_state = None  # Track previous menu state for comparison
         self.current_menu_item_ids = []  # Track item IDs for current menu (parallel to menu items)
+        self.current_menu_items_raw = []  # Items as last received, for applying menu_diff packets
         self.current_edit_multiline = False  # Track if current editbox is multiline
         self.current_edit_read_only = False  # Track if current editbox is read-only
 
@@ -1758,6 +1759,7 @@ class MainWindow(wx.Frame):
 
         # Save old item IDs before updating (for diff algorithm)
         old_item_ids = getattr(self, 'current_menu_item_ids', [])
+        self.current_menu_items_raw = list(items_raw)
 
         # Store item IDs for later use
         self.current_menu_item_ids = item_ids
@@ -1909,12 +1911,48 @@ class MainWindow(wx.Frame):
 
         self.switch_to_edit_mode(prompt, on_submit, default_value, multiline, read_only)
 
+    def on_server_menu_diff(self, packet):
+        """Handle menu_diff packet: apply changes to the current menu's items."""
+        menu_id = packet.get("menu_id")
+        if menu_id != self.current_menu_id or self.current_menu_state is None:
+            print(f"Ignoring menu_diff for {menu_id}: not the current menu")
+            return
+
+        removed = set(packet.get("remove", []))
+        updated = {item.get("id"): item for item in packet.get("update", [])}
+        items = [
+            updated.get(item.get("id"), item)
+            for item in self.current_menu_items_raw
+            if isinstance(item, dict) and item.get("id") not in removed
+        ]
+        for index, item in packet.get("insert", []):
+            items.insert(index, item)
+        if len(items) != packet.get("count", len(items)):
+            print(f"menu_diff for {menu_id} did not apply cleanly")
+
+        # Handle as a full menu with the current menu's settings
+        state = self.current_menu_state
+        menu_packet = {
+            "type": "menu",
+            "menu_id": menu_id,
+            "items": items,
+            "multiletter_enabled": state["multiletter_enabled"],
+            "escape_behavior": state["escape_behavior"],
+            "grid_enabled": state["grid_enabled"],
+            "grid_width": state["grid_width"],
+        }
+        for key in ("position", "selection_id"):
+            if key in packet:
+                menu_packet[key] = packet[key]
+        self.on_server_menu(menu_packet)
+
     def on_server_clear_ui(self, packet):
         """Handle clear_ui packet from server."""
         # Clear menu
         self.menu_list.Clear()
         self.current_menu_id = None
         self.current_menu_state = None
+        self.current_menu_items_raw = []
         # Switch to list mode if in edit mode
         if self.current_mode == "edit":
             self.switch_to_list_mode()
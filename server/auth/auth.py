@@ -1,13 +1,17 @@
 """Authentication and session management."""
 
+import asyncio
 import hashlib
 import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, InvalidHashError
 
+from ..persistence.executor import DatabaseJob, run_database_job
 from ..users.base import TrustLevel
 
 
@@ -22,18 +26,118 @@ if TYPE_CHECKING:
     from ..persistence.database import Database, UserRecord
 
 
+# Default number of threads hashing passwords at once
+DEFAULT_HASH_WORKERS = 2
+
+# Default lifetime of a session token in seconds
+DEFAULT_SESSION_TTL_S = 600
+
+# Runs a database job and returns its result (e.g. Server._db_read)
+DatabaseRunner = Callable[..., Awaitable[Any]]
+
+
+def _create_user_record(db: "Database", username: str, password_hash: str, locale: str) -> bool:
+    """Create a user unless the name is taken. The first user ever becomes developer."""
+    if db.user_exists(username):
+        return False
+    is_first_user = db.get_user_count() == 0
+    trust_level = TrustLevel.SERVER_OWNER if is_first_user else TrustLevel.USER
+    approved = True  # All users are now auto-approved
+
+    db.create_user(username, password_hash, locale, trust_level, approved)
+
+    if is_first_user:
+        print(f"User '{username}' is the first user and has been granted developer (trust level {TrustLevel.SERVER_OWNER.value}).")
+    return True
+
+
+def _take_session(db: "Database", token_hash: str) -> tuple[str, float] | None:
+    """Look up a session token and delete it (tokens are single use)."""
+    session = db.get_session(token_hash)
+    if session:
+        db.delete_session(token_hash)
+    return session
+
+
 class AuthManager:
     """
     Handles user authentication and session management.
 
     Uses Argon2 for password hashing (industry standard for secure password storage).
     Supports migration from legacy SHA-256 hashes.
+
+    The async methods run Argon2 on a bounded thread pool (argon2-cffi releases
+    the GIL while hashing), so logins never block the event loop. Their
+    database work goes through db_read/db_write (the server passes its
+    database executor's reader pool and writer thread), or runs inline when
+    those aren't given. Session tokens are stored hashed in the database and
+    survive restarts, letting clients reconnect within the session window
+    without hashing at all.
     """
 
-    def __init__(self, database: "Database"):
+    def __init__(
+        self,
+        database: "Database",
+        hash_workers: int = DEFAULT_HASH_WORKERS,
+        session_ttl_s: float = DEFAULT_SESSION_TTL_S,
+        db_read: DatabaseRunner | None = None,
+        db_write: DatabaseRunner | None = None,
+    ):
         self._db = database
-        self._sessions: dict[str, str] = {}  # session_token -> username
+        self._db_read = db_read
+        self._db_write = db_write
         self._hasher = PasswordHasher()
+        self.hash_workers = max(1, hash_workers)
+        self.session_ttl_s = session_ttl_s
+        self._hash_pool: ThreadPoolExecutor | None = None
+        self._hash_pending = 0  # Hash jobs submitted and not yet finished
+        self._hash_jobs = 0
+        self._session_logins = 0
+
+    @property
+    def hash_queue_depth(self) -> int:
+        """Number of hash jobs waiting for a free worker."""
+        return max(0, self._hash_pending - self.hash_workers)
+
+    def get_stats(self) -> dict:
+        """Snapshot of hashing and session metrics."""
+        return {
+            "hash_workers": self.hash_workers,
+            "hash_in_flight": self._hash_pending,
+            "hash_queue_depth": self.hash_queue_depth,
+            "hash_jobs": self._hash_jobs,
+            "session_logins": self._session_logins,
+        }
+
+    def close(self) -> None:
+        """Stop the hashing pool."""
+        if self._hash_pool:
+            self._hash_pool.shutdown(wait=True)
+            self._hash_pool = None
+
+    async def _read(self, job: DatabaseJob, *args) -> Any:
+        if self._db_read:
+            return await self._db_read(job, *args)
+        return run_database_job(self._db, job, *args)
+
+    async def _write(self, job: DatabaseJob, *args) -> Any:
+        if self._db_write:
+            return await self._db_write(job, *args)
+        return run_database_job(self._db, job, *args)
+
+    async def _run_hash_job(self, func, *args):
+        """Run a hashing function on the bounded pool."""
+        if self._hash_pool is None:
+            self._hash_pool = ThreadPoolExecutor(
+                max_workers=self.hash_workers, thread_name_prefix="auth-hash"
+            )
+        loop = asyncio.get_running_loop()
+        self._hash_pending += 1
+        self._hash_jobs += 1
+        try:
+            return await loop.run_in_executor(self._hash_pool, func, *args)
+        finally:
+            self._hash_pending -= 1
 
     def hash_password(self, password: str) -> str:
         """Hash a password using Argon2."""
@@ -83,6 +187,47 @@ class AuthManager:
 
         return AuthResult.SUCCESS
 
+    async def authenticate_async(
+        self, username: str, password: str, session_token: str | None = None
+    ) -> AuthResult:
+        """
+        Authenticate a user without blocking the event loop.
+
+        A valid, unexpired session token for this username skips password
+        hashing entirely; the token is consumed either way, so callers should
+        issue a fresh one with create_session() after a successful login.
+        """
+        user = await self._read("get_user", username)
+        if not user:
+            return AuthResult.USER_NOT_FOUND
+
+        if session_token:
+            session = await self._write(_take_session, self._hash_token(session_token))
+            if session and session[0] == username and session[1] > time.time():
+                self._session_logins += 1
+                return AuthResult.SUCCESS
+
+        if not await self._run_hash_job(self.verify_password, password, user.password_hash):
+            return AuthResult.WRONG_PASSWORD
+
+        # Upgrade legacy hash to Argon2 on successful login
+        if self._is_legacy_hash(user.password_hash):
+            new_hash = await self._run_hash_job(self.hash_password, password)
+            await self._write("update_user_password", username, new_hash)
+
+        return AuthResult.SUCCESS
+
+    async def register_async(
+        self, username: str, password: str, locale: str = "en"
+    ) -> bool:
+        """Register a new user, hashing the password off the event loop."""
+        if await self._read("user_exists", username):
+            return False
+
+        password_hash = await self._run_hash_job(self.hash_password, password)
+        # The writer checks the name again: another registration may have won it
+        return await self._write(_create_user_record, username, password_hash, locale)
+
     def register(self, username: str, password: str, locale: str = "en") -> bool:
         """
         Register a new user.
@@ -93,18 +238,8 @@ class AuthManager:
         if self._db.user_exists(username):
             return False
 
-        # Check if this is the first user - they become developer
-        is_first_user = self._db.get_user_count() == 0
-        trust_level = TrustLevel.SERVER_OWNER if is_first_user else TrustLevel.USER
-        approved = True  # All users are now auto-approved
-
         password_hash = self.hash_password(password)
-        self._db.create_user(username, password_hash, locale, trust_level, approved)
-
-        if is_first_user:
-            print(f"User '{username}' is the first user and has been granted developer (trust level {TrustLevel.SERVER_OWNER.value}).")
-
-        return True
+        return _create_user_record(self._db, username, password_hash, locale)
 
     def reset_password(self, username: str, new_password: str) -> bool:
         """
@@ -117,28 +252,54 @@ class AuthManager:
 
         password_hash = self.hash_password(new_password)
         self._db.update_user_password(username, password_hash)
+        self.invalidate_user_sessions(username)
         return True
 
     def get_user(self, username: str) -> "UserRecord | None":
         """Get a user record."""
         return self._db.get_user(username)
 
+    async def get_user_async(self, username: str) -> "UserRecord | None":
+        """Get a user record without blocking the event loop."""
+        return await self._read("get_user", username)
+
+    def _hash_token(self, token: str) -> str:
+        """Hash a session token for storage (tokens are random, so SHA-256 suffices)."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
     def create_session(self, username: str) -> str:
         """Create a session token for a user."""
         token = secrets.token_hex(32)
-        self._sessions[token] = username
+        expires_at = time.time() + self.session_ttl_s
+        self._db.create_session(self._hash_token(token), username, expires_at)
+        return token
+
+    async def create_session_async(self, username: str) -> str:
+        """Create a session token for a user without blocking the event loop."""
+        token = secrets.token_hex(32)
+        expires_at = time.time() + self.session_ttl_s
+        await self._write("create_session", self._hash_token(token), username, expires_at)
         return token
 
     def validate_session(self, token: str) -> str | None:
         """Validate a session token and return the username."""
-        return self._sessions.get(token)
+        session = self._db.get_session(self._hash_token(token))
+        if not session:
+            return None
+        username, expires_at = session
+        if expires_at <= time.time():
+            self.invalidate_session(token)
+            return None
+        return username
 
     def invalidate_session(self, token: str) -> None:
         """Invalidate a session token."""
-        self._sessions.pop(token, None)
+        self._db.delete_session(self._hash_token(token))
 
     def invalidate_user_sessions(self, username: str) -> None:
         """Invalidate all sessions for a user."""
-        to_remove = [t for t, u in self._sessions.items() if u == username]
-        for token in to_remove:
-            del self._sessions[token]
+        self._db.delete_user_sessions(username)
+
+    def purge_expired_sessions(self) -> int:
+        """Remove expired session tokens. Returns the number removed."""
+        return self._db.delete_expired_sessions(time.time())
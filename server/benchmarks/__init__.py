@@ -0,0 +1,6 @@
+"""
+Standalone performance benchmarks.
+
+Each module is runnable with python -m, for example:
+    python -m server.benchmarks.database
+"""
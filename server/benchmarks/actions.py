@@ -0,0 +1,88 @@
+"""
+Action resolution cost during menu rebuilds.
+
+Rebuilds every player's turn menu in started Yahtzee and Age of Heroes games,
+once with callback signatures inspected on every resolution (the old
+behaviour) and once with the cached dispatch in game_utils.actions.
+
+Usage:
+    python -m server.benchmarks.actions
+    python -m server.benchmarks.actions --players 4 --rebuilds 2000
+"""
+
+import argparse
+import inspect
+import sys
+import time
+from pathlib import Path
+
+# Allow running as standalone script
+_MODULE_DIR = Path(__file__).parent.parent
+if __name__ == "__main__":
+    sys.path.insert(0, str(_MODULE_DIR.parent))
+
+from server.game_utils import actions  # noqa: E402
+from server.games.ageofheroes.game import AgeOfHeroesGame  # noqa: E402
+from server.games.yahtzee.game import YahtzeeGame  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+from server.users.test_user import MockUser  # noqa: E402
+
+GAMES = {"yahtzee": YahtzeeGame, "ageofheroes": AgeOfHeroesGame}
+
+
+def _accepts_action_id_uncached(game, name, method) -> bool:
+    """The pre-cache check: inspect the signature every time."""
+    return "action_id" in inspect.signature(method).parameters
+
+
+def make_game(game_class, players: int):
+    """Create and start a game with MockUser players."""
+    game = game_class()
+    for i in range(players):
+        game.add_player(f"Player{i}", MockUser(f"Player{i}"))
+    game.on_start()
+    return game
+
+
+def time_rebuilds(game, rebuilds: int) -> tuple[float, int]:
+    """Rebuild all menus repeatedly. Returns (seconds, actions resolved)."""
+    resolved = 0
+    start = time.perf_counter()
+    for _ in range(rebuilds):
+        for player in game.players:
+            resolved += len(game.get_all_visible_actions(player))
+        game.rebuild_all_menus()
+    return time.perf_counter() - start, resolved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, default=4, help="Players per game")
+    parser.add_argument("--rebuilds", type=int, default=500, help="Menu rebuilds per game")
+    args = parser.parse_args()
+
+    Localization.init(_MODULE_DIR / "locales")
+    cached = actions._accepts_action_id
+
+    print(f"{args.players} players, {args.rebuilds} rebuilds per game")
+    for name, game_class in GAMES.items():
+        game = make_game(game_class, args.players)
+        results = {}
+        for label, accepts in (("inspect", _accepts_action_id_uncached), ("cached", cached)):
+            actions._accepts_action_id = accepts
+            try:
+                time_rebuilds(game, 5)  # Warm up
+                results[label] = time_rebuilds(game, args.rebuilds)
+            finally:
+                actions._accepts_action_id = cached
+        base_s = results["inspect"][0]
+        for label, (seconds, resolved) in results.items():
+            per_rebuild_us = seconds / args.rebuilds * 1_000_000
+            print(
+                f"{name:>12} {label:>8}: {per_rebuild_us:8.1f}us per rebuild, "
+                f"{resolved} visible actions, {base_s / seconds:4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Tick latency under concurrent leaderboard queries.
+
+Runs the real TickScheduler while simulated clients open leaderboards as
+fast as they can, once with queries run inline on the event loop (the old
+behaviour) and once through DatabaseExecutor. Reports how far ticks slipped.
+
+Usage:
+    python -m server.benchmarks.database
+    python -m server.benchmarks.database --results 5000 --clients 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Allow running as standalone script
+_MODULE_DIR = Path(__file__).parent.parent
+if __name__ == "__main__":
+    sys.path.insert(0, str(_MODULE_DIR.parent))
+
+from server.core.server import _load_game_results  # noqa: E402
+from server.core.tick import TickScheduler  # noqa: E402
+from server.persistence.database import Database  # noqa: E402
+from server.persistence.executor import DatabaseExecutor  # noqa: E402
+
+GAME_TYPE = "pig"
+TICK_INTERVAL_MS = 50
+
+
+def populate(db: Database, count: int) -> None:
+    """Insert count four-player game results."""
+    start = datetime(2025, 1, 1)
+    for i in range(count):
+        players = [(f"uuid-{(i + n) % 40}", f"Player{(i + n) % 40}", False, False) for n in range(4)]
+        db.save_game_result(
+            game_type=GAME_TYPE,
+            timestamp=(start + timedelta(minutes=i)).isoformat(),
+            duration_ticks=1200,
+            players=players,
+            custom_data={"winner_name": players[0][1], "final_scores": {p[1]: 50 for p in players}},
+        )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[index]
+
+
+async def run_scenario(
+    db_path: Path, clients: int, seconds: float, use_executor: bool
+) -> dict:
+    """Tick for the given time while clients query leaderboards."""
+    tick_times: list[float] = []
+    scheduler = TickScheduler(lambda: tick_times.append(time.monotonic()), TICK_INTERVAL_MS)
+
+    inline_db = Database(db_path)
+    inline_db.connect()
+    executor = DatabaseExecutor(db_path, reader_count=clients)
+    if use_executor:
+        executor.start()
+
+    queries = 0
+    stop_at = time.monotonic() + seconds
+
+    async def client() -> None:
+        nonlocal queries
+        while time.monotonic() < stop_at:
+            if use_executor:
+                await executor.read(_load_game_results, GAME_TYPE)
+            else:
+                _load_game_results(inline_db, GAME_TYPE)
+                # Handlers yield between packets
+                await asyncio.sleep(0)
+            queries += 1
+
+    await scheduler.start()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    await scheduler.stop()
+
+    executor.close()
+    inline_db.close()
+
+    gaps_ms = [(b - a) * 1000 for a, b in zip(tick_times, tick_times[1:])]
+    return {
+        "ticks": len(tick_times),
+        "tick_rate": len(tick_times) / seconds,
+        "queries": queries,
+        "p50_gap_ms": percentile(gaps_ms, 50),
+        "p99_gap_ms": percentile(gaps_ms, 99),
+        "max_gap_ms": max(gaps_ms, default=0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=int, default=2000, help="Game results to insert")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent leaderboard clients")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        db = Database(db_path)
+        db.connect()
+        populate(db, args.results)
+        db.close()
+
+        print(
+            f"{args.results} results, {args.clients} clients, {args.seconds}s per scenario, "
+            f"target {1000 // TICK_INTERVAL_MS} ticks/sec"
+        )
+        for label, use_executor in (("inline", False), ("executor", True)):
+            stats = asyncio.run(run_scenario(db_path, args.clients, args.seconds, use_executor))
+            print(
+                f"{label:>9}: {stats['tick_rate']:5.1f} ticks/sec, "
+                f"gap p50 {stats['p50_gap_ms']:6.1f}ms, p99 {stats['p99_gap_ms']:6.1f}ms, "
+                f"max {stats['max_gap_ms']:6.1f}ms, {stats['queries']} queries"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+"""
+Game engine and bot benchmarks (the `cli.py bench` command).
+
+Plays bot-only games for every case of a matrix of games x bot counts x
+option presets, spread over a process pool, and reports per case: ticks per
+second, wall time per game, on_tick latency percentiles, time spent in bot
+thinking and peak traced memory of one game. Each game of a case starts
+from its own fixed random seed, so runs are repeatable and a saved baseline
+can be compared against later runs to catch regressions in any game.
+
+Timings from parallel workers compete for CPUs; use --workers 1 (or no more
+workers than idle cores) for numbers worth comparing.
+
+Usage:
+    python -m server.cli bench
+    python -m server.cli bench --games pig,farkle --bots 2,4 --runs 5
+    python -m server.cli bench --games farkle --preset short:target_score=2000
+    python -m server.cli bench --save-baseline bench.json
+    python -m server.cli bench --compare bench.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Allow running as standalone script
+_MODULE_DIR = Path(__file__).parent.parent
+if __name__ == "__main__":
+    sys.path.insert(0, str(_MODULE_DIR.parent))
+
+from server.game_utils import poker_equity  # noqa: E402
+from server.games.registry import GameRegistry  # noqa: E402
+
+# Bump when the layout of baseline files changes
+BASELINE_FORMAT = 1
+
+DEFAULT_RUNS = 3
+DEFAULT_SEED = 1
+DEFAULT_MAX_TICKS = 200_000
+DEFAULT_TOLERANCE = 0.25
+
+# Metrics checked against a baseline, and whether a larger value is better
+COMPARED_METRICS = {
+    "ticks_per_sec": True,
+    "tick_p95_us": False,
+    "bot_think_mean_us": False,
+    "peak_kib": False,
+}
+
+
+@dataclass
+class BenchCase:
+    """One cell of the benchmark matrix."""
+
+    game_type: str
+    bots: int
+    preset: str = "default"
+    options: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.game_type}/{self.bots}/{self.preset}"
+
+
+def parse_preset(text: str) -> tuple[str, dict[str, str]]:
+    """Parse 'name:key=value,key=value' (or just 'name') into a preset."""
+    name, _, assignments = text.partition(":")
+    options = {}
+    for assignment in filter(None, assignments.split(",")):
+        key, sep, value = assignment.partition("=")
+        if not sep:
+            raise ValueError(f"Bad option '{assignment}' in preset '{text}' (expected key=value)")
+        options[key.strip()] = value.strip()
+    return name.strip(), options
+
+
+def build_matrix(
+    game_types: list[str],
+    bot_counts: list[int] | None,
+    presets: dict[str, dict[str, str]],
+) -> list[BenchCase]:
+    """
+    Every combination of games, bot counts and presets.
+
+    Bot counts a game does not support are skipped; with no bot counts each
+    game is played with its minimum number of players.
+    """
+    cases = []
+    for game_type in game_types:
+        descriptor = GameRegistry.get_descriptor(game_type)
+        if descriptor is None:
+            raise ValueError(f"Unknown game type '{game_type}'")
+        counts = bot_counts or [descriptor.min_players]
+        for bots in counts:
+            if not descriptor.min_players <= bots <= descriptor.max_players:
+                continue
+            for preset, options in presets.items():
+                cases.append(BenchCase(game_type, bots, preset, dict(options)))
+    return cases
+
+
+def _init_worker() -> None:
+    """Load locales and bot tables before any game is timed."""
+    from server.cli import Localization
+    from server.games.farkle import strategy as farkle_strategy
+
+    Localization.preload_bundles()
+    farkle_strategy.warm_up()
+
+
+def run_game(
+    case: BenchCase, seed: int, max_ticks: int, trace_memory: bool = False
+) -> dict[str, Any]:
+    """
+    Play one game of a case in this process.
+
+    With trace_memory the game runs under tracemalloc (which slows it down
+    several times) and only the peak traced memory is meaningful.
+    """
+    from server.cli import BOT_NAMES, GameSimulator
+
+    simulator = GameSimulator(
+        case.game_type, BOT_NAMES[: case.bots], case.options, json_mode=True, quiet=True,
+        max_ticks=max_ticks,
+    )
+    random.seed(seed)
+    # Poker bots sample on a wall-clock budget; draw fixed, seeded samples
+    # instead (while the game runs) so tick counts repeat exactly
+    poker_equity.seed(seed)
+    poker_equity.clear_cache()
+    if not simulator.setup():
+        raise ValueError(f"Could not set up {case.key}")
+    game = simulator.game
+
+    tick_times: list[float] = []
+    think = {"calls": 0, "seconds": 0.0}
+    game_on_tick = game.on_tick
+
+    def timed_on_tick() -> None:
+        start = time.perf_counter()
+        game_on_tick()
+        tick_times.append(time.perf_counter() - start)
+
+    # Instance attributes shadow the methods for this game only
+    game.on_tick = timed_on_tick
+    if hasattr(game, "bot_think"):
+        game_bot_think = game.bot_think
+
+        def timed_bot_think(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return game_bot_think(*args, **kwargs)
+            finally:
+                think["calls"] += 1
+                think["seconds"] += time.perf_counter() - start
+
+        game.bot_think = timed_bot_think
+
+    if trace_memory:
+        tracemalloc.start()
+    poker_equity.use_time_budget(False)
+    start = time.perf_counter()
+    try:
+        result = simulator.run()
+    finally:
+        wall_s = time.perf_counter() - start
+        poker_equity.use_time_budget(True)
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    if trace_memory:
+        return {"peak_bytes": peak}
+    return {
+        "ticks": result["ticks"],
+        "timed_out": result["timed_out"],
+        "wall_s": wall_s,
+        "tick_times": tick_times,
+        "think_calls": think["calls"],
+        "think_s": think["seconds"],
+    }
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def summarize(case: BenchCase, games: list[dict], peak_bytes: int | None) -> dict[str, Any]:
+    """Combine the games of one case into its reported figures."""
+    tick_times = sorted(t for game in games for t in game["tick_times"])
+    ticks = sum(game["ticks"] for game in games)
+    wall_s = sum(game["wall_s"] for game in games)
+    think_calls = sum(game["think_calls"] for game in games)
+    think_s = sum(game["think_s"] for game in games)
+    return {
+        "game_type": case.game_type,
+        "bots": case.bots,
+        "preset": case.preset,
+        "options": case.options,
+        "runs": len(games),
+        "timed_out": sum(1 for game in games if game["timed_out"]),
+        "ticks_mean": round(ticks / len(games), 1),
+        "wall_ms_per_game": round(wall_s * 1000 / len(games), 2),
+        "ticks_per_sec": round(ticks / wall_s, 1) if wall_s else 0.0,
+        "tick_p50_us": round(_percentile(tick_times, 0.50) * 1e6, 1),
+        "tick_p95_us": round(_percentile(tick_times, 0.95) * 1e6, 1),
+        "tick_p99_us": round(_percentile(tick_times, 0.99) * 1e6, 1),
+        "tick_max_us": round(tick_times[-1] * 1e6, 1) if tick_times else 0.0,
+        "bot_think_calls": think_calls,
+        "bot_think_ms": round(think_s * 1000, 2),
+        "bot_think_mean_us": round(think_s * 1e6 / think_calls, 1) if think_calls else 0.0,
+        "peak_kib": round(peak_bytes / 1024) if peak_bytes is not None else None,
+    }
+
+
+def run_matrix(
+    cases: list[BenchCase],
+    runs: int = DEFAULT_RUNS,
+    seed: int = DEFAULT_SEED,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    workers: int = 1,
+    measure_memory: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Benchmark every case and return one summary per case, in case order.
+
+    Game i of every case uses seed + i. With more than one worker the games
+    are played on a pool of spawned processes; otherwise in this process.
+    """
+    jobs = []
+    for case in cases:
+        jobs.extend((case, seed + i, max_ticks, False) for i in range(runs))
+        if measure_memory:
+            jobs.append((case, seed, max_ticks, True))
+
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as executor:
+            futures = [executor.submit(run_game, *job) for job in jobs]
+            outcomes = [future.result() for future in futures]
+    else:
+        _init_worker()
+        outcomes = [run_game(*job) for job in jobs]
+
+    summaries = []
+    position = 0
+    for case in cases:
+        games = outcomes[position : position + runs]
+        position += runs
+        peak_bytes = None
+        if measure_memory:
+            peak_bytes = outcomes[position]["peak_bytes"]
+            position += 1
+        summaries.append(summarize(case, games, peak_bytes))
+    return summaries
+
+
+def make_baseline(summaries: list[dict[str, Any]], runs: int, seed: int) -> dict[str, Any]:
+    """The JSON document written by --save-baseline."""
+    return {
+        "format": BASELINE_FORMAT,
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "seed": seed,
+        "cases": {
+            f"{s['game_type']}/{s['bots']}/{s['preset']}": s for s in summaries
+        },
+    }
+
+
+def compare(
+    summaries: list[dict[str, Any]], baseline: dict[str, Any], tolerance: float
+) -> list[dict[str, Any]]:
+    """
+    Compare summaries against a baseline.
+
+    Returns one entry per metric that got worse by more than tolerance (a
+    fraction, 0.25 = 25%). Cases missing from the baseline are not compared.
+    """
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Unsupported baseline format {baseline.get('format')!r}")
+
+    regressions = []
+    for summary in summaries:
+        key = f"{summary['game_type']}/{summary['bots']}/{summary['preset']}"
+        previous = baseline["cases"].get(key)
+        if previous is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), summary.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    {"case": key, "metric": metric, "baseline": old, "current": new,
+                     "change": round(change, 3)}
+                )
+    return regressions
+
+
+def format_table(summaries: list[dict[str, Any]]) -> str:
+    """Render summaries as a fixed-width text table."""
+    header = (
+        f"{'case':<28} {'ticks':>8} {'ms/game':>9} {'ticks/s':>9} "
+        f"{'p50us':>7} {'p95us':>7} {'p99us':>7} {'maxus':>8} "
+        f"{'think ms':>9} {'us/think':>8} {'peak KiB':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in summaries:
+        case = f"{s['game_type']}/{s['bots']}/{s['preset']}"
+        if s["timed_out"]:
+            case += f" ({s['timed_out']} t/o)"
+        peak = "-" if s["peak_kib"] is None else str(s["peak_kib"])
+        lines.append(
+            f"{case:<28} {s['ticks_mean']:>8.0f} {s['wall_ms_per_game']:>9.1f} "
+            f"{s['ticks_per_sec']:>9.0f} {s['tick_p50_us']:>7.1f} {s['tick_p95_us']:>7.1f} "
+            f"{s['tick_p99_us']:>7.1f} {s['tick_max_us']:>8.0f} {s['bot_think_ms']:>9.1f} "
+            f"{s['bot_think_mean_us']:>8.1f} {peak:>9}"
+        )
+    return "\n".join(lines)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the bench options to a parser (shared with cli.py bench)."""
+    parser.add_argument(
+        "--games", "-g", help="Comma-separated game types (default: every game)"
+    )
+    parser.add_argument(
+        "--bots",
+        "-b",
+        help="Comma-separated bot counts (default: each game's minimum players)",
+    )
+    parser.add_argument(
+        "--preset",
+        "-p",
+        action="append",
+        help="Option preset as name:key=value,key=value (repeatable; default: game defaults)",
+    )
+    parser.add_argument(
+        "--runs", "-n", type=int, default=DEFAULT_RUNS,
+        help=f"Games per case (default: {DEFAULT_RUNS})",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=DEFAULT_SEED,
+        help=f"Random seed of each case's first game (default: {DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--max-ticks", type=int, default=DEFAULT_MAX_TICKS,
+        help=f"Ticks before a game times out (default: {DEFAULT_MAX_TICKS})",
+    )
+    parser.add_argument(
+        "--workers", "-w", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count; 1 plays in-process)",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true",
+        help="Skip the extra traced game per case that measures peak memory",
+    )
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help=f"Allowed slowdown before a metric is a regression (default: {DEFAULT_TOLERANCE})",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the benchmark described by parsed arguments. Returns an exit code."""
+    if args.games:
+        game_types = [name.strip() for name in args.games.split(",") if name.strip()]
+    else:
+        game_types = [descriptor.type for descriptor in GameRegistry.get_descriptors()]
+    bot_counts = [int(n) for n in args.bots.split(",")] if args.bots else None
+    presets = dict(parse_preset(text) for text in args.preset) if args.preset else {"default": {}}
+
+    cases = build_matrix(game_types, bot_counts, presets)
+    if not cases:
+        print("No benchmark cases (check --games and --bots)", file=sys.stderr)
+        return 1
+
+    summaries = run_matrix(
+        cases,
+        runs=max(1, args.runs),
+        seed=args.seed,
+        max_ticks=args.max_ticks,
+        workers=max(1, args.workers),
+        measure_memory=not args.no_memory,
+    )
+
+    regressions = []
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(summaries, baseline, args.tolerance)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(
+            json.dumps(make_baseline(summaries, args.runs, args.seed), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    if args.json:
+        output: dict[str, Any] = {"results": summaries}
+        if args.compare:
+            output["regressions"] = regressions
+        print(json.dumps(output, indent=2))
+    else:
+        print(format_table(summaries))
+        if args.compare:
+            if regressions:
+                print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+                for r in regressions:
+                    print(
+                        f"  {r['case']}: {r['metric']} {r['baseline']} -> {r['current']} "
+                        f"({r['change']:+.0%})"
+                    )
+            else:
+                print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+        if args.save_baseline:
+            print(f"\nBaseline written to {args.save_baseline}")
+
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    add_arguments(parser)
+    sys.exit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
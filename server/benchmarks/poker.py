@@ -0,0 +1,65 @@
+"""
+Poker hand evaluation throughput.
+
+Scores random 5, 6 and 7 card hands with the lookup-table evaluator and with
+the exhaustive search over every 5-card combination it replaced.
+
+Usage:
+    python -m server.benchmarks.poker
+    python -m server.benchmarks.poker --hands 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Allow running as standalone script
+_MODULE_DIR = Path(__file__).parent.parent
+if __name__ == "__main__":
+    sys.path.insert(0, str(_MODULE_DIR.parent))
+
+from server.game_utils import poker_evaluator  # noqa: E402
+from server.game_utils.cards import Card  # noqa: E402
+
+
+def make_deck() -> list[Card]:
+    return [
+        Card(id=suit * 13 + rank, rank=rank, suit=suit)
+        for suit in range(1, 5)
+        for rank in range(1, 14)
+    ]
+
+
+def hands_per_second(evaluate, hands: list[list[Card]]) -> float:
+    start = time.perf_counter()
+    for hand in hands:
+        evaluate(hand)
+    return len(hands) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hands", type=int, default=20000, help="Hands per size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    poker_evaluator._get_tables()
+    print(f"Tables ready in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    rng = random.Random(args.seed)
+    deck = make_deck()
+    for size in (5, 6, 7):
+        hands = [rng.sample(deck, size) for _ in range(args.hands)]
+        exhaustive = hands_per_second(poker_evaluator._best_hand_exhaustive, hands)
+        lookup = hands_per_second(poker_evaluator.best_hand, hands)
+        print(
+            f"{size} cards: exhaustive {exhaustive:10,.0f} hands/sec, "
+            f"lookup {lookup:10,.0f} hands/sec ({lookup / exhaustive:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
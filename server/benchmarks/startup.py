@@ -0,0 +1,75 @@
+"""
+Startup time of the server and the CLI.
+
+Runs each command in a fresh interpreter and reports wall-clock times:
+constructing the Server (imports and locale loading, before any network or
+database setup), `cli.py list-games`, and `cli.py simulate`. The first run
+of each command after the .ftl files change compiles and caches the locale
+bundles; --cold clears that cache before every run to measure the
+uncached cost.
+
+Usage:
+    python -m server.benchmarks.startup
+    python -m server.benchmarks.startup --runs 5 --cold
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_MODULE_DIR = Path(__file__).parent.parent
+_REPO_DIR = _MODULE_DIR.parent
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(_REPO_DIR))
+
+from server.messages.localization import bundle_cache_dir  # noqa: E402
+
+COMMANDS = {
+    "server": [
+        "-c",
+        "from server.core.server import Server; Server(db_path=':memory:')",
+    ],
+    "list-games": ["-m", "server.cli", "list-games", "--json"],
+    "simulate": ["-m", "server.cli", "simulate", "pig", "--bots", "2", "--json", "--quiet"],
+}
+
+
+def time_command(args: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=_REPO_DIR,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3, help="Runs per command")
+    parser.add_argument(
+        "--cold", action="store_true", help="Clear the compiled locale cache before each run"
+    )
+    args = parser.parse_args()
+
+    cache_dir = bundle_cache_dir(_MODULE_DIR / "locales")
+    for name, command in COMMANDS.items():
+        times = []
+        for _ in range(args.runs):
+            if args.cold:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+            times.append(time_command(command))
+        print(
+            f"{name:>10}: median {statistics.median(times) * 1000:7.0f}ms, "
+            f"min {min(times) * 1000:7.0f}ms, max {max(times) * 1000:7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
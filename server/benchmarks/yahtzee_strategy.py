@@ -0,0 +1,116 @@
+"""
+Yahtzee bot decisions: speed and strength of the optimal-strategy table.
+
+Measures decisions per second answered from the built table (scoring, and
+keeps with a cold and a warm per-turn cache), then plays one-bot games
+through the real game engine with the table and with the old heuristic and
+reports the average final score of each.
+
+Build the table first with:
+    python -m server.cli build-strategy yahtzee
+
+Usage:
+    python -m server.benchmarks.yahtzee_strategy
+    python -m server.benchmarks.yahtzee_strategy --games 200 --decisions 20000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Allow running as standalone script
+_MODULE_DIR = Path(__file__).parent.parent
+if __name__ == "__main__":
+    sys.path.insert(0, str(_MODULE_DIR.parent))
+
+from server.cli import GameSimulator  # noqa: E402
+from server.games.yahtzee import strategy  # noqa: E402
+
+
+def _random_states(count: int, rng: random.Random) -> list[tuple[int, int, bool, list[int]]]:
+    """Mid-game scoresheets with a roll each (at least one category open)."""
+    states = []
+    for _ in range(count):
+        filled = rng.randrange(strategy.FULL_MASK)
+        upper = rng.choice(strategy._reachable_upper(filled & strategy._UPPER_MASK))
+        yahtzee_50 = bool(filled & strategy._YAHTZEE_BIT) and rng.random() < 0.3
+        dice = [rng.randint(1, 6) for _ in range(5)]
+        states.append((filled, upper, yahtzee_50, dice))
+    return states
+
+
+def _rate(count: int, started: float) -> str:
+    elapsed = time.perf_counter() - started
+    return f"{count / elapsed:10.0f}/sec ({elapsed * 1e6 / count:7.1f}us each)"
+
+
+def bench_decisions(solver: strategy.YahtzeeStrategy, count: int, seed: int) -> None:
+    states = _random_states(count, random.Random(seed))
+
+    started = time.perf_counter()
+    for filled, upper, yahtzee_50, dice in states:
+        solver.best_category(filled, upper, yahtzee_50, dice)
+    print(f"  score decisions:       {_rate(count, started)}")
+
+    cold = states[: max(1, count // 20)]
+    started = time.perf_counter()
+    for filled, upper, yahtzee_50, dice in cold:
+        solver.best_keep(filled, upper, yahtzee_50, dice, 2)
+    print(f"  keep decisions (cold): {_rate(len(cold), started)}")
+
+    # A bot asks again after each die it toggles: same state, cached turn
+    filled, upper, yahtzee_50, _ = states[0]
+    started = time.perf_counter()
+    for _, _, _, dice in states:
+        solver.best_keep(filled, upper, yahtzee_50, dice, 2)
+    print(f"  keep decisions (warm): {_rate(count, started)}")
+
+
+def play_games(count: int, seed: int) -> tuple[list[int], float]:
+    """Play one-bot games; returns final scores and seconds per game."""
+    scores = []
+    started = time.perf_counter()
+    for game_number in range(count):
+        random.seed(seed + game_number)
+        simulator = GameSimulator("yahtzee", ["Bot"], {}, json_mode=True, quiet=True)
+        simulator.setup()
+        simulator.run()
+        scores.append(simulator.game.players[0].get_total_score())
+    return scores, (time.perf_counter() - started) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--table", default=str(strategy.DEFAULT_TABLE_PATH), help="Built table")
+    parser.add_argument("--games", type=int, default=100, help="Games per bot")
+    parser.add_argument("--decisions", type=int, default=10000, help="Timed decisions")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    table = strategy.load_table(Path(args.table))
+    if table is None:
+        sys.exit(f"No usable table at {args.table}; run: python -m server.cli build-strategy yahtzee")
+    solver = strategy.YahtzeeStrategy(table)
+    print(f"Table mapped in {(time.perf_counter() - started) * 1000:.1f}ms, "
+          f"expected score {solver.expected_score():.2f}")
+
+    print("Decisions:")
+    bench_decisions(solver, args.decisions, args.seed)
+
+    print(f"Average final score over {args.games} one-bot games:")
+    for name, bot_strategy in (("heuristic", None), ("table", solver)):
+        strategy.use_strategy(bot_strategy)
+        scores, per_game = play_games(args.games, args.seed)
+        print(
+            f"  {name:>9}: mean {statistics.mean(scores):6.1f}, "
+            f"median {statistics.median(scores):5.0f}, "
+            f"stdev {statistics.pstdev(scores):5.1f} ({per_game * 1000:.0f}ms per game)"
+        )
+
+
+if __name__ == "__main__":
+    main()
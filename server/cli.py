@@ -24,6 +24,19 @@ Usage examples:
 
     # Show game options
     python -m server.cli show-options lightturret
+
+    # Benchmark game engines and bots, and check for regressions
+    python -m server.cli bench --games pig,farkle --bots 2,4 --save-baseline bench.json
+    python -m server.cli bench --games pig,farkle --bots 2,4 --compare bench.json
+
+    # Build the strategy tables bots play from. The tables are generated,
+    # not checked in: run both on every deploy (the server reports any
+    # table that is missing at startup)
+    python -m server.cli build-strategy yahtzee
+    python -m server.cli build-strategy farkle
+
+    # Rebuild leaderboard stats from all stored game results
+    python -m server.cli backfill-stats --db play_vnt.db
 """
 
 import argparse
@@ -345,30 +358,28 @@ class GameSimulator:
 
 def cmd_list_games(args):
     """List all available games."""
-    games = GameRegistry.get_all()
+    games = GameRegistry.get_descriptors()
 
     if args.json:
         output = []
-        for game_class in games:
+        for game in games:
             output.append(
                 {
-                    "type": game_class.get_type(),
-                    "name": game_class.get_name(),
-                    "category": game_class.get_category(),
-                    "min_players": game_class.get_min_players(),
-                    "max_players": game_class.get_max_players(),
+                    "type": game.type,
+                    "name": game.name,
+                    "category": game.category,
+                    "min_players": game.min_players,
+                    "max_players": game.max_players,
                 }
             )
         print(json.dumps(output, indent=2))
     else:
         print("Available games:\n")
-        for game_class in games:
-            print(f"  {game_class.get_type()}")
-            print(f"    Name: {game_class.get_name()}")
-            print(f"    Category: {game_class.get_category()}")
-            print(
-                f"    Players: {game_class.get_min_players()}-{game_class.get_max_players()}"
-            )
+        for game in games:
+            print(f"  {game.type}")
+            print(f"    Name: {game.name}")
+            print(f"    Category: {game.category}")
+            print(f"    Players: {game.min_players}-{game.max_players}")
             print()
 
 
@@ -476,6 +487,80 @@ def cmd_simulate(args):
                     print(f"  {line}")
 
 
+def cmd_bench(args):
+    """Benchmark games played by bots; exits 1 on baseline regressions."""
+    from server.benchmarks import games as bench
+
+    try:
+        sys.exit(bench.run(args))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def cmd_build_strategy(args):
+    """Precompute a game's bot strategy table."""
+    import os
+    import time
+
+    if args.game == "farkle":
+        from server.games.farkle import strategy
+
+        unit = "gaps"
+    else:
+        from server.games.yahtzee import strategy
+
+        unit = "scoresheets"
+
+    output = Path(args.output) if args.output else strategy.DEFAULT_TABLE_PATH
+    workers = args.workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    def progress(done: int, total: int) -> None:
+        if not args.json:
+            print(f"\r  {done}/{total} {unit} solved", end="", flush=True)
+
+    values = strategy.build_table(workers=workers, progress=progress)
+    strategy.save_table(values, output)
+    elapsed = time.perf_counter() - started
+    if args.game == "farkle":
+        # Rolling six dice at the start of a turn, far from the target
+        start = strategy._gap_offset(strategy.HORIZON_STEPS, strategy.HORIZON_STEPS, 6)
+        expected = values[start] * strategy.POINT_STEP
+        summary = f"expected turn {expected:.2f}"
+    else:
+        expected = strategy.YahtzeeStrategy(values).expected_score()
+        summary = f"expected score {expected:.2f}"
+
+    if args.json:
+        print(json.dumps({"game": args.game, "path": str(output), "seconds": round(elapsed, 1),
+                          "expected_score": round(expected, 2)}))
+    else:
+        print(f"\nWrote {output} in {elapsed:.0f}s ({summary}).")
+
+
+def cmd_backfill_stats(args):
+    """Rebuild the leaderboard aggregates from stored game results."""
+    from .persistence.database import Database
+
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"Database not found: {db_path}", file=sys.stderr)
+        sys.exit(1)
+
+    db = Database(db_path)
+    db.connect()
+    try:
+        count = db.rebuild_player_stats(GameRegistry.get_leaderboard_types())
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps({"results": count}))
+    else:
+        print(f"Rebuilt leaderboard stats from {count} game results.")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="play vnt CLI for AI agents",
@@ -528,6 +613,40 @@ def main():
         help="Save and restore game state after each tick to test serialization",
     )
 
+    # bench command
+    from server.benchmarks.games import add_arguments as add_bench_arguments
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark game engines and bots across games, bot counts and presets"
+    )
+    add_bench_arguments(bench_parser)
+
+    # build-strategy command
+    strategy_parser = subparsers.add_parser(
+        "build-strategy", help="Precompute the strategy table a game's bots play from"
+    )
+    strategy_parser.add_argument(
+        "game", choices=["farkle", "yahtzee"], help="Game to build for"
+    )
+    strategy_parser.add_argument(
+        "--output", help="Where to write the table (default: next to the game's module)"
+    )
+    strategy_parser.add_argument(
+        "--workers", "-w", type=int, help="Worker processes (default: CPU count)"
+    )
+    strategy_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # backfill-stats command
+    backfill_parser = subparsers.add_parser(
+        "backfill-stats", help="Rebuild leaderboard stats from stored game results"
+    )
+    backfill_parser.add_argument(
+        "--db",
+        default=str(_MODULE_DIR / "play_vnt.db"),
+        help="Path to the server database (default: play_vnt.db next to the server)",
+    )
+    backfill_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     args = parser.parse_args()
 
     if args.command == "list-games":
@@ -536,6 +655,12 @@ def main():
         cmd_show_options(args)
     elif args.command == "simulate":
         cmd_simulate(args)
+    elif args.command == "bench":
+        cmd_bench(args)
+    elif args.command == "build-strategy":
+        cmd_build_strategy(args)
+    elif args.command == "backfill-stats":
+        cmd_backfill_stats(args)
     else:
         parser.print_help()
         sys.exit(1)
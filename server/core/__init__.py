@@ -1,6 +1,19 @@
 """Core server infrastructure."""
 
 from .server import Server
-from .tick import TickScheduler, load_server_config, DEFAULT_TICK_INTERVAL_MS
+from .tick import (
+    TickScheduler,
+    TickOverrunPolicy,
+    TickStats,
+    load_server_config,
+    DEFAULT_TICK_INTERVAL_MS,
+)
 
-__all__ = ["Server", "TickScheduler", "load_server_config", "DEFAULT_TICK_INTERVAL_MS"]
+__all__ = [
+    "Server",
+    "TickScheduler",
+    "TickOverrunPolicy",
+    "TickStats",
+    "load_server_config",
+    "DEFAULT_TICK_INTERVAL_MS",
+]
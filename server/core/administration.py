@@ -4,12 +4,22 @@ import asyncio
 import functools
 from typing import TYPE_CHECKING
 
-from ..users.network_user import NetworkUser
+from ..network.websocket_server import broadcast_packet
+from ..users.network_user import NetworkUser, sound_packet, speak_packet
 from ..users.base import MenuItem, EscapeBehavior, TrustLevel
 from ..messages.localization import Localization
+from ..game_utils.profiling import get_profiler
 
 if TYPE_CHECKING:
+    from .tick import TickScheduler
     from ..persistence.database import Database
+    from ..network.websocket_server import WebSocketServer
+    from ..tables.manager import TableManager
+
+
+# Slowest profiled entries and tables listed in the profiling menu
+PROFILING_MENU_ENTRIES = 10
+PROFILING_MENU_TABLES = 5
 
 
 # Activity buffer helper for admin/system announcements
@@ -17,6 +27,16 @@ def _speak_activity(user, message_id: str, **kwargs) -> None:
     user.speak_l(message_id, buffer="activity", **kwargs)
 
 
+def _profiling_figures(entry: dict) -> dict[str, str | int]:
+    """Format a profiler entry's timings for the profiling messages."""
+    return {
+        "calls": entry["calls"],
+        "average": f"{entry['average_ms']:.2f}",
+        "max": f"{entry['max_ms']:.1f}",
+        "total": f"{entry['total_ms']:.0f}",
+    }
+
+
 def require_admin(func):
     """Decorator that checks if the user is still an admin before executing an admin action."""
     @functools.wraps(func)
@@ -49,28 +69,63 @@ class AdministrationMixin:
     - _db: Database instance
     - _users: dict[str, NetworkUser] of online users
     - _user_states: dict[str, dict] of user menu states
+    - _tables: TableManager of active tables
+    - _ws_server: WebSocketServer (optional) for the username connection index
+    - _tick_scheduler: TickScheduler (optional) for tick timing in the profiling menu
     - _show_main_menu(user): method to show main menu
     """
 
     _db: "Database"
     _users: dict[str, NetworkUser]
     _user_states: dict[str, dict]
+    _tables: "TableManager"
+    _ws_server: "WebSocketServer | None" = None
+    _tick_scheduler: "TickScheduler | None" = None
 
     def _show_main_menu(self, user: NetworkUser) -> None:
         """Show main menu - to be implemented by the main class."""
         raise NotImplementedError
 
+    def _broadcast_activity_l(
+        self, users, message_id: str, sound: str | None = None, **kwargs
+    ) -> None:
+        """
+        Announce a localized activity message (and optional sound) to users.
+
+        The message is rendered and encoded once per locale and fanned out to
+        the connections of that locale, so a slow client never holds up the
+        rest. Users without a connection (virtual bots) get it via speak_l.
+        """
+        by_locale: dict[str, list] = {}
+        for user in users:
+            if isinstance(user, NetworkUser):
+                by_locale.setdefault(user.locale, []).append(user.connection)
+            else:
+                _speak_activity(user, message_id, **kwargs)
+                if sound:
+                    user.play_sound(sound)
+
+        for locale, connections in by_locale.items():
+            text = Localization.get(locale, message_id, **kwargs)
+            packets = [speak_packet(text, buffer="activity")]
+            if sound:
+                packets.append(sound_packet(sound))
+            broadcast_packet(packets, connections)
+
     def _notify_admins(
         self, message_id: str, sound: str, exclude_username: str | None = None
     ) -> None:
         """Notify all online admins with a message and sound, optionally excluding one admin."""
-        for username, user in self._users.items():
-            if user.trust_level.value < TrustLevel.ADMIN.value:
-                continue  # Not an admin
-            if exclude_username and username == exclude_username:
-                continue  # Skip the excluded admin
-            _speak_activity(user, message_id)
-            user.play_sound(sound)
+        self._broadcast_activity_l(
+            [
+                user
+                for username, user in self._users.items()
+                if user.trust_level.value >= TrustLevel.ADMIN.value
+                and not (exclude_username and username == exclude_username)
+            ],
+            message_id,
+            sound,
+        )
 
     # ==================== Menu Display Functions ====================
 
@@ -114,6 +169,12 @@ class AdministrationMixin:
                     id="virtual_bots",
                 )
             )
+            items.append(
+                MenuItem(
+                    text=Localization.get(user.locale, "profiling"),
+                    id="profiling",
+                )
+            )
             items.append(
                 MenuItem(
                     text=Localization.get(user.locale, "transfer-ownership"),
@@ -586,6 +647,74 @@ class AdministrationMixin:
         )
         self._user_states[user.username] = {"menu": "virtual_bots_clear_confirm_menu"}
 
+    def _show_profiling_menu(self, user: NetworkUser) -> None:
+        """Show tick timing and the slowest profiled work."""
+        locale = user.locale
+        profiler = get_profiler()
+        toggle_key = "profiling-stop" if profiler.enabled else "profiling-start"
+        items = [
+            MenuItem(text=Localization.get(locale, toggle_key), id="toggle"),
+            MenuItem(text=Localization.get(locale, "profiling-reset"), id="reset"),
+        ]
+
+        if self._tick_scheduler:
+            stats = self._tick_scheduler.get_stats()
+            items.append(
+                MenuItem(
+                    text=Localization.get(
+                        locale,
+                        "profiling-tick-summary",
+                        rate=f"{stats['recent_tick_rate']:.1f}",
+                        average=f"{stats['average_duration_ms']:.2f}",
+                        max=f"{stats['max_duration_ms']:.1f}",
+                        overruns=stats["overruns"],
+                    ),
+                    id="refresh",
+                )
+            )
+
+        entries = profiler.top(PROFILING_MENU_ENTRIES)
+        if not entries:
+            items.append(
+                MenuItem(text=Localization.get(locale, "profiling-no-data"), id="refresh")
+            )
+        for entry in entries:
+            items.append(
+                MenuItem(
+                    text=Localization.get(
+                        locale,
+                        "profiling-entry",
+                        game=Localization.get(locale, f"game-name-{entry['game_type']}"),
+                        category=entry["category"],
+                        name=entry["name"],
+                        **_profiling_figures(entry),
+                    ),
+                    id="refresh",
+                )
+            )
+        for table in profiler.top_tables(PROFILING_MENU_TABLES):
+            items.append(
+                MenuItem(
+                    text=Localization.get(
+                        locale,
+                        "profiling-table-entry",
+                        table=table["table_id"],
+                        game=Localization.get(locale, f"game-name-{table['game_type']}"),
+                        **_profiling_figures(table),
+                    ),
+                    id="refresh",
+                )
+            )
+
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        user.show_menu(
+            "profiling_menu",
+            items,
+            multiletter=True,
+            escape_behavior=EscapeBehavior.SELECT_LAST,
+        )
+        self._user_states[user.username] = {"menu": "profiling_menu"}
+
     # ==================== Menu Selection Handlers ====================
 
     async def _handle_admin_menu_selection(
@@ -608,6 +737,8 @@ class AdministrationMixin:
             self._show_manage_accounts_menu(user)
         elif selection_id == "virtual_bots":
             self._show_virtual_bots_menu(user)
+        elif selection_id == "profiling":
+            self._show_profiling_menu(user)
         elif selection_id == "back":
             self._show_main_menu(user)
 
@@ -938,6 +1069,20 @@ class AdministrationMixin:
         elif selection_id == "back":
             self._show_admin_menu(user)
 
+    async def _handle_profiling_selection(
+        self, user: NetworkUser, selection_id: str
+    ) -> None:
+        """Handle profiling menu selection."""
+        if selection_id == "toggle":
+            await self._toggle_profiling(user)
+        elif selection_id == "reset":
+            await self._reset_profiling(user)
+        elif selection_id == "back":
+            self._show_admin_menu(user)
+        else:
+            # Selecting a figure refreshes them
+            self._show_profiling_menu(user)
+
     async def _handle_virtual_bots_clear_confirm_selection(
         self, user: NetworkUser, selection_id: str
     ) -> None:
@@ -1095,6 +1240,7 @@ class AdministrationMixin:
         exclude_username: str | None = None,
     ) -> None:
         """Broadcast an admin promotion/demotion announcement."""
+        recipients = []
         for username, user in self._users.items():
             if not user.approved:
                 continue  # Don't send broadcasts to unapproved users
@@ -1102,8 +1248,8 @@ class AdministrationMixin:
                 continue  # Skip the excluded user
             if broadcast_scope == "admins" and user.trust_level.value < TrustLevel.ADMIN.value:
                 continue  # Only admins if broadcasting to admins only
-            _speak_activity(user, message_id, player=player_name)
-            user.play_sound(sound)
+            recipients.append(user)
+        self._broadcast_activity_l(recipients, message_id, sound, player=player_name)
 
     def _broadcast_rename(
         self,
@@ -1112,13 +1258,18 @@ class AdministrationMixin:
         exclude_username: str | None = None,
     ) -> None:
         """Broadcast a player rename announcement to everyone."""
-        for username, user in self._users.items():
-            if not user.approved:
-                continue
-            if exclude_username and username == exclude_username:
-                continue
-            _speak_activity(user, "rename-broadcast", old_name=old_name, new_name=new_name)
-            user.play_sound("accountactionnotify.ogg")
+        recipients = [
+            user
+            for username, user in self._users.items()
+            if user.approved and not (exclude_username and username == exclude_username)
+        ]
+        self._broadcast_activity_l(
+            recipients,
+            "rename-broadcast",
+            "accountactionnotify.ogg",
+            old_name=old_name,
+            new_name=new_name,
+        )
 
     @require_server_owner
     async def _transfer_ownership(
@@ -1308,12 +1459,16 @@ class AdministrationMixin:
             # 4. Remove from online tracking
             self._users.pop(old_username, None)
             self._user_states.pop(old_username, None)
+            if self._ws_server:
+                self._ws_server.unregister_username(old_username, target_user.connection)
             
             # Note: Active tables/games will be cleaned up by the connection_lost handler
             # as the user is now considered disconnected.
 
         # Perform the actual rename in DB across all tables
         if self._db.rename_user(old_username, new_username):
+            # Keep any live table seat so the user can rejoin under the new name
+            self._tables.rename_member(old_username, new_username)
             # Broadcast rename announcement to all other players
             self._broadcast_rename(old_username, new_username)
             
@@ -1370,6 +1525,25 @@ class AdministrationMixin:
 
         self._show_virtual_bots_menu(owner)
 
+    @require_server_owner
+    async def _toggle_profiling(self, owner: NetworkUser) -> None:
+        """Switch per-table/action profiling on or off."""
+        profiler = get_profiler()
+        if profiler.enabled:
+            profiler.disable()
+            _speak_activity(owner, "profiling-stopped")
+        else:
+            profiler.enable()
+            _speak_activity(owner, "profiling-started")
+        self._show_profiling_menu(owner)
+
+    @require_server_owner
+    async def _reset_profiling(self, owner: NetworkUser) -> None:
+        """Forget all profiled timings."""
+        get_profiler().reset()
+        _speak_activity(owner, "profiling-reset-done")
+        self._show_profiling_menu(owner)
+
     @require_server_owner
     async def _show_virtual_bots_status(self, owner: NetworkUser) -> None:
         """Show virtual bots status."""
@@ -0,0 +1,208 @@
+"""Periodic checkpointing of live tables."""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from ..tables.table import Table, TableMember
+
+
+# Default seconds between checkpoints
+DEFAULT_CHECKPOINT_INTERVAL_S = 30.0
+
+
+@dataclass
+class CheckpointStats:
+    """Metrics collected by the table checkpointer."""
+
+    checkpoints: int = 0
+    tables_written: int = 0
+    tables_unchanged: int = 0
+    tables_clean: int = 0  # Unchanged tables skipped without serializing
+    bytes_written: int = 0
+    errors: int = 0
+    last_duration_s: float = 0.0
+    max_duration_s: float = 0.0
+    total_duration_s: float = 0.0
+    # Time spent serializing on the event loop (the part that competes with ticks)
+    max_snapshot_s: float = 0.0
+
+    def record(
+        self, duration_s: float, snapshot_s: float, written: int, unchanged: int, clean: int, size: int
+    ) -> None:
+        """Record one completed checkpoint."""
+        self.checkpoints += 1
+        self.tables_written += written
+        self.tables_unchanged += unchanged
+        self.tables_clean += clean
+        self.bytes_written += size
+        self.last_duration_s = duration_s
+        self.total_duration_s += duration_s
+        self.max_duration_s = max(self.max_duration_s, duration_s)
+        self.max_snapshot_s = max(self.max_snapshot_s, snapshot_s)
+
+    def to_dict(self) -> dict:
+        """Snapshot of the metrics as plain data."""
+        average = self.total_duration_s / self.checkpoints if self.checkpoints else 0.0
+        return {
+            "checkpoints": self.checkpoints,
+            "tables_written": self.tables_written,
+            "tables_unchanged": self.tables_unchanged,
+            "tables_clean": self.tables_clean,
+            "bytes_written": self.bytes_written,
+            "errors": self.errors,
+            "last_duration_ms": self.last_duration_s * 1000.0,
+            "average_duration_ms": average * 1000.0,
+            "max_duration_ms": self.max_duration_s * 1000.0,
+            "max_snapshot_ms": self.max_snapshot_s * 1000.0,
+        }
+
+
+def _snapshot(table: Table) -> Table:
+    """Copy a table's persisted fields, with its game state freshly serialized."""
+    table.save_game_state()
+    return Table(
+        table_id=table.table_id,
+        game_type=table.game_type,
+        host=table.host,
+        members=[TableMember(m.username, m.is_spectator) for m in table.members],
+        game_json=table.game_json,
+        status=table.status,
+    )
+
+
+def _state_hash(table: Table) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{table.game_type}\0{table.host}\0{table.status}\0".encode("utf-8"))
+    for member in table.members:
+        digest.update(f"{member.username}\0{int(member.is_spectator)}\0".encode("utf-8"))
+    digest.update((table.game_json or "").encode("utf-8"))
+    return digest.digest()
+
+
+class TableCheckpointer:
+    """
+    Periodically saves live tables so a crash loses at most one interval.
+
+    Each checkpoint runs as its own task between ticks. Only tables marked
+    dirty since they were last written (see Table.dirty) are serialized,
+    one at a time on the event loop (game state is not safe to read from
+    another thread), yielding between tables so ticks are not held up.
+    Of those, only tables whose state hash changed are sent to the
+    database writer, which compresses them and commits them in one
+    transaction together with the removal of tables that no longer exist.
+    """
+
+    def __init__(
+        self,
+        get_tables: Callable[[], list[Table]],
+        write: Callable[..., Awaitable[Any]],
+        interval_s: float = DEFAULT_CHECKPOINT_INTERVAL_S,
+    ):
+        """
+        Initialize the checkpointer. The periodic task is created by start().
+
+        Args:
+            get_tables: Returns every live table.
+            write: Runs a database job on the writer and returns its result
+                (see Server._db_write).
+            interval_s: Seconds between checkpoints; 0 disables periodic
+                checkpoints (checkpoint() can still be called directly).
+        """
+        self._get_tables = get_tables
+        self._write = write
+        self.interval_s = interval_s
+        self.stats = CheckpointStats()
+        self._hashes: dict[str, bytes] = {}  # table_id -> hash as last written
+        self._synced = False  # Whether stale rows from before startup were pruned
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Start periodic checkpoints."""
+        if self.interval_s > 0 and not self._task:
+            self._task = asyncio.create_task(self._checkpoint_loop())
+
+    async def stop(self) -> None:
+        """Stop periodic checkpoints (a running checkpoint is abandoned)."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> dict:
+        """Get a snapshot of the checkpoint metrics."""
+        return self.stats.to_dict()
+
+    async def checkpoint(self) -> int:
+        """
+        Save every table whose state changed since the last checkpoint.
+
+        Returns:
+            Number of tables written.
+        """
+        async with self._lock:
+            started = time.monotonic()
+            snapshot_s = 0.0
+            changed: list[Table] = []
+            hashes: dict[str, bytes] = {}
+            sources: dict[str, Table] = {}  # table_id -> live table, to re-dirty on failure
+            clean = 0
+            tables = self._get_tables()
+            for table in tables:
+                if not table.dirty and table.table_id in self._hashes:
+                    clean += 1
+                    continue
+                if sources:
+                    await asyncio.sleep(0)
+                sources[table.table_id] = table
+                snapshot_started = time.monotonic()
+                table.mark_clean()
+                snapshot = _snapshot(table)
+                state_hash = _state_hash(snapshot)
+                snapshot_s += time.monotonic() - snapshot_started
+                hashes[snapshot.table_id] = state_hash
+                if self._hashes.get(snapshot.table_id) != state_hash:
+                    changed.append(snapshot)
+
+            # Tables may have been created or destroyed while we yielded
+            live_ids = {table.table_id for table in self._get_tables()}
+            changed = [snapshot for snapshot in changed if snapshot.table_id in live_ids]
+            if self._synced and not changed and live_ids == self._hashes.keys():
+                self.stats.record(time.monotonic() - started, snapshot_s, 0, len(tables), clean, 0)
+                return 0
+
+            try:
+                size = await self._write("checkpoint_tables", changed, live_ids)
+            except Exception as e:
+                self.stats.errors += 1
+                print(f"Error checkpointing tables: {e}")
+                for snapshot in changed:
+                    sources[snapshot.table_id].mark_dirty()
+                return 0
+
+            self._synced = True
+            for snapshot in changed:
+                self._hashes[snapshot.table_id] = hashes[snapshot.table_id]
+            for table_id in list(self._hashes):
+                if table_id not in live_ids:
+                    del self._hashes[table_id]
+            self.stats.record(
+                time.monotonic() - started,
+                snapshot_s,
+                len(changed),
+                len(tables) - len(changed),
+                clean,
+                size,
+            )
+            return len(changed)
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            await self.checkpoint()
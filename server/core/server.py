@@ -8,18 +8,51 @@ import time
 
 import json
 
-from .tick import TickScheduler, load_server_config
+from .tick import TickScheduler, load_server_config, DEFAULT_MAX_CATCH_UP_TICKS
+from .checkpoint import TableCheckpointer, DEFAULT_CHECKPOINT_INTERVAL_S
 from .administration import AdministrationMixin
 from .friends import FriendsMixin
 from .virtual_bots import VirtualBotManager
-from ..network.websocket_server import WebSocketServer, ClientConnection
+from ..network.websocket_server import (
+    WebSocketServer,
+    ClientConnection,
+    broadcast_packet,
+    DEFAULT_MAX_OUTBOX,
+    DEFAULT_SLOW_CONSUMER_POLICY,
+)
+from ..network.metrics_server import MetricsServer, DEFAULT_METRICS_HOST
 from ..persistence.database import Database
-from ..auth.auth import AuthManager, AuthResult
-from ..tables.manager import TableManager
+from ..persistence.executor import (
+    DatabaseExecutor,
+    DatabaseJob,
+    DEFAULT_READER_COUNT,
+    run_database_job,
+)
+from ..auth.auth import (
+    DEFAULT_HASH_WORKERS,
+    DEFAULT_SESSION_TTL_S,
+    AuthManager,
+    AuthResult,
+)
+from ..tables.manager import DEFAULT_MAX_SLEEP_TICKS, TableManager
 from ..users.network_user import NetworkUser
 from ..users.base import MenuItem, EscapeBehavior, TrustLevel
 from ..users.preferences import UserPreferences, DiceKeepingStyle
 from ..games.registry import GameRegistry, get_game_class
+from ..game_utils.bot_service import (
+    DEFAULT_BOT_WORKERS,
+    DEFAULT_THINK_BUDGET_MS,
+    DEFAULT_THINK_DEADLINE_MS,
+    BotService,
+    configure_bot_service,
+    get_bot_service,
+)
+from ..game_utils.estimate_pool import (
+    DEFAULT_ESTIMATE_WORKERS,
+    EstimatePool,
+    configure_estimate_pool,
+)
+from ..game_utils.profiling import get_profiler
 from ..messages.localization import Localization
 
 
@@ -30,6 +63,71 @@ _MODULE_DIR = Path(__file__).parent.parent
 _DEFAULT_LOCALES_DIR = _MODULE_DIR / "locales"
 
 
+# ==================== Database jobs ====================
+# These run on DatabaseExecutor threads, so they receive that thread's
+# Database and must not touch server state.
+
+
+def _load_game_results(db: Database, game_type: str, limit: int = 100) -> list:
+    """Load recent results for a game type as GameResult objects."""
+    from ..game_utils.game_result import GameResult, PlayerResult
+
+    results = db.get_game_stats(game_type, limit=limit)
+    game_results = []
+
+    for row in results:
+        custom_data = json.loads(row[4]) if row[4] else {}
+        player_rows = db.get_game_result_players(row[0])
+        player_results = [
+            PlayerResult(
+                player_id=p["player_id"],
+                player_name=p["player_name"],
+                is_bot=p["is_bot"],
+                is_virtual_bot=p.get("is_virtual_bot", False),
+            )
+            for p in player_rows
+        ]
+        game_results.append(
+            GameResult(
+                game_type=row[1],
+                timestamp=row[2],
+                duration_ticks=row[3],
+                player_results=player_results,
+                custom_data=custom_data,
+            )
+        )
+
+    return game_results
+
+
+def _load_rating_leaderboard(db: Database, game_type: str, limit: int) -> list[tuple]:
+    """Load the top ratings for a game type as (rating, player_name) pairs."""
+    from ..game_utils.stats_helpers import RatingHelper
+
+    ratings = RatingHelper(db, game_type).get_leaderboard(limit=limit)
+    names = db.get_player_names(game_type, [rating.player_id for rating in ratings])
+    return [(rating, names.get(rating.player_id, rating.player_id)) for rating in ratings]
+
+
+def _display_number(value: float) -> int | float:
+    """Show whole-number aggregates without a trailing .0."""
+    return int(value) if float(value).is_integer() else value
+
+
+def _load_player_rating(db: Database, game_type: str, player_id: str):
+    """Load a player's rating for a game type (defaults if unrated)."""
+    from ..game_utils.stats_helpers import RatingHelper
+
+    return RatingHelper(db, game_type).get_rating(player_id)
+
+
+def _update_ratings(db: Database, game_type: str, rankings: list[list[str]]) -> None:
+    """Apply a finished game's rankings to player ratings."""
+    from ..game_utils.stats_helpers import RatingHelper
+
+    RatingHelper(db, game_type).update_ratings(rankings)
+
+
 class Server(AdministrationMixin, FriendsMixin):
     """
     Main play vnt v11 server.
@@ -53,11 +151,18 @@ class Server(AdministrationMixin, FriendsMixin):
 
         # Initialize components
         self._db = Database(db_path)
+        self._db_executor: DatabaseExecutor | None = None
         self._auth: AuthManager | None = None
+        self._estimate_pool: EstimatePool | None = None
+        self._bot_service: BotService | None = None
         self._tables = TableManager()
         self._tables._server = self  # Enable callbacks from TableManager
         self._ws_server: WebSocketServer | None = None
         self._tick_scheduler: TickScheduler | None = None
+        self._metrics_server: MetricsServer | None = None
+        self._checkpointer = TableCheckpointer(
+            lambda: self._tables.get_tables_to_save(), self._db_write
+        )
 
         # User tracking
         self._users: dict[str, NetworkUser] = {}  # username -> NetworkUser
@@ -76,21 +181,67 @@ class Server(AdministrationMixin, FriendsMixin):
         """Start the server."""
         print(f"Starting play vnt v{VERSION} server...")
 
-        # Connect to database
+        # Load server configuration
+        server_config = load_server_config()
+        tick_interval_ms = server_config.get("tick_interval_ms")
+
+        # Connect to database, then start the worker threads that keep
+        # queries and result writes off the event loop
         self._db.connect()
-        self._auth = AuthManager(self._db)
+        self._db_executor = DatabaseExecutor(
+            self._db.db_path,
+            reader_count=server_config.get("db_reader_threads", DEFAULT_READER_COUNT),
+        )
+        self._db_executor.start()
+        self._auth = AuthManager(
+            self._db,
+            hash_workers=server_config.get("auth_hash_workers", DEFAULT_HASH_WORKERS),
+            session_ttl_s=server_config.get("session_token_ttl_s", DEFAULT_SESSION_TTL_S),
+            db_read=self._db_read,
+            db_write=self._db_write,
+        )
+        self._auth.purge_expired_sessions()
+
+        # Databases from before the leaderboard aggregates need a one-off backfill
+        if self._db.player_stats_need_backfill():
+            count = self._db.rebuild_player_stats(GameRegistry.get_leaderboard_types())
+            print(f"Backfilled leaderboard stats from {count} game results.")
+
+        # Start pre-warmed duration estimate workers (shared by all tables)
+        self._estimate_pool = configure_estimate_pool(
+            server_config.get("estimate_workers", DEFAULT_ESTIMATE_WORKERS)
+        )
+        self._estimate_pool.start()
+
+        # Load the bots' strategy tables now rather than on a table's tick
+        self._load_bot_tables()
+
+        # Start the workers that take slow bot decisions off the tick
+        self._bot_service = configure_bot_service(
+            server_config.get("bot_workers", DEFAULT_BOT_WORKERS),
+            budget_ms=server_config.get("bot_think_budget_ms", DEFAULT_THINK_BUDGET_MS),
+            deadline_ms=server_config.get("bot_think_deadline_ms", DEFAULT_THINK_DEADLINE_MS),
+        )
+        self._bot_service.start()
 
         # Initialize trust levels for users
         promoted_user = self._db.initialize_trust_levels()
         if promoted_user:
             print(f"User '{promoted_user}' has been promoted to developer (trust level 3).")
 
-        # Load existing tables
-        self._load_tables()
+        # Let tables with nothing to do skip ticks until their game has work
+        self._tables.sleep_idle_tables = server_config.get("sleep_idle_tables", True)
+        self._tables.max_sleep_ticks = server_config.get(
+            "table_max_sleep_ticks", DEFAULT_MAX_SLEEP_TICKS
+        )
 
-        # Load server configuration
-        server_config = load_server_config()
-        tick_interval_ms = server_config.get("tick_interval_ms")
+        # Load existing tables, then checkpoint them periodically so a crash
+        # loses at most one interval of play
+        self._load_tables()
+        self._checkpointer.interval_s = server_config.get(
+            "table_checkpoint_interval_s", DEFAULT_CHECKPOINT_INTERVAL_S
+        )
+        self._checkpointer.start()
 
         # Initialize virtual bots
         self._virtual_bots.load_config()
@@ -107,15 +258,41 @@ class Server(AdministrationMixin, FriendsMixin):
             on_message=self._on_client_message,
             ssl_cert=self._ssl_cert,
             ssl_key=self._ssl_key,
+            max_outbox=server_config.get("outbound_queue_limit", DEFAULT_MAX_OUTBOX),
+            slow_consumer_policy=server_config.get(
+                "slow_consumer_policy", DEFAULT_SLOW_CONSUMER_POLICY
+            ),
         )
         await self._ws_server.start()
 
         # Start tick scheduler
-        self._tick_scheduler = TickScheduler(self._on_tick, tick_interval_ms)
+        self._tick_scheduler = TickScheduler(
+            self._on_tick,
+            tick_interval_ms,
+            overrun_policy=server_config.get("tick_overrun_policy", "catch_up"),
+            max_catch_up_ticks=server_config.get(
+                "tick_max_catch_up", DEFAULT_MAX_CATCH_UP_TICKS
+            ),
+        )
         await self._tick_scheduler.start()
         if tick_interval_ms:
             print(f"Tick interval: {tick_interval_ms}ms ({1000 // tick_interval_ms} ticks/sec)")
 
+        # Per-table/action timing (also switchable from the admin menu)
+        if server_config.get("profiling_enabled", False):
+            get_profiler().enable()
+            print("Profiling enabled.")
+
+        # Local metrics endpoint
+        metrics_port = server_config.get("metrics_port", 0)
+        if metrics_port:
+            self._metrics_server = MetricsServer(
+                self.get_metrics,
+                metrics_port,
+                host=server_config.get("metrics_host", DEFAULT_METRICS_HOST),
+            )
+            await self._metrics_server.start()
+
         protocol = "wss" if self._ssl_cert else "ws"
         print(f"Server running on {protocol}://{self.host}:{self.port}")
 
@@ -124,7 +301,8 @@ class Server(AdministrationMixin, FriendsMixin):
         print("Stopping server...")
 
         # Save all tables
-        self._save_tables()
+        await self._checkpointer.stop()
+        await self._save_tables()
 
         # Save virtual bot state (they persist across restarts)
         self._virtual_bots.save_state()
@@ -132,16 +310,67 @@ class Server(AdministrationMixin, FriendsMixin):
         # Stop tick scheduler
         if self._tick_scheduler:
             await self._tick_scheduler.stop()
+            stats = self._tick_scheduler.get_stats()
+            print(
+                f"Ticks: {stats['ticks']} "
+                f"({stats['achieved_tick_rate']:.1f}/{stats['target_tick_rate']:.1f} per sec), "
+                f"overruns: {stats['overruns']}, skipped: {stats['skipped_ticks']}, "
+                f"avg {stats['average_duration_ms']:.2f}ms, max {stats['max_duration_ms']:.2f}ms"
+            )
 
         # Stop WebSocket server
         if self._ws_server:
             await self._ws_server.stop()
 
-        # Close database
+        if self._metrics_server:
+            await self._metrics_server.stop()
+            self._metrics_server = None
+
+        # Stop duration estimate workers
+        if self._estimate_pool:
+            self._estimate_pool.shutdown()
+            self._estimate_pool = None
+
+        # Stop bot think workers
+        if self._bot_service:
+            self._bot_service.shutdown()
+            self._bot_service = None
+
+        # Stop password hashing workers
+        if self._auth:
+            await asyncio.to_thread(self._auth.close)
+
+        # Finish queued writes, then close database
+        if self._db_executor:
+            await asyncio.to_thread(self._db_executor.close)
+            self._db_executor = None
         self._db.close()
 
         print("Server stopped.")
 
+    def _load_bot_tables(self) -> None:
+        """
+        Load the precomputed tables Farkle and Yahtzee bots play from.
+
+        The tables are generated files, not part of a deploy: build them
+        with `python -m server.cli build-strategy <game>`. A missing table is
+        reported here, since bots keep working (more slowly or more weakly)
+        without it.
+        """
+        from ..games.farkle import strategy as farkle_strategy
+        from ..games.yahtzee import strategy as yahtzee_strategy
+
+        if not farkle_strategy.warm_up():
+            print(
+                "Farkle strategy table not built; bots solve each gap when it first comes up "
+                "(build it with: python -m server.cli build-strategy farkle)"
+            )
+        if yahtzee_strategy.get_strategy() is None:
+            print(
+                "Yahtzee strategy table not built; bots fall back to their heuristic "
+                "(build it with: python -m server.cli build-strategy yahtzee)"
+            )
+
     def _load_tables(self) -> None:
         """Load tables from database and restore their games."""
         from ..users.bot import Bot
@@ -172,17 +401,55 @@ class Server(AdministrationMixin, FriendsMixin):
                         bot_user = Bot(player.name)
                         game.attach_user(player.id, bot_user)
 
+        # The rows stay until the first checkpoint replaces them, so a crash
+        # right after startup does not lose the loaded games
         print(f"Loaded {len(tables)} tables from database.")
 
-        # Delete all tables from database after loading to prevent stale data
-        # on subsequent restarts. Tables will be re-saved on shutdown.
-        self._db.delete_all_tables()
+    async def _save_tables(self) -> None:
+        """Save all changed tables to database, dropping rows for ended tables."""
+        written = await self._checkpointer.checkpoint()
+        stats = self._checkpointer.get_stats()
+        print(
+            f"Saved {written} tables to database "
+            f"({stats['checkpoints']} checkpoints, {stats['bytes_written']} bytes written, "
+            f"errors: {stats['errors']}, max {stats['max_duration_ms']:.1f}ms)."
+        )
+
+    def get_metrics(self) -> dict:
+        """Snapshot of the server's performance metrics (see MetricsServer)."""
+        return {
+            "version": VERSION,
+            "users": len(self._users),
+            "tables": len(self._tables.get_all_tables()),
+            "tables_asleep": self._tables.get_sleeping_count(),
+            "menus": self._tables.get_menu_stats(),
+            "ticks": self._tick_scheduler.get_stats() if self._tick_scheduler else None,
+            "checkpoints": self._checkpointer.get_stats(),
+            "database": self._db_executor.get_stats() if self._db_executor else None,
+            "auth": self._auth.get_stats() if self._auth else None,
+            "localization": Localization.get_render_stats(),
+            "profile": get_profiler().get_stats(),
+            "bots": get_bot_service().get_stats(),
+        }
 
-    def _save_tables(self) -> None:
-        """Save all tables to database."""
-        tables = self._tables.save_all()
-        self._db.save_all_tables(tables)
-        print(f"Saved {len(tables)} tables to database.")
+    async def _db_read(self, job: DatabaseJob, *args, **kwargs):
+        """Run a database read on the reader pool (inline if not started)."""
+        if self._db_executor and self._db_executor.running:
+            return await self._db_executor.read(job, *args, **kwargs)
+        return run_database_job(self._db, job, *args, **kwargs)
+
+    async def _db_write(self, job: DatabaseJob, *args, **kwargs):
+        """Run a database write on the writer thread (inline if not started)."""
+        if self._db_executor and self._db_executor.running:
+            return await self._db_executor.write(job, *args, **kwargs)
+        return run_database_job(self._db, job, *args, **kwargs)
+
+    def _db_write_nowait(self, job: DatabaseJob, *args, **kwargs) -> None:
+        """Queue a database write on the writer thread (inline if not started)."""
+        if self._db_executor and self._db_executor.running:
+            self._db_executor.submit_write(job, *args, **kwargs)
+        else:
+            run_database_job(self._db, job, *args, **kwargs)
 
     def _on_tick(self) -> None:
         """Called every tick (50ms)."""
@@ -196,14 +463,13 @@ class Server(AdministrationMixin, FriendsMixin):
         self._flush_user_messages()
 
     def _flush_user_messages(self) -> None:
-        """Send all queued messages for all users."""
+        """Send all queued messages for all users, one frame per user."""
         for username, user in self._users.items():
             messages = user.get_queued_messages()
             if messages and self._ws_server:
                 client = self._ws_server.get_client_by_username(username)
                 if client:
-                    for msg in messages:
-                        asyncio.create_task(client.send(msg))
+                    client.send_frame(messages)
 
     async def _on_client_connect(self, client: ClientConnection) -> None:
         """Handle new client connection."""
@@ -238,37 +504,35 @@ class Server(AdministrationMixin, FriendsMixin):
             self._users.pop(username, None)
             self._user_states.pop(username, None)
 
+    def _approved_users(self) -> list:
+        """Online users that may receive broadcasts (approved accounts only)."""
+        return [user for user in self._users.values() if user.approved]
+
     def _broadcast_presence_l(
         self, message_id: str, player_name: str, sound: str
     ) -> None:
         """Broadcast a localized presence announcement to all approved online users with sound."""
-        for username, user in self._users.items():
-            if not user.approved:
-                continue  # Don't send broadcasts to unapproved users
-            user.speak_l(message_id, buffer="activity", player=player_name)
-            user.play_sound(sound)
+        self._broadcast_activity_l(self._approved_users(), message_id, sound, player=player_name)
 
     def _broadcast_admin_announcement(self, admin_name: str) -> None:
         """Broadcast an admin announcement to all approved online users."""
-        for username, user in self._users.items():
-            if not user.approved:
-                continue  # Don't send broadcasts to unapproved users
-            user.speak_l("user-is-admin", buffer="activity", player=admin_name)
+        self._broadcast_activity_l(self._approved_users(), "user-is-admin", player=admin_name)
 
     def _broadcast_server_owner_announcement(self, owner_name: str) -> None:
         """Broadcast a developer announcement to all approved online users."""
-        for username, user in self._users.items():
-            if not user.approved:
-                continue  # Don't send broadcasts to unapproved users
-            user.speak_l("user-is-server-owner", buffer="activity", player=owner_name)
+        self._broadcast_activity_l(
+            self._approved_users(), "user-is-server-owner", player=owner_name
+        )
 
     def _broadcast_table_created(self, host_name: str, game_name: str) -> None:
         """Broadcast a table creation announcement to all approved online users."""
-        for username, user in self._users.items():
-            if not user.approved:
-                continue  # Don't send broadcasts to unapproved users
-            user.speak_l("table-created", buffer="activity", host=host_name, game=game_name)
-            user.play_sound("table_created.ogg")
+        self._broadcast_activity_l(
+            self._approved_users(),
+            "table-created",
+            "table_created.ogg",
+            host=host_name,
+            game=game_name,
+        )
 
     async def _on_client_message(self, client: ClientConnection, packet: dict) -> None:
         """Handle incoming message from client."""
@@ -311,8 +575,11 @@ class Server(AdministrationMixin, FriendsMixin):
         password = packet.get("password", "")
         locale = packet.get("locale", "en")
 
-        # Try to authenticate or register
-        auth_result = self._auth.authenticate(username, password)
+        # Try to authenticate or register. A session token from a recent login
+        # lets reconnecting clients skip password hashing.
+        auth_result = await self._auth.authenticate_async(
+            username, password, packet.get("session_token")
+        )
         if auth_result != AuthResult.SUCCESS:
             if auth_result == AuthResult.WRONG_PASSWORD:
                 # Username exists but password is wrong - show error dialog
@@ -328,10 +595,10 @@ class Server(AdministrationMixin, FriendsMixin):
                 return
 
             # User not found - check if this will be a new user that needs approval
-            needs_approval = self._db.get_user_count() > 0
+            needs_approval = await self._db_read("get_user_count") > 0
 
             # Try to register
-            if not self._auth.register(username, password):
+            if not await self._auth.register_async(username, password):
                 # Registration failed (shouldn't happen if user not found, but handle anyway)
                 error_message = Localization.get(locale, "incorrect-username")
                 await client.send({"type": "play_sound", "name": "accounterror.ogg"})
@@ -348,6 +615,10 @@ class Server(AdministrationMixin, FriendsMixin):
             if needs_approval:
                 self._notify_admins("account-request", "accountrequest.ogg")
 
+        # Fetch the account first: nothing between the logged-in check and
+        # registering the user below may await, or a second login could slip in
+        user_record = await self._auth.get_user_async(username)
+
         # Check if user is already logged in
         if username in self._users:
             error_message = Localization.get(locale, "already-logged-in")
@@ -364,9 +635,10 @@ class Server(AdministrationMixin, FriendsMixin):
         # Authentication successful
         client.username = username
         client.authenticated = True
+        if self._ws_server:
+            self._ws_server.register_username(client)
 
         # Create network user with preferences and persistent UUID
-        user_record = self._auth.get_user(username)
         locale = user_record.locale if user_record else "en"
         user_uuid = user_record.uuid if user_record else None
         trust_level = user_record.trust_level if user_record else TrustLevel.USER
@@ -384,12 +656,13 @@ class Server(AdministrationMixin, FriendsMixin):
         )
         self._users[username] = user
 
-        # Send success response
+        # Send success response with a fresh session token for reconnects
         await client.send(
             {
                 "type": "authorize_success",
                 "username": username,
                 "version": VERSION,
+                "session_token": await self._auth.create_session_async(username),
             }
         )
         print(f"Client authorized: {username}@{client.address}")
@@ -429,13 +702,13 @@ class Server(AdministrationMixin, FriendsMixin):
 
         # Notify admin of pending account approvals (excluding banned users)
         if trust_level.value >= TrustLevel.ADMIN.value:
-            pending_users = self._db.get_pending_users(exclude_banned=True)
+            pending_users = await self._db_read("get_pending_users", exclude_banned=True)
             if pending_users:
                 user.speak_l("account-request", buffer="activity")
                 user.play_sound("accountrequest.ogg")
 
         # Notify of pending friend requests
-        friend_requests = self._db.get_friend_requests(username)
+        friend_requests = await self._db_read("get_friend_requests", username)
         if friend_requests:
             user.speak_l("pending-friend-requests-notify", buffer="activity")
             user.play_sound("accountrequest.ogg") # Reusing sound
@@ -479,10 +752,10 @@ class Server(AdministrationMixin, FriendsMixin):
             return
 
         # Check if this will be a user that needs approval (not the first user)
-        needs_approval = self._db.get_user_count() > 0
+        needs_approval = await self._db_read("get_user_count") > 0
 
         # Try to register the user
-        if self._auth.register(username, password):
+        if await self._auth.register_async(username, password):
             await client.send({
                 "type": "register_success",
                 "username": username,
@@ -500,11 +773,11 @@ class Server(AdministrationMixin, FriendsMixin):
     async def _send_game_list(self, client: ClientConnection) -> None:
         """Send the list of available games to the client."""
         games = []
-        for game_class in GameRegistry.get_all():
+        for descriptor in GameRegistry.get_descriptors():
             games.append(
                 {
-                    "type": game_class.get_type(),
-                    "name": game_class.get_name(),
+                    "type": descriptor.type,
+                    "name": descriptor.name,
                 }
             )
 
@@ -564,7 +837,7 @@ class Server(AdministrationMixin, FriendsMixin):
 
     def _show_categories_menu(self, user: NetworkUser) -> None:
         """Show game categories menu."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_descriptors_by_category()
         items = []
         for category_key in sorted(categories.keys()):
             category_name = Localization.get(user.locale, category_key)
@@ -587,13 +860,13 @@ class Server(AdministrationMixin, FriendsMixin):
 
     def _show_games_menu(self, user: NetworkUser, category: str) -> None:
         """Show games in a category."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_descriptors_by_category()
         games = categories.get(category, [])
 
         items = []
-        for game_class in games:
-            game_name = Localization.get(user.locale, game_class.get_name_key())
-            items.append(MenuItem(text=game_name, id=f"game_{game_class.get_type()}"))
+        for descriptor in games:
+            game_name = Localization.get(user.locale, descriptor.name_key)
+            items.append(MenuItem(text=game_name, id=f"game_{descriptor.type}"))
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
 
         user.show_menu(
@@ -607,10 +880,10 @@ class Server(AdministrationMixin, FriendsMixin):
     def _show_tables_menu(self, user: NetworkUser, game_type: str) -> None:
         """Show available tables for a game."""
         tables = self._tables.get_waiting_tables(game_type)
-        game_class = get_game_class(game_type)
+        descriptor = GameRegistry.get_descriptor(game_type)
         game_name = (
-            Localization.get(user.locale, game_class.get_name_key())
-            if game_class
+            Localization.get(user.locale, descriptor.name_key)
+            if descriptor
             else game_type
         )
 
@@ -956,6 +1229,8 @@ class Server(AdministrationMixin, FriendsMixin):
             await self._handle_unban_confirm_selection(user, selection_id, state)
         elif current_menu == "virtual_bots_menu":
             await self._handle_virtual_bots_selection(user, selection_id)
+        elif current_menu == "profiling_menu":
+            await self._handle_profiling_selection(user, selection_id)
         elif current_menu == "virtual_bots_clear_confirm_menu":
             await self._handle_virtual_bots_clear_confirm_selection(user, selection_id)
         elif current_menu == "manage_accounts_menu":
@@ -978,7 +1253,7 @@ class Server(AdministrationMixin, FriendsMixin):
         elif selection_id == "leaderboards":
             self._show_leaderboards_menu(user)
         elif selection_id == "my_stats":
-            self._show_my_stats_menu(user)
+            await self._show_my_stats_menu(user)
         elif selection_id == "options":
             self._show_options_menu(user)
         elif selection_id == "friends":
@@ -1158,11 +1433,8 @@ class Server(AdministrationMixin, FriendsMixin):
                 self._show_tables_menu(user, game_type)
 
         elif selection_id == "back":
-            category = None
-            for cat, games in GameRegistry.get_by_category().items():
-                if any(g.get_type() == game_type for g in games):
-                    category = cat
-                    break
+            descriptor = GameRegistry.get_descriptor(game_type)
+            category = descriptor.category if descriptor else None
             if category:
                 self._show_games_menu(user, category)
             else:
@@ -1451,15 +1723,15 @@ class Server(AdministrationMixin, FriendsMixin):
 
     def _show_leaderboards_menu(self, user: NetworkUser) -> None:
         """Show leaderboards game selection menu."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_descriptors_by_category()
         items = []
 
         # Add all games from all categories
         for category_key in sorted(categories.keys()):
-            for game_class in categories[category_key]:
-                game_name = Localization.get(user.locale, game_class.get_name_key())
+            for descriptor in categories[category_key]:
+                game_name = Localization.get(user.locale, descriptor.name_key)
                 items.append(
-                    MenuItem(text=game_name, id=f"lb_{game_class.get_type()}")
+                    MenuItem(text=game_name, id=f"lb_{descriptor.type}")
                 )
 
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
@@ -1472,7 +1744,7 @@ class Server(AdministrationMixin, FriendsMixin):
         )
         self._user_states[user.username] = {"menu": "leaderboards_menu"}
 
-    def _show_leaderboard_types_menu(self, user: NetworkUser, game_type: str) -> None:
+    async def _show_leaderboard_types_menu(self, user: NetworkUser, game_type: str) -> None:
         """Show leaderboard type selection menu for a game."""
         game_class = get_game_class(game_type)
         if not game_class:
@@ -1480,7 +1752,7 @@ class Server(AdministrationMixin, FriendsMixin):
             return
 
         # Check if there's any data for this game
-        results = self._db.get_game_stats(game_type, limit=1)
+        results = await self._db_read("get_game_stats", game_type, limit=1)
         if not results:
             # No data - speak message and stay on game selection
             user.speak_l("leaderboard-no-data")
@@ -1538,72 +1810,15 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _get_game_results(self, game_type: str) -> list:
-        """Get game results as GameResult objects."""
-        from ..game_utils.game_result import GameResult, PlayerResult
-        import json
-
-        results = self._db.get_game_stats(game_type, limit=100)
-        game_results = []
-
-        for row in results:
-            custom_data = json.loads(row[4]) if row[4] else {}
-            player_rows = self._db.get_game_result_players(row[0])
-            player_results = [
-                PlayerResult(
-                    player_id=p["player_id"],
-                    player_name=p["player_name"],
-                    is_bot=p["is_bot"],
-                    is_virtual_bot=p.get("is_virtual_bot", False),
-                )
-                for p in player_rows
-            ]
-            game_results.append(
-                GameResult(
-                    game_type=row[1],
-                    timestamp=row[2],
-                    duration_ticks=row[3],
-                    player_results=player_results,
-                    custom_data=custom_data,
-                )
-            )
-
-        return game_results
-
-    def _show_wins_leaderboard(
+    async def _show_wins_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show win leaders leaderboard."""
-        from ..game_utils.stats_helpers import LeaderboardHelper
-
-        game_results = self._get_game_results(game_type)
-
-        # Build player stats: {player_id: {wins, losses, name}}
-        player_stats: dict[str, dict] = {}
-        for result in game_results:
-            winner_name = result.custom_data.get("winner_name")
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_stats:
-                    player_stats[p.player_id] = {
-                        "wins": 0,
-                        "losses": 0,
-                        "name": p.player_name,
-                    }
-                if winner_name == p.player_name:
-                    player_stats[p.player_id]["wins"] += 1
-                else:
-                    player_stats[p.player_id]["losses"] += 1
-
-        # Sort by wins descending
-        sorted_players = sorted(
-            player_stats.items(), key=lambda x: x[1]["wins"], reverse=True
-        )
+        leaders = await self._db_read("get_stats_leaderboard", game_type, "wins", 10)
 
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for rank, stats in enumerate(leaders, 1):
             wins = stats["wins"]
             losses = stats["losses"]
             total = wins + losses
@@ -1614,7 +1829,7 @@ class Server(AdministrationMixin, FriendsMixin):
                         user.locale,
                         "leaderboard-wins-entry",
                         rank=rank,
-                        player=stats["name"],
+                        player=stats["player_name"],
                         wins=wins,
                         losses=losses,
                         percentage=percentage,
@@ -1637,14 +1852,11 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _show_rating_leaderboard(
+    async def _show_rating_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show skill rating leaderboard."""
-        from ..game_utils.stats_helpers import RatingHelper
-
-        rating_helper = RatingHelper(self._db, game_type)
-        ratings = rating_helper.get_leaderboard(limit=10)
+        ratings = await self._db_read(_load_rating_leaderboard, game_type, 10)
 
         items = []
 
@@ -1656,20 +1868,7 @@ class Server(AdministrationMixin, FriendsMixin):
                 )
             )
         else:
-            for rank, rating in enumerate(ratings, 1):
-                # Get player name from UUID - check recent game results
-                player_name = rating.player_id
-                # Look up name from game results
-                results = self._db.get_game_stats(game_type, limit=100)
-                for result in results:
-                    players = self._db.get_game_result_players(result[0])
-                    for p in players:
-                        if p["player_id"] == rating.player_id:
-                            player_name = p["player_name"]
-                            break
-                    if player_name != rating.player_id:
-                        break
-
+            for rank, (rating, player_name) in enumerate(ratings, 1):
                 items.append(
                     MenuItem(
                         text=Localization.get(
@@ -1699,44 +1898,23 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _show_total_score_leaderboard(
+    async def _show_total_score_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show total score leaderboard."""
-        from ..game_utils.stats_helpers import LeaderboardHelper
-
-        game_results = self._get_game_results(game_type)
-
-        # Build total scores per player
-        player_scores: dict[str, dict] = {}
-        for result in game_results:
-            final_scores = result.custom_data.get("final_scores", {})
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_scores:
-                    player_scores[p.player_id] = {"total": 0, "name": p.player_name}
-                # Try to get score by player name
-                score = final_scores.get(p.player_name, 0)
-                if score:
-                    player_scores[p.player_id]["total"] += score
-
-        # Sort by total score descending
-        sorted_players = sorted(
-            player_scores.items(), key=lambda x: x[1]["total"], reverse=True
-        )
+        leaders = await self._db_read("get_stats_leaderboard", game_type, "total_score", 10)
 
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for rank, stats in enumerate(leaders, 1):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-score-entry",
                         rank=rank,
-                        player=stats["name"],
-                        value=int(stats["total"]),
+                        player=stats["player_name"],
+                        value=int(stats["total_score"]),
                     ),
                     id=f"entry_{rank}",
                 )
@@ -1756,41 +1934,23 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _show_high_score_leaderboard(
+    async def _show_high_score_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show high score leaderboard."""
-        game_results = self._get_game_results(game_type)
-
-        # Build high scores per player
-        player_high: dict[str, dict] = {}
-        for result in game_results:
-            final_scores = result.custom_data.get("final_scores", {})
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                score = final_scores.get(p.player_name, 0)
-                if p.player_id not in player_high:
-                    player_high[p.player_id] = {"high": score, "name": p.player_name}
-                elif score > player_high[p.player_id]["high"]:
-                    player_high[p.player_id]["high"] = score
-
-        # Sort by high score descending
-        sorted_players = sorted(
-            player_high.items(), key=lambda x: x[1]["high"], reverse=True
-        )
+        leaders = await self._db_read("get_stats_leaderboard", game_type, "high_score", 10)
 
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for rank, stats in enumerate(leaders, 1):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-score-entry",
                         rank=rank,
-                        player=stats["name"],
-                        value=int(stats["high"]),
+                        player=stats["player_name"],
+                        value=int(stats["high_score"] or 0),
                     ),
                     id=f"entry_{rank}",
                 )
@@ -1810,38 +1970,23 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _show_games_played_leaderboard(
+    async def _show_games_played_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show games played leaderboard."""
-        game_results = self._get_game_results(game_type)
-
-        # Count games per player
-        player_games: dict[str, dict] = {}
-        for result in game_results:
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-                if p.player_id not in player_games:
-                    player_games[p.player_id] = {"count": 0, "name": p.player_name}
-                player_games[p.player_id]["count"] += 1
-
-        # Sort by games played descending
-        sorted_players = sorted(
-            player_games.items(), key=lambda x: x[1]["count"], reverse=True
-        )
+        leaders = await self._db_read("get_stats_leaderboard", game_type, "games", 10)
 
         items = []
 
-        for rank, (player_id, stats) in enumerate(sorted_players[:10], 1):
+        for rank, stats in enumerate(leaders, 1):
             items.append(
                 MenuItem(
                     text=Localization.get(
                         user.locale,
                         "leaderboard-games-entry",
                         rank=rank,
-                        player=stats["name"],
-                        value=stats["count"],
+                        player=stats["player_name"],
+                        value=stats["games"],
                     ),
                     id=f"entry_{rank}",
                 )
@@ -1861,32 +2006,7 @@ class Server(AdministrationMixin, FriendsMixin):
             "game_name": game_name,
         }
 
-    def _extract_value_from_path(
-        self, data: dict, path: str, player_id: str, player_name: str
-    ) -> float | None:
-        """Extract a value from custom_data using a dot-separated path.
-
-        Supports {player_id} and {player_name} placeholders in path.
-        """
-        # Replace placeholders
-        resolved_path = path.replace("{player_id}", player_id)
-        resolved_path = resolved_path.replace("{player_name}", player_name)
-
-        # Navigate the path
-        parts = resolved_path.split(".")
-        current = data
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-
-        # Convert to float if possible
-        if isinstance(current, (int, float)):
-            return float(current)
-        return None
-
-    def _show_custom_leaderboard(
+    async def _show_custom_leaderboard(
         self,
         user: NetworkUser,
         game_type: str,
@@ -1894,84 +2014,18 @@ class Server(AdministrationMixin, FriendsMixin):
         config: dict,
     ) -> None:
         """Show a custom leaderboard using declarative config."""
-        game_results = self._get_game_results(game_type)
-
-        lb_id = config["id"]
-        aggregate = config.get("aggregate", "sum")
         format_key = config.get("format", "score")
         decimals = config.get("decimals", 0)
 
-        # Check if this is a ratio calculation or simple path
-        is_ratio = "numerator" in config and "denominator" in config
-
-        # Aggregate data per player
-        player_data: dict[str, dict] = {}
-
-        for result in game_results:
-            custom_data = result.custom_data
-            for p in result.player_results:
-                if p.is_bot and not p.is_virtual_bot:
-                    continue
-
-                if p.player_id not in player_data:
-                    player_data[p.player_id] = {
-                        "name": p.player_name,
-                        "values": [],
-                        "numerators": [],
-                        "denominators": [],
-                    }
-
-                if is_ratio:
-                    num = self._extract_value_from_path(
-                        custom_data, config["numerator"], p.player_id, p.player_name
-                    )
-                    denom = self._extract_value_from_path(
-                        custom_data, config["denominator"], p.player_id, p.player_name
-                    )
-                    if num is not None and denom is not None:
-                        player_data[p.player_id]["numerators"].append(num)
-                        player_data[p.player_id]["denominators"].append(denom)
-                else:
-                    value = self._extract_value_from_path(
-                        custom_data, config["path"], p.player_id, p.player_name
-                    )
-                    if value is not None:
-                        player_data[p.player_id]["values"].append(value)
-
-        # Calculate final values based on aggregate type
-        player_scores: list[tuple[str, str, float]] = []
-
-        for player_id, data in player_data.items():
-            if is_ratio:
-                total_num = sum(data["numerators"])
-                total_denom = sum(data["denominators"])
-                if total_denom > 0:
-                    value = total_num / total_denom
-                    player_scores.append((player_id, data["name"], value))
-            else:
-                values = data["values"]
-                if not values:
-                    continue
-
-                if aggregate == "sum":
-                    value = sum(values)
-                elif aggregate == "max":
-                    value = max(values)
-                elif aggregate == "avg":
-                    value = sum(values) / len(values)
-                else:
-                    value = sum(values)
-
-                player_scores.append((player_id, data["name"], value))
-
-        # Sort descending
-        player_scores.sort(key=lambda x: x[2], reverse=True)
+        player_scores = await self._db_read(
+            "get_custom_stat_leaderboard", game_type, config, 10
+        )
 
         # Build menu items
         items = []
         entry_key = f"leaderboard-{format_key}-entry"
 
-        for rank, (player_id, name, value) in enumerate(player_scores[:10], 1):
+        for rank, (player_id, name, value) in enumerate(player_scores, 1):
             display_value = round(value, decimals) if decimals > 0 else int(value)
             items.append(
                 MenuItem(
@@ -2006,7 +2060,7 @@ class Server(AdministrationMixin, FriendsMixin):
         """Handle leaderboards menu selection."""
         if selection_id.startswith("lb_"):
             game_type = selection_id[3:]  # Remove "lb_" prefix
-            self._show_leaderboard_types_menu(user, game_type)
+            await self._show_leaderboard_types_menu(user, game_type)
         elif selection_id == "back":
             self._show_main_menu(user)
 
@@ -2019,15 +2073,15 @@ class Server(AdministrationMixin, FriendsMixin):
 
         # Built-in leaderboard types
         if selection_id == "type_wins":
-            self._show_wins_leaderboard(user, game_type, game_name)
+            await self._show_wins_leaderboard(user, game_type, game_name)
         elif selection_id == "type_rating":
-            self._show_rating_leaderboard(user, game_type, game_name)
+            await self._show_rating_leaderboard(user, game_type, game_name)
         elif selection_id == "type_total_score":
-            self._show_total_score_leaderboard(user, game_type, game_name)
+            await self._show_total_score_leaderboard(user, game_type, game_name)
         elif selection_id == "type_high_score":
-            self._show_high_score_leaderboard(user, game_type, game_name)
+            await self._show_high_score_leaderboard(user, game_type, game_name)
         elif selection_id == "type_games_played":
-            self._show_games_played_leaderboard(user, game_type, game_name)
+            await self._show_games_played_leaderboard(user, game_type, game_name)
         elif selection_id == "back":
             self._show_leaderboards_menu(user)
         elif selection_id.startswith("type_"):
@@ -2037,7 +2091,7 @@ class Server(AdministrationMixin, FriendsMixin):
             if game_class:
                 for config in game_class.get_leaderboard_types():
                     if config["id"] == lb_id:
-                        self._show_custom_leaderboard(
+                        await self._show_custom_leaderboard(
                             user, game_type, game_name, config
                         )
                         return
@@ -2049,31 +2103,25 @@ class Server(AdministrationMixin, FriendsMixin):
         if selection_id == "back":
             game_type = state.get("game_type", "")
             game_name = state.get("game_name", "")
-            self._show_leaderboard_types_menu(user, game_type)
+            await self._show_leaderboard_types_menu(user, game_type)
         # Other selections (entries, header) are informational only
 
     # =========================================================================
     # My Stats menu
     # =========================================================================
 
-    def _show_my_stats_menu(self, user: NetworkUser) -> None:
+    async def _show_my_stats_menu(self, user: NetworkUser) -> None:
         """Show game selection menu for personal stats (only games user has played)."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_descriptors_by_category()
         items = []
+        played = await self._db_read("get_player_game_types", user.uuid)
 
         # Add only games where the user has stats
         for category_key in sorted(categories.keys()):
-            for game_class in categories[category_key]:
-                game_type = game_class.get_type()
-                # Check if user has played this game
-                game_results = self._get_game_results(game_type)
-                has_stats = any(
-                    p.player_id == user.uuid
-                    for result in game_results
-                    for p in result.player_results
-                )
-                if has_stats:
-                    game_name = Localization.get(user.locale, game_class.get_name_key())
+            for descriptor in categories[category_key]:
+                game_type = descriptor.type
+                if game_type in played:
+                    game_name = Localization.get(user.locale, descriptor.name_key)
                     items.append(
                         MenuItem(text=game_name, id=f"stats_{game_type}")
                     )
@@ -2093,45 +2141,22 @@ class Server(AdministrationMixin, FriendsMixin):
         )
         self._user_states[user.username] = {"menu": "my_stats_menu"}
 
-    def _show_my_game_stats(self, user: NetworkUser, game_type: str) -> None:
+    async def _show_my_game_stats(self, user: NetworkUser, game_type: str) -> None:
         """Show personal stats for a specific game."""
-        from ..game_utils.stats_helpers import RatingHelper
-
         game_class = get_game_class(game_type)
         if not game_class:
             user.speak_l("game-type-not-found")
             return
 
         game_name = Localization.get(user.locale, game_class.get_name_key())
-        game_results = self._get_game_results(game_type)
+        stats = await self._db_read("get_player_game_stats", user.uuid, game_type)
 
         # Calculate player's personal stats
-        wins = 0
-        losses = 0
-        total_score = 0
-        high_score = 0
-        games_played = 0
-
-        for result in game_results:
-            winner_name = result.custom_data.get("winner_name")
-            final_scores = result.custom_data.get("final_scores", {})
-            final_light = result.custom_data.get("final_light", {})
-
-            for p in result.player_results:
-                if p.player_id == user.uuid:
-                    games_played += 1
-                    if winner_name == p.player_name:
-                        wins += 1
-                    else:
-                        losses += 1
-
-                    # Get score from final_scores or final_light (for Light Turret)
-                    score = final_scores.get(p.player_name, 0)
-                    if not score:
-                        score = final_light.get(p.player_name, 0)
-                    total_score += score
-                    if score > high_score:
-                        high_score = score
+        games_played = stats["games"] if stats else 0
+        wins = stats["wins"] if stats else 0
+        losses = stats["losses"] if stats else 0
+        total_score = _display_number(stats["total_score"]) if stats else 0
+        high_score = _display_number(stats["high_score"] or 0) if stats else 0
 
         if games_played == 0:
             user.speak_l("my-stats-no-data")
@@ -2182,8 +2207,7 @@ class Server(AdministrationMixin, FriendsMixin):
             )
 
         # Skill rating
-        rating_helper = RatingHelper(self._db, game_type)
-        rating = rating_helper.get_rating(user.uuid)
+        rating = await self._db_read(_load_player_rating, game_type, user.uuid)
         if rating.mu != 25.0 or rating.sigma != 25.0 / 3:  # Non-default rating
             items.append(
                 MenuItem(
@@ -2206,7 +2230,10 @@ class Server(AdministrationMixin, FriendsMixin):
             )
 
         # Game-specific stats from custom leaderboard configs
-        self._add_custom_stats(user, game_class, game_results, items)
+        custom_values = await self._db_read(
+            "get_player_custom_stats", user.uuid, game_type, game_class.get_leaderboard_types()
+        )
+        self._add_custom_stats(user, game_class, custom_values, items)
 
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
 
@@ -2226,67 +2253,14 @@ class Server(AdministrationMixin, FriendsMixin):
         self,
         user: NetworkUser,
         game_class,
-        game_results: list,
+        custom_values: dict[str, float],
         items: list,
     ) -> None:
         """Add game-specific custom stats from leaderboard configs."""
         for config in game_class.get_leaderboard_types():
             lb_id = config["id"]
-            path = config.get("path")
-            numerator_path = config.get("numerator")
-            denominator_path = config.get("denominator")
-            aggregate = config.get("aggregate", "sum")
             decimals = config.get("decimals", 0)
-
-            # Extract values for this player from all game results
-            values = []
-            num_values = []
-            denom_values = []
-
-            for result in game_results:
-                # Check if player participated in this game
-                player_name = None
-                for p in result.player_results:
-                    if p.player_id == user.uuid:
-                        player_name = p.player_name
-                        break
-
-                if not player_name:
-                    continue
-
-                custom_data = result.custom_data
-
-                if path:
-                    # Simple path extraction
-                    resolved_path = path.replace("{player_name}", player_name)
-                    resolved_path = resolved_path.replace("{player_id}", user.uuid)
-                    value = self._extract_path_value(custom_data, resolved_path)
-                    if value is not None:
-                        values.append(value)
-                elif numerator_path and denominator_path:
-                    # Ratio calculation
-                    num_path = numerator_path.replace("{player_name}", player_name)
-                    denom_path = denominator_path.replace("{player_name}", player_name)
-                    num_val = self._extract_path_value(custom_data, num_path)
-                    denom_val = self._extract_path_value(custom_data, denom_path)
-                    if num_val is not None and denom_val is not None:
-                        num_values.append(num_val)
-                        denom_values.append(denom_val)
-
-            # Calculate aggregated value
-            final_value = None
-            if values:
-                if aggregate == "sum":
-                    final_value = sum(values)
-                elif aggregate == "max":
-                    final_value = max(values)
-                elif aggregate == "avg":
-                    final_value = sum(values) / len(values)
-            elif num_values and denom_values:
-                total_num = sum(num_values)
-                total_denom = sum(denom_values)
-                if total_denom > 0:
-                    final_value = total_num / total_denom
+            final_value = custom_values.get(lb_id)
 
             if final_value is not None:
                 # Format the value
@@ -2307,19 +2281,6 @@ class Server(AdministrationMixin, FriendsMixin):
 
                 items.append(MenuItem(text=text, id=f"custom_{lb_id}"))
 
-    def _extract_path_value(self, data: dict, path: str) -> float | None:
-        """Extract a value from nested dict using dot notation path."""
-        parts = path.split(".")
-        current = data
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-        if isinstance(current, (int, float)):
-            return float(current)
-        return None
-
     async def _handle_my_stats_selection(
         self, user: NetworkUser, selection_id: str, state: dict
     ) -> None:
@@ -2328,14 +2289,14 @@ class Server(AdministrationMixin, FriendsMixin):
             self._show_main_menu(user)
         elif selection_id.startswith("stats_"):
             game_type = selection_id[6:]  # Remove "stats_" prefix
-            self._show_my_game_stats(user, game_type)
+            await self._show_my_game_stats(user, game_type)
 
     async def _handle_my_game_stats_selection(
         self, user: NetworkUser, selection_id: str, state: dict
     ) -> None:
         """Handle my game stats menu selection."""
         if selection_id == "back":
-            self._show_my_stats_menu(user)
+            await self._show_my_stats_menu(user)
         # Other selections (stats entries) are informational only
 
     def on_table_destroy(self, table) -> None:
@@ -2355,9 +2316,11 @@ class Server(AdministrationMixin, FriendsMixin):
 
         if not isinstance(result, GameResult):
             return
+        game_class = get_game_class(result.game_type)
 
-        # Save to database
-        self._db.save_game_result(
+        # Queue the write so a slow disk never stalls the tick that finished the game
+        self._db_write_nowait(
+            "save_game_result",
             game_type=result.game_type,
             timestamp=result.timestamp,
             duration_ticks=result.duration_ticks,
@@ -2366,8 +2329,13 @@ class Server(AdministrationMixin, FriendsMixin):
                 for p in result.player_results
             ],
             custom_data=result.custom_data,
+            stat_configs=game_class.get_leaderboard_types() if game_class else None,
         )
 
+    def on_ratings_update(self, game_type: str, rankings: list[list[str]]) -> None:
+        """Handle a rating update. Called by Table when a game finishes."""
+        self._db_write_nowait(_update_ratings, game_type, rankings)
+
     def on_table_save(self, table, username: str) -> None:
         """Handle table save request. Called by TableManager."""
         import json
@@ -2514,25 +2482,29 @@ class Server(AdministrationMixin, FriendsMixin):
             "language": language,
         }
 
+        # Only approved users receive chat
         if convo == "local":
             table = self._tables.find_user_table(username)
             if table:
-                for member_name in [m.username for m in table.members]:
-                    user = self._users.get(member_name)
-                    if user and user.approved:  # Only send to approved users
-                        await user.connection.send(chat_packet)
+                recipients = [self._users.get(m.username) for m in table.members]
+                recipients = [user for user in recipients if user and user.approved]
             else:
-                for user in self._users.values():
-                    if not user.approved:
-                        continue
-                    if self._tables.find_user_table(user.username):
-                        continue
-                    await user.connection.send(chat_packet)
+                recipients = [
+                    user
+                    for user in self._users.values()
+                    if user.approved and not self._tables.find_user_table(user.username)
+                ]
         elif convo == "global":
-            # Broadcast to all approved users only
-            for user in self._users.values():
-                if user.approved:
-                    await user.connection.send(chat_packet)
+            recipients = self._approved_users()
+        else:
+            return
+
+        # Encoded once and queued per connection, so a slow client can't
+        # hold up delivery to everyone after it
+        broadcast_packet(
+            chat_packet,
+            [user.connection for user in recipients if isinstance(user, NetworkUser)],
+        )
 
     def _get_online_usernames(self) -> list[str]:
         """Return sorted list of online usernames."""
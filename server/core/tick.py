@@ -1,6 +1,10 @@
 """Tick scheduler for game updates."""
 
 import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
 from typing import Callable
 
@@ -8,6 +12,31 @@ from typing import Callable
 # Default tick interval
 DEFAULT_TICK_INTERVAL_MS = 50
 
+# Default number of missed ticks the scheduler may run back-to-back
+DEFAULT_MAX_CATCH_UP_TICKS = 5
+
+# Upper bounds (in ms) of the tick duration histogram buckets.
+# The final bucket collects everything slower than the last bound.
+TICK_HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500)
+
+# Number of recent ticks used to compute the current tick rate
+RECENT_TICK_WINDOW = 100
+
+
+class TickOverrunPolicy(Enum):
+    """What the scheduler does when it falls behind its deadlines."""
+
+    CATCH_UP = "catch_up"  # Run missed ticks back-to-back (up to a limit)
+    SKIP = "skip"  # Drop missed ticks and resume on the next deadline
+
+    @classmethod
+    def from_str(cls, value: str | None) -> "TickOverrunPolicy":
+        """Parse a policy name, falling back to CATCH_UP."""
+        for policy in cls:
+            if policy.value == value:
+                return policy
+        return cls.CATCH_UP
+
 
 def load_server_config(path: str | Path | None = None) -> dict:
     """
@@ -37,6 +66,89 @@ def load_server_config(path: str | Path | None = None) -> dict:
     return data.get("server", {})
 
 
+@dataclass
+class TickStats:
+    """
+    Timing metrics collected by the tick scheduler.
+
+    Durations are measured around the tick callback only, so they show how
+    much of the tick budget game logic consumes.
+    """
+
+    tick_interval_s: float
+    ticks: int = 0
+    overruns: int = 0  # Ticks whose callback took longer than the interval
+    skipped_ticks: int = 0  # Deadlines dropped by the overrun policy
+    errors: int = 0
+    total_duration_s: float = 0.0
+    max_duration_s: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(TICK_HISTOGRAM_BOUNDS_MS) + 1)
+    )
+    started_at: float = field(default_factory=time.monotonic)
+    _recent: deque = field(
+        default_factory=lambda: deque(maxlen=RECENT_TICK_WINDOW), repr=False
+    )
+
+    def record(self, started: float, duration_s: float) -> None:
+        """Record one completed tick."""
+        self.ticks += 1
+        self.total_duration_s += duration_s
+        if duration_s > self.max_duration_s:
+            self.max_duration_s = duration_s
+        if duration_s > self.tick_interval_s:
+            self.overruns += 1
+        self._recent.append(started)
+
+        duration_ms = duration_s * 1000.0
+        for index, bound in enumerate(TICK_HISTOGRAM_BOUNDS_MS):
+            if duration_ms <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    @property
+    def average_duration_s(self) -> float:
+        """Average callback duration in seconds."""
+        return self.total_duration_s / self.ticks if self.ticks else 0.0
+
+    def achieved_tick_rate(self, now: float | None = None) -> float:
+        """Average ticks per second since the scheduler started."""
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - self.started_at
+        return self.ticks / elapsed if elapsed > 0 else 0.0
+
+    def recent_tick_rate(self) -> float:
+        """Ticks per second over the most recent window of ticks."""
+        if len(self._recent) < 2:
+            return 0.0
+        span = self._recent[-1] - self._recent[0]
+        return (len(self._recent) - 1) / span if span > 0 else 0.0
+
+    def histogram_labels(self) -> list[str]:
+        """Human-readable labels matching the histogram buckets."""
+        labels = [f"<={bound}ms" for bound in TICK_HISTOGRAM_BOUNDS_MS]
+        labels.append(f">{TICK_HISTOGRAM_BOUNDS_MS[-1]}ms")
+        return labels
+
+    def to_dict(self) -> dict:
+        """Snapshot of the metrics as plain data."""
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "errors": self.errors,
+            "target_tick_rate": 1.0 / self.tick_interval_s,
+            "achieved_tick_rate": self.achieved_tick_rate(),
+            "recent_tick_rate": self.recent_tick_rate(),
+            "average_duration_ms": self.average_duration_s * 1000.0,
+            "max_duration_ms": self.max_duration_s * 1000.0,
+            "histogram": dict(zip(self.histogram_labels(), self.histogram)),
+        }
+
+
 class TickScheduler:
     """
     Schedules game ticks at a fixed interval.
@@ -44,12 +156,21 @@ class TickScheduler:
     The tick callback is called synchronously within the async context.
     This keeps game logic simple while allowing async network I/O.
 
+    Ticks are scheduled against absolute deadlines, so time spent inside
+    the callback does not stretch the period. When a tick runs long, the
+    overrun policy decides whether missed ticks are run back-to-back
+    (catch_up, bounded by max_catch_up_ticks) or dropped (skip).
+
     The tick interval can be configured via config.toml [server] section
     or passed directly to the constructor.
     """
 
     def __init__(
-        self, on_tick: Callable[[], None], tick_interval_ms: int | None = None
+        self,
+        on_tick: Callable[[], None],
+        tick_interval_ms: int | None = None,
+        overrun_policy: TickOverrunPolicy | str = TickOverrunPolicy.CATCH_UP,
+        max_catch_up_ticks: int = DEFAULT_MAX_CATCH_UP_TICKS,
     ):
         """
         Initialize the tick scheduler.
@@ -57,6 +178,9 @@ class TickScheduler:
         Args:
             on_tick: Callback function to call on each tick.
             tick_interval_ms: Tick interval in milliseconds. If None, uses default (50ms).
+            overrun_policy: How to handle missed deadlines (catch_up or skip).
+            max_catch_up_ticks: Most missed ticks to run back-to-back before
+                dropping the rest (catch_up policy only).
         """
         self._on_tick = on_tick
         self._running = False
@@ -68,9 +192,17 @@ class TickScheduler:
         self.tick_interval_ms = tick_interval_ms
         self.tick_interval_s = tick_interval_ms / 1000.0
 
+        if isinstance(overrun_policy, str):
+            overrun_policy = TickOverrunPolicy.from_str(overrun_policy)
+        self.overrun_policy = overrun_policy
+        self.max_catch_up_ticks = max(0, max_catch_up_ticks)
+
+        self.stats = TickStats(tick_interval_s=self.tick_interval_s)
+
     async def start(self) -> None:
         """Start the tick scheduler."""
         self._running = True
+        self.stats = TickStats(tick_interval_s=self.tick_interval_s)
         self._task = asyncio.create_task(self._tick_loop())
 
     async def stop(self) -> None:
@@ -83,14 +215,52 @@ class TickScheduler:
             except asyncio.CancelledError:
                 pass
 
+    def get_stats(self) -> dict:
+        """Get a snapshot of the scheduler's timing metrics."""
+        return self.stats.to_dict()
+
+    def _next_deadline(self, deadline: float, now: float) -> float:
+        """
+        Compute the deadline of the next tick.
+
+        Args:
+            deadline: Deadline of the tick that just ran.
+            now: Current monotonic time.
+
+        Returns:
+            The next deadline, after applying the overrun policy.
+        """
+        deadline += self.tick_interval_s
+        lag = now - deadline
+        if lag < 0:
+            return deadline
+
+        # Whole ticks missed beyond the one that is already due
+        missed = int(lag // self.tick_interval_s)
+        if self.overrun_policy == TickOverrunPolicy.SKIP:
+            allowed = 0
+        else:
+            allowed = self.max_catch_up_ticks
+        if missed > allowed:
+            dropped = missed - allowed
+            deadline += dropped * self.tick_interval_s
+            self.stats.skipped_ticks += dropped
+        return deadline
+
     async def _tick_loop(self) -> None:
         """Main tick loop."""
+        deadline = time.monotonic()
         while self._running:
+            started = time.monotonic()
             try:
                 # Call tick callback synchronously
                 self._on_tick()
             except Exception as e:
+                self.stats.errors += 1
                 print(f"Error in tick: {e}")
+            finished = time.monotonic()
+            self.stats.record(started, finished - started)
 
-            # Sleep for tick interval
-            await asyncio.sleep(self.tick_interval_s)
+            # Sleep until the next absolute deadline
+            deadline = self._next_deadline(deadline, finished)
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
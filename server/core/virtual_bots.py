@@ -6,6 +6,8 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ..game_utils.timer_wheel import TimerWheel
+
 if TYPE_CHECKING:
     from .server import Server
 
@@ -34,6 +36,7 @@ class VirtualBotConfig:
     max_offline_ticks: int = 3000  # 2.5 min maximum offline
     leave_game_delay_ticks: int = 200  # 10 sec - spread bot departures after game ends
     start_game_delay_ticks: int = 400  # 20 sec - wait for players before starting
+    in_game_check_ticks: int = 20  # 1 sec - how often bots in a game look at it
 
     # Behavior probabilities (per decision tick when idle)
     join_game_chance: float = 0.3
@@ -68,6 +71,9 @@ class VirtualBot:
     game_join_tick: int = 0  # Tick when bot joined/created the game (for start delay)
     logout_after_game: bool = False  # If True, will log off shortly after leaving game
 
+    # Scheduling state (runtime only)
+    synced_tick: int = 0  # Manager tick the countdowns above are up to date with
+
 
 class VirtualBotManager:
     """
@@ -82,6 +88,8 @@ class VirtualBotManager:
         self._server = server
         self._config = VirtualBotConfig()
         self._bots: dict[str, VirtualBot] = {}  # name -> VirtualBot
+        # Bot names by the tick of their next decision; bots sleep in between
+        self._wheel: TimerWheel[str] = TimerWheel()
 
     def load_config(self, path: str | Path | None = None) -> None:
         """Load bot configuration from config.toml."""
@@ -114,6 +122,7 @@ class VirtualBotManager:
             max_offline_ticks=vb_config.get("max_offline_ticks", 3000),
             leave_game_delay_ticks=vb_config.get("leave_game_delay_ticks", 200),
             start_game_delay_ticks=vb_config.get("start_game_delay_ticks", 400),
+            in_game_check_ticks=vb_config.get("in_game_check_ticks", 20),
             join_game_chance=vb_config.get("join_game_chance", 0.3),
             create_game_chance=vb_config.get("create_game_chance", 0.1),
             go_offline_chance=vb_config.get("go_offline_chance", 0.05),
@@ -134,6 +143,7 @@ class VirtualBotManager:
 
         # Save each bot's state
         for bot in self._bots.values():
+            self._sync(bot, self._wheel.now)
             db.save_virtual_bot(
                 name=bot.name,
                 state=bot.state.value,
@@ -170,12 +180,12 @@ class VirtualBotManager:
                 table_id=data["table_id"],
                 game_join_tick=data["game_join_tick"],
             )
-            self._bots[name] = bot
             count += 1
 
             # If the bot was online or in a game, recreate their VirtualUser
             if bot.state in (VirtualBotState.ONLINE_IDLE, VirtualBotState.IN_GAME, VirtualBotState.LEAVING_GAME):
                 self._restore_bot_user(bot)
+            self._add_bot(bot)
 
         return count
 
@@ -246,19 +256,21 @@ class VirtualBotManager:
                     state=VirtualBotState.OFFLINE,
                     cooldown_ticks=0,  # Will come online on next tick
                 )
-                self._bots[name] = bot
                 # Actually bring them online now
                 self._bring_bot_online(bot)
+                self._add_bot(bot)
                 online += 1
             else:
                 # Stay offline with random long cooldown
                 cooldown = random.randint(
                     self._config.min_offline_ticks, self._config.max_offline_ticks
                 )
-                self._bots[name] = VirtualBot(
-                    name=name,
-                    state=VirtualBotState.OFFLINE,
-                    cooldown_ticks=cooldown,
+                self._add_bot(
+                    VirtualBot(
+                        name=name,
+                        state=VirtualBotState.OFFLINE,
+                        cooldown_ticks=cooldown,
+                    )
                 )
             added += 1
 
@@ -290,6 +302,7 @@ class VirtualBotManager:
                 self._take_bot_offline_silent(bot)
 
         self._bots.clear()
+        self._wheel.clear()
 
         # Also clear from database
         if self._server._db:
@@ -334,9 +347,62 @@ class VirtualBotManager:
         }
 
     def on_tick(self) -> None:
-        """Process bot decisions each server tick."""
-        for bot in list(self._bots.values()):
-            self._process_bot_tick(bot)
+        """Process the bots whose next decision falls on this tick."""
+        for name in self._wheel.advance():
+            bot = self._bots.get(name)
+            if bot:
+                self._sync(bot, self._wheel.now - 1)
+                self._process_bot_tick(bot)
+                bot.synced_tick = self._wheel.now
+                self._schedule(bot)
+
+    def _add_bot(self, bot: VirtualBot) -> None:
+        """Track a bot and schedule its first decision."""
+        self._bots[bot.name] = bot
+        bot.synced_tick = self._wheel.now
+        self._schedule(bot)
+
+    def _sync(self, bot: VirtualBot, tick: int) -> None:
+        """
+        Bring a bot's countdowns up to date with a tick.
+
+        A sleeping bot is owed the ticks since it was last processed, which
+        would only have counted down its cooldown, then its think time and
+        time online.
+        """
+        elapsed = tick - bot.synced_tick
+        if elapsed <= 0:
+            return
+        bot.synced_tick = tick
+
+        waited = min(bot.cooldown_ticks, elapsed)
+        bot.cooldown_ticks -= waited
+        elapsed -= waited
+        if bot.state == VirtualBotState.OFFLINE:
+            return
+        bot.online_ticks += elapsed
+        if bot.state == VirtualBotState.ONLINE_IDLE:
+            bot.think_ticks -= min(bot.think_ticks, elapsed)
+
+    def _schedule(self, bot: VirtualBot) -> None:
+        """Put a synced bot to sleep until the tick it next has something to do."""
+        wait = bot.cooldown_ticks + 1
+        if bot.state == VirtualBotState.ONLINE_IDLE:
+            wait += bot.think_ticks
+        elif bot.state == VirtualBotState.IN_GAME:
+            # Look at the game now and then, and as soon as a host may start it
+            check = self._config.in_game_check_ticks
+            until_start = self._config.start_game_delay_ticks - (
+                bot.online_ticks - bot.game_join_tick
+            )
+            if 0 < until_start < check:
+                check = until_start
+            wait += check - 1
+        self._wheel.schedule(bot.name, bot.synced_tick + wait)
+
+    def _wake(self, bot: VirtualBot) -> None:
+        """Have a bot look at its game on the next tick."""
+        self._wheel.schedule(bot.name, self._wheel.now + 1)
 
     def _process_bot_tick(self, bot: VirtualBot) -> None:
         """Process a single bot's tick."""
@@ -524,8 +590,8 @@ class VirtualBotManager:
 
     def _try_join_game(self, bot: VirtualBot) -> bool:
         """Try to join an existing waiting table. Returns True if joined."""
-        # Get all waiting tables
-        tables = self._server._tables.get_waiting_tables()
+        # Get all tables whose game is still in its lobby
+        tables = self._server._tables.get_joinable_tables()
         if not tables:
             return False
 
@@ -563,16 +629,19 @@ class VirtualBotManager:
             "table_id": table.table_id,
         }
 
+        # A virtual host may be able to start the game now
+        host_bot = self._bots.get(game.host)
+        if host_bot and host_bot.state == VirtualBotState.IN_GAME:
+            self._wake(host_bot)
+
         return True
 
     def _count_bot_owned_tables(self, game_type: str) -> int:
         """Count how many tables of a game type are owned by virtual bots."""
         count = 0
-        for table in self._server._tables.get_all_tables():
+        for table in self._server._tables.get_tables_by_type(game_type):
             if not table.game:
                 continue
-            if table.game.get_type() != game_type:
-                continue
             # Check if the host is a virtual bot
             host = table.game.host
             if host and host in self._bots:
@@ -649,4 +718,6 @@ class VirtualBotManager:
         """
         for bot in self._bots.values():
             if bot.table_id == table_id and bot.state == VirtualBotState.IN_GAME:
+                self._sync(bot, self._wheel.now)
                 self._start_leaving_game(bot)
+                self._schedule(bot)
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
 
 from .actions import Action, MenuInput, EditboxInput
 from .options import get_option_meta, MenuOption
+from .profiling import ACTION, get_profiler
 from ..users.base import MenuItem, EscapeBehavior
 from ..messages.localization import Localization
 
@@ -21,6 +22,8 @@ class ActionExecutionMixin:
         - self.find_action(player, action_id) -> Action | None
         - self.resolve_action(player, action) -> ResolvedAction
         - self.advance_turn()
+        - self.menu_batch() / self.flush_menus()
+        - self.wake()
     """
 
     def execute_action(
@@ -31,6 +34,7 @@ class ActionExecutionMixin:
         context: "ActionContext | None" = None,
     ) -> None:
         """Execute an action for a player, optionally with input value and context."""
+        self.wake()
         action = self.find_action(player, action_id)
         if not action:
             return
@@ -74,13 +78,17 @@ class ActionExecutionMixin:
         self._action_context[player.id] = context or AC()
 
         try:
-            # Execute the action handler (always pass action_id for context)
-            if action.input_request is not None and input_value is not None:
-                # Handler expects input value: (player, input_value, action_id)
-                handler(player, input_value, action_id)
-            else:
-                # Handler doesn't expect input: (player, action_id)
-                handler(player, action_id)
+            # Menus rebuilt by the handler are sent once, when it returns
+            with self.menu_batch(), get_profiler().measure(
+                ACTION, self.get_type(), action.handler
+            ):
+                # Execute the action handler (always pass action_id for context)
+                if action.input_request is not None and input_value is not None:
+                    # Handler expects input value: (player, input_value, action_id)
+                    handler(player, input_value, action_id)
+                else:
+                    # Handler doesn't expect input: (player, action_id)
+                    handler(player, action_id)
         finally:
             # Clean up context
             self._action_context.pop(player.id, None)
@@ -150,6 +158,7 @@ class ActionExecutionMixin:
 
         req = action.input_request
         self._pending_actions[player.id] = action.id
+        self.flush_menus()  # Send pending turn menus before the input prompt
 
         if isinstance(req, MenuInput):
             options = self._get_menu_options_for_action(action, player)
@@ -12,6 +12,31 @@ if TYPE_CHECKING:
     from ..games.base import Game, Player
 
 
+# (game class, callback name) -> (function, whether it accepts action_id).
+# Filled lazily so menu rebuilds never call inspect.signature more than once
+# per callback; the function is stored to notice instance-level overrides.
+_callback_dispatch: dict[tuple[type, str], tuple[object, bool]] = {}
+
+
+def _accepts_action_id(game: "Game", name: str, method) -> bool:
+    """Return whether a state callback takes an action_id kwarg (cached)."""
+    key = (type(game), name)
+    func = getattr(method, "__func__", method)
+    cached = _callback_dispatch.get(key)
+    if cached is not None and cached[0] is func:
+        return cached[1]
+    accepts = "action_id" in inspect.signature(method).parameters
+    _callback_dispatch[key] = (func, accepts)
+    return accepts
+
+
+def _call_state_callback(game: "Game", name: str, method, player: "Player", action_id: str):
+    """Call is_enabled/is_hidden/get_sound, passing action_id if accepted."""
+    if _accepts_action_id(game, name, method):
+        return method(player, action_id=action_id)
+    return method(player)
+
+
 class Visibility(str, Enum):
     """Visibility state for actions."""
 
@@ -140,24 +165,18 @@ class ActionSet(DataClassJSONMixin):
         if action.is_enabled:
             method = getattr(game, action.is_enabled, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    disabled_reason = method(player, action_id=action.id)
-                else:
-                    disabled_reason = method(player)
+                disabled_reason = _call_state_callback(
+                    game, action.is_enabled, method, player, action.id
+                )
 
         # Resolve visibility
         visible = True
         if action.is_hidden:
             method = getattr(game, action.is_hidden, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    visibility = method(player, action_id=action.id)
-                else:
-                    visibility = method(player)
+                visibility = _call_state_callback(
+                    game, action.is_hidden, method, player, action.id
+                )
                 visible = visibility == Visibility.VISIBLE
 
         # Resolve label
@@ -172,12 +191,9 @@ class ActionSet(DataClassJSONMixin):
         if action.get_sound:
             method = getattr(game, action.get_sound, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    sound = method(player, action_id=action.id)
-                else:
-                    sound = method(player)
+                sound = _call_state_callback(
+                    game, action.get_sound, method, player, action.id
+                )
 
         return ResolvedAction(
             action=action,
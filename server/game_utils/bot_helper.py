@@ -8,6 +8,8 @@ This is a stateless helper that operates on serialized Player fields:
 
 from typing import TYPE_CHECKING, Callable
 
+from .bot_service import get_bot_service
+
 if TYPE_CHECKING:
     from ..games.base import Game, Player
 
@@ -72,6 +74,16 @@ class BotHelper:
         """Get the game-specific target for a bot."""
         return player.bot_target
 
+    @staticmethod
+    def think(game: "Game", player: "Player") -> str | None:
+        """
+        Ask what a bot should do, through the server's BotService.
+
+        The service times the think, and may run it on a worker process (see
+        ThinkJob), in which case None means the answer is not ready yet.
+        """
+        return get_bot_service().think(game, player)
+
     @staticmethod
     def process_bot_action(
         bot: "Player",
@@ -97,7 +109,7 @@ class BotHelper:
         Example usage:
             BotHelper.process_bot_action(
                 bot=player,
-                think_fn=lambda: self.bot_think(player),
+                think_fn=lambda: BotHelper.think(self, player),
                 execute_fn=lambda action_id: self.execute_action(player, action_id),
             )
         """
@@ -121,6 +133,25 @@ class BotHelper:
 
         return False
 
+    @staticmethod
+    def ticks_until_wake(game: "Game") -> int | None:
+        """Ticks until on_tick next acts for a bot, or None while no bot has the turn."""
+        if not game.game_active or game.status != "playing":
+            return None
+        current = game.current_player
+        if not current or not current.is_bot:
+            return None
+        return current.bot_think_ticks + 1
+
+    @staticmethod
+    def on_ticks_skipped(game: "Game", ticks: int) -> None:
+        """Count down a thinking bot over ticks on_tick wasn't called (see ticks_until_wake)."""
+        if not game.game_active or game.status != "playing":
+            return
+        current = game.current_player
+        if current and current.is_bot:
+            current.bot_think_ticks = max(0, current.bot_think_ticks - ticks)
+
     @staticmethod
     def on_tick(game: "Game", debug: bool = False) -> None:
         """
@@ -130,6 +161,7 @@ class BotHelper:
         """
         # Only process if game is active and playing
         if not game.game_active or game.status != "playing":
+            game.cancel_bot_thinks()
             return
 
         # Get current player - only they can act in turn-based games
@@ -139,7 +171,11 @@ class BotHelper:
                 f"[BotHelper] current={current.name if current else None}, is_bot={current.is_bot if current else None}, turn_index={game.turn_index}"
             )
         if not current or not current.is_bot:
+            game.cancel_bot_thinks()
             return
+        # Thinks for bots whose turn has passed will never be asked for again
+        if any(player_id != current.id for player_id in game._bot_thinks):
+            game.cancel_bot_thinks(current.id)
 
         # Count down thinking time
         if current.bot_think_ticks > 0:
@@ -155,6 +191,6 @@ class BotHelper:
 
         # Ask game what this bot should do
         if hasattr(game, "bot_think"):
-            action_id = game.bot_think(current)
+            action_id = BotHelper.think(game, current)
             if action_id:
                 current.bot_pending_action = action_id
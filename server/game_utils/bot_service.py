@@ -0,0 +1,285 @@
+"""Deadline-bounded bot thinking, with pure decisions offloaded to worker processes."""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+from .profiling import BOT_THINK, get_profiler
+
+if TYPE_CHECKING:
+    from ..games.base import Game, Player
+
+
+# Worker processes for offloaded bot decisions (0 = every think runs inline)
+DEFAULT_BOT_WORKERS = 0
+
+# Inline thinks slower than this are counted as over budget
+DEFAULT_THINK_BUDGET_MS = 10.0
+
+# How long an offloaded think may run before the bot falls back
+DEFAULT_THINK_DEADLINE_MS = 1000.0
+
+
+@dataclass(frozen=True)
+class ThinkJob:
+    """
+    A bot decision that can run off the tick thread.
+
+    fn must be a module-level function and args a picklable snapshot of the
+    state it reads, so the job can run in a worker process. Equal args mean
+    the same decision: a pending job whose args no longer match the game is
+    dropped and submitted again.
+    """
+
+    fn: Callable[..., str | None]
+    args: tuple
+    fallback: str | None = None  # Cheap action if the deadline passes (None: run fn inline)
+    # Computes the cheap action from args instead, only once it is needed
+    fallback_fn: Callable[..., str | None] | None = None
+
+    def run(self) -> str | None:
+        """Make the decision in this process."""
+        return self.fn(*self.args)
+
+
+@dataclass
+class PendingThink:
+    """An offloaded think waiting for its result (runtime-only, per player)."""
+
+    job: ThinkJob
+    future: Future
+    submitted: float  # time.monotonic()
+    deadline: float
+
+
+@dataclass(slots=True)
+class ThinkStats:
+    """Think timings for one game type."""
+
+    thinks: int = 0  # Decisions handed to bots
+    inline_s: float = 0.0  # Time spent thinking on the tick thread
+    max_inline_s: float = 0.0
+    over_budget: int = 0  # Inline thinks slower than the budget
+    offloaded: int = 0  # Jobs submitted to workers
+    completed: int = 0  # Jobs answered before their deadline
+    offload_s: float = 0.0  # Submit-to-answer time of completed jobs
+    max_offload_s: float = 0.0
+    timeouts: int = 0  # Jobs that missed their deadline
+    stale: int = 0  # Jobs dropped because the game moved on
+    errors: int = 0  # Jobs that raised or could not be submitted
+
+    def record_inline(self, elapsed: float, budget_s: float) -> None:
+        self.inline_s += elapsed
+        if elapsed > self.max_inline_s:
+            self.max_inline_s = elapsed
+        if elapsed > budget_s:
+            self.over_budget += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "thinks": self.thinks,
+            "inline_ms": self.inline_s * 1000.0,
+            "max_inline_ms": self.max_inline_s * 1000.0,
+            "over_budget": self.over_budget,
+            "offloaded": self.offloaded,
+            "completed": self.completed,
+            "average_offload_ms": (
+                self.offload_s * 1000.0 / self.completed if self.completed else 0.0
+            ),
+            "max_offload_ms": self.max_offload_s * 1000.0,
+            "timeouts": self.timeouts,
+            "stale": self.stale,
+            "errors": self.errors,
+        }
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+class BotService:
+    """
+    Runs bot thinks within a time budget.
+
+    Games that can describe a decision as a ThinkJob (a pure function over a
+    snapshot of their state) have it run on a pool of worker processes. The
+    bot asks again every tick: the first ask submits the job, and later asks
+    return its answer once it is ready. A job that misses its deadline is
+    abandoned and the bot takes the job's fallback instead. Every other think
+    runs inline and is timed against the budget. With no workers, everything
+    runs inline, which keeps simulations and tests deterministic.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_BOT_WORKERS,
+        budget_ms: float = DEFAULT_THINK_BUDGET_MS,
+        deadline_ms: float = DEFAULT_THINK_DEADLINE_MS,
+    ):
+        self.workers = max(0, workers)
+        self.budget_s = budget_ms / 1000.0
+        self.deadline_s = deadline_ms / 1000.0
+        self._executor: ProcessPoolExecutor | None = None
+        self._stats: dict[str, ThinkStats] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether worker processes have been started."""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Spawn the worker processes (no-op without workers)."""
+        if self._executor or not self.workers:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Don't fork the server: it runs threads and an event loop
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        for _ in range(self.workers):
+            self._executor.submit(_warm_up)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, abandoning pending jobs."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _stats_for(self, game_type: str) -> ThinkStats:
+        stats = self._stats.get(game_type)
+        if stats is None:
+            stats = self._stats[game_type] = ThinkStats()
+        return stats
+
+    def think(self, game: "Game", player: "Player") -> str | None:
+        """
+        Decide what a bot does, or None if it has nothing to do yet.
+
+        A None from an offloaded think means the answer is still pending; the
+        bot asks again on its next tick.
+        """
+        game_type = game.get_type()
+        stats = self._stats_for(game_type)
+        make_job = getattr(game, "bot_think_job", None)
+        if self._executor and make_job:
+            job = make_job(player)
+            if job is not None:
+                return self._think_offloaded(game, player, job, stats)
+
+        started = time.perf_counter()
+        with get_profiler().measure(BOT_THINK, game_type):
+            action_id = game.bot_think(player)
+        stats.record_inline(time.perf_counter() - started, self.budget_s)
+        if action_id:
+            stats.thinks += 1
+        return action_id
+
+    def _think_offloaded(
+        self, game: "Game", player: "Player", job: ThinkJob, stats: ThinkStats
+    ) -> str | None:
+        now = time.monotonic()
+        pending = game._bot_thinks.get(player.id)
+        if pending and pending.job.args != job.args:
+            pending.future.cancel()
+            stats.stale += 1
+            pending = None
+
+        if pending is None:
+            future = self._submit(job)
+            if future is None:
+                stats.errors += 1
+                return self._fall_back(job, stats)
+            game._bot_thinks[player.id] = PendingThink(job, future, now, now + self.deadline_s)
+            stats.offloaded += 1
+            return None
+
+        if pending.future.done():
+            del game._bot_thinks[player.id]
+            try:
+                action_id = pending.future.result()
+            except Exception as e:
+                print(f"Offloaded bot think failed for {game.get_type()}: {e}")
+                stats.errors += 1
+                return self._fall_back(job, stats)
+            elapsed = now - pending.submitted
+            stats.completed += 1
+            stats.offload_s += elapsed
+            if elapsed > stats.max_offload_s:
+                stats.max_offload_s = elapsed
+            if action_id:
+                stats.thinks += 1
+            return action_id
+
+        if now >= pending.deadline:
+            del game._bot_thinks[player.id]
+            pending.future.cancel()
+            stats.timeouts += 1
+            return self._fall_back(job, stats)
+
+        return None
+
+    def _fall_back(self, job: ThinkJob, stats: ThinkStats) -> str | None:
+        """The job's cheap fallback, or the job itself run inline if it has none."""
+        action_id = job.fallback
+        if action_id is None:
+            started = time.perf_counter()
+            action_id = job.fallback_fn(*job.args) if job.fallback_fn else job.run()
+            stats.record_inline(time.perf_counter() - started, self.budget_s)
+        if action_id:
+            stats.thinks += 1
+        return action_id
+
+    def _submit(self, job: ThinkJob) -> Future | None:
+        try:
+            try:
+                return self._executor.submit(job.fn, *job.args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); replace the pool
+                self._executor = None
+                self.start()
+                return self._executor.submit(job.fn, *job.args)
+        except Exception as e:
+            print(f"Could not offload bot think: {e}")
+            return None
+
+    def get_stats(self) -> dict:
+        """Per-game think statistics, plus the service settings."""
+        return {
+            "workers": self.workers,
+            "budget_ms": self.budget_s * 1000.0,
+            "deadline_ms": self.deadline_s * 1000.0,
+            "games": {
+                game_type: stats.to_dict() for game_type, stats in sorted(self._stats.items())
+            },
+        }
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+
+_service: BotService | None = None
+
+
+def get_bot_service() -> BotService:
+    """Return the server-wide bot service, creating it if needed."""
+    global _service
+    if _service is None:
+        _service = BotService()
+    return _service
+
+
+def configure_bot_service(
+    workers: int,
+    budget_ms: float = DEFAULT_THINK_BUDGET_MS,
+    deadline_ms: float = DEFAULT_THINK_DEADLINE_MS,
+) -> BotService:
+    """Replace the server-wide service with one of the given settings."""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+    _service = BotService(workers, budget_ms, deadline_ms)
+    return _service
@@ -1,22 +1,24 @@
 """Mixin providing game duration estimation via simulation."""
 
-import subprocess
-import sys
-import json as json_module
-import threading
-from pathlib import Path
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
+from .estimate_pool import get_estimate_pool
+
 if TYPE_CHECKING:
     from ..games.base import Player
     from ..users.base import User
 
 
 class DurationEstimateMixin:
-    """Mixin providing game duration estimation by running CLI simulations.
+    """Mixin providing game duration estimation by running bot simulations.
+
+    Simulations run on the server-wide EstimatePool; finished estimates are
+    cached there by game type, options and player count.
 
     Expects on the Game class:
-        - self._estimate_threads: list
+        - self._estimate_jobs: list[Future]
+        - self._estimate_key: EstimateKey | None
         - self._estimate_results: list
         - self._estimate_errors: list
         - self._estimate_running: bool
@@ -35,93 +37,93 @@ class DurationEstimateMixin:
     TICKS_PER_SECOND = 20  # 50ms per tick (may be overridden by GameSoundMixin)
 
     def _action_estimate_duration(self, player: "Player", action_id: str) -> None:
-        """Start duration estimation by spawning CLI simulation threads."""
+        """Start duration estimation on the shared simulation pool."""
         if self._estimate_running:
             user = self.get_user(player)
             if user:
                 user.speak_l("estimate-already-running")
             return
 
-        # Build the options string for CLI
-        options_args = []
+        # Options as strings, the way the CLI simulator accepts them
+        options: dict[str, str] = {}
         if hasattr(self, "options"):
             for field_name in self.options.__dataclass_fields__:
-                value = getattr(self.options, field_name)
-                options_args.extend(["-o", f"{field_name}={value}"])
+                options[field_name] = str(getattr(self.options, field_name))
 
         # Determine number of bots (use current player count, minimum 2)
         num_bots = max(len([p for p in self.players if not p.is_spectator]), self.get_min_players())
 
-        # Build CLI command
-        cli_path = Path(__file__).parent.parent / "cli.py"
-        base_cmd = [
-            sys.executable, str(cli_path), "simulate",
-            self.get_type(),
-            "--bots", str(num_bots),
-            "--json", "--quiet"
-        ] + options_args
+        pool = get_estimate_pool()
+        key = pool.make_key(self.get_type(), num_bots, options)
+        cached = pool.get_cached(key)
+        if cached:
+            self._announce_estimate(cached, [])
+            return
 
         # Reset results
         self._estimate_results = []
         self._estimate_errors = []
-        self._estimate_threads = []
-
-        # Spawn simulation threads
-        def run_simulation():
-            try:
-                result = subprocess.run(
-                    base_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 minute timeout per simulation
-                )
-                if result.returncode == 0 and result.stdout:
-                    data = json_module.loads(result.stdout)
-                    if "ticks" in data and not data.get("timed_out", False):
-                        with self._estimate_lock:
-                            self._estimate_results.append(data["ticks"])
-                elif result.stderr:
-                    with self._estimate_lock:
-                        self._estimate_errors.append(result.stderr.strip()[:200])
-            except Exception as e:
-                with self._estimate_lock:
-                    self._estimate_errors.append(str(e)[:200])
-
-        for _ in range(self.NUM_ESTIMATE_SIMULATIONS):
-            thread = threading.Thread(target=run_simulation, daemon=True)
-            thread.start()
-            self._estimate_threads.append(thread)
-
-        if self._estimate_threads:
+        self._estimate_key = key
+
+        try:
+            self._estimate_jobs = pool.submit(
+                self.get_type(), num_bots, options,
+                self.NUM_ESTIMATE_SIMULATIONS, self._on_estimate_job_done,
+            )
+        except Exception as e:
+            print(f"Could not start duration estimate: {e}")
+            self._estimate_jobs = []
+
+        if self._estimate_jobs:
             self._estimate_running = True
             self.broadcast_l("estimate-computing")
         else:
             self.broadcast_l("estimate-error")
 
+    def _on_estimate_job_done(self, future: Future) -> None:
+        """Collect one simulation result (runs on a pool thread)."""
+        try:
+            ticks = future.result()
+        except Exception as e:
+            with self._estimate_lock:
+                self._estimate_errors.append(str(e)[:200])
+            return
+        if ticks is not None:
+            with self._estimate_lock:
+                self._estimate_results.append(ticks)
+
     def check_estimate_completion(self) -> None:
         """Check if duration estimation simulations have completed.
 
         Called automatically from on_tick().
         """
-        if not self._estimate_running or not self._estimate_threads:
+        if not self._estimate_running or not self._estimate_jobs:
             return
 
-        # Check if all threads have completed
-        all_done = all(not t.is_alive() for t in self._estimate_threads)
+        # Check if all simulations have completed
+        all_done = all(job.done() for job in self._estimate_jobs)
         if not all_done:
             return
 
-        # Get results (already collected by threads)
+        # Get results (already collected by the done callbacks)
         with self._estimate_lock:
             tick_counts = list(self._estimate_results)
             errors = list(self._estimate_errors)
 
+        if tick_counts and self._estimate_key is not None:
+            get_estimate_pool().store(self._estimate_key, tick_counts)
+
         # Clean up
-        self._estimate_threads = []
+        self._estimate_jobs = []
+        self._estimate_key = None
         self._estimate_results = []
         self._estimate_errors = []
         self._estimate_running = False
 
+        self._announce_estimate(tick_counts, errors)
+
+    def _announce_estimate(self, tick_counts: list[int], errors: list[str]) -> None:
+        """Broadcast the estimate for a set of simulated tick counts."""
         # Calculate and announce result
         if tick_counts:
             # Calculate statistics
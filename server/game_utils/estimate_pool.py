@@ -0,0 +1,153 @@
+"""Shared process pool for game duration estimation."""
+
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+
+# Default number of simulation worker processes (server-wide)
+DEFAULT_ESTIMATE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Number of finished estimates kept, keyed by game type, options and players
+ESTIMATE_CACHE_SIZE = 256
+
+# (game type, sorted option strings, number of bots)
+EstimateKey = tuple[str, tuple[tuple[str, str], ...], int]
+
+
+def _init_worker() -> None:
+    """Pre-warm a worker: load locales and import every game once."""
+    # Importing the CLI initializes localization and the game registry
+    from ..cli import GameRegistry, Localization
+
+    Localization.preload_bundles()
+    GameRegistry.get_all()
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def run_simulation(game_type: str, num_bots: int, options: dict[str, str]) -> int | None:
+    """
+    Play one bot-only game in this process.
+
+    Returns the number of ticks the game took, or None if it timed out.
+    """
+    from ..cli import BOT_NAMES, GameSimulator
+
+    bot_names = BOT_NAMES[:num_bots]
+    simulator = GameSimulator(game_type, bot_names, options, json_mode=True, quiet=True)
+    if not simulator.setup():
+        raise ValueError(f"Could not set up simulation of {game_type} with {num_bots} bots")
+    result = simulator.run()
+    if result.get("timed_out"):
+        return None
+    return result["ticks"]
+
+
+class EstimatePool:
+    """
+    Runs duration simulations on a pool of long-lived worker processes.
+
+    Workers are spawned once and pre-warmed (locales compiled, games
+    imported), so an estimate only pays for the simulations themselves. The
+    pool size caps how many simulations run at once across all tables, and
+    finished estimates are cached so repeated requests answer immediately.
+    """
+
+    def __init__(self, workers: int = DEFAULT_ESTIMATE_WORKERS):
+        self.workers = max(1, workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._cache: OrderedDict[EstimateKey, list[int]] = OrderedDict()
+
+    @property
+    def running(self) -> bool:
+        """Whether worker processes have been started."""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Spawn the worker processes and warm them up."""
+        if self._executor:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Don't fork the server: it runs threads and an event loop
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        for _ in range(self.workers):
+            self._executor.submit(_warm_up)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, abandoning queued simulations."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def make_key(game_type: str, num_bots: int, options: dict[str, str]) -> EstimateKey:
+        return (game_type, tuple(sorted(options.items())), num_bots)
+
+    def get_cached(self, key: EstimateKey) -> list[int] | None:
+        """Return cached tick counts for an estimate, if any."""
+        ticks = self._cache.get(key)
+        if ticks is not None:
+            self._cache.move_to_end(key)
+        return ticks
+
+    def store(self, key: EstimateKey, ticks: list[int]) -> None:
+        """Cache the tick counts of a finished estimate."""
+        self._cache[key] = list(ticks)
+        self._cache.move_to_end(key)
+        while len(self._cache) > ESTIMATE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def submit(
+        self,
+        game_type: str,
+        num_bots: int,
+        options: dict[str, str],
+        count: int,
+        on_done: Callable[[Future], None],
+    ) -> list[Future]:
+        """
+        Queue count simulations. on_done is called (on a pool thread) as
+        each one finishes, so results stream back in completion order.
+        """
+        self.start()
+        futures = []
+        for _ in range(count):
+            try:
+                future = self._executor.submit(run_simulation, game_type, num_bots, options)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); replace the pool
+                self._executor = None
+                self.start()
+                future = self._executor.submit(run_simulation, game_type, num_bots, options)
+            future.add_done_callback(on_done)
+            futures.append(future)
+        return futures
+
+
+_pool: EstimatePool | None = None
+
+
+def get_estimate_pool() -> EstimatePool:
+    """Return the server-wide estimate pool, creating it if needed."""
+    global _pool
+    if _pool is None:
+        _pool = EstimatePool()
+    return _pool
+
+
+def configure_estimate_pool(workers: int) -> EstimatePool:
+    """Replace the server-wide pool with one of the given size."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = EstimatePool(workers)
+    return _pool
@@ -21,21 +21,25 @@ class EventHandlingMixin:
         - self.get_all_visible_actions(player) -> list[ResolvedAction]
         - self.rebuild_player_menu(player)
         - self.rebuild_all_menus()
+        - self.menu_batch() / self.flush_menus()
         - self._is_player_spectator(player) -> bool
+        - self.wake()
     """
 
     def handle_event(self, player: "Player", event: dict) -> None:
         """Handle an event from a player."""
+        self.wake()
         event_type = event.get("type")
 
-        if event_type == "menu":
-            self._handle_menu_event(player, event)
+        with self.menu_batch():
+            if event_type == "menu":
+                self._handle_menu_event(player, event)
 
-        elif event_type == "editbox":
-            self._handle_editbox_event(player, event)
+            elif event_type == "editbox":
+                self._handle_editbox_event(player, event)
 
-        elif event_type == "keybind":
-            self._handle_keybind_event(player, event)
+            elif event_type == "keybind":
+                self._handle_keybind_event(player, event)
 
     def _handle_menu_event(self, player: "Player", event: dict) -> None:
         """Handle a menu selection event."""
@@ -75,6 +79,7 @@ class EventHandlingMixin:
         elif menu_id == "status_box":
             user = self.get_user(player)
             if user:
+                self.flush_menus()
                 user.remove_menu("status_box")
                 user.speak_l("status-box-closed")
                 self._status_box_open.discard(player.id)
@@ -100,6 +105,7 @@ class EventHandlingMixin:
         elif menu_id == "leave_game_confirm":
             user = self.get_user(player)
             if user:
+                self.flush_menus()
                 user.remove_menu("leave_game_confirm")
             if player.id in self._pending_actions:
                 self._pending_actions.pop(player.id, None)
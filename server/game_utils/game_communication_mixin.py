@@ -36,12 +36,27 @@ class GameCommunicationMixin:
         **kwargs,
     ) -> None:
         """Send a localized message to all players (each in their own locale)."""
-        for player in self.players:
-            if player is exclude:
-                continue
+        self._speak_to_players(
+            [player for player in self.players if player is not exclude],
+            message_id,
+            buffer,
+            kwargs,
+        )
+
+    def _speak_to_players(
+        self, players: "list[Player]", message_id: str, buffer: str, kwargs: dict
+    ) -> None:
+        """Render a message once per locale and send it to each player's user."""
+        texts: dict[str, str] = {}
+        for player in players:
             user = self.get_user(player)
-            if user:
-                user.speak_l(message_id, buffer, **kwargs)
+            if not user:
+                continue
+            locale = user.locale
+            text = texts.get(locale)
+            if text is None:
+                text = texts[locale] = Localization.get(locale, message_id, **kwargs)
+            user.speak(text, buffer)
 
     def broadcast_personal_l(
         self,
@@ -68,12 +83,12 @@ class GameCommunicationMixin:
         if user:
             user.speak_l(personal_message_id, buffer, **kwargs)
 
-        for p in self.players:
-            if p is player:
-                continue
-            u = self.get_user(p)
-            if u:
-                u.speak_l(others_message_id, buffer, player=player.name, **kwargs)
+        self._speak_to_players(
+            [p for p in self.players if p is not player],
+            others_message_id,
+            buffer,
+            {"player": player.name, **kwargs},
+        )
 
     def label_l(self, message_id: str) -> Callable[["Game", "Player"], str]:
         """
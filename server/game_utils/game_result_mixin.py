@@ -7,7 +7,6 @@ if TYPE_CHECKING:
     from ..users.base import User
 
 from .game_result import GameResult, PlayerResult
-from .stats_helpers import RatingHelper
 from ..messages.localization import Localization
 from ..users.base import MenuItem
 
@@ -25,6 +24,7 @@ class GameResultMixin:
         - self.get_type() -> str
         - self.get_active_players() -> list[Player]
         - self.destroy()
+        - self.cancel_bot_thinks()
     """
 
     def finish_game(self, show_end_screen: bool = True) -> None:
@@ -39,6 +39,7 @@ class GameResultMixin:
         """
         self.game_active = False
         self.status = "finished"
+        self.cancel_bot_thinks()
 
         # Build and persist the game result
         result = self.build_game_result()
@@ -112,16 +113,14 @@ class GameResultMixin:
         if not self._table or not self._table._db:
             return
 
-        rating_helper = RatingHelper(self._table._db, self.get_type())
-
         # Get rankings from the result
         rankings = self.get_rankings_for_rating(result)
         if not rankings or len(rankings) < 2:
             # Need at least 2 teams/players to update ratings
             return
 
-        # Update ratings
-        rating_helper.update_ratings(rankings)
+        # Update ratings (the server queues this off the tick)
+        self._table.update_ratings(self.get_type(), rankings)
 
     def get_rankings_for_rating(self, result: GameResult) -> list[list[str]]:
         """Get player rankings for rating update. Override for custom ranking logic.
@@ -171,6 +170,7 @@ class GameResultMixin:
                     text=Localization.get(user.locale, "game-leave"),
                     id="leave_game"
                 ))
+                self.flush_menus()
                 user.show_menu("game_over", items, multiletter=False)
 
     def show_game_end_menu(self, score_lines: list[str]) -> None:
@@ -187,4 +187,5 @@ class GameResultMixin:
             user = self.get_user(player)
             if user:
                 items = [MenuItem(text=line, id="score_line") for line in score_lines]
+                self.flush_menus()
                 user.show_menu("game_over", items, multiletter=False)
@@ -81,6 +81,17 @@ class GameSoundMixin:
         self.scheduled_sounds = remaining
         self.sound_scheduler_tick += 1
 
+    def ticks_until_next_sound(self) -> int | None:
+        """Ticks until process_scheduled_sounds next plays a sound (None if none are scheduled)."""
+        if not self.scheduled_sounds:
+            return None
+        first = min(scheduled[0] for scheduled in self.scheduled_sounds)
+        return max(1, first - self.sound_scheduler_tick + 1)
+
+    def skip_sound_ticks(self, ticks: int) -> None:
+        """Advance the sound clock over ticks process_scheduled_sounds wasn't called."""
+        self.sound_scheduler_tick += ticks
+
     # ==========================================================================
     # Sound Playback
     # ==========================================================================
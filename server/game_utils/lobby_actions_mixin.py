@@ -31,6 +31,7 @@ class LobbyActionsMixin:
         - self._table: Any
         - self._users: dict
         - self._destroyed: bool
+        - self.cancel_bot_thinks()
         - self._actions_menu_open: set[str]
         - self.player_action_sets: dict
         - self.get_user(player) -> User | None
@@ -40,6 +41,7 @@ class LobbyActionsMixin:
         - self.get_all_enabled_actions()
         - self._get_keybind_for_action()
         - self.setup_keybinds(), self.setup_player_actions()
+        - self.wake()
     """
 
     def _action_start_game(self, player: "Player", action_id: str) -> None:
@@ -137,6 +139,7 @@ class LobbyActionsMixin:
             return
         self._pending_actions[player.id] = "leave_game_confirm"
         user.speak_l("confirm-leave-game")
+        self.flush_menus()
         items = [
             MenuItem(text=Localization.get(user.locale, "confirm-no"), id="no"),
             MenuItem(text=Localization.get(user.locale, "confirm-yes"), id="yes"),
@@ -150,6 +153,7 @@ class LobbyActionsMixin:
 
     def _perform_leave_game(self, player: "Player") -> None:
         """Leave the game."""
+        self.wake()
         # Spectators can always leave cleanly (no bot replacement)
         if player.is_spectator:
             self.players = [p for p in self.players if p.id != player.id]
@@ -229,6 +233,7 @@ class LobbyActionsMixin:
             )
             self._actions_menu_open.add(player.id)
             user.speak_l("context-menu")
+            self.flush_menus()
             user.show_menu(
                 "actions_menu",
                 items,
@@ -248,6 +253,7 @@ class LobbyActionsMixin:
     def destroy(self) -> None:
         """Request destruction of this game/table."""
         self._destroyed = True
+        self.cancel_bot_thinks()
         if self._table:
             self._table.destroy()
 
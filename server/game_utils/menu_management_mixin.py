@@ -1,6 +1,8 @@
 """Mixin providing menu management functionality for games."""
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from ..games.base import Player
@@ -8,22 +10,95 @@ if TYPE_CHECKING:
     from .actions import ResolvedAction
 
 from ..users.base import MenuItem, EscapeBehavior
+from .profiling import MENU, get_profiler
+
+
+@dataclass
+class DirtyMenu:
+    """A turn menu waiting to be sent at the end of a menu batch."""
+
+    rebuild: bool  # Send a full show_menu rather than an update
+    selection_id: str | None = None  # Item to focus, from update_player_menu
 
 
 class MenuManagementMixin:
     """Mixin providing menu rebuilding and status box functionality.
 
+    Inside a menu_batch() (a tick, an incoming event or an action), rebuild
+    and update requests only mark the player's turn menu dirty; each dirty
+    menu is resolved and sent once when the outermost batch ends, or earlier
+    if another menu or editbox is about to be shown (see flush_menus()).
+    Spectators can't act, so every spectator sees the same turn menu: a
+    flush resolves it once per locale and sends that to all of them.
+
     Expects on the Game class:
         - self._destroyed: bool
         - self.status: str
         - self.players: list[Player]
         - self._status_box_open: set[str]
+        - self._menu_batch_depth: int
+        - self._dirty_menus: dict[str, DirtyMenu]
+        - self._menu_stats: dict[str, int]
         - self.get_user(player) -> User | None
+        - self.get_player_by_id(player_id) -> Player | None
         - self.get_all_visible_actions(player) -> list[ResolvedAction]
     """
 
-    def rebuild_player_menu(self, player: "Player") -> None:
-        """Rebuild the turn menu for a player."""
+    @contextmanager
+    def menu_batch(self) -> Iterator[None]:
+        """Coalesce menu rebuilds until the outermost batch ends."""
+        self._menu_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._menu_batch_depth -= 1
+            if self._menu_batch_depth == 0:
+                self.flush_menus()
+
+    def flush_menus(self) -> None:
+        """Send all dirty turn menus now, each resolved once."""
+        while self._dirty_menus:
+            dirty_menus = self._dirty_menus
+            self._dirty_menus = {}
+            # (locale, is host) -> items; the host's lobby menu has the options
+            spectator_items: dict[tuple[str, bool], list[MenuItem]] = {}
+            for player_id, dirty in dirty_menus.items():
+                player = self.get_player_by_id(player_id)
+                if player:
+                    self._send_turn_menu(player, dirty, spectator_items)
+
+    def get_menu_stats(self) -> dict[str, int]:
+        """Counters for turn menu requests, builds, coalesced requests and spectator menus shared."""
+        return dict(self._menu_stats)
+
+    def _mark_menu_dirty(
+        self, player: "Player", rebuild: bool, selection_id: str | None
+    ) -> None:
+        dirty = self._dirty_menus.get(player.id)
+        if dirty is None:
+            self._dirty_menus[player.id] = DirtyMenu(rebuild, selection_id)
+            return
+        self._menu_stats["coalesced"] += 1
+        if rebuild:
+            # A later rebuild resets focus, dropping any earlier update's selection
+            dirty.rebuild = True
+            dirty.selection_id = None
+        elif selection_id is not None:
+            dirty.selection_id = selection_id
+
+    def _send_turn_menu(
+        self,
+        player: "Player",
+        dirty: "DirtyMenu",
+        spectator_items: dict[tuple[str, bool], list[MenuItem]] | None = None,
+    ) -> None:
+        """
+        Resolve a player's turn menu and send it as a rebuild and/or update.
+
+        Spectator menus resolved earlier in the same flush are reused from
+        spectator_items (by locale, and whether the spectator is the host)
+        instead of being resolved again.
+        """
         if self._destroyed:
             return  # Don't rebuild menus after game is destroyed
         if self.status == "finished":
@@ -32,16 +107,48 @@ class MenuManagementMixin:
         if not user:
             return
 
-        items: list[MenuItem] = []
-        for resolved in self.get_all_visible_actions(player):
-            items.append(MenuItem(text=resolved.label, id=resolved.action.id, sound=resolved.sound))
+        shared = spectator_items is not None and player.is_spectator
+        share_key = (user.locale, player.name == self.host)
+        items = spectator_items.get(share_key) if shared else None
+        if items is not None:
+            self._menu_stats["shared"] += 1
+            items = list(items)
+        else:
+            items = self._build_turn_menu(player)
+            if shared:
+                spectator_items[share_key] = list(items)
+
+        if dirty.rebuild:
+            user.show_menu(
+                "turn_menu",
+                items,
+                multiletter=False,
+                escape_behavior=EscapeBehavior.KEYBIND,
+            )
+            if dirty.selection_id is None:
+                return
+        user.update_menu("turn_menu", items, selection_id=dirty.selection_id)
+
+    def _build_turn_menu(self, player: "Player") -> list[MenuItem]:
+        """Resolve a player's visible actions into turn menu items."""
+        self._menu_stats["built"] += 1
+        with get_profiler().measure(MENU, self.get_type(), "turn_menu"):
+            items: list[MenuItem] = []
+            for resolved in self.get_all_visible_actions(player):
+                items.append(
+                    MenuItem(text=resolved.label, id=resolved.action.id, sound=resolved.sound)
+                )
+        return items
 
-        user.show_menu(
-            "turn_menu",
-            items,
-            multiletter=False,
-            escape_behavior=EscapeBehavior.KEYBIND,
-        )
+    def rebuild_player_menu(self, player: "Player") -> None:
+        """Rebuild the turn menu for a player."""
+        if self._destroyed:
+            return  # Don't rebuild menus after game is destroyed
+        self._menu_stats["requested"] += 1
+        if self._menu_batch_depth:
+            self._mark_menu_dirty(player, True, None)
+            return
+        self._send_turn_menu(player, DirtyMenu(True, None))
 
     def rebuild_all_menus(self) -> None:
         """Rebuild menus for all players."""
@@ -56,17 +163,11 @@ class MenuManagementMixin:
         """Update the turn menu for a player, preserving focus position."""
         if self._destroyed:
             return
-        if self.status == "finished":
-            return
-        user = self.get_user(player)
-        if not user:
+        self._menu_stats["requested"] += 1
+        if self._menu_batch_depth:
+            self._mark_menu_dirty(player, False, selection_id)
             return
-
-        items: list[MenuItem] = []
-        for resolved in self.get_all_visible_actions(player):
-            items.append(MenuItem(text=resolved.label, id=resolved.action.id, sound=resolved.sound))
-
-        user.update_menu("turn_menu", items, selection_id=selection_id)
+        self._send_turn_menu(player, DirtyMenu(False, selection_id))
 
     def update_all_menus(self) -> None:
         """Update menus for all players, preserving focus position."""
@@ -83,6 +184,7 @@ class MenuManagementMixin:
         """
         user = self.get_user(player)
         if user:
+            self.flush_menus()
             items = [MenuItem(text=line, id="status_line") for line in lines]
             user.show_menu(
                 "status_box",
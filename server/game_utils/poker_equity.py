@@ -0,0 +1,229 @@
+"""
+Monte Carlo hand equity for poker bots.
+
+Deals random run-outs of the unknown cards (rest of the board, opponents'
+hands, and any cards still to be drawn) and scores every hand with the
+poker_evaluator lookup tables. Sampling stops at a sample limit or a time
+budget, whichever comes first, so a bot decision has a bounded cost.
+Results are cached by the known cards and opponent count.
+
+Run-outs are drawn from a random source of this module's own (see seed),
+never the global random module. How many samples fit in the time budget
+depends on the machine, so drawing them from the global stream would
+change every later shuffle and roll of a seeded game.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import OrderedDict
+from typing import Iterable
+
+from .cards import Card
+from .poker_evaluator import _RANK_PRIMES, _get_tables
+
+# Default samples and time budget for one estimate
+DEFAULT_SAMPLES = 1500
+DEFAULT_TIME_BUDGET_S = 0.02
+
+# Check the clock every this many samples
+_CLOCK_INTERVAL = 64
+
+# Number of cached estimates
+EQUITY_CACHE_SIZE = 4096
+
+# A card as (prime of its rank, suit, rank bit); see poker_evaluator._lookup
+_Code = tuple[int, int, int]
+
+_FULL_DECK: tuple[_Code, ...] = tuple(
+    (_RANK_PRIMES[rank], suit, 1 << rank) for suit in range(1, 5) for rank in range(2, 15)
+)
+
+_cache: OrderedDict[tuple, float] = OrderedDict()
+
+# Random source for run-outs (kept apart from the games' random stream)
+_rng = random.Random()
+
+# Whether estimates stop at their time budget (off for reproducible runs)
+_use_time_budget = True
+
+
+def _code(card: Card) -> _Code:
+    rank = 14 if card.rank == 1 else card.rank
+    return (_RANK_PRIMES[rank], card.suit, 1 << rank)
+
+
+def _score(codes: Iterable[_Code], flush_table: dict, rank_table: dict) -> tuple:
+    """Score 5-7 distinct standard cards (same result as best_hand)."""
+    product = 1
+    suit_counts = [0, 0, 0, 0, 0]
+    suit_masks = [0, 0, 0, 0, 0]
+    for prime, suit, bit in codes:
+        product *= prime
+        suit_counts[suit] += 1
+        suit_masks[suit] |= bit
+    for suit in (1, 2, 3, 4):
+        if suit_counts[suit] >= 5:
+            return flush_table[suit_masks[suit]]
+    return rank_table[product]
+
+
+def _is_standard(cards: Iterable[Card]) -> bool:
+    return all(1 <= card.rank <= 13 and 1 <= card.suit <= 4 for card in cards)
+
+
+def estimate_equity(
+    hand: list[Card],
+    board: list[Card] | None = None,
+    opponents: int = 1,
+    *,
+    hand_size: int | None = None,
+    board_size: int = 5,
+    dead: list[Card] | None = None,
+    samples: int = DEFAULT_SAMPLES,
+    time_budget_s: float | None = DEFAULT_TIME_BUDGET_S,
+    rng: random.Random | None = None,
+) -> float:
+    """
+    Estimate the share of the pot a hand wins against random opponent hands.
+
+    Ties count as a split (1/k of the pot for a k-way tie).
+
+    Args:
+        hand: The player's known cards.
+        board: Community cards dealt so far (Hold'em); None for draw games.
+        opponents: Number of opponents still in the hand.
+        hand_size: Cards each player holds at showdown. Defaults to 2 with a
+            board and 5 without; the player's missing cards are drawn randomly.
+        board_size: Community cards at showdown (ignored without a board).
+        dead: Other cards known to be out of play.
+        samples: Maximum number of run-outs.
+        time_budget_s: Stop sampling after this long (None for no limit).
+        rng: Random source, for reproducible estimates (default: this
+            module's own, see seed).
+
+    Returns:
+        Equity between 0 and 1, or 0.0 if there are no cards to evaluate.
+    """
+    has_board = board is not None
+    board = board or []
+    dead = dead or []
+    if hand_size is None:
+        hand_size = 2 if has_board else 5
+    if opponents <= 0:
+        return 1.0
+    known = hand + board + dead
+    if not _is_standard(known):
+        return 0.0
+
+    showdown_board = board_size if has_board else 0
+    key = (
+        tuple(sorted((card.rank, card.suit) for card in hand)),
+        tuple(sorted((card.rank, card.suit) for card in board)),
+        tuple(sorted((card.rank, card.suit) for card in dead)),
+        opponents,
+        hand_size,
+        showdown_board,
+    )
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+        return cached
+
+    equity = _simulate(
+        [_code(card) for card in hand],
+        [_code(card) for card in board],
+        {_code(card) for card in known},
+        opponents,
+        hand_size,
+        showdown_board,
+        samples,
+        time_budget_s if _use_time_budget else None,
+        rng or _rng,
+    )
+    _cache[key] = equity
+    while len(_cache) > EQUITY_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return equity
+
+
+def _simulate(
+    hand: list[_Code],
+    board: list[_Code],
+    known: set[_Code],
+    opponents: int,
+    hand_size: int,
+    board_size: int,
+    samples: int,
+    time_budget_s: float | None,
+    rng: random.Random,
+) -> float:
+    flush_table, rank_table = _get_tables()
+    deck = [code for code in _FULL_DECK if code not in known]
+    hand_draw = hand_size - len(hand)
+    board_draw = board_size - len(board)
+    needed = hand_draw + board_draw + opponents * hand_size
+    if needed > len(deck) or hand_draw < 0 or board_draw < 0:
+        return 0.0
+
+    deadline = time.perf_counter() + time_budget_s if time_budget_s is not None else None
+    won = 0.0
+    played = 0
+    sample = rng.sample
+    while played < samples:
+        dealt = sample(deck, needed)
+        full_board = board + dealt[:board_draw]
+        position = board_draw + hand_draw
+        hero = _score(hand + dealt[board_draw:position] + full_board, flush_table, rank_table)
+
+        best_villain = None
+        ties = 0
+        for _ in range(opponents):
+            villain_cards = dealt[position:position + hand_size]
+            position += hand_size
+            villain = _score(villain_cards + full_board, flush_table, rank_table)
+            if best_villain is None or villain > best_villain:
+                best_villain = villain
+                ties = 0
+            if villain == hero:
+                ties += 1
+
+        if hero > best_villain:
+            won += 1.0
+        elif hero == best_villain:
+            won += 1.0 / (ties + 1)
+
+        played += 1
+        if deadline is not None and played % _CLOCK_INTERVAL == 0 and time.perf_counter() >= deadline:
+            break
+
+    return won / played
+
+
+def pot_odds(to_call: int, pot: int) -> float:
+    """Share of the final pot a call costs (the equity needed to break even)."""
+    if to_call <= 0:
+        return 0.0
+    return to_call / (pot + to_call)
+
+
+def seed(value: int | None = None) -> None:
+    """Seed the random source estimates draw from when not given one."""
+    _rng.seed(value)
+
+
+def use_time_budget(enabled: bool) -> None:
+    """
+    Turn time budgets on or off for every estimate.
+
+    With them off, an estimate always draws its full sample count, so a
+    seeded run makes the same decisions on any machine.
+    """
+    global _use_time_budget
+    _use_time_budget = enabled
+
+
+def clear_cache() -> None:
+    """Drop all cached estimates."""
+    _cache.clear()
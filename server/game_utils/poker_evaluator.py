@@ -3,12 +3,22 @@ Poker hand evaluator for standard 52-card decks.
 
 Provides helpers for scoring a 5-card hand and selecting the best 5-card hand
 from a larger set (e.g., 7 cards in Hold'em).
+
+Hands of 5 to 7 standard cards are scored by table lookup: one table maps
+the rank bitmask of a flush suit to its best flush or straight flush, and
+another maps the prime product of all ranks to the best non-flush hand.
+With at most 7 cards a flush always beats anything the other ranks can
+make, so one lookup scores the whole hand. The tables are built on first
+use and cached on disk; other hands fall back to trying every 5-card
+combination.
 """
 
 from __future__ import annotations
 
+import pickle
 from collections import Counter
 from itertools import combinations
+from pathlib import Path
 from typing import Iterable
 
 from .cards import Card, SUIT_NONE, RANK_KEYS
@@ -25,17 +35,40 @@ FULL_HOUSE = 6
 FOUR_OF_A_KIND = 7
 STRAIGHT_FLUSH = 8
 
+HandScore = tuple[int, tuple[int, ...]]
+
+# One prime per poker rank (index 2-14), so a product identifies a multiset
+_RANK_PRIMES = (0, 0, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Bump when the table layout or scoring changes, to ignore old cache files
+_TABLES_VERSION = 1
+_TABLES_CACHE = Path(__file__).parent / "__pycache__" / f"poker_tables.v{_TABLES_VERSION}.pickle"
+
+# (flush rank mask -> score, rank prime product -> score), built on first use
+_tables: tuple[dict[int, HandScore], dict[int, HandScore]] | None = None
+
 
 def best_hand(cards: list[Card]) -> tuple[tuple[int, tuple[int, ...]], list[Card]]:
     """Return the best 5-card hand score and the chosen 5 cards."""
     if len(cards) < 5:
         raise ValueError("best_hand requires at least 5 cards")
 
+    if len(cards) <= 7:
+        found = _lookup(cards)
+        if found is not None:
+            score, flush_suit = found
+            return score, _select_cards(cards, score, flush_suit)
+
+    return _best_hand_exhaustive(cards)
+
+
+def _best_hand_exhaustive(cards: list[Card]) -> tuple[HandScore, list[Card]]:
+    """Score every 5-card combination; the first best one wins ties."""
     best_score: tuple[int, tuple[int, ...]] | None = None
     best_five: list[Card] | None = None
 
     for hand in combinations(cards, 5):
-        score = score_5_cards(list(hand))
+        score = _score_5_direct(list(hand))
         if best_score is None or score > best_score:
             best_score = score
             best_five = list(hand)
@@ -49,6 +82,14 @@ def score_5_cards(cards: list[Card]) -> tuple[int, tuple[int, ...]]:
     if len(cards) != 5:
         raise ValueError("score_5_cards requires exactly 5 cards")
 
+    found = _lookup(cards)
+    if found is not None:
+        return found[0]
+    return _score_5_direct(cards)
+
+
+def _score_5_direct(cards: list[Card]) -> HandScore:
+    """Score exactly 5 cards without the lookup tables."""
     ranks = [_rank_value(card.rank) for card in cards]
     suits = [card.suit for card in cards]
 
@@ -287,3 +328,180 @@ def _is_straight(ranks: list[int]) -> tuple[bool, int]:
 def _highest_of_excluding(ranks: list[int], excluded: set[int]) -> list[int]:
     remaining = [r for r in ranks if r not in excluded]
     return sorted(remaining, reverse=True)
+
+
+# ==================== Lookup tables ====================
+
+
+def _lookup(cards: list[Card]) -> tuple[HandScore, int | None] | None:
+    """
+    Score 5-7 cards by table lookup.
+
+    Returns (score, flush suit or None), or None if the cards can't be
+    looked up (non-standard ranks, or more than four of a rank).
+    """
+    flush_table, rank_table = _tables or _get_tables()
+    product = 1
+    suit_counts = [0, 0, 0, 0, 0]
+    suit_masks = [0, 0, 0, 0, 0]
+    for card in cards:
+        rank = card.rank
+        if rank == 1:
+            rank = 14
+        elif not 2 <= rank <= 13:
+            return None
+        product *= _RANK_PRIMES[rank]
+        suit = card.suit
+        if suit != SUIT_NONE:
+            suit_counts[suit] += 1
+            suit_masks[suit] |= 1 << rank
+
+    for suit in range(1, 5):
+        if suit_counts[suit] >= 5:
+            score = flush_table.get(suit_masks[suit])
+            if score is None or suit_masks[suit].bit_count() != suit_counts[suit]:
+                return None  # Duplicate cards in the suit
+            return score, suit
+
+    score = rank_table.get(product)
+    if score is None:
+        return None
+    return score, None
+
+
+def _select_cards(cards: list[Card], score: HandScore, flush_suit: int | None) -> list[Card]:
+    """
+    Pick the 5 cards that make a looked-up score.
+
+    Takes the earliest card of each needed rank, which is the same hand the
+    exhaustive search returns (its first best combination), in input order.
+    """
+    category, tiebreakers = score
+    needed: dict[int, int] = {}
+    if category in (STRAIGHT, STRAIGHT_FLUSH):
+        high = tiebreakers[0]
+        ranks = [14, 2, 3, 4, 5] if high == 5 else range(high - 4, high + 1)
+        for rank in ranks:
+            needed[rank] = 1
+    else:
+        multiples = {
+            FOUR_OF_A_KIND: (4, 1),
+            FULL_HOUSE: (3, 2),
+            THREE_OF_A_KIND: (3, 1, 1),
+            TWO_PAIR: (2, 2, 1),
+            ONE_PAIR: (2, 1, 1, 1),
+        }.get(category, (1, 1, 1, 1, 1))
+        for rank, count in zip(tiebreakers, multiples):
+            needed[rank] = count
+
+    chosen = []
+    for card in cards:
+        if flush_suit is not None and card.suit != flush_suit:
+            continue
+        rank = _rank_value(card.rank)
+        if needed.get(rank):
+            needed[rank] -= 1
+            chosen.append(card)
+    return chosen
+
+
+def _get_tables() -> tuple[dict[int, HandScore], dict[int, HandScore]]:
+    """Load the lookup tables from the disk cache, or build and cache them."""
+    global _tables
+    if _tables is None:
+        try:
+            with open(_TABLES_CACHE, "rb") as f:
+                _tables = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+            _tables = _build_tables()
+            try:
+                _TABLES_CACHE.parent.mkdir(exist_ok=True)
+                tmp_path = _TABLES_CACHE.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(_tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_path.replace(_TABLES_CACHE)
+            except OSError:
+                pass  # Read-only install; rebuild next time
+    return _tables
+
+
+def _build_tables() -> tuple[dict[int, HandScore], dict[int, HandScore]]:
+    """Build the flush and rank-product tables for hands of 5-7 cards."""
+    # Share one tuple per distinct score to keep the tables small
+    interned: dict[HandScore, HandScore] = {}
+
+    flush_table: dict[int, HandScore] = {}
+    for mask in range(1 << 15):
+        if mask & 0b11 or not 5 <= mask.bit_count() <= 7:
+            continue  # Bits 0 and 1 are unused
+        ranks = [rank for rank in range(14, 1, -1) if mask >> rank & 1]
+        straight_high = _best_straight(ranks)
+        if straight_high:
+            score = (STRAIGHT_FLUSH, (straight_high,))
+        else:
+            score = (FLUSH, tuple(ranks[:5]))
+        flush_table[mask] = interned.setdefault(score, score)
+
+    rank_table: dict[int, HandScore] = {}
+    counts = [0] * 15
+
+    def fill(rank: int, remaining: int, size: int, product: int) -> None:
+        if rank == 1:
+            if size >= 5:
+                score = _best_of_rank_counts(counts)
+                rank_table[product] = interned.setdefault(score, score)
+            return
+        for count in range(min(4, remaining) + 1):
+            counts[rank] = count
+            fill(rank - 1, remaining - count, size + count, product * _RANK_PRIMES[rank] ** count)
+        counts[rank] = 0
+
+    fill(14, 7, 0, 1)
+    return flush_table, rank_table
+
+
+def _best_straight(ranks_desc: list[int]) -> int:
+    """Return the high card of the best straight in distinct ranks, or 0."""
+    present = set(ranks_desc)
+    for high in range(14, 5, -1):
+        if all(rank in present for rank in range(high - 4, high + 1)):
+            return high
+    if {14, 2, 3, 4, 5} <= present:
+        return 5
+    return 0
+
+
+def _best_of_rank_counts(counts: list[int]) -> HandScore:
+    """Best non-flush 5-card hand from rank counts (index 2-14)."""
+    ranks = [rank for rank in range(14, 1, -1) if counts[rank]]
+    quads = [rank for rank in ranks if counts[rank] >= 4]
+    trips = [rank for rank in ranks if counts[rank] >= 3]
+    pairs = [rank for rank in ranks if counts[rank] >= 2]
+
+    if quads:
+        kicker = next(rank for rank in ranks if rank != quads[0])
+        return (FOUR_OF_A_KIND, (quads[0], kicker))
+
+    if trips:
+        full_pairs = [rank for rank in pairs if rank != trips[0]]
+        if full_pairs:
+            return (FULL_HOUSE, (trips[0], full_pairs[0]))
+
+    straight_high = _best_straight(ranks)
+    if straight_high:
+        return (STRAIGHT, (straight_high,))
+
+    if trips:
+        kickers = [rank for rank in ranks if rank != trips[0]][:2]
+        return (THREE_OF_A_KIND, (trips[0], *kickers))
+
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        kicker = next(rank for rank in ranks if rank not in (high_pair, low_pair))
+        return (TWO_PAIR, (high_pair, low_pair, kicker))
+
+    if pairs:
+        kickers = [rank for rank in ranks if rank != pairs[0]][:3]
+        return (ONE_PAIR, (pairs[0], *kickers))
+
+    return (HIGH_CARD, tuple(ranks[:5]))
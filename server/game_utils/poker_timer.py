@@ -22,6 +22,17 @@ class PokerTurnTimer(DataClassJSONMixin):
         self.ticks_remaining -= 1
         return self.ticks_remaining == 0
 
+    def ticks_until_expiry(self) -> int | None:
+        """Ticks until tick() reports expiry, or None if not running."""
+        if self.ticks_remaining <= 0:
+            return None
+        return self.ticks_remaining
+
+    def skip(self, ticks: int) -> None:
+        """Count down over ticks tick() wasn't called (fewer than ticks_until_expiry)."""
+        if self.ticks_remaining > 0:
+            self.ticks_remaining -= ticks
+
     def seconds_remaining(self) -> int:
         if self.ticks_remaining <= 0:
             return 0
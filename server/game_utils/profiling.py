@@ -0,0 +1,174 @@
+"""
+Opt-in timing of the work done inside server ticks.
+
+When enabled, the profiler records how long each table tick, action
+handler, bot think and turn menu build takes, aggregated per game type, so
+the tables and handlers that eat the tick budget can be found. Times are
+inclusive: a table tick includes the bot thinking and actions it ran.
+
+When disabled (the default), measure() returns a shared no-op context
+manager, so instrumented code pays for one attribute check per call.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Iterator
+
+# Categories of measured work
+TABLE_TICK = "table_tick"
+ACTION = "action"
+BOT_THINK = "bot_think"
+MENU = "menu"
+
+
+@dataclass(slots=True)
+class TimingStat:
+    """Call count and durations of one measured piece of work."""
+
+    calls: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    def record(self, duration_s: float) -> None:
+        self.calls += 1
+        self.total_s += duration_s
+        if duration_s > self.max_s:
+            self.max_s = duration_s
+
+    def to_dict(self) -> dict:
+        """Snapshot of the timings as plain data."""
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_s * 1000.0,
+            "average_ms": self.total_s * 1000.0 / self.calls if self.calls else 0.0,
+            "max_ms": self.max_s * 1000.0,
+        }
+
+
+class _NullTimer:
+    """Context manager used while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_stat", "_started")
+
+    def __init__(self, stat: TimingStat):
+        self._stat = stat
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._stat.record(time.perf_counter() - self._started)
+
+
+class Profiler:
+    """Aggregates timings per (category, game type, name) and per table."""
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.monotonic()
+        self._stats: dict[tuple[str, str, str], TimingStat] = {}
+        self._tables: dict[str, tuple[str, TimingStat]] = {}
+
+    def enable(self) -> None:
+        """Start recording (keeping anything recorded earlier)."""
+        if not self.enabled:
+            self.enabled = True
+            self.started_at = time.monotonic()
+
+    def disable(self) -> None:
+        """Stop recording; recorded timings stay viewable."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget all recorded timings."""
+        self._stats.clear()
+        self._tables.clear()
+        self.started_at = time.monotonic()
+
+    def _stat(self, category: str, game_type: str, name: str) -> TimingStat:
+        key = (category, game_type, name)
+        stat = self._stats.get(key)
+        if stat is None:
+            stat = self._stats[key] = TimingStat()
+        return stat
+
+    def measure(self, category: str, game_type: str, name: str = ""):
+        """
+        Time a block of work:
+
+            with get_profiler().measure(ACTION, game.get_type(), handler_name):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self._stat(category, game_type, name))
+
+    def record(self, category: str, game_type: str, name: str, duration_s: float) -> None:
+        """Record a duration measured by the caller."""
+        if self.enabled:
+            self._stat(category, game_type, name).record(duration_s)
+
+    def record_table_tick(self, table_id: str, game_type: str, duration_s: float) -> None:
+        """Record one table's tick, both per game type and per table."""
+        if not self.enabled:
+            return
+        self._stat(TABLE_TICK, game_type, "").record(duration_s)
+        entry = self._tables.get(table_id)
+        if entry is None or entry[0] != game_type:
+            entry = self._tables[table_id] = (game_type, TimingStat())
+        entry[1].record(duration_s)
+
+    def forget_table(self, table_id: str) -> None:
+        """Drop a destroyed table's per-table timings."""
+        self._tables.pop(table_id, None)
+
+    def _entries(self) -> Iterator[dict]:
+        for (category, game_type, name), stat in self._stats.items():
+            yield {"category": category, "game_type": game_type, "name": name, **stat.to_dict()}
+
+    def top(self, limit: int = 10, category: str | None = None) -> list[dict]:
+        """The entries with the most total time, optionally of one category."""
+        entries = [
+            entry for entry in self._entries() if category is None or entry["category"] == category
+        ]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return entries[:limit]
+
+    def top_tables(self, limit: int = 10) -> list[dict]:
+        """Live tables with the most total tick time."""
+        tables = [
+            {"table_id": table_id, "game_type": game_type, **stat.to_dict()}
+            for table_id, (game_type, stat) in self._tables.items()
+        ]
+        tables.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return tables[:limit]
+
+    def get_stats(self) -> dict:
+        """Snapshot of every recorded timing as plain data."""
+        return {
+            "enabled": self.enabled,
+            "elapsed_s": time.monotonic() - self.started_at,
+            "entries": self.top(limit=len(self._stats)),
+            "tables": self.top_tables(limit=len(self._tables)),
+        }
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Return the process-wide profiler."""
+    return _profiler
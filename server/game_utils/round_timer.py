@@ -112,6 +112,17 @@ class RoundTimer:
             self._game.round_timer_ticks = 0
             self._game.on_round_timer_ready()
 
+    def ticks_until_ready(self) -> int | None:
+        """Ticks until on_tick calls on_round_timer_ready, or None if not counting."""
+        if self._game.round_timer_state != self.COUNTING:
+            return None
+        return max(1, self._game.round_timer_ticks)
+
+    def skip_ticks(self, ticks: int) -> None:
+        """Count down over ticks on_tick wasn't called (fewer than ticks_until_ready)."""
+        if self._game.round_timer_state == self.COUNTING:
+            self._game.round_timer_ticks -= ticks
+
     def on_tick(self) -> None:
         """Called every game tick. Decrements timer if counting."""
         if self._game.round_timer_state != self.COUNTING:
@@ -0,0 +1,124 @@
+"""Hierarchical timer wheel for waking things up on a given tick."""
+
+from typing import Generic, Hashable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+# Slots per wheel level (a power of two keeps the digit arithmetic cheap)
+DEFAULT_WHEEL_SLOTS = 64
+
+# Levels of wheels; 64 slots over 4 levels cover 64**4 ticks (~9.7 days at 50ms)
+DEFAULT_WHEEL_LEVELS = 4
+
+
+class TimerWheel(Generic[T]):
+    """
+    Schedules items to come due on a future tick.
+
+    Scheduling, cancelling and advancing one tick are O(1) however many
+    items are waiting, so callers only pay for the items that come due.
+    Level 0 holds items due within the current run of `slots` ticks, one
+    slot per tick. Each higher level holds items further out, one slot per
+    `slots ** level` ticks, and is emptied into the lower levels when the
+    wheel reaches that slot. Items beyond the top level wait in an overflow
+    list until they come within range.
+
+    Each item is scheduled at most once: scheduling it again moves it.
+    Items come due in the order they were scheduled into their final slot.
+    """
+
+    def __init__(
+        self,
+        slots: int = DEFAULT_WHEEL_SLOTS,
+        levels: int = DEFAULT_WHEEL_LEVELS,
+        now: int = 0,
+    ):
+        self.slots = slots
+        self.levels = levels
+        self._now = now
+        self._wheels: list[list[dict[T, None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: dict[T, None] = {}
+        self._ticks: dict[T, int] = {}  # item -> tick it comes due
+        self._where: dict[T, dict[T, None]] = {}  # item -> the slot holding it
+
+    @property
+    def now(self) -> int:
+        """The last tick the wheel advanced to."""
+        return self._now
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._ticks
+
+    def deadline(self, item: T) -> int | None:
+        """The tick an item comes due, or None if it isn't scheduled."""
+        return self._ticks.get(item)
+
+    def schedule(self, item: T, tick: int) -> None:
+        """Make an item come due on a tick (at the earliest, the next one)."""
+        self.cancel(item)
+        tick = max(tick, self._now + 1)
+        self._ticks[item] = tick
+        self._place(item, tick)
+
+    def cancel(self, item: T) -> bool:
+        """Unschedule an item. Returns True if it was scheduled."""
+        slot = self._where.pop(item, None)
+        if slot is None:
+            return False
+        del slot[item]
+        del self._ticks[item]
+        return True
+
+    def clear(self) -> None:
+        """Unschedule everything."""
+        for item in list(self._ticks):
+            self.cancel(item)
+
+    def advance(self) -> list[T]:
+        """Move to the next tick and return the items due on it."""
+        self._now += 1
+        now = self._now
+        span = 1
+        for level in range(1, self.levels):
+            span *= self.slots
+            if now % span:
+                break
+            self._cascade(self._wheels[level][(now // span) % self.slots])
+        else:
+            if now % (span * self.slots) == 0:
+                self._cascade(self._overflow)
+
+        slot = self._wheels[0][now % self.slots]
+        if not slot:
+            return []
+        due = list(slot)
+        slot.clear()
+        for item in due:
+            del self._ticks[item]
+            del self._where[item]
+        return due
+
+    def _place(self, item: T, tick: int) -> None:
+        # The level is the highest base-`slots` digit where tick and now differ
+        now = self._now
+        span = 1
+        for level in range(self.levels):
+            if tick // (span * self.slots) == now // (span * self.slots):
+                slot = self._wheels[level][(tick // span) % self.slots]
+                break
+            span *= self.slots
+        else:
+            slot = self._overflow
+        slot[item] = None
+        self._where[item] = slot
+
+    def _cascade(self, slot: dict[T, None]) -> None:
+        items = list(slot)
+        slot.clear()
+        for item in items:
+            self._place(item, self._ticks[item])
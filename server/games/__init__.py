@@ -1,30 +1,65 @@
 """Game implementations."""
 
-from .base import Game
-from .registry import GameRegistry, register_game, get_game_class
-
-# Import all games to trigger registration
-from .pig.game import PigGame
-from .scopa.game import ScopaGame
-from .lightturret.game import LightTurretGame
-from .threes.game import ThreesGame
-from .milebymile.game import MileByMileGame
-from .chaosbear.game import ChaosBearGame
-from .farkle.game import FarkleGame
-from .yahtzee.game import YahtzeeGame
-from .ninetynine.game import NinetyNineGame
-from .tradeoff.game import TradeoffGame
-from .pirates.game import PiratesGame
-from .leftrightcenter.game import LeftRightCenterGame
-from .tossup.game import TossUpGame
-from .midnight.game import MidnightGame
-from .ageofheroes.game import AgeOfHeroesGame
-from .fivecarddraw.game import FiveCardDrawGame
-from .holdem.game import HoldemGame
-from .crazyeights.game import CrazyEightsGame
+from .registry import GameDescriptor, GameRegistry, register_game, get_game_class
+
+# Every game's descriptor, keyed by class name, so games are described
+# without importing them. A game's module is imported (registering its
+# class) the first time the class is needed; menus and listings only use
+# these descriptors. Keep in sync with the classes
+# (checked by tests/test_integration.py).
+_DESCRIPTORS_BY_CLASS: dict[str, GameDescriptor] = {}
+
+
+def _describe(
+    game_type: str,
+    class_name: str,
+    name: str,
+    category: str,
+    min_players: int,
+    max_players: int,
+) -> None:
+    descriptor = GameDescriptor(
+        game_type, name, category, min_players, max_players,
+        f"{__name__}.{game_type}.game", class_name,
+    )
+    GameRegistry.describe(descriptor)
+    _DESCRIPTORS_BY_CLASS[class_name] = descriptor
+
+
+_describe("pig", "PigGame", "Pig", "category-dice-games", 2, 4)
+_describe("scopa", "ScopaGame", "Scopa", "category-card-games", 2, 16)
+_describe("lightturret", "LightTurretGame", "Light Turret", "category-rb-play-center", 2, 4)
+_describe("threes", "ThreesGame", "Threes", "category-dice-games", 2, 8)
+_describe("milebymile", "MileByMileGame", "Mile by Mile", "category-card-games", 2, 9)
+_describe("chaosbear", "ChaosBearGame", "Chaos Bear", "category-rb-play-center", 2, 4)
+_describe("farkle", "FarkleGame", "Farkle", "category-dice-games", 2, 20)
+_describe("yahtzee", "YahtzeeGame", "Yahtzee", "category-dice-games", 1, 4)
+_describe("ninetynine", "NinetyNineGame", "Ninety Nine", "category-card-games", 2, 6)
+_describe("tradeoff", "TradeoffGame", "Tradeoff", "category-dice-games", 2, 8)
+_describe("pirates", "PiratesGame", "Pirates of the Lost Seas", "category-uncategorized", 2, 5)
+_describe("leftrightcenter", "LeftRightCenterGame", "Left Right Center", "category-dice-games", 2, 20)
+_describe("tossup", "TossUpGame", "Toss Up", "category-dice-games", 2, 8)
+_describe("midnight", "MidnightGame", "1-4-24", "category-dice-games", 2, 6)
+_describe("ageofheroes", "AgeOfHeroesGame", "Age of Heroes", "category-uncategorized", 2, 6)
+_describe("fivecarddraw", "FiveCardDrawGame", "Five Card Draw", "category-poker", 2, 5)
+_describe("holdem", "HoldemGame", "Texas Hold'em", "category-poker", 2, 12)
+_describe("crazyeights", "CrazyEightsGame", "Crazy Eights", "category-card-games", 2, 8)
+
+
+def __getattr__(name: str):
+    """Import game classes (and Game) on first access."""
+    if name == "Game":
+        from .base import Game
+
+        return Game
+    if name in _DESCRIPTORS_BY_CLASS:
+        return _DESCRIPTORS_BY_CLASS[name].load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Game",
+    "GameDescriptor",
     "GameRegistry",
     "register_game",
     "get_game_class",
@@ -3336,7 +3336,7 @@ class AgeOfHeroesGame(Game):
 
                 BotHelper.process_bot_action(
                     bot=player,
-                    think_fn=lambda p=player: self.bot_think(p),
+                    think_fn=lambda p=player: BotHelper.think(self, p),
                     execute_fn=lambda action_id, p=player: self.execute_action(p, action_id),
                 )
 
@@ -3364,7 +3364,7 @@ class AgeOfHeroesGame(Game):
                 if target.is_bot and not target.is_spectator:
                     BotHelper.process_bot_action(
                         bot=target,
-                        think_fn=lambda: self.bot_think(target),
+                        think_fn=lambda: BotHelper.think(self, target),
                         execute_fn=lambda action_id: self.execute_action(target, action_id),
                     )
         # During war battle, both attacker and defender need to roll
@@ -3378,7 +3378,7 @@ class AgeOfHeroesGame(Game):
                 if attacker.is_bot and not attacker.is_spectator and war.attacker_roll == 0:
                     BotHelper.process_bot_action(
                         bot=attacker,
-                        think_fn=lambda: self.bot_think(attacker),
+                        think_fn=lambda: BotHelper.think(self, attacker),
                         execute_fn=lambda action_id: self.execute_action(attacker, action_id),
                     )
 
@@ -3388,7 +3388,7 @@ class AgeOfHeroesGame(Game):
                 if defender.is_bot and not defender.is_spectator and war.defender_roll == 0:
                     BotHelper.process_bot_action(
                         bot=defender,
-                        think_fn=lambda: self.bot_think(defender),
+                        think_fn=lambda: BotHelper.think(self, defender),
                         execute_fn=lambda action_id: self.execute_action(defender, action_id),
                     )
         else:
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from typing import Any
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 import threading
 
 from mashumaro.mixins.json import DataClassJSONMixin
@@ -20,10 +21,12 @@ from ..game_utils.game_sound_mixin import GameSoundMixin
 from ..game_utils.game_communication_mixin import GameCommunicationMixin
 from ..game_utils.game_result_mixin import GameResultMixin
 from ..game_utils.duration_estimate_mixin import DurationEstimateMixin
+from ..game_utils.bot_service import PendingThink
+from ..game_utils.estimate_pool import EstimateKey
 from ..game_utils.game_scores_mixin import GameScoresMixin
 from ..game_utils.game_prediction_mixin import GamePredictionMixin
 from ..game_utils.turn_management_mixin import TurnManagementMixin
-from ..game_utils.menu_management_mixin import MenuManagementMixin
+from ..game_utils.menu_management_mixin import DirtyMenu, MenuManagementMixin
 from ..game_utils.action_visibility_mixin import ActionVisibilityMixin
 from ..game_utils.lobby_actions_mixin import LobbyActionsMixin, BOT_NAMES
 from ..game_utils.event_handling_mixin import EventHandlingMixin
@@ -151,8 +154,20 @@ class Game(
         self._status_box_open: set[str] = set()  # player_ids with status box open
         self._actions_menu_open: set[str] = set()  # player_ids with actions menu open
         self._destroyed: bool = False  # Whether game has been destroyed
+        # Turn menu coalescing (see MenuManagementMixin.menu_batch)
+        self._menu_batch_depth: int = 0
+        self._dirty_menus: dict[str, DirtyMenu] = {}  # player_id -> pending menu
+        self._menu_stats: dict[str, int] = {
+            "requested": 0,
+            "built": 0,
+            "coalesced": 0,
+            "shared": 0,
+        }
+        # Offloaded bot thinks awaiting an answer (see BotService)
+        self._bot_thinks: dict[str, PendingThink] = {}  # player_id -> pending think
         # Duration estimation state
-        self._estimate_threads: list[threading.Thread] = []  # Running simulation threads
+        self._estimate_jobs: list[Future] = []  # Running simulations on the estimate pool
+        self._estimate_key: EstimateKey | None = None  # Cache key of the running estimate
         self._estimate_results: list[int] = []  # Collected tick counts
         self._estimate_errors: list[str] = []  # Collected errors
         self._estimate_running: bool = False  # Whether estimation is in progress
@@ -277,15 +292,83 @@ class Game(
         """
         # Check if duration estimation has completed
         self.check_estimate_completion()
+        # Nobody acts in a game that is over; drop thinks still running for it
+        if self._bot_thinks and (not self.game_active or self.status != "playing"):
+            self.cancel_bot_thinks()
 
     def on_round_timer_ready(self) -> None:
         """Called when round timer expires. Override in subclasses that use RoundTimer."""
         pass
 
+    # Idle tick skipping
+
+    def ticks_until_wake(self) -> int | None:
+        """
+        Ticks until on_tick next has something to do, unless an event comes first.
+
+        1 means the next tick; None means only an event (an action, someone
+        joining or leaving) can give it anything to do. The table manager lets
+        a table sleep until then and passes the ticks it slept through to
+        on_ticks_skipped before ticking it again.
+
+        While on_tick polls for work running elsewhere (waiting_off_tick) the
+        table never sleeps. Otherwise the game's own ticks_until_work decides;
+        games override that rather than this.
+        """
+        if self.waiting_off_tick():
+            return 1
+        return self.ticks_until_work()
+
+    def ticks_until_work(self) -> int | None:
+        """
+        The game's answer for ticks_until_wake, when nothing runs off the tick.
+
+        By default only lobbies sleep. Games override this together with
+        on_ticks_skipped, mirroring their on_tick: scheduled sounds, round
+        timers, turn timers and BotHelper each report when they next act.
+        """
+        if self.status == "waiting":
+            return None
+        return 1
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        """
+        Catch up on ticks a sleeping table skipped (fewer than ticks_until_wake).
+
+        Leaves every tick counter as if on_tick had run that many more times.
+        """
+        pass
+
+    def cancel_bot_thinks(self, keep_player_id: str | None = None) -> None:
+        """Abandon offloaded bot thinks, except the one for keep_player_id."""
+        for player_id in list(self._bot_thinks):
+            if player_id != keep_player_id:
+                self._bot_thinks.pop(player_id).future.cancel()
+
+    def waiting_off_tick(self) -> bool:
+        """Whether on_tick is polling for work running elsewhere (estimates, bot thinks)."""
+        return self._estimate_running or bool(self._bot_thinks)
+
+    @staticmethod
+    def soonest_wake(*waits: int | None) -> int | None:
+        """The soonest of several ticks_until_wake answers (None if all are None)."""
+        pending = [wait for wait in waits if wait is not None]
+        return min(pending) if pending else None
+
+    def wake(self) -> None:
+        """
+        Make a sleeping table tick again, catching up on the ticks it skipped.
+
+        Called before anything outside on_tick changes the game.
+        """
+        if self._table:
+            self._table.wake()
+
     # Player management
 
     def attach_user(self, player_id: str, user: User) -> None:
         """Attach a user to a player by ID."""
+        self.wake()
         self._users[player_id] = user
         # Play current music/ambience for the joining user
         if self.current_music:
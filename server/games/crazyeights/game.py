@@ -451,6 +451,14 @@ class CrazyEightsGame(Game):
         self._maybe_play_timer_warning()
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Between games, sleep until the next scheduled sound."""
+        return self.soonest_wake(super().ticks_until_work(), self.ticks_until_next_sound())
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+
     def _start_new_hand(self) -> None:
         self.round += 1
         self.turn_direction = 1
@@ -1303,6 +1311,7 @@ class CrazyEightsGame(Game):
             "crazyeights-game-winner",
             score=winner.score,
         )
+        self.flush_menus()
         for p in self.players:
             user = self.get_user(p)
             if user:
@@ -13,6 +13,7 @@ from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
+from ...game_utils.bot_service import ThinkJob
 from ...game_utils.game_result import GameResult, PlayerResult
 from ...game_utils.options import IntOption, option_field
 from ...messages.localization import Localization
@@ -277,6 +278,59 @@ def get_available_combinations(dice: list[int]) -> list[tuple[str, int, int]]:
     return combinations
 
 
+def split_combination(
+    dice: list[int], combo_type: str, number: int = 0
+) -> tuple[list[int], list[int]]:
+    """Split dice into (dice used by a combination, dice left over)."""
+    if combo_type == COMBO_SINGLE_1:
+        needed = [1]
+    elif combo_type == COMBO_SINGLE_5:
+        needed = [5]
+    elif combo_type == COMBO_THREE_OF_KIND:
+        needed = [number] * 3
+    elif combo_type == COMBO_FOUR_OF_KIND:
+        needed = [number] * 4
+    elif combo_type == COMBO_FIVE_OF_KIND:
+        needed = [number] * 5
+    elif combo_type == COMBO_SIX_OF_KIND:
+        needed = [number] * 6
+    elif combo_type == COMBO_SMALL_STRAIGHT:
+        # Prefer 1-2-3-4-5 when both straights are present
+        counts = count_dice(dice)
+        if all(counts[i] >= 1 for i in range(1, 6)):
+            needed = [1, 2, 3, 4, 5]
+        else:
+            needed = [2, 3, 4, 5, 6]
+    elif combo_type in (
+        COMBO_LARGE_STRAIGHT,
+        COMBO_THREE_PAIRS,
+        COMBO_DOUBLE_TRIPLETS,
+        COMBO_FULL_HOUSE,
+    ):
+        # These use all 6 dice
+        return list(dice), []
+    else:
+        return [], list(dice)
+
+    left = list(dice)
+    for die in needed:
+        left.remove(die)
+    return needed, left
+
+
+def bot_policy_action(
+    roll: tuple[int, ...], turn_score: int, gap: int, can_roll: bool, must_reach: bool
+) -> str:
+    """The action id of the policy's best move (see strategy.best_move)."""
+    from .strategy import best_move
+
+    move = best_move(list(roll), turn_score, gap, can_roll, must_reach=must_reach)
+    if isinstance(move, tuple):
+        combo_type, number = move
+        return f"score_{combo_type}_{number}"
+    return move
+
+
 @dataclass
 @register_game
 class FarkleGame(Game):
@@ -775,69 +829,10 @@ class FarkleGame(Game):
         self, player: FarklePlayer, combo_type: str, number: int
     ) -> None:
         """Remove dice from current_roll for the given combination."""
-        counts = count_dice(player.current_roll)
-
-        if combo_type == COMBO_SINGLE_1:
-            # Remove one 1
-            player.current_roll.remove(1)
-            player.banked_dice.append(1)
-
-        elif combo_type == COMBO_SINGLE_5:
-            # Remove one 5
-            player.current_roll.remove(5)
-            player.banked_dice.append(5)
-
-        elif combo_type == COMBO_THREE_OF_KIND:
-            # Remove three of the number
-            for _ in range(3):
-                player.current_roll.remove(number)
-                player.banked_dice.append(number)
-
-        elif combo_type == COMBO_FOUR_OF_KIND:
-            # Remove four of the number
-            for _ in range(4):
-                player.current_roll.remove(number)
-                player.banked_dice.append(number)
-
-        elif combo_type == COMBO_FIVE_OF_KIND:
-            # Remove five of the number
-            for _ in range(5):
-                player.current_roll.remove(number)
-                player.banked_dice.append(number)
-
-        elif combo_type == COMBO_SIX_OF_KIND:
-            # Remove all six of the number
-            for _ in range(6):
-                player.current_roll.remove(number)
-                player.banked_dice.append(number)
-
-        elif combo_type == COMBO_LARGE_STRAIGHT:
-            # Remove all dice (1-6)
-            player.banked_dice.extend(player.current_roll)
-            player.current_roll = []
-
-        elif combo_type == COMBO_SMALL_STRAIGHT:
-            # Remove 5 dice for small straight
-            counts = count_dice(player.current_roll)
-            # Determine which straight we have
-            has_1_5 = all(counts[i] >= 1 for i in range(1, 6))
-            if has_1_5:
-                needed = [1, 2, 3, 4, 5]
-            else:
-                needed = [2, 3, 4, 5, 6]
-
-            for num in needed:
-                player.current_roll.remove(num)
-                player.banked_dice.append(num)
-
-        elif combo_type in (
-            COMBO_THREE_PAIRS,
-            COMBO_DOUBLE_TRIPLETS,
-            COMBO_FULL_HOUSE,
-        ):
-            # Remove all 6 dice
-            player.banked_dice.extend(player.current_roll)
-            player.current_roll = []
+        taken, player.current_roll = split_combination(
+            player.current_roll, combo_type, number
+        )
+        player.banked_dice.extend(taken)
 
     def _action_bank(self, player: Player, action_id: str) -> None:
         """Handle bank action."""
@@ -970,68 +965,65 @@ class FarkleGame(Game):
 
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the next dice sound or the bot's next take, roll or bank."""
+        return self.soonest_wake(self.ticks_until_next_sound(), BotHelper.ticks_until_wake(self))
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: FarklePlayer) -> str | None:
-        """Bot AI decision making."""
-        turn_set = self.get_action_set(player, "turn")
-        if not turn_set:
+        """Bot AI decision making, from the expected-value policy tables."""
+        args = self._bot_policy_args(player)
+        return bot_policy_action(*args) if args else None
+
+    def bot_think_job(self, player: FarklePlayer) -> ThinkJob | None:
+        """
+        The bot's decision as a job the BotService can run off the tick.
+
+        A new gap to the target costs a table build, so policy moves run on a
+        worker; the fallback takes the best combo, then banks at 35 points.
+        """
+        args = self._bot_policy_args(player)
+        if not args:
             return None
+        if player.current_roll and not player.has_taken_combo:
+            combo_type, number, _ = get_available_combinations(player.current_roll)[0]
+            fallback = f"score_{combo_type}_{number}"
+        elif player.turn_score >= 35 and self._is_bank_enabled(player) is None:
+            fallback = "bank"
+        else:
+            fallback = "roll"
+        return ThinkJob(bot_policy_action, args, fallback=fallback)
 
-        # Resolve actions to get enabled state
-        resolved = turn_set.resolve_actions(self, player)
-
-        # Take highest-value scoring combo first
-        for ra in resolved:
-            if ra.enabled and ra.action.id.startswith("score_"):
-                return ra.action.id
-
-        # Check roll/bank enabled state
-        roll_enabled = self._is_roll_enabled(player) is None
-        bank_enabled = self._is_bank_enabled(player) is None
-
-        if roll_enabled:
-            # Banking decision based on dice remaining and points
-            dice_remaining = 6 - len(player.banked_dice)
-            if dice_remaining == 0:
-                dice_remaining = 6  # Hot dice
-
-            # Check if someone already reached target score
-            score_to_beat = None
-            for other in self.players:
-                if other != player:
-                    other_farkle: FarklePlayer = other  # type: ignore
-                    if other_farkle.score >= self.options.target_score:
-                        if score_to_beat is None or other_farkle.score > score_to_beat:
-                            score_to_beat = other_farkle.score
-
-            potential_total = player.score + player.turn_score
-
-            # If someone has already won, must beat them or bust trying
-            if score_to_beat is not None and potential_total <= score_to_beat:
-                return "roll"
-
-            # Banking decision based on turn score and dice remaining
-            if player.turn_score >= 35:
-                # Bank probability increases as fewer dice remain
-                bank_probabilities = {
-                    6: 0.40,
-                    5: 0.50,
-                    4: 0.55,
-                    3: 0.65,
-                    2: 0.70,
-                    1: 0.75,
-                }
-                bank_prob = bank_probabilities.get(dice_remaining, 0.50)
-
-                if random.random() < bank_prob:
-                    if bank_enabled:
-                        return "bank"
-
-            return "roll"
-
-        if bank_enabled:
-            return "bank"
+    def _bot_policy_args(self, player: FarklePlayer) -> tuple | None:
+        """Arguments of bot_policy_action for this bot, or None if it can't act."""
+        if self._is_scoring_action_enabled(player) is not None:
+            return None
 
-        return None
+        # If someone has already won, must beat them or bust trying
+        score_to_beat = max(
+            (
+                other.score
+                for other in self.players
+                if other != player and other.score >= self.options.target_score
+            ),
+            default=None,
+        )
+        if score_to_beat is not None:
+            gap = score_to_beat - player.score + 1
+        else:
+            gap = self.options.target_score - player.score
+
+        return (
+            tuple(player.current_roll),
+            player.turn_score,
+            gap,
+            self._is_roll_enabled(player) is None,
+            score_to_beat is not None,
+        )
 
     def _on_turn_end(self) -> None:
         """Handle end of a player's turn."""
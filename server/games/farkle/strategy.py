@@ -0,0 +1,378 @@
+"""
+Expected-value banking policy for Farkle bots.
+
+A turn is a chain of rolls. After each roll the player takes scoring
+combinations one at a time. They may then roll the dice they did not take,
+or roll all six again if every die scored. They may bank only once no
+scoring dice are left. The policy values every point of that chain by its
+expected banked points under optimal play. Points past the target score
+are worth nothing extra, because banking them gets no more out of the game.
+
+The solver works in steps of 5 points, the smallest score in the game. It
+tabulates the value of rolling for each (dice to roll, turn score, gap to
+the target). The outcomes of 1-6 dice are enumerated once. Every sequence
+of takes from an outcome is reduced to the best points for each number of
+dice left over, and outcomes with the same options are merged. A table
+for one gap then costs a single backward pass over the turn score. Each
+take scores at least one step, so later turn scores are always solved
+first. Gaps beyond GAP_HORIZON share one table, since no policy keeps
+rolling that far. Moves are found by trying each sequence of takes from
+the current dice against the table, and are cached.
+
+When banking short of the gap is worthless (must_reach), rolling is worth
+the gap times the chance of covering the steps still missing. That chance
+depends on nothing else, so one table indexed by the steps missing (up to
+the horizon) serves every gap.
+
+Solving a gap near the horizon takes about 100 ms, too long for a tick.
+`build-strategy farkle` solves every gap ahead of time into a float32
+table (4 MB) that the server memory-maps at startup. The table is a
+generated file, not checked in, so each deploy has to build it (about 30
+seconds on one core):
+    python -m server.cli build-strategy farkle
+Without it, gaps are solved on the tick they first come up (the server
+warns at startup) and kept for the rest of the process.
+
+The scoring rules come from game.py (get_available_combinations and
+split_combination), so the policy follows any change to them.
+"""
+
+import mmap
+import struct
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import factorial, inf
+from pathlib import Path
+from typing import Callable
+
+from .game import get_available_combinations, split_combination
+
+# Where the built table is stored (generated, not under version control)
+DEFAULT_TABLE_PATH = Path(__file__).parent / "strategy.f32"
+
+# File header: magic, format version, horizon in steps
+_MAGIC = b"FKST"
+_FORMAT = 1
+_HEADER = struct.Struct("<4sII")
+
+# Every combination is worth a multiple of this many points
+POINT_STEP = 5
+
+# Gaps (and, with must_reach, points missing) past this many points are
+# solved as if the target were this far
+GAP_HORIZON = 3000
+HORIZON_STEPS = GAP_HORIZON // POINT_STEP
+
+# Decisions remembered by (dice, turn score, gap)
+MOVE_CACHE_SIZE = 65536
+
+# A decision: a combination to take, "roll" or "bank"
+Move = tuple[str, int] | str
+
+
+def _multiset_probability(dice: tuple[int, ...]) -> float:
+    """Chance that rolling len(dice) dice gives this sorted multiset."""
+    ways = factorial(len(dice))
+    for face in set(dice):
+        ways //= factorial(dice.count(face))
+    return ways / 6 ** len(dice)
+
+
+@lru_cache(maxsize=None)
+def _takes(dice: tuple[int, ...]) -> tuple[tuple[str, int, int, tuple[int, ...]], ...]:
+    """The combinations in sorted dice as (combo_type, number, steps, dice left)."""
+    takes = []
+    for combo_type, number, points in get_available_combinations(list(dice)):
+        _, left = split_combination(list(dice), combo_type, number)
+        takes.append((combo_type, number, points // POINT_STEP, tuple(left)))
+    return tuple(takes)
+
+
+@lru_cache(maxsize=None)
+def _take_positions(dice: tuple[int, ...]) -> frozenset[tuple[int, tuple[int, ...]]]:
+    """Every (steps scored, dice left) reachable by taking combinations from dice."""
+    positions = {(0, dice)}
+    for _, _, steps, left in _takes(dice):
+        for more, rest in _take_positions(left):
+            positions.add((steps + more, rest))
+    return frozenset(positions)
+
+
+@lru_cache(maxsize=None)
+def _roll_outcomes(count: int) -> tuple[tuple[float, tuple[tuple[int, int], ...], int], ...]:
+    """
+    The scoring outcomes of rolling count dice, merged by what they allow.
+
+    Each entry is (probability, roll options, bank steps). Roll options are
+    (dice to roll next, best steps scored) pairs; bank steps is the most the
+    roll can add before banking. Farkles are left out (they are worth 0).
+    """
+    merged: dict[tuple, float] = defaultdict(float)
+    for roll in combinations_with_replacement(range(1, 7), count):
+        best_by_left: dict[int, int] = {}
+        bank = -1
+        for steps, left in _take_positions(roll):
+            if steps == 0:
+                continue
+            next_count = len(left) or 6  # Hot dice: roll all six again
+            best_by_left[next_count] = max(best_by_left.get(next_count, 0), steps)
+            if not _takes(left):
+                bank = max(bank, steps)
+        if bank >= 0:
+            merged[(tuple(sorted(best_by_left.items())), bank)] += _multiset_probability(roll)
+    return tuple((probability, options, bank) for (options, bank), probability in merged.items())
+
+
+def _solve_gap(gap: int) -> list[array]:
+    """
+    Value of rolling, in steps, indexed [dice to roll][turn steps].
+
+    Banking is worth the turn score up to the gap; a farkle loses it.
+    """
+    outcomes = [()] + [_roll_outcomes(count) for count in range(1, 7)]
+    values = [array("d", [float(gap)]) * gap for _ in range(7)]
+    for turn in reversed(range(gap)):
+        for count in range(1, 7):
+            total = 0.0
+            for probability, options, bank in outcomes[count]:
+                banked = turn + bank
+                if banked >= gap:
+                    total += probability * gap
+                    continue
+                # No option scores more than bank, so every option stays short of the gap
+                best = float(banked)
+                for next_count, steps in options:
+                    value = values[next_count][turn + steps]
+                    if value > best:
+                        best = value
+                total += probability * best
+            values[count][turn] = total
+    return values
+
+
+def _solve_reach(horizon: int) -> list[array]:
+    """
+    Chance of reaching the gap by rolling, indexed [dice to roll][steps missing].
+
+    Banking short of the gap is worth nothing: another player already
+    finished and only passing them counts.
+    """
+    outcomes = [()] + [_roll_outcomes(count) for count in range(1, 7)]
+    chances = [array("d", [1.0]) * (horizon + 1) for _ in range(7)]
+    for missing in range(1, horizon + 1):
+        for count in range(1, 7):
+            total = 0.0
+            for probability, options, bank in outcomes[count]:
+                if bank >= missing:
+                    total += probability
+                    continue
+                best = 0.0
+                for next_count, steps in options:
+                    chance = chances[next_count][missing - steps]
+                    if chance > best:
+                        best = chance
+                total += probability * best
+            chances[count][missing] = total
+    return chances
+
+
+# ==================== Built table ====================
+# The reach chances come first (6 rows of horizon + 1), then the table of
+# every gap from 1 to the horizon in turn (6 rows of gap values each).
+
+
+def table_size(horizon: int = HORIZON_STEPS) -> int:
+    """Number of float32 values in a table built up to horizon steps."""
+    return (horizon + 1) * (6 + 3 * horizon)
+
+
+def _reach_offset(horizon: int, count: int) -> int:
+    return (count - 1) * (horizon + 1)
+
+
+def _gap_offset(horizon: int, gap: int, count: int) -> int:
+    return 6 * (horizon + 1) + 3 * gap * (gap - 1) + (count - 1) * gap
+
+
+def build_table(
+    horizon: int = HORIZON_STEPS,
+    workers: int = 1,
+    progress: Callable[[int, int], None] | None = None,
+) -> array:
+    """
+    Solve the reach chances and every gap up to horizon steps.
+
+    Gaps are independent and are split across worker processes when
+    workers > 1. progress(done, total) is called as gaps are solved.
+    """
+    values = array("f", bytes(4 * table_size(horizon)))
+    for count, row in enumerate(_solve_reach(horizon)[1:], 1):
+        start = _reach_offset(horizon, count)
+        values[start : start + horizon + 1] = array("f", row)
+
+    gaps = range(1, horizon + 1)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = executor.map(_solve_gap, gaps, chunksize=8) if executor else map(_solve_gap, gaps)
+        for gap, rows in zip(gaps, results):
+            for count in range(1, 7):
+                start = _gap_offset(horizon, gap, count)
+                values[start : start + gap] = array("f", rows[count])
+            if progress:
+                progress(gap, horizon)
+    finally:
+        if executor:
+            executor.shutdown()
+    return values
+
+
+def save_table(values: array, path: Path = DEFAULT_TABLE_PATH, horizon: int = HORIZON_STEPS) -> None:
+    """Write a built table (atomically, so a running server never reads half of it)."""
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _FORMAT, horizon))
+        values.tofile(f)
+    temp_path.replace(path)
+
+
+def load_table(path: Path = DEFAULT_TABLE_PATH, horizon: int = HORIZON_STEPS) -> memoryview | None:
+    """Memory-map a built table, or return None if it is missing or unusable."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) != _HEADER.size + 4 * table_size(horizon):
+        return None
+    magic, version, built_horizon = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC or version != _FORMAT or built_horizon != horizon:
+        return None
+    return memoryview(mapped)[_HEADER.size :].cast("f")
+
+
+_table: memoryview | array | None = None
+_table_loaded = False
+
+
+def use_table(values: memoryview | array | None) -> None:
+    """Replace the table bots read (None solves gaps as they come up)."""
+    global _table, _table_loaded
+    _table, _table_loaded = values, True
+    _gap_values.cache_clear()
+    _reach_chances.cache_clear()
+    _evaluate.cache_clear()
+
+
+def get_table() -> memoryview | array | None:
+    """The built table, or None if it was not built."""
+    global _table, _table_loaded
+    if not _table_loaded:
+        _table_loaded = True
+        _table = load_table()
+    return _table
+
+
+def warm_up() -> bool:
+    """Load the table (or solve the reach chances without it); False if not built."""
+    _reach_chances()
+    return get_table() is not None
+
+
+# ==================== Decisions ====================
+
+
+# One entry per gap, so no gap is ever solved twice
+@lru_cache(maxsize=HORIZON_STEPS)
+def _gap_values(gap: int) -> list:
+    """Rolling values for one gap, indexed [dice to roll][turn steps]."""
+    table = get_table()
+    if table is None:
+        return _solve_gap(gap)
+    starts = [_gap_offset(HORIZON_STEPS, gap, count) for count in range(1, 7)]
+    return [None] + [table[start : start + gap] for start in starts]
+
+
+@lru_cache(maxsize=1)
+def _reach_chances() -> list:
+    """Reach chances, indexed [dice to roll][steps missing]."""
+    table = get_table()
+    if table is None:
+        return _solve_reach(HORIZON_STEPS)
+    starts = [_reach_offset(HORIZON_STEPS, count) for count in range(1, 7)]
+    return [None] + [table[start : start + HORIZON_STEPS + 1] for start in starts]
+
+
+def _roll_steps(dice_count: int, turn: int, gap: int, must_reach: bool) -> float:
+    """Value in steps of rolling dice_count dice at turn steps, short of the gap."""
+    if must_reach:
+        return gap * _reach_chances()[dice_count][min(gap - turn, HORIZON_STEPS)]
+    return _gap_values(gap)[dice_count][turn]
+
+
+def _gap_steps(gap: int, must_reach: bool) -> int:
+    """Gap in steps, clamped to the horizon unless it must be reached."""
+    if not must_reach:
+        gap = min(gap, GAP_HORIZON)
+    return max(1, -(-gap // POINT_STEP))
+
+
+def roll_value(dice_count: int, turn_score: int, gap: int, *, must_reach: bool = False) -> float:
+    """Expected banked points (capped at the gap) of rolling dice_count dice now."""
+    steps = _gap_steps(gap, must_reach)
+    turn = turn_score // POINT_STEP
+    if turn >= steps:
+        return float(steps * POINT_STEP)
+    return _roll_steps(dice_count, turn, steps, must_reach) * POINT_STEP
+
+
+def best_move(
+    roll: list[int],
+    turn_score: int,
+    gap: int,
+    can_roll: bool,
+    *,
+    must_reach: bool = False,
+) -> Move:
+    """
+    The best next move in a turn.
+
+    Args:
+        roll: Dice rolled and not yet taken (empty before the first roll and
+            after hot dice).
+        turn_score: Points taken so far this turn.
+        gap: Points still needed to reach the target (or to pass the leader).
+        can_roll: Whether rolling is allowed yet (a combination was taken, or
+            there is nothing to take).
+        must_reach: Banking short of the gap is worthless.
+
+    Returns:
+        A (combo_type, number) pair to take, "roll", or "bank".
+    """
+    steps = _gap_steps(gap, must_reach)
+    return _evaluate(tuple(sorted(roll)), turn_score // POINT_STEP, can_roll, steps, must_reach)[1]
+
+
+@lru_cache(maxsize=MOVE_CACHE_SIZE)
+def _evaluate(
+    dice: tuple[int, ...], turn: int, stop_allowed: bool, gap: int, must_reach: bool
+) -> tuple[float, Move]:
+    """Best (value in steps, move) from a point in a turn."""
+    best: tuple[float, Move] = (-inf, "roll")
+    takes = _takes(dice)
+    if stop_allowed:
+        if turn < gap:
+            best = (_roll_steps(len(dice) or 6, turn, gap, must_reach), "roll")
+        if not takes and turn > 0 and (turn >= gap or not must_reach):
+            # Ties go to banking: the points are certain
+            bank_now = min(turn, gap)
+            if bank_now >= best[0]:
+                best = (bank_now, "bank")
+    for combo_type, number, steps, left in takes:
+        value, _ = _evaluate(left, turn + steps, True, gap, must_reach)
+        if value > best[0]:
+            best = (value, (combo_type, number))
+    return best
@@ -1,11 +1,16 @@
 """
 Bot AI for Five Card Draw.
+
+Discards are chosen by comparing the Monte Carlo equity of a few candidate
+holds, and bets weigh equity against pot odds.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ...game_utils.cards import Card
+from ...game_utils.poker_equity import DEFAULT_TIME_BUDGET_S, estimate_equity, pot_odds
 from ...game_utils.poker_evaluator import best_hand
 
 if TYPE_CHECKING:
@@ -24,12 +29,45 @@ def bot_think(game: "FiveCardDrawGame", player: "FiveCardDrawPlayer") -> str | N
 
 
 def _choose_discards(game: "FiveCardDrawGame", player: "FiveCardDrawPlayer") -> None:
-    if len(player.hand) >= 5:
-        score, _ = best_hand(player.hand)
+    hand = player.hand
+    max_discards = 4 if any(card.rank == 1 for card in hand) else 3
+    heuristic = _heuristic_discards(hand, max_discards)
+    if len(hand) < 5:
+        player.to_discard = heuristic
+        return
+    candidates = [frozenset(i for i in range(len(hand)) if i not in heuristic)]
+    for keep in _candidate_holds(hand):
+        if keep not in candidates and len(hand) - len(keep) <= max_discards:
+            candidates.append(keep)
+
+    opponents = _count_opponents(game, player)
+    budget = DEFAULT_TIME_BUDGET_S / len(candidates)
+    best_keep = candidates[0]
+    best_equity = -1.0
+    for keep in candidates:
+        kept = [hand[i] for i in keep]
+        dropped = [hand[i] for i in range(len(hand)) if i not in keep]
+        equity = estimate_equity(
+            kept, None, opponents, dead=dropped, samples=500, time_budget_s=budget
+        )
+        if equity > best_equity:
+            best_keep, best_equity = keep, equity
+    player.to_discard = {i for i in range(len(hand)) if i not in best_keep}
+
+
+def _heuristic_discards(hand: list[Card], max_discards: int) -> set[int]:
+    """Keep made hands (pairs and better), discard the rest."""
+    discard_indices = [i for i in range(len(hand)) if i not in _made_hold(hand)]
+    return set(discard_indices[:max_discards])
+
+
+def _made_hold(hand: list[Card]) -> frozenset[int]:
+    if len(hand) >= 5:
+        score, _ = best_hand(hand)
         category = score[0]
     else:
         category = 0
-    ranks = [card.rank for card in player.hand]
+    ranks = [card.rank for card in hand]
     counts: dict[int, int] = {}
     for r in ranks:
         counts[r] = counts.get(r, 0) + 1
@@ -38,35 +76,66 @@ def _choose_discards(game: "FiveCardDrawGame", player: "FiveCardDrawPlayer") ->
         keep_ranks = set(ranks)
     elif category == 3:  # three of a kind
         keep_ranks = {r for r, c in counts.items() if c == 3}
-    elif category == 2:  # two pair
+    elif category in (1, 2):  # one or two pair
         keep_ranks = {r for r, c in counts.items() if c == 2}
-    elif category == 1:  # one pair
-        keep_ranks = {r for r, c in counts.items() if c == 2}
-    discard_indices = [i for i, card in enumerate(player.hand) if card.rank not in keep_ranks]
-    max_discards = 4 if any(card.rank == 1 for card in player.hand) else 3
-    if len(discard_indices) > max_discards:
-        discard_indices = discard_indices[:max_discards]
-    player.to_discard = set(discard_indices)
+    return frozenset(i for i, card in enumerate(hand) if card.rank in keep_ranks)
+
+
+def _candidate_holds(hand: list[Card]) -> list[frozenset[int]]:
+    """Index sets worth holding: made hands, four-card draws and high cards."""
+    holds = [_made_hold(hand), frozenset(range(len(hand)))]
+
+    by_suit: dict[int, list[int]] = {}
+    for i, card in enumerate(hand):
+        by_suit.setdefault(card.suit, []).append(i)
+    for indices in by_suit.values():
+        if len(indices) == 4:
+            holds.append(frozenset(indices))
+
+    values = {i: _rank_value(card.rank) for i, card in enumerate(hand)}
+    for low in range(1, 11):
+        window = {low, low + 1, low + 2, low + 3, low + 4}
+        if low == 1:
+            window = {14, 2, 3, 4, 5}
+        seen: dict[int, int] = {}
+        for i, value in values.items():
+            if value in window:
+                seen.setdefault(value, i)
+        if len(seen) == 4:
+            holds.append(frozenset(seen.values()))
+
+    high = sorted(values, key=lambda i: values[i], reverse=True)
+    holds.append(frozenset(high[:1]))
+    holds.append(frozenset(high[:2]))
+
+    return holds
+
+
+def _rank_value(rank: int) -> int:
+    return 14 if rank == 1 else rank
+
+
+def _count_opponents(game: "FiveCardDrawGame", player: "FiveCardDrawPlayer") -> int:
+    return sum(1 for p in game.get_active_players() if not p.folded and p.id != player.id)
 
 
 def _decide_bet(game: "FiveCardDrawGame", player: "FiveCardDrawPlayer") -> str | None:
     to_call = game.betting.amount_to_call(player.id)
-    if len(player.hand) >= 5:
-        score, _ = best_hand(player.hand)
-        category = score[0]
-    else:
-        category = 0
+    opponents = _count_opponents(game, player)
+    equity = estimate_equity(player.hand, None, opponents) if len(player.hand) >= 5 else 0.0
     min_raise = max(game.betting.last_raise_size, 1)
     can_raise = game.betting.can_raise() and (to_call + min_raise) <= player.chips
+    # Equity of an average hand against this many opponents
+    fair_share = 1 / (max(1, opponents) + 1)
     if to_call == 0:
-        if can_raise and category >= 1:
+        if can_raise and equity >= fair_share + (1 - fair_share) * 0.25:
             return "raise"
         return "call"
     if to_call >= player.chips:
         return "call"
-    if category >= 2 and to_call <= max(1, player.chips // 6):
-        return "call"
-    if category >= 1 and to_call <= max(1, player.chips // 12):
+    if can_raise and equity >= fair_share + (1 - fair_share) * 0.5:
+        return "raise"
+    if equity >= pot_odds(to_call, game.pot_manager.total_pot()):
         return "call"
     if to_call <= max(1, player.chips // 25):
         return "call"
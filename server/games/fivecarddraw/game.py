@@ -500,7 +500,7 @@ class FiveCardDrawGame(Game):
             self._advance_turn()
             return
         if self.phase == "draw" and p.is_bot and p.all_in:
-            self.bot_think(p)
+            BotHelper.think(self, p)
             self._action_draw_cards(p, "draw_cards")
             return
         self.announce_turn(turn_sound="game_3cardpoker/turn.ogg")
@@ -543,6 +543,29 @@ class FiveCardDrawGame(Game):
             self._handle_turn_timeout()
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the next sound or hand, a turn timeout, or a bot's bet or draw."""
+        sound = self.ticks_until_next_sound()
+        if not self.game_active:
+            return sound
+        next_hand = getattr(self, "_next_hand_wait_ticks", 0)
+        if next_hand > 0:
+            return self.soonest_wake(sound, next_hand)
+        return self.soonest_wake(
+            sound, self.timer.ticks_until_expiry(), BotHelper.ticks_until_wake(self)
+        )
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        if not self.game_active:
+            return
+        if getattr(self, "_next_hand_wait_ticks", 0) > 0:
+            self._next_hand_wait_ticks -= ticks
+            return
+        self.timer.skip(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: FiveCardDrawPlayer) -> str | None:
         return bot_think(self, player)
 
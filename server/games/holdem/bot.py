@@ -1,8 +1,8 @@
 """
 Bot AI for Texas Hold'em.
 
-Lightweight strategy based on preflop hand strength, position, stack size,
-and postflop hand category.
+Lightweight strategy based on preflop hand strength, position and stack size.
+Postflop decisions weigh Monte Carlo equity against pot odds.
 """
 
 from __future__ import annotations
@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import random
 
-from ...game_utils.poker_evaluator import best_hand
+from ...game_utils.poker_equity import estimate_equity, pot_odds
 from ...game_utils.poker_state import order_after_button
 from ...game_utils.poker_actions import compute_pot_limit_caps, clamp_total_to_cap
 
@@ -35,11 +35,26 @@ def bot_think(game: "HoldemGame", player: "HoldemPlayer") -> str | None:
             strength, to_call, can_raise, stack_bb, position, can_raise_amount, variance
         )
 
-    score = None
-    if len(player.hand) + len(game.community) >= 5:
-        score, _ = best_hand(player.hand + game.community)
+    opponents = _count_opponents(game, player)
+    equity = estimate_equity(player.hand, game.community, opponents)
     return _decide_postflop(
-        score, to_call, can_raise, stack_bb, position, can_raise_amount, variance
+        equity,
+        opponents,
+        to_call,
+        game.pot_manager.total_pot(),
+        can_raise,
+        stack_bb,
+        position,
+        can_raise_amount,
+        variance,
+    )
+
+
+def _count_opponents(game: "HoldemGame", player: "HoldemPlayer") -> int:
+    return sum(
+        1
+        for p in game.get_active_players()
+        if isinstance(p, type(player)) and not p.folded and p.id != player.id
     )
 
 
@@ -113,8 +128,10 @@ def _decide_preflop(
 
 
 def _decide_postflop(
-    score: tuple[int, tuple[int, ...]] | None,
+    equity: float,
+    opponents: int,
     to_call: int,
+    pot: int,
     can_raise: bool,
     stack_bb: float,
     position: int,
@@ -123,23 +140,20 @@ def _decide_postflop(
 ) -> str:
     late_position = position >= 2
     loose = variance > 1.05
+    raise_ok = can_raise and can_raise_amount and stack_bb >= 6
+    # Equity of an average hand against this many opponents
+    fair_share = 1 / (max(1, opponents) + 1)
     if to_call == 0:
-        if score and score[0] >= 2 and can_raise and can_raise_amount and stack_bb >= 6:
+        if raise_ok and equity >= fair_share + (1 - fair_share) * 0.25:
             return "raise"
         if loose and can_raise and can_raise_amount and random.random() < 0.2:
             return "raise"
         return "call"
-    if score and score[0] >= 4:
-        return "raise" if can_raise and can_raise_amount and stack_bb >= 6 else "call"
-    if score and score[0] >= 2:
-        if to_call <= max(1, stack_bb * (2.5 if loose else 2)):
-            return "call"
-        return "fold"
-    if score and score[0] >= 1:
-        if to_call <= max(1, stack_bb * (1.3 if late_position or loose else 1.0)):
-            return "call"
-        return "fold"
-    if to_call <= max(1, stack_bb * (0.7 if late_position or loose else 0.4)):
+    if raise_ok and equity >= fair_share + (1 - fair_share) * 0.5:
+        return "raise"
+    # Late position and loose bots call a little wider than the odds allow
+    needed = pot_odds(to_call, pot) / (1.15 if late_position or loose else 1.0)
+    if equity * variance >= needed:
         return "call"
     return "fold"
 
@@ -715,6 +715,39 @@ class HoldemGame(Game):
         self._tick_blind_timer()
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the next sound, hand or board card, a blind raise, a timeout or a bot bet."""
+        sound = self.ticks_until_next_sound()
+        if not self.game_active:
+            return sound
+        next_hand = getattr(self, "_next_hand_wait_ticks", 0)
+        if next_hand > 0:
+            return self.soonest_wake(sound, next_hand)
+        if self.pending_showdown:
+            return self.soonest_wake(sound, self.pending_board_wait_ticks + 1)
+        return self.soonest_wake(
+            sound,
+            self.timer.ticks_until_expiry(),
+            self.blind_timer_ticks if self.blind_timer_ticks > 0 else None,
+            BotHelper.ticks_until_wake(self),
+        )
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        if not self.game_active:
+            return
+        if getattr(self, "_next_hand_wait_ticks", 0) > 0:
+            self._next_hand_wait_ticks -= ticks
+            return
+        if self.pending_showdown:
+            self.pending_board_wait_ticks -= ticks
+            return
+        self.timer.skip(ticks)
+        if self.blind_timer_ticks > 0:
+            self.blind_timer_ticks -= ticks
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: HoldemPlayer) -> str | None:
         return bot_think(self, player)
 
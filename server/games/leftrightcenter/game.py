@@ -355,6 +355,27 @@ class LeftRightCenterGame(Game):
             return
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the next sound, the roll or turn delay ending, or a bot roll."""
+        sound = self.ticks_until_next_sound()
+        if self._roll_delay_ticks > 0:
+            return self.soonest_wake(sound, self._roll_delay_ticks)
+        if self.turn_delay_ticks > 0:
+            return self.soonest_wake(sound, self.turn_delay_ticks + 1)
+        if self._pending_turn_advance:
+            return 1
+        return self.soonest_wake(sound, BotHelper.ticks_until_wake(self))
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        if self._roll_delay_ticks > 0:
+            self._roll_delay_ticks -= ticks
+        elif self.turn_delay_ticks > 0:
+            self.turn_delay_ticks -= ticks
+        else:
+            BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: LeftRightCenterPlayer) -> str | None:
         return "roll"
 
@@ -378,6 +378,21 @@ class LightTurretGame(Game):
             return
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until a sound, the pending game end, or a bot's next shot or upgrade."""
+        sound = self.ticks_until_next_sound()
+        if self._pending_finish:
+            return sound or 1
+        if not self.game_active or self.status == "finished":
+            return sound
+        return self.soonest_wake(sound, BotHelper.ticks_until_wake(self))
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        if self.game_active and self.status != "finished":
+            BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making."""
         if not isinstance(player, LightTurretPlayer) or not player.alive:
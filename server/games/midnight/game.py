@@ -411,6 +411,14 @@ class MidnightGame(Game, DiceGameMixin):
 
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the bot on turn rolls or keeps a die; human turns wait for events."""
+        return BotHelper.ticks_until_wake(self)
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: MidnightPlayer) -> str | None:
         """Bot AI decision making. Called by BotHelper."""
         # Strategy: Keep 1 and 4 first, then keep highest dice
@@ -1834,6 +1834,25 @@ class MileByMileGame(Game):
 
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the race timer or dirty trick window runs out, or a bot plays."""
+        if not self.game_active:
+            return None
+        return self.soonest_wake(
+            self._round_timer.ticks_until_ready(),
+            self.dirty_trick_window_ticks if self.dirty_trick_window_ticks > 0 else None,
+            BotHelper.ticks_until_wake(self),
+        )
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        if not self.game_active:
+            return
+        self._round_timer.skip_ticks(ticks)
+        if self.dirty_trick_window_ticks > 0:
+            self.dirty_trick_window_ticks -= ticks
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: MileByMilePlayer) -> str | None:
         """Bot AI decision making."""
         # Don't act during between-race countdown
@@ -520,6 +520,15 @@ class PiratesGame(Game):
         # Process bot thinking
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until a queued sound plays or the bot on turn moves."""
+        return self.soonest_wake(self.ticks_until_next_sound(), BotHelper.ticks_until_wake(self))
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        self.skip_sound_ticks(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Determine what action a bot should take."""
         if not isinstance(player, PiratesPlayer):
@@ -1,15 +1,64 @@
 """Game registry for registering and looking up game types."""
 
+import importlib
+from dataclasses import dataclass
 from typing import Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import Game
 
 
+@dataclass(frozen=True)
+class GameDescriptor:
+    """
+    What menus and listings need to know about a game, without importing it.
+
+    The game's module is only imported when its class is first needed
+    (see GameRegistry.get).
+    """
+
+    type: str
+    name: str  # English fallback name
+    category: str
+    min_players: int
+    max_players: int
+    module: str  # Absolute module that defines (and registers) the class
+    class_name: str
+
+    @property
+    def name_key(self) -> str:
+        """Localization key for the game's name."""
+        return f"game-name-{self.type}"
+
+    @classmethod
+    def from_class(cls, game_class: Type["Game"]) -> "GameDescriptor":
+        """Describe an already imported game class."""
+        return cls(
+            type=game_class.get_type(),
+            name=game_class.get_name(),
+            category=game_class.get_category(),
+            min_players=game_class.get_min_players(),
+            max_players=game_class.get_max_players(),
+            module=game_class.__module__,
+            class_name=game_class.__name__,
+        )
+
+    def load(self) -> Type["Game"]:
+        """Import the game's module and return its class."""
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+
 class GameRegistry:
-    """Registry of all available game types."""
+    """
+    Registry of all available game types.
+
+    Games are known up front by descriptor (see games/__init__.py) and their
+    modules are imported on first use, so listing games or starting a
+    process that only plays one game does not import all of them.
+    """
 
     _games: dict[str, Type["Game"]] = {}
+    _descriptors: dict[str, GameDescriptor] = {}
 
     @classmethod
     def register(cls, game_class: Type["Game"]) -> None:
@@ -17,27 +66,70 @@ class GameRegistry:
         game_type = game_class.get_type()
         cls._games[game_type] = game_class
 
+    @classmethod
+    def describe(cls, descriptor: GameDescriptor) -> None:
+        """Register a game by descriptor, to be imported when first used."""
+        cls._descriptors[descriptor.type] = descriptor
+
     @classmethod
     def get(cls, game_type: str) -> Type["Game"] | None:
-        """Get a game class by type."""
-        return cls._games.get(game_type)
+        """Get a game class by type, importing it if needed."""
+        game_class = cls._games.get(game_type)
+        if game_class is None and game_type in cls._descriptors:
+            game_class = cls._descriptors[game_type].load()
+        return game_class
 
     @classmethod
     def get_all(cls) -> list[Type["Game"]]:
-        """Get all registered game classes."""
-        return list(cls._games.values())
+        """Get all registered game classes (imports every game)."""
+        return [cls.get(descriptor.type) for descriptor in cls.get_descriptors()]
+
+    @classmethod
+    def get_descriptor(cls, game_type: str) -> GameDescriptor | None:
+        """Get a game's descriptor by type, without importing the game."""
+        descriptor = cls._descriptors.get(game_type)
+        if descriptor is None and game_type in cls._games:
+            descriptor = GameDescriptor.from_class(cls._games[game_type])
+        return descriptor
+
+    @classmethod
+    def get_descriptors(cls) -> list[GameDescriptor]:
+        """Get every game's descriptor, without importing any games."""
+        descriptors = list(cls._descriptors.values())
+        descriptors.extend(
+            GameDescriptor.from_class(game_class)
+            for game_type, game_class in cls._games.items()
+            if game_type not in cls._descriptors
+        )
+        return descriptors
+
+    @classmethod
+    def get_leaderboard_types(cls) -> dict[str, list[dict]]:
+        """Get each game type's custom leaderboard types."""
+        return {
+            game_class.get_type(): game_class.get_leaderboard_types()
+            for game_class in cls.get_all()
+        }
 
     @classmethod
     def get_by_category(cls) -> dict[str, list[Type["Game"]]]:
         """Get games organized by category."""
         categories: dict[str, list[Type["Game"]]] = {}
-        for game_class in cls._games.values():
+        for game_class in cls.get_all():
             category = game_class.get_category()
             if category not in categories:
                 categories[category] = []
             categories[category].append(game_class)
         return categories
 
+    @classmethod
+    def get_descriptors_by_category(cls) -> dict[str, list[GameDescriptor]]:
+        """Get game descriptors organized by category, without importing games."""
+        categories: dict[str, list[GameDescriptor]] = {}
+        for descriptor in cls.get_descriptors():
+            categories.setdefault(descriptor.category, []).append(descriptor)
+        return categories
+
 
 def register_game(game_class: Type["Game"]) -> Type["Game"]:
     """Decorator to register a game class."""
@@ -4,14 +4,18 @@ Bot AI for Scopa game.
 Handles bot decision making for card play.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
+from ...game_utils.bot_service import ThinkJob
 from ...game_utils.cards import Card
 from .capture import find_captures, select_best_capture
 
 if TYPE_CHECKING:
     from .game import ScopaGame, ScopaPlayer
 
+# Combo chain results by (ids of cards played, depth, max depth)
+ChainTable = dict[tuple[frozenset[int], int, int], tuple[list[Card], list[Card], float]]
+
 
 def bot_think(game: "ScopaGame", player: "ScopaPlayer") -> str | None:
     """
@@ -24,15 +28,69 @@ def bot_think(game: "ScopaGame", player: "ScopaPlayer") -> str | None:
     Returns:
         Action ID to execute, or None if no action available.
     """
+    return choose_card(*snapshot(game, player))
+
+
+def bot_think_job(game: "ScopaGame", player: "ScopaPlayer") -> ThinkJob | None:
+    """The bot's decision as a job that can run on a worker process."""
     if not player.hand:
         return None
+    # Falls back to the best card without searching for combo chains
+    return ThinkJob(choose_card, snapshot(game, player), fallback_fn=choose_card_quickly)
+
+
+def snapshot(game: "ScopaGame", player: "ScopaPlayer") -> tuple:
+    """Everything choose_card reads, as picklable arguments."""
+    return (
+        tuple(player.hand),
+        tuple(game.table_cards),
+        game.options.escoba,
+        game.options.inverse_scopa,
+        len(game.get_active_players()),
+    )
+
+
+def choose_card_quickly(*args) -> str | None:
+    """choose_card without searching for combo chains (takes the same arguments)."""
+    return choose_card(*args, search_combos=False)
+
+
+def choose_card(
+    hand: tuple[Card, ...],
+    table_cards: tuple[Card, ...],
+    escoba: bool,
+    inverse: bool,
+    num_players: int,
+    search_combos: bool = True,
+) -> str | None:
+    """
+    Pick the card to play (pure: reads only its arguments).
+
+    Args:
+        hand: The bot's hand.
+        table_cards: Cards on the table.
+        escoba: Whether escoba rules apply.
+        inverse: Whether inverse scopa rules apply.
+        num_players: Active players (longer combo chains are riskier with more).
+        search_combos: Search for combo chains set up by non-capturing plays.
+
+    Returns:
+        Action ID to execute, or None if the hand is empty.
+    """
+    if not hand:
+        return None
 
     # Evaluate each card and pick the best
     best_card = None
     best_score = float("-inf")
-
-    for card in player.hand:
-        score = evaluate_card(game, card, player)
+    # Chains started from different cards reach the same states, so the
+    # search results are shared across the whole decision
+    transpositions: ChainTable | None = {} if search_combos else None
+
+    for card in hand:
+        score = score_card(
+            card, hand, table_cards, escoba, inverse, num_players, transpositions, search_combos
+        )
         if score > best_score:
             best_score = score
             best_card = card
@@ -49,6 +107,7 @@ def find_best_combo_chain(
     cards_played: list[Card],
     depth: int = 0,
     max_depth: int = 4,
+    transpositions: ChainTable | None = None,
 ) -> tuple[list[Card], list[Card], float]:
     """
     Recursively find the best combo chain starting from current state.
@@ -62,6 +121,10 @@ def find_best_combo_chain(
         cards_played: Cards played so far in this combo chain.
         depth: Current recursion depth.
         max_depth: Maximum depth to search.
+        transpositions: Results of states already searched. The table is
+            assumed to be a fixed starting table plus cards_played, so a state
+            is identified by the set of cards played; reuse a table only for
+            searches from the same starting table and hand.
 
     Returns:
         Tuple of (cards_to_play, cards_captured, score).
@@ -69,6 +132,13 @@ def find_best_combo_chain(
     if depth >= max_depth or not remaining_hand:
         return ([], [], 0.0)
 
+    key = (frozenset(c.id for c in cards_played), depth, max_depth)
+    if transpositions is not None:
+        cached = transpositions.get(key)
+        if cached is not None:
+            return cached
+    played_set = key[0]
+
     best_sequence: list[Card] = []
     best_captured: list[Card] = []
     best_score = 0.0
@@ -78,34 +148,18 @@ def find_best_combo_chain(
         captures = find_captures(table, card.rank, escoba)
 
         if captures:
-            best_capture = select_best_capture(captures)
-            # Check if any of our previously played cards are in this capture
-            played_set = set(c.id for c in cards_played)
-            captured_from_combo = [c for c in best_capture if c.id in played_set]
-
-            if captured_from_combo:
-                # This completes a combo! Score it.
-                score = 0.0
-                # Base score for combo completion
-                score += 15 + len(best_capture) * 5
-                # Bonus for each card we played that gets captured back
-                score += len(captured_from_combo) * 8
-                # Bonus for chain length
-                score += len(cards_played) * 3
-
-                # Value of captured cards
-                for c in best_capture:
-                    if c.suit == 1:  # Diamond
-                        score += 2
-                    if c.rank == 7:
-                        score += 3
-                    if c.rank == 7 and c.suit == 1:
-                        score += 5
-
+            # Score the longest captures; taking the best of them (rather than
+            # the first in table order) makes the result independent of the
+            # order the chain was played in, which the transposition table needs
+            longest = len(select_best_capture(captures))
+            for capture in captures:
+                if len(capture) != longest:
+                    continue
+                score = _score_combo_capture(capture, played_set, len(cards_played))
                 if score > best_score:
                     best_score = score
                     best_sequence = cards_played + [card]
-                    best_captured = best_capture
+                    best_captured = capture
         else:
             # No capture - this card goes to table, continue the chain
             new_table = table + [card]
@@ -113,7 +167,7 @@ def find_best_combo_chain(
             new_played = cards_played + [card]
 
             seq, captured, score = find_best_combo_chain(
-                new_table, new_hand, escoba, new_played, depth + 1, max_depth
+                new_table, new_hand, escoba, new_played, depth + 1, max_depth, transpositions
             )
 
             if score > best_score:
@@ -121,11 +175,46 @@ def find_best_combo_chain(
                 best_sequence = seq
                 best_captured = captured
 
-    return (best_sequence, best_captured, best_score)
+    result = (best_sequence, best_captured, best_score)
+    if transpositions is not None:
+        transpositions[key] = result
+    return result
+
+
+def _score_combo_capture(
+    capture: list[Card], played_ids: frozenset[int], chain_length: int
+) -> float:
+    """Score a capture that ends a combo chain (0 if it takes back none of our cards)."""
+    # Check if any of our previously played cards are in this capture
+    captured_from_combo = [c for c in capture if c.id in played_ids]
+    if not captured_from_combo:
+        return 0.0
+
+    # This completes a combo! Score it.
+    score = 0.0
+    # Base score for combo completion
+    score += 15 + len(capture) * 5
+    # Bonus for each card we played that gets captured back
+    score += len(captured_from_combo) * 8
+    # Bonus for chain length
+    score += chain_length * 3
+
+    # Value of captured cards
+    for c in capture:
+        if c.suit == 1:  # Diamond
+            score += 2
+        if c.rank == 7:
+            score += 3
+        if c.rank == 7 and c.suit == 1:
+            score += 5
+    return score
 
 
 def check_combo_potential(
-    game: "ScopaGame", card: Card, player: "ScopaPlayer"
+    game: "ScopaGame",
+    card: Card,
+    player: "ScopaPlayer",
+    transpositions: ChainTable | None = None,
 ) -> float:
     """
     Check if playing this card sets up a capture combo chain.
@@ -140,18 +229,38 @@ def check_combo_potential(
         game: The Scopa game instance.
         card: The card being considered for play.
         player: The bot player.
+        transpositions: Shared combo chain search results (see
+            find_best_combo_chain).
 
     Returns:
         Bonus score if combo potential exists.
     """
-    escoba = game.options.escoba
-    other_cards = [c for c in player.hand if c.id != card.id]
+    return combo_potential(
+        card,
+        player.hand,
+        game.table_cards,
+        game.options.escoba,
+        len(game.get_active_players()),
+        transpositions,
+    )
+
+
+def combo_potential(
+    card: Card,
+    hand: Sequence[Card],
+    table_cards: Sequence[Card],
+    escoba: bool,
+    num_players: int,
+    transpositions: ChainTable | None = None,
+) -> float:
+    """check_combo_potential over plain state (see choose_card)."""
+    other_cards = [c for c in hand if c.id != card.id]
 
     if not other_cards:
         return 0.0
 
     # Simulate the table after playing this card
-    simulated_table = game.table_cards + [card]
+    simulated_table = list(table_cards) + [card]
 
     # Find the best combo chain starting from this state
     sequence, captured, score = find_best_combo_chain(
@@ -161,6 +270,7 @@ def check_combo_potential(
         cards_played=[card],
         depth=0,
         max_depth=min(len(other_cards), 4),  # Don't search too deep
+        transpositions=transpositions,
     )
 
     # Discount score based on chain length (longer chains are riskier)
@@ -169,7 +279,6 @@ def check_combo_potential(
         chain_length = len(sequence)
         # Each extra step has ~50% chance of being interrupted in 2-player
         # More players = more risk
-        num_players = len(game.get_active_players())
         risk_factor = 0.7 ** ((chain_length - 1) * (num_players - 1))
         score *= risk_factor
 
@@ -202,7 +311,12 @@ def evaluate_escoba_empty_table(card: Card, inverse: bool) -> float:
         return risk_penalty if not inverse else -risk_penalty
 
 
-def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float:
+def evaluate_card(
+    game: "ScopaGame",
+    card: Card,
+    player: "ScopaPlayer",
+    transpositions: ChainTable | None = None,
+) -> float:
     """
     Evaluate a card for bot play.
 
@@ -210,15 +324,36 @@ def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float
         game: The Scopa game instance.
         card: The card to evaluate.
         player: The bot player.
+        transpositions: Shared combo chain search results.
 
     Returns:
         Score for this card (higher is better).
     """
+    return score_card(
+        card,
+        player.hand,
+        game.table_cards,
+        game.options.escoba,
+        game.options.inverse_scopa,
+        len(game.get_active_players()),
+        transpositions,
+    )
+
+
+def score_card(
+    card: Card,
+    hand: Sequence[Card],
+    table_cards: Sequence[Card],
+    escoba: bool,
+    inverse: bool,
+    num_players: int,
+    transpositions: ChainTable | None = None,
+    search_combos: bool = True,
+) -> float:
+    """evaluate_card over plain state (see choose_card)."""
     score = 0.0
-    inverse = game.options.inverse_scopa
-    escoba = game.options.escoba
 
-    captures = find_captures(game.table_cards, card.rank, escoba)
+    captures = find_captures(list(table_cards), card.rank, escoba)
 
     if not captures:
         # No capture available
@@ -228,11 +363,13 @@ def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float
             score = -5 + (card.rank * 0.5)  # Prefer playing high cards
 
         # Check for combo setup potential
-        combo_bonus = check_combo_potential(game, card, player)
-        score += combo_bonus
+        if search_combos:
+            score += combo_potential(
+                card, hand, table_cards, escoba, num_players, transpositions
+            )
 
         # Escoba empty table defense
-        if escoba and len(game.table_cards) == 0:
+        if escoba and len(table_cards) == 0:
             score += evaluate_escoba_empty_table(card, inverse)
     else:
         best_capture = select_best_capture(captures)
@@ -246,7 +383,7 @@ def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float
             score = num_captured * 10
 
         # Check for scopa
-        is_scopa = num_captured == len(game.table_cards) and len(game.table_cards) > 0
+        is_scopa = num_captured == len(table_cards) and len(table_cards) > 0
         if is_scopa:
             score += 100 if not inverse else -100
 
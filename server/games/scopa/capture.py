@@ -4,29 +4,50 @@ Capture logic for Scopa game.
 Handles finding valid capture combinations and selecting the best one.
 """
 
+from functools import lru_cache
+
 from ...game_utils.cards import Card, card_name
 
+# Number of (table ranks, target) capture indexes kept
+CAPTURE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CAPTURE_CACHE_SIZE)
+def _subset_positions(ranks: tuple[int, ...], target: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Positions of the subsets of ranks (a sorted multiset) that sum to target.
+
+    Subsets are found as bitmasks by a DP over partial sums, so only subsets
+    that stay at or under the target are ever extended.
+    """
+    partial: dict[int, list[int]] = {0: [0]}
+    for i, rank in enumerate(ranks):
+        if rank <= 0 or rank > target:
+            continue
+        bit = 1 << i
+        for total in sorted(partial, reverse=True):
+            new_total = total + rank
+            if new_total <= target:
+                partial.setdefault(new_total, []).extend(mask | bit for mask in partial[total])
+    return tuple(
+        tuple(i for i in range(len(ranks)) if mask >> i & 1) for mask in partial.get(target, ())
+    )
+
 
 def find_subsets_with_sum(cards: list[Card], target: int) -> list[list[Card]]:
-    """Find all subsets of cards that sum to target."""
+    """
+    Find all subsets of cards that sum to target.
+
+    Subsets are returned in table order (the order a left-to-right search
+    finds them), and the search itself is cached by the multiset of ranks.
+    """
     if target <= 0:
         return []
 
-    results: list[list[Card]] = []
-
-    def backtrack(start: int, current: list[Card], current_sum: int):
-        if current_sum == target:
-            results.append(list(current))
-            return
-        if current_sum > target:
-            return
-        for i in range(start, len(cards)):
-            current.append(cards[i])
-            backtrack(i + 1, current, current_sum + cards[i].rank)
-            current.pop()
-
-    backtrack(0, [], 0)
-    return results
+    order = sorted(range(len(cards)), key=lambda i: cards[i].rank)
+    positions = _subset_positions(tuple(cards[i].rank for i in order), target)
+    subsets = sorted(sorted([order[p] for p in subset]) for subset in positions)
+    return [[cards[i] for i in subset] for subset in subsets]
 
 
 def find_captures(
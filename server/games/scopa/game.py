@@ -12,6 +12,7 @@ from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
+from ...game_utils.bot_service import ThinkJob
 from ...game_utils.cards import (
     Card,
     Deck,
@@ -36,7 +37,7 @@ from ...ui.keybinds import KeybindState
 # Modular components
 from .capture import find_captures, select_best_capture, get_capture_hint
 from .scoring import score_round, check_winner, declare_winner
-from .bot import bot_think
+from .bot import bot_think, bot_think_job
 
 
 @dataclass
@@ -851,12 +852,33 @@ class ScopaGame(Game):
         self._round_timer.on_tick()
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the round timer runs out or a bot plays a card (None between games)."""
+        if not self.game_active:
+            return None
+        return self.soonest_wake(
+            self._round_timer.ticks_until_ready(), BotHelper.ticks_until_wake(self)
+        )
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        if not self.game_active:
+            return
+        self._round_timer.skip_ticks(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making - delegated to bot module."""
         if not isinstance(player, ScopaPlayer):
             return None
         return bot_think(self, player)
 
+    def bot_think_job(self, player: Player) -> ThinkJob | None:
+        """The bot's decision as a job the BotService can run off the tick."""
+        if not isinstance(player, ScopaPlayer):
+            return None
+        return bot_think_job(self, player)
+
     # ==========================================================================
     # Action Handlers
     # ==========================================================================
@@ -499,6 +499,14 @@ class ThreesGame(Game, DiceGameMixin):
             return
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Only a bot on turn gives on_tick work: ticks until it next moves."""
+        return BotHelper.ticks_until_wake(self)
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making."""
         if not isinstance(player, ThreesPlayer):
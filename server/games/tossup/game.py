@@ -487,6 +487,17 @@ class TossUpGame(Game):
 
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the bot's next roll or bank; 1 until on_tick gives it a target."""
+        player = self.current_player
+        if self.game_active and player and player.is_bot and BotHelper.get_target(player) is None:
+            return 1  # on_tick sets up its target
+        return BotHelper.ticks_until_wake(self)
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: TossUpPlayer) -> str | None:
         """Bot AI decision making. Called by BotHelper."""
         target = BotHelper.get_target(player)
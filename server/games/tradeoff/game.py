@@ -1248,7 +1248,7 @@ class TradeoffGame(Game):
                 continue
 
             # Ask for new action
-            action_id = self.bot_think(tp)
+            action_id = BotHelper.think(self, tp)
             if action_id:
                 player.bot_pending_action = action_id
 
@@ -1276,7 +1276,7 @@ class TradeoffGame(Game):
             return
 
         # Ask for new action
-        action_id = self.bot_think(tp)
+        action_id = BotHelper.think(self, tp)
         if action_id:
             current_taker.bot_pending_action = action_id
 
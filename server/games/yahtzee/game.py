@@ -825,6 +825,14 @@ class YahtzeeGame(Game, DiceGameMixin):
             return
         BotHelper.on_tick(self)
 
+    def ticks_until_work(self) -> int | None:
+        """Ticks until the bot whose turn it is acts (None on a human's turn)."""
+        return BotHelper.ticks_until_wake(self)
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        super().on_ticks_skipped(ticks)
+        BotHelper.on_ticks_skipped(self, ticks)
+
     def bot_think(self, player: YahtzeePlayer) -> str | None:
         """Bot AI decision making."""
         turn_set = self.get_action_set(player, "turn")
@@ -863,9 +871,35 @@ class YahtzeeGame(Game, DiceGameMixin):
         # Must score - pick best category
         return self._bot_pick_best_category(player)
 
+    def _bot_state(self, player: YahtzeePlayer) -> tuple[int, int, bool]:
+        """The bot's scoresheet as a strategy state (filled mask, upper total, Yahtzee for 50)."""
+        filled = 0
+        for index, category in enumerate(ALL_CATEGORIES):
+            if player.scores.get(category) is not None:
+                filled |= 1 << index
+        return filled, player.get_upper_total(), player.scores.get("yahtzee") == 50
+
     def _bot_decide_keeps(self, player: YahtzeePlayer) -> list[bool]:
         """Decide which dice to keep for bot."""
         dice_values = player.dice.values
+
+        # Optimal play when the strategy table has been built
+        from .strategy import get_strategy
+
+        strategy = get_strategy()
+        if strategy:
+            keep = list(
+                strategy.best_keep(*self._bot_state(player), dice_values, player.rolls_left)
+            )
+            # Prefer dice that are already kept, so fewer toggles are needed
+            keeps = [False] * len(dice_values)
+            order = sorted(range(len(dice_values)), key=lambda i: not player.dice.is_kept(i))
+            for i in order:
+                if dice_values[i] in keep:
+                    keep.remove(dice_values[i])
+                    keeps[i] = True
+            return keeps
+
         counts = count_dice(dice_values)
 
         # Find best value to keep multiples of
@@ -892,6 +926,13 @@ class YahtzeeGame(Game, DiceGameMixin):
         if not open_cats:
             return None
 
+        from .strategy import get_strategy
+
+        strategy = get_strategy()
+        if strategy:
+            category = strategy.best_category(*self._bot_state(player), player.dice.values)
+            return f"score_{category}"
+
         # Calculate score for each open category
         scores = [(cat, calculate_score(player.dice.values, cat)) for cat in open_cats]
 
@@ -0,0 +1,377 @@
+"""
+Optimal solitaire strategy for Yahtzee bots.
+
+The solver computes the expected score of the rest of the game under
+optimal play for every turn-start state. A state is the set of filled
+categories, the upper section progress toward the bonus, and whether
+Yahtzee was scored for 50. These values are stored as a flat float32 table
+(4 MB) that is memory-mapped when a bot first needs it.
+
+Decisions inside a turn are derived from the table. Scoring picks the
+category with the best points plus value of the resulting state, which is
+a dozen lookups. Keep decisions compare the expected value of every keep.
+The keep values are computed once per turn-start state and cached. Bots
+toggle one die per think, so their repeated decisions in a turn are
+lookups.
+
+The scoring rules match game.py. The upper bonus is 35 at 63 points. Each
+further Yahtzee scores 100 once Yahtzee was scored for 50. There are no
+joker rules.
+
+Build the table once (about ten minutes on one core) with:
+    python -m server.cli build-strategy yahtzee
+"""
+
+import mmap
+import struct
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import factorial
+from operator import mul
+from pathlib import Path
+from typing import Callable
+
+from .game import ALL_CATEGORIES, UPPER_CATEGORIES, calculate_score
+
+# Where the built table is stored (generated, not under version control)
+DEFAULT_TABLE_PATH = Path(__file__).parent / "strategy.f32"
+
+# File header: magic, format version, number of float32 values
+_MAGIC = b"YZST"
+_FORMAT = 1
+_HEADER = struct.Struct("<4sII")
+
+UPPER_BONUS = 35
+UPPER_BONUS_THRESHOLD = 63
+YAHTZEE_BONUS = 100
+
+NUM_CATEGORIES = len(ALL_CATEGORIES)
+FULL_MASK = (1 << NUM_CATEGORIES) - 1
+_UPPER_MASK = (1 << len(UPPER_CATEGORIES)) - 1
+_YAHTZEE_BIT = 1 << ALL_CATEGORIES.index("yahtzee")
+
+# One value per (filled mask, upper progress 0-63, yahtzee-scored-50 flag)
+TABLE_SIZE = (FULL_MASK + 1) << 7
+
+# Turn-start states whose keep values are cached for keep decisions
+TURN_CACHE_SIZE = 64
+
+
+def state_index(filled: int, upper: int, yahtzee_50: bool) -> int:
+    """Position of a turn-start state in the table."""
+    return (filled << 7) | (min(upper, UPPER_BONUS_THRESHOLD) << 1) | int(yahtzee_50)
+
+
+# ==================== Dice tables ====================
+# Keeps are sorted multisets of 0-5 dice, grouped in layers by size; a roll
+# is a keep of all five dice (layer 5, 252 rolls). Keep values are computed
+# layer by layer: a keep of n dice is worth the average of its six n+1
+# children, and the best keep within a roll is the best of the keep itself
+# and of the keeps one die smaller.
+
+KEEP_LAYERS: list[list[tuple[int, ...]]] = [
+    list(combinations_with_replacement(range(1, 7), size)) for size in range(6)
+]
+_LAYER_INDEX = [{keep: i for i, keep in enumerate(layer)} for layer in KEEP_LAYERS]
+ROLLS = KEEP_LAYERS[5]
+ROLL_INDEX = _LAYER_INDEX[5]
+
+# Children of each keep: the keep plus one more die of each face
+_CHILDREN = [
+    [[_LAYER_INDEX[size + 1][tuple(sorted(keep + (face,)))] for face in range(1, 7)]
+     for keep in KEEP_LAYERS[size]]
+    for size in range(5)
+]
+# Parents of each keep: the distinct keeps with one die fewer
+_PARENTS = [[]] + [
+    [sorted({_LAYER_INDEX[size - 1][keep[:i] + keep[i + 1:]] for i in range(size)})
+     for keep in KEEP_LAYERS[size]]
+    for size in range(1, 6)
+]
+# Distinct keeps of each roll as (size, index in layer), largest first
+_ROLL_KEEPS = [
+    sorted(
+        {(size, _LAYER_INDEX[size][keep]) for size in range(6) for keep in combinations(roll, size)},
+        key=lambda keep: -keep[0],
+    )
+    for roll in ROLLS
+]
+_SIXTH = 1 / 6
+
+
+def _multiset_probability(dice: tuple[int, ...]) -> float:
+    """Chance that rolling len(dice) dice gives exactly this multiset."""
+    ways = factorial(len(dice))
+    for face in set(dice):
+        ways //= factorial(dice.count(face))
+    return ways / 6 ** len(dice)
+
+
+ROLL_PROBABILITIES = [_multiset_probability(roll) for roll in ROLLS]
+SCORES: list[list[int]] = [
+    [calculate_score(list(roll), category) for roll in ROLLS] for category in ALL_CATEGORIES
+]
+FACE_COUNTS: list[list[int]] = [[roll.count(face) for roll in ROLLS] for face in range(1, 7)]
+YAHTZEE_ROLLS = [i for i, roll in enumerate(ROLLS) if roll[0] == roll[4]]
+
+
+# ==================== Solver ====================
+
+
+def _final_values(values, filled: int, upper: int, flag: int) -> list[float]:
+    """Value of each final roll: best category's points plus the next state."""
+    columns = []
+    for category in range(NUM_CATEGORIES):
+        bit = 1 << category
+        if filled & bit:
+            continue
+        next_base = (filled | bit) << 7
+        if category < 6:
+            face = category + 1
+            adds = []
+            for count in range(6):
+                points = count * face
+                new_upper = min(UPPER_BONUS_THRESHOLD, upper + points)
+                if upper < UPPER_BONUS_THRESHOLD <= new_upper:
+                    points += UPPER_BONUS
+                adds.append(points + values[next_base | (new_upper << 1) | flag])
+            columns.append(list(map(adds.__getitem__, FACE_COUNTS[category])))
+        elif bit == _YAHTZEE_BIT:
+            scored = 50 + values[next_base | (upper << 1) | 1]
+            missed = values[next_base | (upper << 1)]
+            columns.append([scored if points else missed for points in SCORES[category]])
+        else:
+            following = values[next_base | (upper << 1) | flag]
+            columns.append([points + following for points in SCORES[category]])
+
+    best = list(map(max, *columns)) if len(columns) > 1 else columns[0]
+    if flag:
+        for roll in YAHTZEE_ROLLS:
+            best[roll] += YAHTZEE_BONUS
+    return best
+
+
+def _keep_values(roll_values: list[float]) -> list[list[float]]:
+    """Expected value of every keep (by layer), given each roll's value."""
+    layers = [roll_values]
+    for children in reversed(_CHILDREN):
+        get = layers[-1].__getitem__
+        layers.append([sum(map(get, six)) * _SIXTH for six in children])
+    layers.reverse()
+    return layers
+
+
+def _best_roll_values(keep_values: list[list[float]]) -> list[float]:
+    """Value of each roll when its best keep is chosen (keeping all = stop)."""
+    best = keep_values[0]
+    for size in range(1, 6):
+        get = best.__getitem__
+        best = [
+            max(value, max(map(get, parents)))
+            for value, parents in zip(keep_values[size], _PARENTS[size])
+        ]
+    return best
+
+
+def _turn_keep_values(values, filled: int, upper: int, flag: int):
+    """Keep values before the last reroll and before the second-to-last."""
+    last = _keep_values(_final_values(values, filled, upper, flag))
+    return last, _keep_values(_best_roll_values(last))
+
+
+def _state_value(values, filled: int, upper: int, flag: int) -> float:
+    """Expected remaining score from the start of a turn in this state."""
+    _, second = _turn_keep_values(values, filled, upper, flag)
+    first_roll = _best_roll_values(second)
+    return sum(map(mul, ROLL_PROBABILITIES, first_roll))
+
+
+@lru_cache(maxsize=None)
+def _reachable_upper(upper_filled: int) -> tuple[int, ...]:
+    """Upper section totals (capped at 63) possible with these categories filled."""
+    totals = {0}
+    for category in range(6):
+        if upper_filled >> category & 1:
+            face = category + 1
+            totals = {min(UPPER_BONUS_THRESHOLD, t + n * face) for t in totals for n in range(6)}
+    return tuple(sorted(totals))
+
+
+def _states(filled: int):
+    for upper in _reachable_upper(filled & _UPPER_MASK):
+        yield upper, 0
+        if filled & _YAHTZEE_BIT:
+            yield upper, 1
+
+
+def _solve_masks(values, masks: list[int]) -> list[tuple[int, float]]:
+    """Solve every state of the given masks (whose successors are solved)."""
+    if isinstance(values, bytes):
+        values = array("f", values)
+    return [
+        (state_index(filled, upper, flag), _state_value(values, filled, upper, flag))
+        for filled in masks
+        for upper, flag in _states(filled)
+    ]
+
+
+def build_table(
+    min_filled: int = 0,
+    workers: int = 1,
+    progress: Callable[[int, int], None] | None = None,
+) -> array:
+    """
+    Solve every turn-start state with at least min_filled categories filled.
+
+    States are solved from the end of the game backwards, one number of
+    filled categories at a time, so each state only needs values already
+    computed. The states of one layer are independent and are split across
+    worker processes when workers > 1. A full build (min_filled=0) solves
+    536,320 states. progress(done, total) is called as masks are solved.
+    """
+    values = array("f", bytes(4 * TABLE_SIZE))
+    layers = [
+        [filled for filled in range(FULL_MASK) if bin(filled).count("1") == size]
+        for size in range(NUM_CATEGORIES - 1, min_filled - 1, -1)
+    ]
+    total = sum(len(masks) for masks in layers)
+    done = 0
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for masks in layers:
+            if executor:
+                snapshot = values.tobytes()
+                chunks = [masks[i::workers * 4] for i in range(workers * 4)]
+                results = executor.map(_solve_masks, [snapshot] * len(chunks), chunks)
+            else:
+                results = ([state] for state in _solve_masks(values, masks))
+            for solved in results:
+                for index, value in solved:
+                    values[index] = value
+            done += len(masks)
+            if progress:
+                progress(done, total)
+    finally:
+        if executor:
+            executor.shutdown()
+    return values
+
+
+def save_table(values: array, path: Path = DEFAULT_TABLE_PATH) -> None:
+    """Write a built table (atomically, so a running server never reads half of it)."""
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _FORMAT, len(values)))
+        values.tofile(f)
+    temp_path.replace(path)
+
+
+def load_table(path: Path = DEFAULT_TABLE_PATH) -> memoryview | None:
+    """Memory-map a built table, or return None if it is missing or unusable."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) != _HEADER.size + 4 * TABLE_SIZE:
+        return None
+    magic, version, count = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC or version != _FORMAT or count != TABLE_SIZE:
+        return None
+    return memoryview(mapped)[_HEADER.size :].cast("f")
+
+
+# ==================== Decisions ====================
+
+
+class YahtzeeStrategy:
+    """Answers keep and scoring decisions from a table of state values."""
+
+    def __init__(self, values):
+        self._values = values
+        self._turns: OrderedDict[int, tuple[list[list[float]], list[list[float]]]] = OrderedDict()
+
+    def expected_score(self, filled: int = 0, upper: int = 0, yahtzee_50: bool = False) -> float:
+        """Expected remaining score from the start of a turn."""
+        return self._values[state_index(filled, upper, yahtzee_50)]
+
+    def _turn(self, filled: int, upper: int, flag: int):
+        key = state_index(filled, upper, bool(flag))
+        turn = self._turns.get(key)
+        if turn is None:
+            turn = _turn_keep_values(self._values, filled, upper, flag)
+            self._turns[key] = turn
+            if len(self._turns) > TURN_CACHE_SIZE:
+                self._turns.popitem(last=False)
+        else:
+            self._turns.move_to_end(key)
+        return turn
+
+    def best_keep(
+        self, filled: int, upper: int, yahtzee_50: bool, dice: list[int], rolls_left: int
+    ) -> tuple[int, ...]:
+        """
+        The dice values to keep for the next roll (sorted).
+
+        Returns all five dice when scoring now is best.
+        """
+        upper = min(upper, UPPER_BONUS_THRESHOLD)
+        last, second = self._turn(filled, upper, int(yahtzee_50))
+        keep_values = last if rolls_left <= 1 else second
+        best_keep, best_value = None, -1.0
+        # Keeping fewer dice only wins when strictly better
+        for size, index in _ROLL_KEEPS[ROLL_INDEX[tuple(sorted(dice))]]:
+            value = keep_values[size][index]
+            if value > best_value:
+                best_keep, best_value = (size, index), value
+        size, index = best_keep
+        return KEEP_LAYERS[size][index]
+
+    def best_category(self, filled: int, upper: int, yahtzee_50: bool, dice: list[int]) -> str:
+        """The open category to score these dice in."""
+        upper = min(upper, UPPER_BONUS_THRESHOLD)
+        flag = int(yahtzee_50)
+        roll = ROLL_INDEX[tuple(sorted(dice))]
+        values = self._values
+        best_category, best_value = None, None
+        for category in range(NUM_CATEGORIES):
+            bit = 1 << category
+            if filled & bit:
+                continue
+            points = SCORES[category][roll]
+            next_upper, next_flag = upper, flag
+            if category < 6:
+                next_upper = min(UPPER_BONUS_THRESHOLD, upper + points)
+                if upper < UPPER_BONUS_THRESHOLD <= next_upper:
+                    points += UPPER_BONUS
+            elif bit == _YAHTZEE_BIT:
+                next_flag = int(points == 50)
+            value = points + values[((filled | bit) << 7) | (next_upper << 1) | next_flag]
+            if best_value is None or value > best_value:
+                best_category, best_value = category, value
+        return ALL_CATEGORIES[best_category]
+
+
+_strategy: YahtzeeStrategy | None = None
+_strategy_loaded = False
+
+
+def use_strategy(strategy: YahtzeeStrategy | None) -> None:
+    """Replace the strategy bots use (None falls back to their heuristic)."""
+    global _strategy, _strategy_loaded
+    _strategy, _strategy_loaded = strategy, True
+
+
+def get_strategy() -> YahtzeeStrategy | None:
+    """The strategy backed by the built table, or None if it was not built."""
+    global _strategy, _strategy_loaded
+    if not _strategy_loaded:
+        _strategy_loaded = True
+        table = load_table()
+        if table is not None:
+            _strategy = YahtzeeStrategy(table)
+    return _strategy
@@ -333,6 +333,24 @@ virtual-bot-table-closed = Table closed by administrator.
 virtual-bots-none-to-clear = No virtual bots to clear.
 virtual-bots-status-report = Virtual Bots: { $total } total, { $online } online, { $offline } offline, { $in_game } in game.
 
+# Profiling (developer only)
+profiling = Performance Profiling
+profiling-start = Start Profiling
+profiling-stop = Stop Profiling
+profiling-reset = Reset Timings
+profiling-started = Profiling started.
+profiling-stopped = Profiling stopped.
+profiling-reset-done = Profiling timings reset.
+profiling-no-data = No timings recorded yet.
+profiling-tick-summary = Ticks: { $rate } per second, average { $average } ms, max { $max } ms, { $overruns } overruns.
+profiling-entry = { $game }, { $category ->
+    [table_tick] table ticks
+    [action] action { $name }
+    [bot_think] bot thinking
+   *[menu] menu builds
+}: { $total } ms total, { $calls } calls, average { $average } ms, max { $max } ms.
+profiling-table-entry = Table { $table } ({ $game }): { $total } ms total, { $calls } ticks, average { $average } ms, max { $max } ms.
+
 # Account management
 manage-accounts = Manage Accounts
 reset-password = Reset Password
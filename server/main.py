@@ -2,6 +2,7 @@
 
 import argparse
 import asyncio
+import multiprocessing
 import sys
 import os
 
@@ -80,4 +81,6 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Estimate workers are spawned processes; needed for frozen builds
+    multiprocessing.freeze_support()
     main()
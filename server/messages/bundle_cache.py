@@ -0,0 +1,190 @@
+"""
+On-disk cache of compiled Fluent bundles.
+
+fluent_compiler turns every message into a Python function by generating
+and compiling Python code, which takes seconds per locale. The compiled
+code objects are saved with marshal (like Python's own bytecode cache) and
+reloaded on the next start, skipping parsing, code generation and
+compilation. A cache file is only used when the .ftl files it was built
+from are unchanged (same names, order, sizes and modification times) and
+it was written by the same Python and fluent_compiler versions.
+
+Loading from code relies on fluent_compiler internals, which is why the
+project pins its version. If those internals are missing or no longer
+behave as expected, bundles are compiled the normal way instead.
+"""
+
+import builtins
+import importlib.util
+import marshal
+import os
+from importlib.metadata import version
+from pathlib import Path
+
+import babel
+from babel.plural import to_python
+from fluent_compiler.bundle import FluentBundle
+from fluent_compiler.resource import FtlResource
+
+try:
+    from fluent_compiler import runtime
+    from fluent_compiler.builtins import BUILTINS
+    from fluent_compiler.compiler import (
+        LOCALE_NAME,
+        PLURAL_FORM_FOR_NUMBER_NAME,
+        _parse_resources,
+        messages_to_module,
+    )
+    from fluent_compiler.utils import TERM_SIGIL
+except ImportError as e:
+    print(f"Locale cache disabled, fluent_compiler internals changed: {e}")
+    CACHE_SUPPORTED = False
+else:
+    CACHE_SUPPORTED = True
+
+# Bump when the layout of cache files changes
+CACHE_FORMAT = 1
+
+_CACHE_SUFFIX = ".ftlc"
+
+
+def _source_stamp(ftl_files: list[Path]) -> list[tuple[str, int, int]]:
+    stamp = []
+    for ftl_file in ftl_files:
+        stat = ftl_file.stat()
+        stamp.append((ftl_file.name, stat.st_mtime_ns, stat.st_size))
+    return stamp
+
+
+def _header(locale: str, ftl_files: list[Path]) -> dict:
+    return {
+        "format": CACHE_FORMAT,
+        "python": importlib.util.MAGIC_NUMBER,
+        "fluent_compiler": version("fluent_compiler"),
+        "locale": locale,
+        "sources": _source_stamp(ftl_files),
+    }
+
+
+def _plural_form_function(babel_locale: babel.Locale):
+    """The plural rule function fluent_compiler gives compiled messages."""
+    plural_form_for_number_main = to_python(babel_locale.plural_form)
+
+    def plural_form_for_number(number):
+        try:
+            return plural_form_for_number_main(number)
+        except TypeError:
+            return None
+
+    return plural_form_for_number
+
+
+def _compile(locale: str, ftl_files: list[Path]) -> dict:
+    """Compile .ftl files to code objects (what a cache file stores)."""
+    text = "\n".join(ftl_file.read_text(encoding="utf-8") for ftl_file in ftl_files)
+    messages, _ = _parse_resources([FtlResource.from_string(text)])
+    babel_locale = babel.Locale.parse(locale.replace("-", "_"))
+    module, message_mapping, module_globals, _ = messages_to_module(
+        messages, babel_locale, functions=BUILTINS.copy()
+    )
+    # Names the generated code uses for NUMBER, DATETIME, etc.
+    functions = {
+        name: builtin_name
+        for name, value in module_globals.items()
+        for builtin_name, builtin in BUILTINS.items()
+        if value is builtin
+    }
+    return {
+        "code": [
+            compile(module_ast, f"<ftl {locale}>", "exec")
+            for module_ast in module.as_multiple_module_ast()
+        ],
+        "messages": {
+            str(message_id): name
+            for message_id, name in message_mapping.items()
+            if not message_id.startswith(TERM_SIGIL)
+        },
+        "functions": functions,
+    }
+
+
+def _bundle_from_code(locale: str, compiled: dict) -> FluentBundle:
+    """Build a bundle by running compiled message code."""
+    babel_locale = babel.Locale.parse(locale.replace("-", "_"))
+    module_globals = {name: getattr(runtime, name) for name in runtime.__all__}
+    module_globals.update(builtins.__dict__)
+    module_globals[LOCALE_NAME] = babel_locale
+    module_globals[PLURAL_FORM_FOR_NUMBER_NAME] = _plural_form_function(babel_locale)
+    for name, builtin_name in compiled["functions"].items():
+        module_globals[name] = BUILTINS[builtin_name]
+    for code in compiled["code"]:
+        exec(code, module_globals)
+
+    bundle = FluentBundle.__new__(FluentBundle)
+    bundle.locale = locale
+    bundle._compiled_messages = {
+        message_id: module_globals[name] for message_id, name in compiled["messages"].items()
+    }
+    bundle._compilation_errors = []
+    return bundle
+
+
+def _plain_bundle(locale: str, ftl_files: list[Path]) -> FluentBundle:
+    """Compile a bundle through fluent_compiler's public API."""
+    text = "\n".join(ftl_file.read_text(encoding="utf-8") for ftl_file in ftl_files)
+    return FluentBundle.from_string(locale, text)
+
+
+def _read(path: Path, header: dict) -> dict | None:
+    try:
+        data = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("header") != header:
+        return None
+    return data.get("compiled")
+
+
+def _write(path: Path, header: dict, compiled: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent processes never read a partial file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(marshal.dumps({"header": header, "compiled": compiled}))
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"Could not write locale cache {path}: {e}")
+
+
+def load_bundle(locale: str, ftl_files: list[Path], cache_dir: Path | None) -> FluentBundle:
+    """
+    Load a bundle, from the cache if it is up to date.
+
+    Args:
+        locale: Locale the bundle is compiled for.
+        ftl_files: The locale's .ftl files, in the order they are joined.
+        cache_dir: Directory for cache files, or None to always compile.
+
+    Returns:
+        The compiled bundle.
+    """
+    if cache_dir is None or not CACHE_SUPPORTED:
+        return _plain_bundle(locale, ftl_files)
+
+    path = cache_dir / f"{locale}{_CACHE_SUFFIX}"
+    header = _header(locale, ftl_files)
+    compiled = _read(path, header)
+    if compiled is not None:
+        try:
+            return _bundle_from_code(locale, compiled)
+        except Exception as e:
+            print(f"Ignoring unusable locale cache {path}: {e}")
+
+    try:
+        compiled = _compile(locale, ftl_files)
+        bundle = _bundle_from_code(locale, compiled)
+    except Exception as e:
+        print(f"Compiling {locale} without the locale cache: {e}")
+        return _plain_bundle(locale, ftl_files)
+    _write(path, header, compiled)
+    return bundle
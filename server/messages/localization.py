@@ -1,10 +1,29 @@
 """Localization system using Mozilla Fluent."""
 
+from collections import OrderedDict
 from pathlib import Path
 
 from fluent_compiler.bundle import FluentBundle
 from babel.lists import format_list
 
+from .bundle_cache import load_bundle
+
+# Number of rendered messages kept by Localization.get
+RENDER_CACHE_SIZE = 4096
+
+# Argument types whose values fully determine the rendered text
+_CACHEABLE_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+def bundle_cache_dir(locales_dir: Path) -> Path:
+    """
+    Where compiled bundles for a locales directory are cached.
+
+    This is the __pycache__ next to the locales directory, which git
+    ignores like Python's own bytecode cache.
+    """
+    return locales_dir.parent / "__pycache__" / locales_dir.name
+
 
 class Localization:
     """
@@ -16,12 +35,26 @@ class Localization:
 
     _bundles: dict[str, FluentBundle] = {}
     _locales_dir: Path | None = None
+    _cache_dir: Path | None = None
+
+    # Rendered messages by (locale, message_id, args); see get()
+    _render_cache: OrderedDict[tuple, str] = OrderedDict()
+    _render_hits = 0
+    _render_misses = 0
 
     @classmethod
-    def init(cls, locales_dir: Path | str) -> None:
-        """Initialize the localization system with a locales directory."""
+    def init(cls, locales_dir: Path | str, *, use_cache: bool = True) -> None:
+        """
+        Initialize the localization system with a locales directory.
+
+        Args:
+            locales_dir: Directory with one subdirectory of .ftl files per locale.
+            use_cache: Reuse compiled bundles from earlier runs (see bundle_cache).
+        """
         cls._locales_dir = Path(locales_dir)
+        cls._cache_dir = bundle_cache_dir(cls._locales_dir) if use_cache else None
         cls._bundles = {}
+        cls.clear_render_cache()
 
     @classmethod
     def preload_bundles(cls) -> None:
@@ -54,15 +87,12 @@ class Localization:
                 raise RuntimeError(f"No locale files found for {locale} or en")
 
         # Load all .ftl files in the locale directory
-        ftl_content = []
-        for ftl_file in locale_dir.glob("*.ftl"):
-            ftl_content.append(ftl_file.read_text(encoding="utf-8"))
-
-        if not ftl_content:
+        ftl_files = list(locale_dir.glob("*.ftl"))
+        if not ftl_files:
             raise RuntimeError(f"No .ftl files found in {locale_dir}")
 
         # Compile messages - join all content (use actual locale for bundle)
-        bundle = FluentBundle.from_string(actual_locale, "\n".join(ftl_content))
+        bundle = load_bundle(actual_locale, ftl_files, cls._cache_dir)
         cls._bundles[locale] = bundle
         return bundle
 
@@ -74,6 +104,11 @@ class Localization:
         """
         Get a localized message.
 
+        Rendered messages are kept in a bounded LRU cache, so the same
+        message sent to many players (or rebuilt into many menus) is only
+        formatted once per locale. Calls with arguments other than plain
+        strings and numbers are always formatted.
+
         Args:
             locale: The locale code (e.g., 'en', 'es').
             message_id: The message ID from the .ftl file.
@@ -82,6 +117,28 @@ class Localization:
         Returns:
             The formatted message string.
         """
+        key = None
+        values = kwargs.values()
+        if all(type(value) in _CACHEABLE_ARG_TYPES for value in values):
+            # Types are part of the key: True == 1 but renders differently
+            key = (locale, message_id, *kwargs.items(), *map(type, values))
+            cached = cls._render_cache.get(key)
+            if cached is not None:
+                cls._render_cache.move_to_end(key)
+                cls._render_hits += 1
+                return cached
+            cls._render_misses += 1
+
+        result = cls._format(locale, message_id, kwargs)
+        if key is not None:
+            cls._render_cache[key] = result
+            if len(cls._render_cache) > RENDER_CACHE_SIZE:
+                cls._render_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def _format(cls, locale: str, message_id: str, kwargs: dict) -> str:
+        """Format a message with its bundle (uncached)."""
         try:
             bundle = cls._get_bundle(locale)
             result, errors = bundle.format(message_id, kwargs)
@@ -93,6 +150,24 @@ class Localization:
             # Return the message ID as fallback
             return message_id
 
+    @classmethod
+    def get_render_stats(cls) -> dict:
+        """Hit and miss counts for the render cache."""
+        lookups = cls._render_hits + cls._render_misses
+        return {
+            "hits": cls._render_hits,
+            "misses": cls._render_misses,
+            "hit_rate": cls._render_hits / lookups if lookups else 0.0,
+            "size": len(cls._render_cache),
+        }
+
+    @classmethod
+    def clear_render_cache(cls) -> None:
+        """Drop all rendered messages and reset the counters."""
+        cls._render_cache.clear()
+        cls._render_hits = 0
+        cls._render_misses = 0
+
     @classmethod
     def format_list_and(cls, locale: str, items: list[str]) -> str:
         """
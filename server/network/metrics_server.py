@@ -0,0 +1,79 @@
+"""Local HTTP endpoint exporting server metrics as JSON."""
+
+import asyncio
+import json
+from typing import Callable
+
+# Only serve the local machine unless configured otherwise
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+# Seconds a client gets to send its request line and headers
+REQUEST_TIMEOUT_S = 5.0
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server answering GET /metrics with a JSON snapshot.
+
+    It is meant for local scraping (curl, a monitoring agent) and speaks just
+    enough HTTP/1.0 for that: one request per connection, no keep-alive.
+    """
+
+    def __init__(
+        self,
+        get_metrics: Callable[[], dict],
+        port: int,
+        host: str = DEFAULT_METRICS_HOST,
+    ):
+        self._get_metrics = get_metrics
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if self.port == 0:
+            # Pick up the port the OS assigned
+            self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Metrics available on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT_S)
+            # Skip the headers
+            while (await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT_S)) not in (
+                b"\r\n",
+                b"\n",
+                b"",
+            ):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                status, body = "405 Method Not Allowed", {"error": "only GET is supported"}
+            elif parts[1].split("?")[0] != "/metrics":
+                status, body = "404 Not Found", {"error": "not found"}
+            else:
+                status, body = "200 OK", self._get_metrics()
+            payload = json.dumps(body).encode()
+            writer.write(
+                f"HTTP/1.0 {status}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            print(f"Error serving metrics: {e}")
+        finally:
+            writer.close()
@@ -30,6 +30,8 @@ class PacketType(Enum):
     DISCONNECT = "disconnect"
     TABLE_CREATE = "table_create"
     UPDATE_OPTIONS_LISTS = "update_options_lists"
+    FRAME = "frame"  # Batch of server-to-client packets, applied in order
+    MENU_DIFF = "menu_diff"  # Changes to the menu the client is showing
 
 
 @dataclass
@@ -1,14 +1,57 @@
 """WebSocket server for client connections."""
 
+import asyncio
 import json
 import ssl
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Coroutine
+from typing import Callable, Coroutine, Iterable
 import websockets
 from websockets.asyncio.server import serve, ServerConnection
 
 
+# Outbound packets a connection may have queued before its slow-consumer
+# policy applies
+DEFAULT_MAX_OUTBOX = 256
+
+# What to do with broadcasts to a client whose outbox is full:
+# "drop"       = discard the new broadcast
+# "coalesce"   = discard the oldest queued broadcasts, keeping the newest
+# "disconnect" = close the connection
+SLOW_CONSUMER_POLICIES = ("drop", "coalesce", "disconnect")
+DEFAULT_SLOW_CONSUMER_POLICY = "drop"
+
+
+def encode_packets(packets: list[dict | str]) -> str:
+    """
+    Encode packets as one message: the packet itself, or a frame of several.
+
+    Strings are packets that were already encoded (e.g. by broadcast_packet).
+    """
+    if len(packets) == 1:
+        packet = packets[0]
+        return packet if isinstance(packet, str) else json.dumps(packet)
+    parts = [packet if isinstance(packet, str) else json.dumps(packet) for packet in packets]
+    # Same text json.dumps would produce for the frame dict
+    return '{"type": "frame", "packets": [' + ", ".join(parts) + "]}"
+
+
+def broadcast_packet(packet: dict | list[dict], clients: Iterable["ClientConnection"]) -> int:
+    """
+    Send a packet (or several, as one frame) to many clients.
+
+    The packet is serialized once and queued on every client's outbox, so
+    each client's sender delivers it independently and a slow client never
+    delays the others. Returns the number of clients it was queued for.
+    """
+    text = encode_packets(packet if isinstance(packet, list) else [packet])
+    count = 0
+    for client in clients:
+        if client.send_encoded(text):
+            count += 1
+    return count
+
+
 @dataclass
 class ClientConnection:
     """Represents a connected client."""
@@ -17,14 +60,92 @@ class ClientConnection:
     address: str
     username: str | None = None
     authenticated: bool = False
+    max_outbox: int = field(default=DEFAULT_MAX_OUTBOX, compare=False)
+    slow_consumer_policy: str = field(default=DEFAULT_SLOW_CONSUMER_POLICY, compare=False)
+    # Broadcasts discarded by the slow-consumer policy
+    dropped_broadcasts: int = field(default=0, compare=False)
+
+    # Outbound packets waiting for the frame sender (not part of equality).
+    # Strings are pre-encoded broadcasts.
+    _outbox: list[dict | str] = field(default_factory=list, repr=False, compare=False)
+    _sender: asyncio.Task | None = field(default=None, repr=False, compare=False)
+    _closing: bool = field(default=False, repr=False, compare=False)
 
     async def send(self, packet: dict) -> None:
         """Send a packet to this client."""
+        await self._send_text(json.dumps(packet))
+
+    async def _send_text(self, text: str) -> None:
         try:
-            await self.websocket.send(json.dumps(packet))
+            await self.websocket.send(text)
         except websockets.exceptions.ConnectionClosed:
             pass
 
+    def send_frame(self, packets: list[dict]) -> None:
+        """
+        Queue packets to be sent together as a single frame.
+
+        At most one sender task runs per connection; packets queued while it
+        is sending are batched into its next frame, preserving order.
+        These packets carry the client's own state (menus, game output), so
+        they are never dropped, though a full outbox still triggers the
+        disconnect policy. Must be called from within the event loop.
+        """
+        if not packets or self._closing:
+            return
+        self._outbox.extend(packets)
+        if len(self._outbox) > self.max_outbox and self.slow_consumer_policy == "disconnect":
+            self._disconnect_slow_consumer()
+            return
+        self._start_sender()
+
+    def send_encoded(self, text: str) -> bool:
+        """
+        Queue an already encoded broadcast packet.
+
+        If the outbox is full, the slow-consumer policy decides what happens.
+        Returns whether the packet was queued. Must be called from within
+        the event loop.
+        """
+        if self._closing:
+            return False
+        if len(self._outbox) >= self.max_outbox:
+            if self.slow_consumer_policy == "disconnect":
+                self._disconnect_slow_consumer()
+                return False
+            if self.slow_consumer_policy == "coalesce":
+                self._discard_oldest_broadcast()
+            if len(self._outbox) >= self.max_outbox:
+                self.dropped_broadcasts += 1
+                return False
+        self._outbox.append(text)
+        self._start_sender()
+        return True
+
+    def _discard_oldest_broadcast(self) -> None:
+        for index, item in enumerate(self._outbox):
+            if isinstance(item, str):
+                del self._outbox[index]
+                self.dropped_broadcasts += 1
+                return
+
+    def _disconnect_slow_consumer(self) -> None:
+        print(f"Disconnecting slow client {self.username or self.address}: outbox full")
+        self._closing = True
+        self._outbox = []
+        asyncio.create_task(self.close())
+
+    def _start_sender(self) -> None:
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._drain_outbox())
+
+    async def _drain_outbox(self) -> None:
+        """Send queued packets until the outbox is empty."""
+        while self._outbox:
+            packets = self._outbox
+            self._outbox = []
+            await self._send_text(encode_packets(packets))
+
     async def close(self) -> None:
         """Close this connection."""
         try:
@@ -50,13 +171,20 @@ class WebSocketServer:
         on_message: Callable[[ClientConnection, dict], Coroutine] | None = None,
         ssl_cert: str | Path | None = None,
         ssl_key: str | Path | None = None,
+        max_outbox: int = DEFAULT_MAX_OUTBOX,
+        slow_consumer_policy: str = DEFAULT_SLOW_CONSUMER_POLICY,
     ):
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy}")
         self.host = host
         self.port = port
+        self.max_outbox = max(1, max_outbox)
+        self.slow_consumer_policy = slow_consumer_policy
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
         self._on_message = on_message
         self._clients: dict[str, ClientConnection] = {}
+        self._clients_by_username: dict[str, ClientConnection] = {}
         self._server = None
         self._running = False
         self._ssl_context = None
@@ -96,11 +224,17 @@ class WebSocketServer:
         for client in list(self._clients.values()):
             await client.close()
         self._clients.clear()
+        self._clients_by_username.clear()
 
     async def _handle_client(self, websocket: ServerConnection) -> None:
         """Handle a client connection."""
         address = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        client = ClientConnection(websocket=websocket, address=address)
+        client = ClientConnection(
+            websocket=websocket,
+            address=address,
+            max_outbox=self.max_outbox,
+            slow_consumer_policy=self.slow_consumer_policy,
+        )
         self._clients[address] = client
 
         try:
@@ -120,28 +254,60 @@ class WebSocketServer:
         finally:
             if address in self._clients:
                 del self._clients[address]
+            if client.username:
+                self.unregister_username(client.username, client)
             if self._on_disconnect:
                 await self._on_disconnect(client)
 
-    async def broadcast(
-        self, packet: dict, exclude: ClientConnection | None = None
+    def broadcast(
+        self,
+        packet: dict | list[dict],
+        recipients: Iterable[ClientConnection] | None = None,
+        exclude: ClientConnection | None = None,
+    ) -> int:
+        """
+        Broadcast a packet to recipients (default: all authenticated clients).
+
+        The packet is encoded once and fanned out through each client's
+        bounded outbox (see broadcast_packet). Returns the number of clients
+        it was queued for.
+        """
+        if recipients is None:
+            recipients = (client for client in self._clients.values() if client.authenticated)
+        return broadcast_packet(
+            packet, (client for client in recipients if client is not exclude)
+        )
+
+    def register_username(self, client: ClientConnection) -> None:
+        """
+        Index a client under its current username.
+
+        Call after setting client.username (on authorize). A newer connection
+        for the same username replaces the older one in the index.
+        """
+        if client.username:
+            self._clients_by_username[client.username] = client
+
+    def unregister_username(
+        self, username: str, client: ClientConnection | None = None
     ) -> None:
-        """Broadcast a packet to all authenticated clients."""
-        for client in self._clients.values():
-            if client.authenticated and client != exclude:
-                await client.send(packet)
+        """
+        Drop a username from the index (on disconnect or rename).
+
+        If client is given, the entry is only removed while it still points to
+        that client, so a stale connection cannot evict a newer login.
+        """
+        if client is None or self._clients_by_username.get(username) is client:
+            self._clients_by_username.pop(username, None)
 
     async def send_to_user(self, username: str, packet: dict) -> bool:
         """Send a packet to a specific user."""
-        for client in self._clients.values():
-            if client.username == username:
-                await client.send(packet)
-                return True
+        client = self._clients_by_username.get(username)
+        if client:
+            await client.send(packet)
+            return True
         return False
 
     def get_client_by_username(self, username: str) -> ClientConnection | None:
         """Get a client by username."""
-        for client in self._clients.values():
-            if client.username == username:
-                return client
-        return None
+        return self._clients_by_username.get(username)
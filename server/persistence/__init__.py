@@ -1,5 +1,6 @@
 """Database persistence layer."""
 
 from .database import Database
+from .executor import DatabaseExecutor
 
-__all__ = ["Database"]
+__all__ = ["Database", "DatabaseExecutor"]
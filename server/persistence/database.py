@@ -2,13 +2,19 @@
 
 import sqlite3
 import json
+import zlib
 from pathlib import Path
+from typing import Iterable
 from dataclasses import dataclass
 
 from ..tables.table import Table
 from ..users.base import TrustLevel
 
 
+# zlib level for checkpointed game state (favours speed; JSON compresses well)
+TABLE_COMPRESS_LEVEL = 6
+
+
 @dataclass
 class UserRecord:
     """A user record from the database."""
@@ -36,6 +42,50 @@ class SavedTableRecord:
     saved_at: str
 
 
+# Aggregates a stats leaderboard can be ordered by
+_LEADERBOARD_COLUMNS = ("wins", "total_score", "high_score", "games")
+
+
+def _members_json(table: Table) -> str:
+    """Serialize a table's members for the tables table."""
+    return json.dumps(
+        [{"username": m.username, "is_spectator": m.is_spectator} for m in table.members]
+    )
+
+
+def _stat_value(data: dict, path: str, player_id: str, player_name: str) -> float | None:
+    """
+    Extract a number from custom_data using a dot-separated path.
+
+    Supports {player_id} and {player_name} placeholders in the path.
+    """
+    resolved_path = path.replace("{player_id}", player_id)
+    resolved_path = resolved_path.replace("{player_name}", player_name)
+
+    current = data
+    for part in resolved_path.split("."):
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return None
+    if isinstance(current, (int, float)):
+        return float(current)
+    return None
+
+
+def _custom_stat_expression(config: dict) -> str:
+    """SQL for a custom stat's value from its player_custom_stats row (alias cs)."""
+    if "numerator" in config and "denominator" in config:
+        # Values are summed across games, then divided
+        return "(CASE WHEN cs.denominator > 0 THEN cs.total / cs.denominator END)"
+    aggregate = config.get("aggregate", "sum")
+    if aggregate == "max":
+        return "cs.max_value"
+    if aggregate == "avg":
+        return "(cs.total / cs.count)"
+    return "cs.total"
+
+
 class Database:
     """
     SQLite database for play vnt persistence.
@@ -47,11 +97,22 @@ class Database:
         self.db_path = Path(db_path)
         self._conn: sqlite3.Connection | None = None
 
-    def connect(self) -> None:
-        """Connect to the database and create tables if needed."""
-        self._conn = sqlite3.connect(str(self.db_path))
+    def connect(self, create_tables: bool = True) -> None:
+        """
+        Connect to the database and create tables if needed.
+
+        Args:
+            create_tables: Create tables and run migrations. Extra connections
+                opened by DatabaseExecutor readers skip this.
+        """
+        # Executor connections are closed from the thread that shuts the pool down
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
-        self._create_tables()
+        # WAL lets readers run alongside the writer; NORMAL sync is safe in WAL
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if create_tables:
+            self._create_tables()
 
     def close(self) -> None:
         """Close the database connection."""
@@ -138,6 +199,45 @@ class Database:
             ON game_result_players(player_id)
         """)
 
+        # Per-player aggregates of game results, kept up to date by
+        # save_game_result so leaderboards never re-scan the results
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS player_game_stats (
+                game_type TEXT NOT NULL,
+                player_id TEXT NOT NULL,
+                player_name TEXT NOT NULL,
+                games INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                losses INTEGER NOT NULL DEFAULT 0,
+                total_score REAL NOT NULL DEFAULT 0,
+                high_score REAL,
+                PRIMARY KEY (game_type, player_id)
+            )
+        """)
+        for column in ("wins", "total_score", "high_score", "games"):
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_player_game_stats_{column}
+                ON player_game_stats(game_type, {column} DESC)
+            """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_game_stats_player
+            ON player_game_stats(player_id)
+        """)
+
+        # Aggregates of game-specific stats (see BaseGame.get_leaderboard_types)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS player_custom_stats (
+                game_type TEXT NOT NULL,
+                stat_id TEXT NOT NULL,
+                player_id TEXT NOT NULL,
+                total REAL NOT NULL DEFAULT 0,
+                count INTEGER NOT NULL DEFAULT 0,
+                max_value REAL,
+                denominator REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (game_type, stat_id, player_id)
+            )
+        """)
+
         # Player ratings (for skill-based matchmaking)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS player_ratings (
@@ -171,6 +271,19 @@ class Database:
             )
         """)
 
+        # Session tokens (stored hashed) for reconnecting without a password
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                token_hash TEXT PRIMARY KEY,
+                username TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_username
+            ON sessions(username)
+        """)
+
         self._conn.commit()
 
         # Run migrations for existing databases
@@ -490,6 +603,48 @@ class Database:
             for row in rows
         ]
 
+    # Session operations
+
+    def create_session(self, token_hash: str, username: str, expires_at: float) -> None:
+        """Store a session token hash for a user."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "INSERT OR REPLACE INTO sessions (token_hash, username, expires_at) VALUES (?, ?, ?)",
+            (token_hash, username, expires_at),
+        )
+        self._conn.commit()
+
+    def get_session(self, token_hash: str) -> tuple[str, float] | None:
+        """Get (username, expires_at) for a session token hash."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT username, expires_at FROM sessions WHERE token_hash = ?",
+            (token_hash,),
+        )
+        row = cursor.fetchone()
+        if row:
+            return (row["username"], row["expires_at"])
+        return None
+
+    def delete_session(self, token_hash: str) -> None:
+        """Delete a session token."""
+        cursor = self._conn.cursor()
+        cursor.execute("DELETE FROM sessions WHERE token_hash = ?", (token_hash,))
+        self._conn.commit()
+
+    def delete_user_sessions(self, username: str) -> None:
+        """Delete all session tokens for a user."""
+        cursor = self._conn.cursor()
+        cursor.execute("DELETE FROM sessions WHERE username = ?", (username,))
+        self._conn.commit()
+
+    def delete_expired_sessions(self, now: float) -> int:
+        """Delete session tokens that expired before now. Returns the number removed."""
+        cursor = self._conn.cursor()
+        cursor.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        self._conn.commit()
+        return cursor.rowcount
+
     # ==================== Friend System Methods ====================
 
     def add_friend_request(self, sender_username: str, receiver_username: str) -> bool:
@@ -651,15 +806,6 @@ class Database:
     def save_table(self, table: Table) -> None:
         """Save a table to the database."""
         cursor = self._conn.cursor()
-
-        # Serialize members
-        members_json = json.dumps(
-            [
-                {"username": m.username, "is_spectator": m.is_spectator}
-                for m in table.members
-            ]
-        )
-
         cursor.execute(
             """
             INSERT OR REPLACE INTO tables (table_id, game_type, host, members_json, game_json, status)
@@ -669,13 +815,61 @@ class Database:
                 table.table_id,
                 table.game_type,
                 table.host,
-                members_json,
+                _members_json(table),
                 table.game_json,
                 table.status,
             ),
         )
         self._conn.commit()
 
+    def checkpoint_tables(self, tables: list[Table], live_ids: Iterable[str]) -> int:
+        """
+        Write table snapshots and drop rows for tables that no longer exist.
+
+        Everything happens in one transaction, so a crash leaves either the
+        previous checkpoint or this one. Game state is stored zlib-compressed;
+        load_table accepts both forms.
+
+        Args:
+            tables: Snapshots of the tables that changed.
+            live_ids: IDs of every table that still exists.
+
+        Returns:
+            Bytes of table data written.
+        """
+        rows = []
+        written = 0
+        for table in tables:
+            members_json = _members_json(table)
+            game_data = None
+            if table.game_json is not None:
+                game_data = zlib.compress(table.game_json.encode("utf-8"), TABLE_COMPRESS_LEVEL)
+                written += len(game_data)
+            written += len(members_json)
+            rows.append(
+                (table.table_id, table.game_type, table.host, members_json, game_data, table.status)
+            )
+
+        live_ids = set(live_ids)
+        cursor = self._conn.cursor()
+        try:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO tables (table_id, game_type, host, members_json, game_json, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            cursor.execute("SELECT table_id FROM tables")
+            stale = [(row[0],) for row in cursor.fetchall() if row[0] not in live_ids]
+            cursor.executemany("DELETE FROM tables WHERE table_id = ?", stale)
+        except Exception:
+            self._conn.rollback()
+            raise
+
+        self._conn.commit()
+        return written
+
     def load_table(self, table_id: str) -> Table | None:
         """Load a table from the database."""
         cursor = self._conn.cursor()
@@ -693,12 +887,17 @@ class Database:
             for m in members_data
         ]
 
+        # Checkpoints store game state compressed
+        game_json = row["game_json"]
+        if isinstance(game_json, bytes):
+            game_json = zlib.decompress(game_json).decode("utf-8")
+
         return Table(
             table_id=row["table_id"],
             game_type=row["game_type"],
             host=row["host"],
             members=members,
-            game_json=row["game_json"],
+            game_json=game_json,
             status=row["status"],
         )
 
@@ -820,49 +1019,305 @@ class Database:
         duration_ticks: int,
         players: list[tuple[str, str, bool, bool]],  # (player_id, player_name, is_bot, is_virtual_bot)
         custom_data: dict | None = None,
+        stat_configs: list[dict] | None = None,
     ) -> int:
         """
         Save a game result to the database.
 
+        The player aggregates used by leaderboards are updated in the same
+        transaction.
+
         Args:
             game_type: The game type identifier
             timestamp: ISO format timestamp
             duration_ticks: Game duration in ticks
             players: List of (player_id, player_name, is_bot, is_virtual_bot) tuples
             custom_data: Game-specific result data
+            stat_configs: The game's custom leaderboard types, whose values
+                are aggregated per player (see BaseGame.get_leaderboard_types)
 
         Returns:
             The result ID
         """
         cursor = self._conn.cursor()
 
-        # Insert the main result record
-        cursor.execute(
-            """
-            INSERT INTO game_results (game_type, timestamp, duration_ticks, custom_data)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                game_type,
-                timestamp,
-                duration_ticks,
-                json.dumps(custom_data) if custom_data else None,
-            ),
-        )
-        result_id = cursor.lastrowid
+        try:
+            # Insert the main result record
+            cursor.execute(
+                """
+                INSERT INTO game_results (game_type, timestamp, duration_ticks, custom_data)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    game_type,
+                    timestamp,
+                    duration_ticks,
+                    json.dumps(custom_data) if custom_data else None,
+                ),
+            )
+            result_id = cursor.lastrowid
+
+            # Insert player records
+            for player_id, player_name, is_bot, is_virtual_bot in players:
+                cursor.execute(
+                    """
+                    INSERT INTO game_result_players (result_id, player_id, player_name, is_bot, is_virtual_bot)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (result_id, player_id, player_name, 1 if is_bot else 0, 1 if is_virtual_bot else 0),
+                )
+
+            self._add_to_player_stats(cursor, game_type, players, custom_data or {}, stat_configs or [])
+        except Exception:
+            self._conn.rollback()
+            raise
+
+        self._conn.commit()
+        return result_id
+
+    def _add_to_player_stats(
+        self,
+        cursor: sqlite3.Cursor,
+        game_type: str,
+        players: list[tuple[str, str, bool, bool]],
+        custom_data: dict,
+        stat_configs: list[dict],
+    ) -> None:
+        """Fold one game result into the player aggregates (no commit)."""
+        winner_name = custom_data.get("winner_name")
+        final_scores = custom_data.get("final_scores") or {}
+        final_light = custom_data.get("final_light") or {}
 
-        # Insert player records
         for player_id, player_name, is_bot, is_virtual_bot in players:
+            # Plain bots don't appear on leaderboards
+            if is_bot and not is_virtual_bot:
+                continue
+
+            won = 1 if winner_name is not None and winner_name == player_name else 0
+            # Light Turret reports its scores as final_light
+            score = final_scores.get(player_name) or final_light.get(player_name) or 0
+            if not isinstance(score, (int, float)):
+                score = 0
             cursor.execute(
                 """
-                INSERT INTO game_result_players (result_id, player_id, player_name, is_bot, is_virtual_bot)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO player_game_stats
+                    (game_type, player_id, player_name, games, wins, losses, total_score, high_score)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT (game_type, player_id) DO UPDATE SET
+                    player_name = excluded.player_name,
+                    games = games + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    total_score = total_score + excluded.total_score,
+                    high_score = MAX(COALESCE(high_score, excluded.high_score), excluded.high_score)
                 """,
-                (result_id, player_id, player_name, 1 if is_bot else 0, 1 if is_virtual_bot else 0),
+                (game_type, player_id, player_name, won, 1 - won, score, score),
             )
 
+            for config in stat_configs:
+                if "numerator" in config and "denominator" in config:
+                    value = _stat_value(custom_data, config["numerator"], player_id, player_name)
+                    denominator = _stat_value(
+                        custom_data, config["denominator"], player_id, player_name
+                    )
+                    if value is None or denominator is None:
+                        continue
+                elif "path" in config:
+                    value = _stat_value(custom_data, config["path"], player_id, player_name)
+                    denominator = 0.0
+                    if value is None:
+                        continue
+                else:
+                    continue
+                cursor.execute(
+                    """
+                    INSERT INTO player_custom_stats
+                        (game_type, stat_id, player_id, total, count, max_value, denominator)
+                    VALUES (?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT (game_type, stat_id, player_id) DO UPDATE SET
+                        total = total + excluded.total,
+                        count = count + 1,
+                        max_value = MAX(COALESCE(max_value, excluded.max_value), excluded.max_value),
+                        denominator = denominator + excluded.denominator
+                    """,
+                    (game_type, config["id"], player_id, value, value, denominator),
+                )
+
+    def rebuild_player_stats(self, stat_configs: dict[str, list[dict]]) -> int:
+        """
+        Recompute all player aggregates from the stored game results.
+
+        Used to backfill the aggregates for results saved before they
+        existed, or after a game changes its leaderboard types.
+
+        Args:
+            stat_configs: Custom leaderboard types by game type.
+
+        Returns:
+            The number of game results processed.
+        """
+        cursor = self._conn.cursor()
+        players_by_result: dict[int, list[tuple[str, str, bool, bool]]] = {}
+        cursor.execute(
+            """
+            SELECT result_id, player_id, player_name, is_bot, is_virtual_bot
+            FROM game_result_players
+            ORDER BY id
+            """
+        )
+        for row in cursor.fetchall():
+            players_by_result.setdefault(row["result_id"], []).append(
+                (row["player_id"], row["player_name"], bool(row["is_bot"]), bool(row["is_virtual_bot"]))
+            )
+
+        count = 0
+        try:
+            cursor.execute("DELETE FROM player_game_stats")
+            cursor.execute("DELETE FROM player_custom_stats")
+            # Oldest first, so each player keeps their most recent name
+            results = self._conn.execute(
+                "SELECT id, game_type, custom_data FROM game_results ORDER BY timestamp, id"
+            )
+            for row in results:
+                custom_data = json.loads(row["custom_data"]) if row["custom_data"] else {}
+                self._add_to_player_stats(
+                    cursor,
+                    row["game_type"],
+                    players_by_result.get(row["id"], []),
+                    custom_data,
+                    stat_configs.get(row["game_type"], []),
+                )
+                count += 1
+        except Exception:
+            self._conn.rollback()
+            raise
+
         self._conn.commit()
-        return result_id
+        return count
+
+    def player_stats_need_backfill(self) -> bool:
+        """Whether there are game results but no player aggregates yet."""
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM player_game_stats)")
+        if cursor.fetchone()[0]:
+            return False
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM game_results)")
+        return bool(cursor.fetchone()[0])
+
+    def get_stats_leaderboard(self, game_type: str, order_by: str, limit: int = 10) -> list[dict]:
+        """
+        Get the top players of a game type by an aggregate.
+
+        Args:
+            game_type: The game type to query
+            order_by: "wins", "total_score", "high_score" or "games"
+            limit: Maximum number of players
+
+        Returns:
+            List of player aggregate dictionaries, best first
+        """
+        if order_by not in _LEADERBOARD_COLUMNS:
+            raise ValueError(f"Unknown leaderboard column: {order_by}")
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT player_id, player_name, games, wins, losses, total_score, high_score
+            FROM player_game_stats
+            WHERE game_type = ?
+            ORDER BY {order_by} DESC, player_name
+            LIMIT ?
+            """,
+            (game_type, limit),
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_player_game_stats(self, player_id: str, game_type: str) -> dict | None:
+        """Get a player's aggregates for a game type, or None if they haven't played it."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT player_id, player_name, games, wins, losses, total_score, high_score
+            FROM player_game_stats
+            WHERE game_type = ? AND player_id = ?
+            """,
+            (game_type, player_id),
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_player_game_types(self, player_id: str) -> set[str]:
+        """Get the game types a player has results for."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT game_type FROM player_game_stats WHERE player_id = ?",
+            (player_id,),
+        )
+        return {row["game_type"] for row in cursor.fetchall()}
+
+    def get_player_names(self, game_type: str, player_ids: list[str]) -> dict[str, str]:
+        """Get the most recent names of players in a game type's results."""
+        if not player_ids:
+            return {}
+        cursor = self._conn.cursor()
+        placeholders = ", ".join("?" for _ in player_ids)
+        cursor.execute(
+            f"""
+            SELECT player_id, player_name FROM player_game_stats
+            WHERE game_type = ? AND player_id IN ({placeholders})
+            """,
+            (game_type, *player_ids),
+        )
+        return {row["player_id"]: row["player_name"] for row in cursor.fetchall()}
+
+    def get_custom_stat_leaderboard(
+        self, game_type: str, config: dict, limit: int = 10
+    ) -> list[tuple[str, str, float]]:
+        """
+        Get the top players for a custom leaderboard type.
+
+        Args:
+            game_type: The game type to query
+            config: The leaderboard type (see BaseGame.get_leaderboard_types)
+            limit: Maximum number of players
+
+        Returns:
+            List of (player_id, player_name, value) tuples, best first
+        """
+        value = _custom_stat_expression(config)
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT cs.player_id, pgs.player_name, {value} AS value
+            FROM player_custom_stats cs
+            INNER JOIN player_game_stats pgs
+                ON pgs.game_type = cs.game_type AND pgs.player_id = cs.player_id
+            WHERE cs.game_type = ? AND cs.stat_id = ? AND {value} IS NOT NULL
+            ORDER BY value DESC, pgs.player_name
+            LIMIT ?
+            """,
+            (game_type, config["id"], limit),
+        )
+        return [(row["player_id"], row["player_name"], row["value"]) for row in cursor.fetchall()]
+
+    def get_player_custom_stats(
+        self, player_id: str, game_type: str, configs: list[dict]
+    ) -> dict[str, float]:
+        """Get a player's custom stat values for a game type, by stat id."""
+        values = {}
+        cursor = self._conn.cursor()
+        for config in configs:
+            cursor.execute(
+                f"""
+                SELECT {_custom_stat_expression(config)} AS value
+                FROM player_custom_stats cs
+                WHERE cs.game_type = ? AND cs.stat_id = ? AND cs.player_id = ?
+                """,
+                (game_type, config["id"], player_id),
+            )
+            row = cursor.fetchone()
+            if row and row["value"] is not None:
+                values[config["id"]] = row["value"]
+        return values
 
     def get_player_game_history(
         self,
@@ -1189,6 +1644,7 @@ class Database:
         if self.user_exists(new_username):
             return False
 
+        self._ensure_virtual_bots_table()
         cursor = self._conn.cursor()
         try:
             # 1. Update users table
@@ -1228,6 +1684,50 @@ class Database:
                 "UPDATE player_ratings SET player_id = ? WHERE player_id = ?",
                 (new_username, old_username),
             )
+
+            # Leaderboard aggregates: rows keyed by the old name fold into any
+            # rows already under the new one, and the shown name follows
+            cursor.execute(
+                """
+                INSERT INTO player_game_stats
+                    (game_type, player_id, player_name, games, wins, losses, total_score, high_score)
+                SELECT game_type, ?, ?, games, wins, losses, total_score, high_score
+                FROM player_game_stats WHERE player_id = ? AND true
+                ON CONFLICT (game_type, player_id) DO UPDATE SET
+                    games = games + excluded.games,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    total_score = total_score + excluded.total_score,
+                    high_score = MAX(
+                        COALESCE(high_score, excluded.high_score),
+                        COALESCE(excluded.high_score, high_score)
+                    )
+                """,
+                (new_username, new_username, old_username),
+            )
+            cursor.execute(
+                """
+                INSERT INTO player_custom_stats
+                    (game_type, stat_id, player_id, total, count, max_value, denominator)
+                SELECT game_type, stat_id, ?, total, count, max_value, denominator
+                FROM player_custom_stats WHERE player_id = ? AND true
+                ON CONFLICT (game_type, stat_id, player_id) DO UPDATE SET
+                    total = total + excluded.total,
+                    count = count + excluded.count,
+                    max_value = MAX(
+                        COALESCE(max_value, excluded.max_value),
+                        COALESCE(excluded.max_value, max_value)
+                    ),
+                    denominator = denominator + excluded.denominator
+                """,
+                (new_username, old_username),
+            )
+            cursor.execute("DELETE FROM player_game_stats WHERE player_id = ?", (old_username,))
+            cursor.execute("DELETE FROM player_custom_stats WHERE player_id = ?", (old_username,))
+            cursor.execute(
+                "UPDATE player_game_stats SET player_name = ? WHERE player_name = ?",
+                (new_username, old_username),
+            )
             
             # Virtual bots
             cursor.execute(
@@ -1235,6 +1735,9 @@ class Database:
                 (new_username, old_username),
             )
 
+            # Sessions (the user must log in again with a password)
+            cursor.execute("DELETE FROM sessions WHERE username = ?", (old_username,))
+
             # 3. Update members_json in tables (Active tables)
             cursor.execute("SELECT table_id, members_json FROM tables WHERE members_json LIKE ?", 
                            (f'%"{old_username}"%',))
@@ -0,0 +1,176 @@
+"""Thread-backed executor that keeps SQLite work off the event loop."""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from .database import Database
+
+
+# Default number of reader threads (each holds its own connection)
+DEFAULT_READER_COUNT = 2
+
+# A database job is either the name of a Database method or a callable
+# that receives the thread's Database as its first argument.
+DatabaseJob = str | Callable[..., Any]
+
+
+def run_database_job(db: Database, job: DatabaseJob, *args, **kwargs) -> Any:
+    """Run a job against a Database on the calling thread."""
+    if isinstance(job, str):
+        return getattr(db, job)(*args, **kwargs)
+    return job(db, *args, **kwargs)
+
+
+class DatabaseExecutor:
+    """
+    Runs Database operations on worker threads.
+
+    All writes go through a single writer thread, so they are applied in the
+    order they were submitted and never contend with each other. Reads run on
+    a small pool of reader threads. Every thread owns its own connection, and
+    the database is switched to WAL mode so readers never block the writer.
+
+    Jobs are named Database methods or callables taking a Database:
+
+        user = await executor.read("get_user", username)
+        executor.submit_write("save_game_result", ...)
+        await executor.write(lambda db: db.rename_user(old, new))
+    """
+
+    def __init__(
+        self, db_path: str | Path, reader_count: int = DEFAULT_READER_COUNT
+    ):
+        """
+        Initialize the executor. Threads are created by start().
+
+        Args:
+            db_path: Path to the SQLite database file.
+            reader_count: Number of reader threads.
+        """
+        self.db_path = Path(db_path)
+        self.reader_count = max(1, reader_count)
+        self._writer: ThreadPoolExecutor | None = None
+        self._readers: ThreadPoolExecutor | None = None
+        self._local = threading.local()
+        self._databases: list[Database] = []
+        self._databases_lock = threading.Lock()
+        self._pending_writes = 0
+        self._failed_writes = 0
+        self._counter_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the executor has been started and not closed."""
+        return self._writer is not None
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of fire-and-forget writes not yet applied."""
+        return self._pending_writes
+
+    @property
+    def failed_writes(self) -> int:
+        """Number of fire-and-forget writes that raised an error."""
+        return self._failed_writes
+
+    def get_stats(self) -> dict:
+        """Snapshot of the write queue."""
+        return {
+            "running": self.running,
+            "readers": self.reader_count,
+            "pending_writes": self._pending_writes,
+            "failed_writes": self._failed_writes,
+        }
+
+    def start(self) -> None:
+        """Start the writer thread and reader pool."""
+        if self.running:
+            return
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="db-writer",
+            initializer=self._init_thread,
+            initargs=(True,),
+        )
+        self._readers = ThreadPoolExecutor(
+            max_workers=self.reader_count,
+            thread_name_prefix="db-reader",
+            initializer=self._init_thread,
+            initargs=(False,),
+        )
+
+    def close(self) -> None:
+        """Wait for queued work to finish, then stop threads and close connections."""
+        if self._writer:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        if self._readers:
+            self._readers.shutdown(wait=True)
+            self._readers = None
+        with self._databases_lock:
+            for db in self._databases:
+                db.close()
+            self._databases.clear()
+
+    def _init_thread(self, is_writer: bool) -> None:
+        """Open this worker thread's connection."""
+        db = Database(self.db_path)
+        db.connect(create_tables=is_writer)
+        self._local.db = db
+        with self._databases_lock:
+            self._databases.append(db)
+
+    def _run_job(self, job: DatabaseJob, args: tuple, kwargs: dict) -> Any:
+        """Run a job against this worker thread's connection."""
+        return run_database_job(self._local.db, job, *args, **kwargs)
+
+    def _require_running(self) -> None:
+        if not self.running:
+            raise RuntimeError("DatabaseExecutor is not running")
+
+    async def read(self, job: DatabaseJob, *args, **kwargs) -> Any:
+        """Run a read-only job on the reader pool and return its result."""
+        self._require_running()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers, functools.partial(self._run_job, job, args, kwargs)
+        )
+
+    async def write(self, job: DatabaseJob, *args, **kwargs) -> Any:
+        """Run a job on the writer thread and return its result."""
+        self._require_running()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._writer, functools.partial(self._run_job, job, args, kwargs)
+        )
+
+    def submit_write(self, job: DatabaseJob, *args, **kwargs) -> None:
+        """
+        Queue a job on the writer thread without waiting for it.
+
+        Safe to call from synchronous code such as a game tick. Errors are
+        logged and counted rather than raised.
+        """
+        self._require_running()
+        with self._counter_lock:
+            self._pending_writes += 1
+        future = self._writer.submit(self._run_job, job, args, kwargs)
+        future.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, future: Future) -> None:
+        error = future.exception()
+        with self._counter_lock:
+            self._pending_writes -= 1
+            if error is not None:
+                self._failed_writes += 1
+        if error is not None:
+            print(f"Error in queued database write: {error}")
+
+    async def flush(self) -> None:
+        """Wait until every previously submitted write has been applied."""
+        # The writer is FIFO, so a no-op job completes after everything before it
+        await self.write(lambda db: None)
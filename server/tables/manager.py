@@ -1,20 +1,40 @@
 """Table manager for tracking all active tables."""
 
 from typing import TYPE_CHECKING, Any
+import time
 import uuid
 
 from .table import Table
+from ..game_utils.profiling import get_profiler
+from ..game_utils.timer_wheel import TimerWheel
 
 if TYPE_CHECKING:
     from ..users.base import User
 
 
+# Longest a table sleeps before it is ticked anyway (0 = until woken). A
+# safety net for changes that reach a game without waking its table.
+DEFAULT_MAX_SLEEP_TICKS = 100  # 5 sec
+
+
 class TableManager:
     """Manages all active tables on the server."""
 
     def __init__(self):
         self._tables: dict[str, Table] = {}
+        # username -> table_id -> table, for players and spectators
+        self._user_tables: dict[str, dict[str, Table]] = {}
+        self._tables_by_type: dict[str, dict[str, Table]] = {}  # game_type -> table_id -> table
+        # game_type -> table_id -> table, for tables whose game may still be in its lobby
+        self._lobby_tables: dict[str, dict[str, Table]] = {}
         self._server: Any = None  # Reference to server for destroy/save notifications
+        # Idle tables sleep until their game has work (see Game.ticks_until_wake)
+        self.sleep_idle_tables = True
+        self.max_sleep_ticks = DEFAULT_MAX_SLEEP_TICKS
+        self._awake: dict[str, Table] = {}  # table_id -> table, ticked every tick
+        self._asleep: dict[str, int] = {}  # table_id -> last tick it was ticked
+        self._wheel: TimerWheel[str] = TimerWheel()  # Sleeping table IDs by wake tick
+        self._capped: set[str] = set()  # Sleeping table IDs due only for max_sleep_ticks
 
     def create_table(
         self,
@@ -35,15 +55,32 @@ class TableManager:
             table._db = self._server._db
         table.add_member(host_username, host_user, as_spectator=False)
         self._tables[table_id] = table
+        self._awake[table_id] = table
+        self._index_table(table)
         return table
 
+    def _index_table(self, table: Table) -> None:
+        """Add a table to the per-game-type indexes."""
+        self._tables_by_type.setdefault(table.game_type, {})[table.table_id] = table
+        self._lobby_tables.setdefault(table.game_type, {})[table.table_id] = table
+
     def get_table(self, table_id: str) -> Table | None:
         """Get a table by ID."""
         return self._tables.get(table_id)
 
     def remove_table(self, table_id: str) -> None:
         """Remove a table."""
-        self._tables.pop(table_id, None)
+        table = self._tables.pop(table_id, None)
+        get_profiler().forget_table(table_id)
+        if table:
+            self._tables_by_type.get(table.game_type, {}).pop(table_id, None)
+            self._lobby_tables.get(table.game_type, {}).pop(table_id, None)
+            self._awake.pop(table_id, None)
+            self._asleep.pop(table_id, None)
+            self._wheel.cancel(table_id)
+            self._capped.discard(table_id)
+            for member in table.members:
+                self.on_member_removed(member.username, table)
 
     def get_all_tables(self) -> list[Table]:
         """Get all tables."""
@@ -51,30 +88,158 @@ class TableManager:
 
     def get_tables_by_type(self, game_type: str) -> list[Table]:
         """Get all tables of a specific game type."""
-        return [t for t in self._tables.values() if t.game_type == game_type]
+        return list(self._tables_by_type.get(game_type, {}).values())
 
     def get_waiting_tables(self, game_type: str | None = None) -> list[Table]:
         """Get all tables in waiting status."""
-        tables = self._tables.values()
         if game_type:
-            tables = [t for t in tables if t.game_type == game_type]
+            tables = self._tables_by_type.get(game_type, {}).values()
+        else:
+            tables = self._tables.values()
         return [t for t in tables if t.status == "waiting"]
 
+    def get_joinable_tables(self, game_type: str | None = None) -> list[Table]:
+        """Get tables whose game is still in its lobby, waiting for players."""
+        if game_type:
+            lobbies = [self._lobby_tables.get(game_type, {})]
+        else:
+            lobbies = list(self._lobby_tables.values())
+        joinable = []
+        for lobby in lobbies:
+            for table_id, table in list(lobby.items()):
+                game = table.game
+                if not game:
+                    continue
+                if game.status != "waiting":
+                    # Games never go back to their lobby; a new game re-indexes the table
+                    del lobby[table_id]
+                    continue
+                joinable.append(table)
+        return joinable
+
+    def on_game_attached(self, table: Table) -> None:
+        """Index a table's new game. Called when Table.game is set."""
+        if table.table_id in self._tables:
+            self._lobby_tables.setdefault(table.game_type, {})[table.table_id] = table
+            self.wake_table(table)
+
     def find_user_table(self, username: str) -> Table | None:
-        """Find the table a user is currently in."""
-        for table in self._tables.values():
-            for member in table.members:
-                if member.username == username:
-                    return table
-        return None
+        """Find the table a user is currently in (the first they joined, if several)."""
+        tables = self._user_tables.get(username)
+        return next(iter(tables.values())) if tables else None
+
+    def on_member_added(self, username: str, table: Table) -> None:
+        """Index a new table member. Called by Table.add_member()."""
+        self._user_tables.setdefault(username, {})[table.table_id] = table
+        self.wake_table(table)
+
+    def on_member_removed(self, username: str, table: Table) -> None:
+        """Unindex a table member. Called by Table.remove_member()."""
+        tables = self._user_tables.get(username)
+        if tables and tables.get(table.table_id) is table:
+            del tables[table.table_id]
+            if not tables:
+                del self._user_tables[username]
+        # An empty table is destroyed on its next tick
+        self.wake_table(table)
+
+    def rename_member(self, old_username: str, new_username: str) -> None:
+        """Carry a renamed user's table membership over to their new name."""
+        tables = self._user_tables.pop(old_username, None)
+        if not tables:
+            return
+        for table in tables.values():
+            table.rename_member(old_username, new_username)
+        self._user_tables.setdefault(new_username, {}).update(tables)
 
     def on_tick(self) -> None:
-        """Tick all active tables."""
-        for table in list(self._tables.values()):
+        """Tick all awake tables, and put tables with nothing to do to sleep."""
+        # Tables due only because they hit max_sleep_ticks have no work, so
+        # their tick doesn't make them dirty for the checkpointer
+        idle: set[str] = set()
+        for table_id in self._wheel.advance():
+            if table_id in self._capped:
+                idle.add(table_id)
+            self._wake(table_id, self._wheel.now - 1)
+
+        profiler = get_profiler()
+        for table in list(self._awake.values()):
             if not table.members:
                 table.destroy()
                 continue
-            table.on_tick()
+            is_idle = table.table_id in idle
+            if not profiler.enabled:
+                table.on_tick(is_idle)
+            else:
+                started = time.perf_counter()
+                try:
+                    table.on_tick(is_idle)
+                finally:
+                    profiler.record_table_tick(
+                        table.table_id, table.game_type, time.perf_counter() - started
+                    )
+            if self.sleep_idle_tables and table.table_id in self._awake:
+                self._sleep_if_idle(table)
+
+    def _sleep_if_idle(self, table: Table) -> None:
+        """Put a just-ticked table to sleep until its game next has work."""
+        wait = table.ticks_until_wake()
+        if wait is not None and wait <= 1:
+            return
+        if self.max_sleep_ticks and (wait is None or wait > self.max_sleep_ticks):
+            wait = self.max_sleep_ticks
+            self._capped.add(table.table_id)
+        del self._awake[table.table_id]
+        self._asleep[table.table_id] = self._wheel.now
+        if wait is not None:
+            self._wheel.schedule(table.table_id, self._wheel.now + wait)
+
+    def _wake(self, table_id: str, through: int) -> None:
+        """Wake a sleeping table, catching it up on the ticks up to `through`."""
+        slept_since = self._asleep.pop(table_id, None)
+        if slept_since is None:
+            return
+        self._wheel.cancel(table_id)
+        self._capped.discard(table_id)
+        table = self._tables[table_id]
+        if through > slept_since:
+            table.on_ticks_skipped(through - slept_since)
+        self._awake[table_id] = table
+
+    def wake_table(self, table: Table) -> None:
+        """
+        Tick a sleeping table again from the next tick.
+
+        The ticks it slept through are caught up first, so the change about
+        to be made sees the game as if it had been ticking all along.
+        """
+        self._wake(table.table_id, self._wheel.now)
+
+    def catch_up_sleeping_tables(self) -> None:
+        """Catch sleeping tables up on the ticks so far, leaving them asleep."""
+        now = self._wheel.now
+        for table_id, slept_since in self._asleep.items():
+            if now > slept_since:
+                self._tables[table_id].on_ticks_skipped(now - slept_since)
+                self._asleep[table_id] = now
+
+    def get_menu_stats(self) -> dict[str, int]:
+        """Turn menu counters (see Game.get_menu_stats) summed over all tables."""
+        totals: dict[str, int] = {}
+        for table in self._tables.values():
+            if table.game:
+                for key, value in table.game.get_menu_stats().items():
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def get_sleeping_count(self) -> int:
+        """Number of tables currently asleep."""
+        return len(self._asleep)
+
+    def get_tables_to_save(self) -> list[Table]:
+        """Get all tables, with sleeping ones caught up so their state is current."""
+        self.catch_up_sleeping_tables()
+        return list(self._tables.values())
 
     def add_table(self, table: Table) -> None:
         """Add an existing table (e.g., loaded from database)."""
@@ -83,12 +248,17 @@ class TableManager:
         if self._server:
             table._db = self._server._db
         self._tables[table.table_id] = table
+        self._awake[table.table_id] = table
+        self._index_table(table)
+        for member in table.members:
+            self.on_member_added(member.username, table)
 
     def save_all(self) -> list[Table]:
         """Save all tables' game state and return them."""
-        for table in self._tables.values():
+        tables = self.get_tables_to_save()
+        for table in tables:
             table.save_game_state()
-        return list(self._tables.values())
+        return tables
 
     def on_table_destroy(self, table: Table) -> None:
         """Handle table destruction. Called by Table.destroy()."""
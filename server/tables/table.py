@@ -40,6 +40,7 @@ class Table(DataClassJSONMixin):
     _manager: Any = field(default=None, repr=False)  # Reference to TableManager
     _server: Any = field(default=None, repr=False)  # Reference to Server (for saves)
     _db: Any = field(default=None, repr=False)  # Reference to Database (for ratings)
+    _dirty: bool = field(default=True, repr=False)  # Changed since the last checkpoint
 
     def __post_init__(self):
         self._game = None
@@ -47,6 +48,25 @@ class Table(DataClassJSONMixin):
         self._manager = None
         self._server = None
         self._db = None
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether the table may have changed since the last checkpoint.
+
+        Set by ticks, events, wakes (which precede every action) and
+        membership changes; cleared by the checkpointer when it snapshots
+        the table. Catch-up for skipped ticks only advances counters and
+        leaves the flag alone.
+        """
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def mark_clean(self) -> None:
+        self._dirty = False
 
     @property
     def game(self) -> "Game | None":
@@ -55,8 +75,11 @@ class Table(DataClassJSONMixin):
     @game.setter
     def game(self, value: "Game | None") -> None:
         self._game = value
+        self._dirty = True
         if value:
             self.game_json = value.to_json()
+        if self._manager:
+            self._manager.on_game_attached(self)
 
     def add_member(
         self, username: str, user: "User", as_spectator: bool = False
@@ -69,16 +92,34 @@ class Table(DataClassJSONMixin):
 
         self.members.append(TableMember(username=username, is_spectator=as_spectator))
         self._users[username] = user
+        self._dirty = True
+        if self._manager:
+            self._manager.on_member_added(username, self)
 
     def remove_member(self, username: str) -> None:
         """Remove a member from the table."""
         self.members = [m for m in self.members if m.username != username]
         self._users.pop(username, None)
+        self._dirty = True
+        if self._manager:
+            self._manager.on_member_removed(username, self)
 
         # Destroy table if it's empty
         if not self.members:
             self.destroy()
 
+    def rename_member(self, old_username: str, new_username: str) -> None:
+        """Rename a member in place, keeping their seat and role."""
+        self._dirty = True
+        for member in self.members:
+            if member.username == old_username:
+                member.username = new_username
+        user = self._users.pop(old_username, None)
+        if user:
+            self._users[new_username] = user
+        if self.host == old_username:
+            self.host = new_username
+
     def get_user(self, username: str) -> "User | None":
         """Get a user by username."""
         return self._users.get(username)
@@ -110,13 +151,40 @@ class Table(DataClassJSONMixin):
         for user in self._users.values():
             user.play_sound(name, volume)
 
-    def on_tick(self) -> None:
-        """Called every tick. Forwards to game."""
+    def on_tick(self, idle: bool = False) -> None:
+        """
+        Called every tick. Forwards to game.
+
+        idle marks a tick the game said it had no work for (the sleeping
+        table safety net), which doesn't make the table dirty.
+        """
+        if not idle:
+            self._dirty = True
+        if self._game:
+            # Rebuild each dirty turn menu once, at the end of the tick
+            with self._game.menu_batch():
+                self._game.on_tick()
+
+    def ticks_until_wake(self) -> int | None:
+        """Ticks until on_tick next has work (see Game.ticks_until_wake)."""
+        if self._game:
+            return self._game.ticks_until_wake()
+        return None
+
+    def on_ticks_skipped(self, ticks: int) -> None:
+        """Catch the game up on ticks this table slept through."""
         if self._game:
-            self._game.on_tick()
+            self._game.on_ticks_skipped(ticks)
+
+    def wake(self) -> None:
+        """Have the manager tick this table again if it is asleep."""
+        self._dirty = True
+        if self._manager:
+            self._manager.wake_table(self)
 
     def handle_event(self, username: str, event: dict) -> None:
         """Handle an event from a member."""
+        self._dirty = True
         if self._game:
             # Find the player
             for player in self._game.players:
@@ -147,3 +215,12 @@ class Table(DataClassJSONMixin):
         """Save a game result to the database. Called by game when it finishes."""
         if self._server:
             self._server.on_game_result(result)
+
+    def update_ratings(self, game_type: str, rankings: list[list[str]]) -> None:
+        """Update player ratings from a game's rankings. Called by game when it finishes."""
+        if self._server:
+            self._server.on_ratings_update(game_type, rankings)
+        elif self._db:
+            from ..game_utils.stats_helpers import RatingHelper
+
+            RatingHelper(self._db, game_type).update_ratings(rankings)
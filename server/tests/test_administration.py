@@ -148,6 +148,7 @@ def test_show_admin_menu_includes_owner_actions():
         "promote_admin",
         "demote_admin",
         "virtual_bots",
+        "profiling",
         "transfer_ownership",
         "back",
     ]
@@ -186,6 +187,34 @@ def test_virtual_bots_menu_shows_status_and_updates_state():
     assert host._user_states["owner"]["menu"] == "virtual_bots_menu"
 
 
+@pytest.mark.asyncio
+async def test_profiling_menu_toggles_and_resets(monkeypatch):
+    profiler = administration.get_profiler()
+    monkeypatch.setattr(profiler, "enabled", False)
+    host = AdminHost()
+    owner_user = DummyUser("owner", TrustLevel.SERVER_OWNER)
+
+    host._show_profiling_menu(owner_user)
+    assert _get_menu_ids(owner_user)[:2] == ["toggle", "reset"]
+    assert owner_user.menus[-1]["items"][0].text == "profiling-start"
+    assert host._user_states["owner"]["menu"] == "profiling_menu"
+
+    await host._handle_profiling_selection(owner_user, "toggle")
+    assert profiler.enabled
+    assert owner_user.spoken[-1][0] == "profiling-started"
+    assert owner_user.menus[-1]["items"][0].text == "profiling-stop"
+
+    profiler.record("action", "pig", "_action_roll", 0.002)
+    host._show_profiling_menu(owner_user)
+    assert "profiling-entry" in [item.text for item in owner_user.menus[-1]["items"]]
+
+    await host._handle_profiling_selection(owner_user, "reset")
+    assert profiler.top() == []
+    await host._handle_profiling_selection(owner_user, "toggle")
+    assert not profiler.enabled
+    assert owner_user.spoken[-1][0] == "profiling-stopped"
+
+
 def test_show_promote_admin_menu_handles_empty_and_entries():
     db = DummyDB()
     host = AdminHost(db=db)
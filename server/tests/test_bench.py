@@ -0,0 +1,72 @@
+"""Tests for the game benchmark behind `cli.py bench`."""
+
+import pytest
+
+from server.benchmarks.games import (
+    BenchCase,
+    build_matrix,
+    compare,
+    make_baseline,
+    parse_preset,
+    run_matrix,
+)
+
+
+def test_parse_preset():
+    assert parse_preset("short:target_score=30, dice=2") == (
+        "short",
+        {"target_score": "30", "dice": "2"},
+    )
+    assert parse_preset("plain") == ("plain", {})
+    with pytest.raises(ValueError):
+        parse_preset("bad:target_score")
+
+
+def test_matrix_skips_unsupported_bot_counts():
+    cases = build_matrix(["pig", "yahtzee"], [1, 2], {"default": {}, "short": {"target_score": "30"}})
+    assert [case.key for case in cases] == [
+        "pig/2/default",
+        "pig/2/short",
+        "yahtzee/1/default",
+        "yahtzee/1/short",
+        "yahtzee/2/default",
+        "yahtzee/2/short",
+    ]
+    assert [case.key for case in build_matrix(["pig"], None, {"default": {}})] == ["pig/2/default"]
+    with pytest.raises(ValueError):
+        build_matrix(["nosuchgame"], None, {"default": {}})
+
+
+def test_seeded_runs_are_repeatable():
+    cases = [BenchCase("pig", 2, "short", {"target_score": "30"})]
+    first, second = (run_matrix(cases, runs=2, seed=7) for _ in range(2))
+
+    summary = first[0]
+    assert summary["runs"] == 2
+    assert summary["timed_out"] == 0
+    assert summary["ticks_mean"] == second[0]["ticks_mean"] > 0
+    assert summary["bot_think_calls"] > 0
+    assert 0 < summary["tick_p50_us"] <= summary["tick_p95_us"] <= summary["tick_max_us"]
+    assert summary["peak_kib"] > 0
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    summary = {
+        "game_type": "pig",
+        "bots": 2,
+        "preset": "default",
+        "ticks_per_sec": 1000.0,
+        "tick_p95_us": 50.0,
+        "bot_think_mean_us": 2.0,
+        "peak_kib": 40,
+    }
+    baseline = make_baseline([summary], runs=3, seed=1)
+
+    slower = dict(summary, ticks_per_sec=700.0, tick_p95_us=55.0)
+    regressions = compare([slower], baseline, tolerance=0.2)
+    assert [(r["case"], r["metric"]) for r in regressions] == [("pig/2/default", "ticks_per_sec")]
+
+    faster = dict(summary, ticks_per_sec=2000.0, tick_p95_us=10.0)
+    assert compare([faster], baseline, tolerance=0.2) == []
+    # Cases the baseline does not know are not compared
+    assert compare([dict(slower, bots=3)], baseline, tolerance=0.2) == []
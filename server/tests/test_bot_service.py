@@ -0,0 +1,231 @@
+"""Tests for deadline-bounded bot thinking (BotService)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from server.game_utils import bot_service
+from server.game_utils.bot_service import BotService, ThinkJob
+from server.games.scopa.bot import bot_think, bot_think_job
+from server.games.farkle.game import FarkleGame
+from server.games.scopa.game import ScopaGame
+from server.game_utils.cards import Card
+from server.games.base import Player
+from server.users.bot import Bot
+
+release = threading.Event()
+
+
+def decide(answer: str) -> str:
+    release.wait(5)
+    return answer
+
+
+def explode(answer: str) -> str:
+    raise ValueError(answer)
+
+
+def stuck_in_worker(answer: str) -> str:
+    if threading.current_thread() is threading.main_thread():
+        return answer
+    release.wait(5)
+    return "worker"
+
+
+class FakeGame:
+    """Just what the service touches on a game."""
+
+    def __init__(self):
+        self._bot_thinks = {}
+        self.answer = "inline"
+        self.job: ThinkJob | None = None
+
+    def get_type(self) -> str:
+        return "fake"
+
+    def bot_think(self, player):
+        return self.answer
+
+    def bot_think_job(self, player):
+        return self.job
+
+
+@pytest.fixture
+def service():
+    # Threads stand in for worker processes: jobs only need to be callables
+    service = BotService(workers=1, deadline_ms=60_000)
+    service._executor = ThreadPoolExecutor(max_workers=1)
+    release.clear()
+    yield service
+    release.set()
+    service.shutdown()
+
+
+def _wait(game: FakeGame, player: Player) -> None:
+    pending = game._bot_thinks[player.id]
+    pending.future.exception(timeout=5)
+
+
+def test_without_workers_thinks_inline_and_times_it():
+    service = BotService(workers=0, budget_ms=0)
+    service.start()
+    game = FakeGame()
+    game.job = ThinkJob(decide, ("offloaded",))
+
+    assert not service.running
+    assert service.think(game, Player(id="b", name="Bot")) == "inline"
+    stats = service.get_stats()["games"]["fake"]
+    assert stats["thinks"] == 1
+    assert stats["over_budget"] == 1
+    assert stats["offloaded"] == 0
+
+
+def test_offloaded_think_answers_on_a_later_ask(service):
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    game.job = ThinkJob(decide, ("offloaded",), fallback="cheap")
+
+    assert service.think(game, player) is None
+    assert service.think(game, player) is None
+    release.set()
+    _wait(game, player)
+    assert service.think(game, player) == "offloaded"
+    assert game._bot_thinks == {}
+
+    stats = service.get_stats()["games"]["fake"]
+    assert stats["offloaded"] == stats["completed"] == stats["thinks"] == 1
+    assert stats["timeouts"] == 0
+
+
+def test_changed_state_drops_the_pending_job(service):
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    game.job = ThinkJob(decide, ("first",))
+    assert service.think(game, player) is None
+
+    game.job = ThinkJob(decide, ("second",))
+    assert service.think(game, player) is None
+    release.set()
+    _wait(game, player)
+    assert service.think(game, player) == "second"
+    assert service.get_stats()["games"]["fake"]["stale"] == 1
+
+
+def test_missed_deadline_takes_the_fallback(service):
+    service.deadline_s = 0.0
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    game.job = ThinkJob(decide, ("slow",), fallback="cheap")
+
+    assert service.think(game, player) is None
+    time.sleep(0.001)
+    assert service.think(game, player) == "cheap"
+    assert game._bot_thinks == {}
+    assert service.get_stats()["games"]["fake"]["timeouts"] == 1
+
+
+def test_fallback_fn_only_runs_when_the_deadline_passes(service):
+    service.deadline_s = 0.0
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    fallbacks = []
+
+    def cheap(answer: str) -> str:
+        fallbacks.append(answer)
+        return "cheap"
+
+    game.job = ThinkJob(decide, ("slow",), fallback_fn=cheap)
+    assert service.think(game, player) is None
+    assert fallbacks == []
+    time.sleep(0.001)
+    assert service.think(game, player) == "cheap"
+    assert fallbacks == ["slow"]
+
+
+def test_failed_job_takes_the_fallback(service):
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    game.job = ThinkJob(explode, ("boom",), fallback="cheap")
+    assert service.think(game, player) is None
+    _wait(game, player)
+    assert service.think(game, player) == "cheap"
+    assert service.get_stats()["games"]["fake"]["errors"] == 1
+
+
+def test_late_job_without_fallback_runs_inline(service):
+    service.deadline_s = 0.0
+    game, player = FakeGame(), Player(id="b", name="Bot")
+    game.job = ThinkJob(stuck_in_worker, ("inline",))
+
+    assert service.think(game, player) is None
+    time.sleep(0.001)
+    assert service.think(game, player) == "inline"
+    stats = service.get_stats()["games"]["fake"]
+    assert stats["timeouts"] == 1
+    assert stats["thinks"] == 1
+
+
+def test_scopa_job_matches_inline_think():
+    game = ScopaGame()
+    game.add_player("Bot", Bot("Bot"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+    player = game.players[0]
+    game.table_cards = [Card(id=100, rank=2, suit=1)]
+    player.hand = [
+        Card(id=101, rank=3, suit=2),
+        Card(id=102, rank=5, suit=3),
+        Card(id=103, rank=10, suit=4),
+    ]
+
+    job = bot_think_job(game, player)
+    assert job.run() == bot_think(game, player)
+    assert job.fallback is None
+    assert job.fallback_fn(*job.args) in {f"play_card_{card.id}" for card in player.hand}
+
+    player.hand = []
+    assert bot_think_job(game, player) is None
+
+
+def test_bot_helper_uses_the_server_service(monkeypatch):
+    service = BotService(workers=0)
+    monkeypatch.setattr(bot_service, "_service", service)
+    game = ScopaGame()
+    game.add_player("Bot", Bot("Bot"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+
+    for _ in range(200):
+        game.on_tick()
+
+    assert service.get_stats()["games"]["scopa"]["thinks"] > 0
+
+
+def _farkle_with_pending_think(service):
+    game = FarkleGame()
+    game.add_player("Bot1", Bot("Bot1"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+    player = game.current_player
+    game._bot_thinks[player.id] = bot_service.PendingThink(
+        ThinkJob(decide, ("slow",)), service._executor.submit(decide, "slow"), 0.0, 1e18
+    )
+    return game, player
+
+
+def test_finished_game_drops_pending_thinks(service):
+    game, _ = _farkle_with_pending_think(service)
+    assert game.ticks_until_wake() == 1
+
+    game.status = "finished"
+    game.on_tick()
+    assert game._bot_thinks == {}
+    assert not game.waiting_off_tick()
+
+
+def test_think_for_a_bot_off_turn_is_dropped(service, monkeypatch):
+    monkeypatch.setattr(bot_service, "_service", BotService(workers=0))
+    game, player = _farkle_with_pending_think(service)
+    game.advance_turn()
+    assert game.current_player is not player
+
+    game.on_tick()
+    assert player.id not in game._bot_thinks
+    assert not game.waiting_off_tick()
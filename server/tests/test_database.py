@@ -90,6 +90,21 @@ def test_delete_all_tables_removes_saved_entries(db):
     assert db.load_all_tables() == []
 
 
+def test_checkpoint_tables_compresses_and_prunes(db):
+    game_json = json.dumps({"state": "playing", "log": ["roll"] * 200})
+    kept = Table("kept", "pig", "host", [TableMember("host")], game_json=game_json, status="playing")
+    ended = Table("ended", "pig", "host", [TableMember("host")])
+    db.save_table(ended)
+
+    written = db.checkpoint_tables([kept], live_ids=["kept"])
+
+    assert 0 < written < len(game_json)
+    assert [table.table_id for table in db.load_all_tables()] == ["kept"]
+    loaded = db.load_table("kept")
+    assert loaded.game_json == game_json
+    assert loaded.status == "playing"
+
+
 def test_save_user_table_and_get_list(db):
     rec1 = db.save_user_table(
         "player",
@@ -150,3 +165,146 @@ def test_approve_and_delete_user(db):
 
     assert db.delete_user("pending") is True
     assert db.get_user("pending") is None
+
+
+FARKLE_STATS = [
+    {
+        "id": "avg_points_per_turn",
+        "numerator": "player_stats.{player_name}.total_score",
+        "denominator": "player_stats.{player_name}.turns_taken",
+        "aggregate": "sum",
+        "format": "avg",
+        "decimals": 1,
+    },
+    {
+        "id": "best_single_turn",
+        "path": "player_stats.{player_name}.best_turn",
+        "aggregate": "max",
+        "format": "score",
+    },
+]
+
+
+def _save_farkle_result(db: Database, timestamp: str, winner: str, scores: dict, turns: int):
+    players = [(f"uuid-{name}", name, name == "Bot", False) for name in scores]
+    db.save_game_result(
+        game_type="farkle",
+        timestamp=timestamp,
+        duration_ticks=100,
+        players=players,
+        custom_data={
+            "winner_name": winner,
+            "final_scores": scores,
+            "player_stats": {
+                name: {"total_score": score, "turns_taken": turns, "best_turn": score // 2}
+                for name, score in scores.items()
+            },
+        },
+        stat_configs=FARKLE_STATS,
+    )
+
+
+def test_save_game_result_updates_player_aggregates(db):
+    _save_farkle_result(db, "2025-01-01T00:00", "alice", {"alice": 100, "bob": 60, "Bot": 90}, 10)
+    _save_farkle_result(db, "2025-01-02T00:00", "bob", {"alice": 40, "bob": 120, "Bot": 10}, 10)
+    _save_farkle_result(db, "2025-01-03T00:00", "alice", {"alice": 200, "bob": 80, "Bot": 0}, 20)
+
+    wins = db.get_stats_leaderboard("farkle", "wins")
+    # Plain bots are left off the leaderboards
+    assert [(row["player_name"], row["wins"], row["losses"]) for row in wins] == [
+        ("alice", 2, 1),
+        ("bob", 1, 2),
+    ]
+    alice = db.get_player_game_stats("uuid-alice", "farkle")
+    assert alice["games"] == 3
+    assert alice["total_score"] == 340
+    assert alice["high_score"] == 200
+    assert [row["player_name"] for row in db.get_stats_leaderboard("farkle", "high_score")] == [
+        "alice",
+        "bob",
+    ]
+
+    assert db.get_custom_stat_leaderboard("farkle", FARKLE_STATS[0]) == [
+        ("uuid-alice", "alice", 340 / 40),
+        ("uuid-bob", "bob", 260 / 40),
+    ]
+    assert db.get_player_custom_stats("uuid-bob", "farkle", FARKLE_STATS) == {
+        "avg_points_per_turn": 260 / 40,
+        "best_single_turn": 60,
+    }
+    assert db.get_player_game_types("uuid-alice") == {"farkle"}
+    assert db.get_player_names("farkle", ["uuid-bob", "uuid-nobody"]) == {"uuid-bob": "bob"}
+
+
+def test_rename_user_carries_leaderboard_stats(db):
+    _insert_user(db, "alice")
+    _save_farkle_result(db, "2025-01-01T00:00", "alice", {"alice": 100, "bob": 60}, 10)
+
+    assert db.rename_user("alice", "alicia")
+
+    wins = db.get_stats_leaderboard("farkle", "wins")
+    assert [(row["player_name"], row["wins"]) for row in wins] == [("alicia", 1), ("bob", 0)]
+    assert db.get_custom_stat_leaderboard("farkle", FARKLE_STATS[0])[0][:2] == (
+        "uuid-alice",
+        "alicia",
+    )
+
+    # Later results add to the same row
+    players = [("uuid-alice", "alicia", False, False), ("uuid-bob", "bob", False, False)]
+    result = {"winner_name": "alicia", "final_scores": {"alicia": 50, "bob": 20}}
+    db.save_game_result("farkle", "2025-01-02T00:00", 1, players, result)
+    [alicia, bob] = db.get_stats_leaderboard("farkle", "wins")
+    assert (alicia["player_name"], alicia["games"], alicia["wins"]) == ("alicia", 2, 2)
+
+
+def test_rename_user_moves_stats_keyed_by_name(db):
+    # Virtual bots' results are keyed by their name
+    _insert_user(db, "robo")
+    result = {"winner_name": "robo", "final_scores": {"robo": 70}}
+    db.save_game_result("farkle", "2025-01-01T00:00", 1, [("robo", "robo", True, True)], result)
+
+    assert db.rename_user("robo", "robot")
+
+    assert db.get_player_game_stats("robo", "farkle") is None
+    result = {"winner_name": "robot", "final_scores": {"robot": 90}}
+    db.save_game_result("farkle", "2025-01-02T00:00", 1, [("robot", "robot", True, True)], result)
+    [row] = db.get_stats_leaderboard("farkle", "wins")
+    assert (row["player_id"], row["player_name"], row["games"]) == ("robot", "robot", 2)
+    assert row["high_score"] == 90
+
+
+def test_get_stats_leaderboard_rejects_unknown_column(db):
+    with pytest.raises(ValueError):
+        db.get_stats_leaderboard("farkle", "wins; DROP TABLE users")
+
+
+def test_rebuild_player_stats_matches_incremental_updates(db):
+    _save_farkle_result(db, "2025-01-01T00:00", "alice", {"alice": 100, "bob": 60}, 10)
+    _save_farkle_result(db, "2025-01-02T00:00", "bob", {"alice": 40, "bob": 120}, 8)
+    expected = db.get_stats_leaderboard("farkle", "total_score")
+    expected_custom = db.get_custom_stat_leaderboard("farkle", FARKLE_STATS[1])
+
+    db._conn.execute("DELETE FROM player_game_stats")
+    db._conn.execute("DELETE FROM player_custom_stats")
+    db._conn.commit()
+    assert db.player_stats_need_backfill()
+
+    assert db.rebuild_player_stats({"farkle": FARKLE_STATS}) == 2
+    assert not db.player_stats_need_backfill()
+    assert db.get_stats_leaderboard("farkle", "total_score") == expected
+    assert db.get_custom_stat_leaderboard("farkle", FARKLE_STATS[1]) == expected_custom
+
+
+def test_failed_game_result_save_rolls_back(db):
+    with pytest.raises(KeyError):
+        db.save_game_result(
+            game_type="farkle",
+            timestamp="2025-01-01T00:00",
+            duration_ticks=1,
+            players=[("uuid-alice", "alice", False, False)],
+            custom_data={"player_stats": {"alice": {"best_turn": 5}}},
+            stat_configs=[{"path": "player_stats.{player_name}.best_turn"}],  # No id
+        )
+
+    assert db.get_game_stats("farkle") == []
+    assert db.get_player_game_stats("uuid-alice", "farkle") is None
@@ -0,0 +1,130 @@
+"""Tests for persistence.executor.DatabaseExecutor."""
+
+import threading
+
+import pytest
+
+from server.auth.auth import AuthManager, AuthResult
+from server.persistence.database import Database
+from server.persistence.executor import DatabaseExecutor, run_database_job
+
+
+@pytest.fixture
+def executor(tmp_path):
+    db_path = tmp_path / "test.db"
+    # The server's main connection creates the schema before the executor starts
+    main_db = Database(db_path)
+    main_db.connect()
+    executor = DatabaseExecutor(db_path, reader_count=2)
+    executor.start()
+    try:
+        yield executor
+    finally:
+        executor.close()
+        main_db.close()
+
+
+@pytest.mark.asyncio
+async def test_read_and_write_by_method_name(executor):
+    assert await executor.read("get_user_count") == 0
+
+    record = await executor.write("create_user", "alice", "hash")
+    assert record.username == "alice"
+
+    user = await executor.read("get_user", "alice")
+    assert user is not None and user.uuid == record.uuid
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_on_worker_threads(executor):
+    def thread_name(db):
+        return threading.current_thread().name
+
+    assert (await executor.read(thread_name)).startswith("db-reader")
+    assert (await executor.write(thread_name)).startswith("db-writer")
+
+
+@pytest.mark.asyncio
+async def test_submit_write_applies_in_order_after_flush(executor):
+    executor.submit_write("create_user", "bob", "hash")
+    executor.submit_write("update_user_locale", "bob", "vi")
+    await executor.flush()
+
+    assert executor.pending_writes == 0
+    user = await executor.read("get_user", "bob")
+    assert user.locale == "vi"
+
+
+@pytest.mark.asyncio
+async def test_submit_write_errors_are_counted_not_raised(executor):
+    def boom(db):
+        raise RuntimeError("disk on fire")
+
+    executor.submit_write(boom)
+    executor.submit_write("create_user", "carol", "hash")
+    await executor.flush()
+
+    assert executor.failed_writes == 1
+    assert await executor.read("user_exists", "carol")
+    stats = executor.get_stats()
+    assert stats["failed_writes"] == 1
+    assert stats["pending_writes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_auth_runs_on_the_executor(executor):
+    # No main connection: every database call must go through the executor
+    auth = AuthManager(None, db_read=executor.read, db_write=executor.write)
+    try:
+        assert await auth.register_async("erin", "pass")
+        assert not await auth.register_async("erin", "other")
+        assert await auth.authenticate_async("erin", "pass") == AuthResult.SUCCESS
+        assert await auth.authenticate_async("nobody", "pass") == AuthResult.USER_NOT_FOUND
+
+        token = await auth.create_session_async("erin")
+        assert await auth.authenticate_async("erin", "", token) == AuthResult.SUCCESS
+        assert await auth.authenticate_async("erin", "", token) == AuthResult.WRONG_PASSWORD
+        user = await auth.get_user_async("erin")
+        assert user.trust_level.name == "SERVER_OWNER"
+    finally:
+        auth.close()
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_queued_writes(tmp_path):
+    db_path = tmp_path / "test.db"
+    main_db = Database(db_path)
+    main_db.connect()
+    executor = DatabaseExecutor(db_path)
+    executor.start()
+
+    for i in range(20):
+        executor.submit_write("create_user", f"user{i}", "hash")
+    executor.close()
+
+    assert not executor.running
+    assert main_db.get_user_count() == 20
+    main_db.close()
+
+
+@pytest.mark.asyncio
+async def test_read_requires_running_executor(tmp_path):
+    executor = DatabaseExecutor(tmp_path / "test.db")
+    with pytest.raises(RuntimeError):
+        await executor.read("get_user_count")
+
+
+def test_connect_enables_wal(tmp_path):
+    db = Database(tmp_path / "test.db")
+    db.connect()
+    mode = db._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    db.close()
+    assert mode == "wal"
+
+
+def test_run_database_job_accepts_names_and_callables(tmp_path):
+    db = Database(tmp_path / "test.db")
+    db.connect()
+    run_database_job(db, "create_user", "dave", "hash")
+    assert run_database_job(db, lambda d, name: d.user_exists(name), "dave")
+    db.close()
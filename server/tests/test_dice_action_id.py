@@ -141,5 +141,49 @@ class TestActionIdPassing:
         assert len(enabled) > 0
 
 
+    def test_signature_inspected_once_per_callback(self, monkeypatch):
+        """Menu rebuilds reuse the cached dispatch instead of inspect.signature."""
+        from server.game_utils import actions
+
+        game = ThreesGame()
+        player = game.add_player("Alice", MockUser("Alice"))
+        game.on_start()
+        player.dice.roll()
+        game.get_all_visible_actions(player)
+
+        calls = []
+        real_signature = actions.inspect.signature
+        monkeypatch.setattr(
+            actions.inspect,
+            "signature",
+            lambda method: calls.append(method) or real_signature(method),
+        )
+        first = [a.action.id for a in game.get_all_visible_actions(player)]
+        second = [a.action.id for a in game.get_all_visible_actions(player)]
+
+        assert calls == []
+        assert first == second
+
+    def test_instance_override_refreshes_dispatch(self):
+        """Replacing a callback on one game picks up the new signature."""
+        game = ThreesGame()
+        player = game.add_player("Alice", MockUser("Alice"))
+        game.on_start()
+        player.dice.roll()
+        turn_set = game.get_action_set(player, "turn")
+        action = turn_set.get_action("toggle_die_0")
+        assert turn_set.resolve_action(game, player, action).enabled
+
+        seen = []
+
+        def is_enabled(player, action_id=None):
+            seen.append(action_id)
+            return "disabled"
+
+        setattr(game, action.is_enabled, is_enabled)
+        assert not turn_set.resolve_action(game, player, action).enabled
+        assert seen == ["toggle_die_0"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
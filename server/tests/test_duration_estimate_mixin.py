@@ -1,20 +1,43 @@
 """Tests for DurationEstimateMixin helpers and completion flow."""
 
 import threading
+from concurrent.futures import Future
 
+import pytest
+
+from server.game_utils import duration_estimate_mixin
 from server.game_utils.duration_estimate_mixin import DurationEstimateMixin
+from server.game_utils.estimate_pool import EstimatePool, run_simulation
+
+
+class DoneJob:
+    def done(self) -> bool:
+        return True
 
 
-class DeadThread:
-    def is_alive(self) -> bool:
-        return False
+class FakePool(EstimatePool):
+    """Runs nothing; hands back pending futures the test completes."""
+
+    def __init__(self):
+        super().__init__(workers=1)
+        self.submitted: list[tuple] = []
+
+    def submit(self, game_type, num_bots, options, count, on_done):
+        self.submitted.append((game_type, num_bots, options, count))
+        futures = []
+        for _ in range(count):
+            future = Future()
+            future.add_done_callback(on_done)
+            futures.append(future)
+        return futures
 
 
 class DummyGame(DurationEstimateMixin):
     TICKS_PER_SECOND = 20
 
     def __init__(self):
-        self._estimate_threads: list[DeadThread] = []
+        self._estimate_jobs: list[DoneJob] = []
+        self._estimate_key = None
         self._estimate_results: list[int] = []
         self._estimate_errors: list[str] = []
         self._estimate_running: bool = False
@@ -41,14 +64,14 @@ class DummyGame(DurationEstimateMixin):
 
 def test_check_estimate_completion_broadcasts_results_and_resets():
     game = DummyGame()
-    game._estimate_threads = [DeadThread(), DeadThread()]
+    game._estimate_jobs = [DoneJob(), DoneJob()]
     game._estimate_results = [1200, 1800, 2400, 3000]
     game._estimate_errors = []
     game._estimate_running = True
 
     game.check_estimate_completion()
 
-    assert not game._estimate_threads
+    assert not game._estimate_jobs
     assert not game._estimate_results
     assert not game._estimate_errors
     assert game._estimate_running is False
@@ -76,3 +99,63 @@ def test_format_duration_handles_seconds_and_hours():
     assert game._format_duration(40) == "2 seconds"
     assert game._format_duration(20 * 75) == "1:15"
     assert game._format_duration(20 * 3700) == "1:01:40"
+
+
+def test_estimate_streams_results_then_answers_from_cache(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(duration_estimate_mixin, "get_estimate_pool", lambda: pool)
+    game = DummyGame()
+
+    game._action_estimate_duration(None, "estimate_duration")
+    assert game._estimate_running
+    assert pool.submitted == [("dummy", 1, {}, game.NUM_ESTIMATE_SIMULATIONS)]
+    assert game.broadcast_events[-1][0] == "estimate-computing"
+
+    # Results arrive as each simulation finishes
+    for i, job in enumerate(game._estimate_jobs):
+        game.check_estimate_completion()
+        assert game._estimate_running
+        if i == 0:
+            job.set_exception(RuntimeError("worker died"))
+        else:
+            job.set_result(2000)
+    assert game._estimate_results == [2000] * (game.NUM_ESTIMATE_SIMULATIONS - 1)
+
+    game.check_estimate_completion()
+    assert not game._estimate_running
+    assert game.broadcast_events[-1][0] == "estimate-result"
+
+    # The same game type, options and player count is served from the cache
+    game.broadcast_events.clear()
+    game._action_estimate_duration(None, "estimate_duration")
+    assert len(pool.submitted) == 1
+    assert not game._estimate_running
+    assert [event for event, _ in game.broadcast_events] == ["estimate-result"]
+
+
+def test_estimate_pool_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr("server.game_utils.estimate_pool.ESTIMATE_CACHE_SIZE", 2)
+    pool = EstimatePool(workers=1)
+    keys = [pool.make_key("pig", n, {"target_score": "50"}) for n in (2, 3, 4)]
+    for key in keys:
+        pool.store(key, [100])
+    assert pool.get_cached(keys[0]) is None
+    assert pool.get_cached(keys[2]) == [100]
+
+
+def test_run_simulation_in_process():
+    ticks = run_simulation("pig", 2, {"target_score": "10"})
+    assert ticks is not None and ticks > 0
+
+
+@pytest.mark.slow
+def test_estimate_pool_runs_simulations_in_workers():
+    pool = EstimatePool(workers=2)
+    results = []
+    try:
+        futures = pool.submit("pig", 2, {"target_score": "10"}, 3, lambda f: results.append(f.result()))
+        for future in futures:
+            future.result(timeout=120)
+    finally:
+        pool.shutdown()
+    assert len(results) == 3 and all(ticks > 0 for ticks in results)
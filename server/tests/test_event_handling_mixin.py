@@ -1,5 +1,6 @@
 """Targeted tests for the EventHandlingMixin behaviors."""
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 
 from server.games.base import Player, ActionContext
@@ -66,6 +67,15 @@ class DummyGame(EventHandlingMixin):
         self._visible_actions = resolved
 
     # Methods used by mixin
+    def menu_batch(self):
+        return nullcontext()
+
+    def wake(self) -> None:
+        pass
+
+    def flush_menus(self) -> None:
+        pass
+
     def get_user(self, player: Player) -> DummyUser | None:
         return self._users.get(player.id)
 
@@ -0,0 +1,103 @@
+"""Tests for the Farkle expected-value banking policy."""
+
+import random
+
+import pytest
+
+from server.games.farkle import strategy
+from server.games.farkle.game import FarkleGame, FarkleOptions, split_combination
+from server.games.farkle.strategy import best_move, roll_value
+from server.users.bot import Bot
+
+
+def test_split_combination():
+    assert split_combination([1, 2, 3, 4, 5, 5], "small_straight") == ([1, 2, 3, 4, 5], [5])
+    assert split_combination([2, 3, 4, 5, 6, 6], "small_straight") == ([2, 3, 4, 5, 6], [6])
+    assert split_combination([4, 4, 4, 4, 1], "three_of_kind", 4) == ([4, 4, 4], [4, 1])
+    assert split_combination([2, 2, 3, 3, 6, 6], "three_pairs") == ([2, 2, 3, 3, 6, 6], [])
+
+
+def test_roll_outcomes_cover_the_scoring_rolls():
+    def scoring_chance(count):
+        return sum(probability for probability, _, _ in strategy._roll_outcomes(count))
+
+    assert scoring_chance(1) == pytest.approx(1 / 3)
+    assert scoring_chance(2) == pytest.approx(1 - (4 / 6) ** 2)
+    # Six dice only farkle on two pairs and two singles of 2, 3, 4 and 6
+    assert scoring_chance(6) == pytest.approx(1 - 5 / 216)
+
+
+def test_roll_values_near_the_target():
+    # One step from the target: any score reaches it
+    assert roll_value(1, 0, 5) == pytest.approx(5 / 3)
+    # A 1 reaches 10; a 5 is worth rolling six dice again for the last 5
+    assert roll_value(1, 0, 10) == pytest.approx((10 + 10 * (1 - 5 / 216)) / 6)
+    assert roll_value(3, 20, 10) == 10
+
+
+def test_best_moves():
+    assert best_move([], 0, 500, True) == "roll"
+    assert best_move([1, 1, 1, 2, 3, 4], 0, 500, False) == ("three_of_kind", 1)
+    # Two dice at 100 points: bank rather than risk the turn
+    assert best_move([2, 3], 100, 500, True) == "bank"
+    assert best_move([2, 3], 100, 500, True, must_reach=True) == "roll"
+    # Past the target, take what is left and bank instead of rolling it
+    assert best_move([1, 2], 100, 50, True) == ("single_1", 1)
+    assert best_move([2], 110, 50, True) == "bank"
+
+
+def test_bot_reads_moves_from_the_policy():
+    game = FarkleGame()
+    game.add_player("Bot1", Bot("Bot1"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+    player = game.current_player
+    player.current_roll = [1, 1, 1, 2, 3, 4]
+    game.update_scoring_actions(player)
+
+    assert game.bot_think(player) == "score_three_of_kind_1"
+    assert game.bot_think(game.players[1]) is None
+
+
+def test_bots_finish_a_game():
+    random.seed(7)
+    game = FarkleGame(options=FarkleOptions(target_score=500))
+    game.add_player("Bot1", Bot("Bot1"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+
+    for _ in range(20000):
+        if not game.game_active:
+            break
+        game.on_tick()
+
+    assert not game.game_active
+    assert max(p.score for p in game.players) >= 500
+
+
+def test_built_table_matches_the_solver(tmp_path):
+    horizon = 40
+    values = strategy.build_table(horizon=horizon, workers=1)
+    path = tmp_path / "strategy.f32"
+    strategy.save_table(values, path, horizon=horizon)
+    table = strategy.load_table(path, horizon=horizon)
+    assert table is not None
+    assert strategy.load_table(path) is None
+
+    for gap in (1, 7, horizon):
+        rows = strategy._solve_gap(gap)
+        for count in range(1, 7):
+            start = strategy._gap_offset(horizon, gap, count)
+            assert list(table[start : start + gap]) == pytest.approx(list(rows[count]), rel=1e-6)
+    chances = strategy._solve_reach(horizon)
+    start = strategy._reach_offset(horizon, 6)
+    assert list(table[start : start + horizon + 1]) == pytest.approx(list(chances[6]), rel=1e-6)
+
+
+def test_must_reach_gaps_are_bounded():
+    far = strategy.GAP_HORIZON * 3
+    # Only the points still missing are clamped to the horizon
+    assert roll_value(6, 0, far, must_reach=True) == pytest.approx(
+        far * strategy._reach_chances()[6][strategy.HORIZON_STEPS]
+    )
+    assert best_move([1, 2, 3, 4, 6, 6], 0, far, False, must_reach=True) == ("single_1", 1)
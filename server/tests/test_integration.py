@@ -11,7 +11,7 @@ import os
 from server.persistence.database import Database
 from server.auth.auth import AuthManager, AuthResult
 from server.tables.manager import TableManager
-from server.tables.table import Table
+from server.tables.table import Table, TableMember
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 from server.games.pig.game import PigGame, PigOptions
@@ -123,6 +123,7 @@ class TestAuthIntegration:
 
     def teardown_method(self):
         """Clean up."""
+        self.auth.close()
         self.db.close()
         os.unlink(self.temp_file.name)
 
@@ -153,6 +154,54 @@ class TestAuthIntegration:
         self.auth.invalidate_session(token)
         assert self.auth.validate_session(token) is None
 
+    def test_sessions_survive_restart_and_expire(self):
+        """Session tokens are stored hashed in the database with a TTL."""
+        self.auth.register("sessionuser", "pass")
+        token = self.auth.create_session("sessionuser")
+
+        # The raw token is never stored
+        stored = self.db._conn.execute("SELECT token_hash FROM sessions").fetchone()[0]
+        assert stored != token
+
+        # A new manager (e.g. after a restart) still accepts it
+        assert AuthManager(self.db).validate_session(token) == "sessionuser"
+
+        expired = AuthManager(self.db, session_ttl_s=-1)
+        old_token = expired.create_session("sessionuser")
+        assert self.auth.validate_session(old_token) is None
+        assert self.auth.purge_expired_sessions() == 0
+
+    def test_reset_password_invalidates_sessions(self):
+        """Changing a password drops that user's session tokens."""
+        self.auth.register("sessionuser", "pass")
+        token = self.auth.create_session("sessionuser")
+        self.auth.reset_password("sessionuser", "newpass")
+        assert self.auth.validate_session(token) is None
+
+    @pytest.mark.asyncio
+    async def test_authenticate_async(self):
+        """Async login hashes on the pool and accepts single-use session tokens."""
+        assert await self.auth.register_async("asyncuser", "pass")
+        assert not await self.auth.register_async("asyncuser", "other")
+
+        assert await self.auth.authenticate_async("asyncuser", "pass") == AuthResult.SUCCESS
+        assert await self.auth.authenticate_async("asyncuser", "bad") == AuthResult.WRONG_PASSWORD
+        assert await self.auth.authenticate_async("nobody", "pass") == AuthResult.USER_NOT_FOUND
+        assert self.auth.get_stats()["hash_jobs"] == 3
+        assert self.auth.hash_queue_depth == 0
+
+        # A valid token logs in without the password, once
+        token = self.auth.create_session("asyncuser")
+        assert await self.auth.authenticate_async("asyncuser", "", token) == AuthResult.SUCCESS
+        assert self.auth.get_stats()["session_logins"] == 1
+        assert await self.auth.authenticate_async("asyncuser", "", token) == AuthResult.WRONG_PASSWORD
+
+        # A token for another user falls back to the password
+        self.auth.register("other", "pass")
+        other_token = self.auth.create_session("other")
+        assert await self.auth.authenticate_async("asyncuser", "pass", other_token) == AuthResult.SUCCESS
+        assert self.auth.get_stats()["session_logins"] == 1
+
 
 class TestTableManagerIntegration:
     """Test table manager operations."""
@@ -191,6 +240,34 @@ class TestTableManagerIntegration:
         waiting_all = manager.get_waiting_tables()
         assert len(waiting_all) == 3
 
+    def test_joinable_tables(self):
+        """Tables drop out of the joinable index once their game starts."""
+        manager = TableManager()
+        host = MockUser("host")
+        other = MockUser("other")
+        table = manager.create_table("pig", "host", host)
+        manager.create_table("other", "other", other)
+        assert manager.get_joinable_tables() == []  # No games yet
+
+        game = PigGame()
+        table.game = game
+        game.initialize_lobby("host", host)
+        assert manager.get_joinable_tables("pig") == [table]
+        assert manager.get_tables_by_type("pig") == [table]
+
+        game.status = "playing"
+        assert manager.get_joinable_tables() == []
+        assert manager._lobby_tables["pig"] == {}
+
+        # A new game puts the table back in its lobby
+        table.game = PigGame()
+        table.game.initialize_lobby("host", host)
+        assert manager.get_joinable_tables() == [table]
+
+        manager.remove_table(table.table_id)
+        assert manager.get_joinable_tables() == []
+        assert manager.get_tables_by_type("pig") == []
+
     def test_table_destroyed_when_empty(self):
         """Removing the last member should destroy the table."""
         manager = TableManager()
@@ -207,6 +284,65 @@ class TestTableManagerIntegration:
         manager.on_tick()
         assert manager.get_table("empty") is None
 
+    def test_find_user_table_tracks_members_and_spectators(self):
+        """The user index should follow joins, leaves and table removal."""
+        manager = TableManager()
+        table = manager.create_table("pig", "host", MockUser("host"))
+        table.add_member("watcher", MockUser("watcher"), as_spectator=True)
+        assert manager.find_user_table("watcher") is table
+
+        table.remove_member("watcher")
+        assert manager.find_user_table("watcher") is None
+        assert manager.find_user_table("host") is table
+
+        manager.remove_table(table.table_id)
+        assert manager.find_user_table("host") is None
+
+    def test_find_user_table_for_loaded_table(self):
+        """Tables added from the database should index their members."""
+        manager = TableManager()
+        table = Table(
+            table_id="loaded",
+            game_type="pig",
+            host="host",
+            members=[TableMember("host"), TableMember("watcher", is_spectator=True)],
+        )
+        manager.add_table(table)
+        assert manager.find_user_table("host") is table
+        assert manager.find_user_table("watcher") is table
+
+    def test_rename_member_moves_table_membership(self):
+        """Renaming a seated user keeps their seat under the new name."""
+        manager = TableManager()
+        user = MockUser("old")
+        table = manager.create_table("pig", "old", user)
+
+        manager.rename_member("old", "new")
+
+        assert manager.find_user_table("old") is None
+        assert manager.find_user_table("new") is table
+        assert table.host == "new"
+        assert [m.username for m in table.members] == ["new"]
+        assert table.get_user("new") is user
+
+    def test_user_at_two_tables_stays_indexed(self):
+        """Leaving one of two tables keeps the user indexed at the other."""
+        manager = TableManager()
+        watched = manager.create_table("pig", "host", MockUser("host"))
+        user = MockUser("both")
+        watched.add_member("both", user, as_spectator=True)
+        seated = manager.create_table("pig", "both", user)
+        assert manager.find_user_table("both") is watched
+
+        manager.rename_member("both", "renamed")
+        assert [m.username for m in seated.members] == ["renamed"]
+        assert "renamed" in [m.username for m in watched.members]
+
+        watched.remove_member("renamed")
+        assert manager.find_user_table("renamed") is seated
+        seated.remove_member("renamed")
+        assert manager.find_user_table("renamed") is None
+
 
 class TestGameRegistryIntegration:
     """Test game registry."""
@@ -227,6 +363,38 @@ class TestGameRegistryIntegration:
         assert "category-dice-games" in categories
         assert PigGame in categories["category-dice-games"]
 
+    def test_descriptors_match_game_classes(self):
+        """Descriptors (used without importing games) must agree with the classes."""
+        from server.games.registry import GameDescriptor
+
+        descriptors = GameRegistry.get_descriptors()
+        games_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "games")
+        packages = {
+            name for name in os.listdir(games_dir)
+            if os.path.exists(os.path.join(games_dir, name, "game.py"))
+        }
+        # Every game package is described in games/__init__.py
+        assert packages <= {d.type for d in descriptors}
+        for descriptor in descriptors:
+            game_class = get_game_class(descriptor.type)
+            assert GameDescriptor.from_class(game_class) == descriptor
+            assert descriptor.name_key == game_class.get_name_key()
+
+    def test_games_are_imported_on_first_use(self):
+        """Listing games does not import them; looking one up does."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from server.games.registry import GameRegistry; "
+            "GameRegistry.get_descriptors_by_category(); "
+            "assert 'server.games.pig.game' not in sys.modules; "
+            "assert GameRegistry.get('pig').get_type() == 'pig'; "
+            "assert 'server.games.scopa.game' not in sys.modules"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
 
 class TestFullGameFlow:
     """Test complete game flow from creation to completion."""
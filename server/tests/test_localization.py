@@ -0,0 +1,120 @@
+"""Tests for the Localization render cache."""
+
+import pytest
+
+from server.games.pig.game import PigGame
+from server.messages.localization import Localization
+from server.users.test_user import MockUser
+
+
+@pytest.fixture(autouse=True)
+def _clear_render_cache():
+    Localization.clear_render_cache()
+    yield
+    Localization.clear_render_cache()
+
+
+def test_repeated_messages_are_cached():
+    first = Localization.get("en", "game-winner", player="Alice")
+    assert Localization.get("en", "game-winner", player="Alice") == first == "Alice wins!"
+    assert Localization.get("en", "game-winner", player="Bob") == "Bob wins!"
+
+    stats = Localization.get_render_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+
+def test_argument_types_are_part_of_the_key():
+    # True == 1, but each must be rendered from its own arguments
+    Localization.get("en", "game-score-line", player="A", score=1)
+    Localization.get("en", "game-score-line", player="A", score=True)
+    assert Localization.get_render_stats()["misses"] == 2
+
+
+def test_unhashable_arguments_bypass_the_cache():
+    Localization.get("en", "game-winner", player=["Alice"])
+    stats = Localization.get_render_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (0, 0, 0)
+
+
+def test_broadcast_formats_once_per_locale(monkeypatch):
+    game = PigGame()
+    users = [MockUser("Ann"), MockUser("Bo"), MockUser("Chi", locale="vi")]
+    for user in users:
+        game.add_player(user.username, user)
+
+    formatted = []
+    real_format = Localization._format
+
+    def counting_format(locale, message_id, kwargs):
+        formatted.append(locale)
+        return real_format(locale, message_id, kwargs)
+
+    monkeypatch.setattr(Localization, "_format", counting_format)
+    game.broadcast_l("game-turn-start", player="Ann")
+    game.broadcast_l("game-turn-start", player="Ann")
+    assert formatted == ["en", "vi"]
+
+    game.broadcast_personal_l(game.players[0], "game-winner", "game-winner")
+    assert formatted == ["en", "vi", "en", "en", "vi"]
+    assert users[1].get_spoken_messages() == ["Ann's turn.", "Ann's turn.", "Ann wins!"]
+
+
+def test_compiled_bundles_are_cached_until_files_change(tmp_path, monkeypatch):
+    from server.messages import bundle_cache
+
+    locale_dir = tmp_path / "en"
+    locale_dir.mkdir()
+    ftl_file = locale_dir / "main.ftl"
+    ftl_file.write_text("greet = Hello, { $name }!\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    compiled = []
+    real_compile = bundle_cache._compile
+
+    def counting_compile(locale, ftl_files):
+        compiled.append(locale)
+        return real_compile(locale, ftl_files)
+
+    monkeypatch.setattr(bundle_cache, "_compile", counting_compile)
+
+    def load():
+        return bundle_cache.load_bundle("en", [ftl_file], cache_dir)
+
+    assert load().format("greet", {"name": "Ann"})[0] == "Hello, \u2068Ann\u2069!"
+    assert load().format("greet", {"name": "Bo"})[0] == "Hello, \u2068Bo\u2069!"
+    assert compiled == ["en"]
+
+    ftl_file.write_text("greet = Hi, { $name }!\n", encoding="utf-8")
+    assert load().format("greet", {"name": "Ann"})[0] == "Hi, \u2068Ann\u2069!"
+    assert compiled == ["en", "en"]
+
+    # A damaged cache file is recompiled rather than trusted
+    (cache_dir / "en.ftlc").write_bytes(b"garbage")
+    assert load().format("greet", {"name": "Ann"})[0] == "Hi, \u2068Ann\u2069!"
+    assert compiled == ["en", "en", "en"]
+
+
+
+def test_bundles_compile_without_fluent_compiler_internals(tmp_path, monkeypatch):
+    from fluent_compiler.bundle import FluentBundle
+
+    from server.messages import bundle_cache
+
+    ftl_file = tmp_path / "main.ftl"
+    ftl_file.write_text("greet = Hello, { $name }!\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    def changed_internals(locale, compiled):
+        raise AttributeError("'FluentBundle' object has no attribute '_compiled_messages'")
+
+    monkeypatch.setattr(bundle_cache, "_bundle_from_code", changed_internals)
+    bundle = bundle_cache.load_bundle("en", [ftl_file], cache_dir)
+    assert type(bundle) is FluentBundle
+    assert bundle.format("greet", {"name": "Ann"})[0] == "Hello, \u2068Ann\u2069!"
+    assert not (cache_dir / "en.ftlc").exists()
+
+    # Internals that fail to import skip the cache entirely
+    monkeypatch.setattr(bundle_cache, "CACHE_SUPPORTED", False)
+    monkeypatch.setattr(bundle_cache, "_compile", None)
+    bundle = bundle_cache.load_bundle("en", [ftl_file], cache_dir)
+    assert bundle.format("greet", {"name": "Bo"})[0] == "Hello, \u2068Bo\u2069!"
@@ -0,0 +1,126 @@
+"""Tests for coalesced turn menu rebuilds (MenuManagementMixin.menu_batch)."""
+
+from server.games.pig.game import PigGame
+from server.tables.manager import TableManager
+from server.users.test_user import MockUser
+
+
+def _menu_messages(user: MockUser) -> list[str]:
+    return [
+        m.type
+        for m in user.messages
+        if m.type in ("show_menu", "update_menu") and m.data["menu_id"] == "turn_menu"
+    ]
+
+
+def _started_game() -> tuple[PigGame, list[MockUser]]:
+    game = PigGame()
+    users = [MockUser("Alice"), MockUser("Bob")]
+    for user in users:
+        game.add_player(user.username, user)
+    game.on_start()
+    for user in users:
+        user.clear_messages()
+    return game, users
+
+
+def test_rebuilds_inside_batch_are_sent_once():
+    game, users = _started_game()
+    before = game.get_menu_stats()
+
+    with game.menu_batch():
+        game.rebuild_all_menus()
+        game.rebuild_all_menus()
+        game.update_all_menus()
+        assert _menu_messages(users[0]) == []
+
+    for user in users:
+        assert _menu_messages(user) == ["show_menu"]
+    stats = {key: value - before[key] for key, value in game.get_menu_stats().items()}
+    assert stats == {"requested": 6, "built": 2, "coalesced": 4, "shared": 0}
+
+
+def test_update_selection_survives_coalescing():
+    game, users = _started_game()
+    alice = game.players[0]
+
+    with game.menu_batch():
+        game.rebuild_player_menu(alice)
+        game.update_player_menu(alice, selection_id="roll")
+
+    assert _menu_messages(users[0]) == ["show_menu", "update_menu"]
+    assert users[0].messages[-1].data["selection_id"] == "roll"
+
+
+def test_status_box_flushes_pending_menus_first():
+    game, users = _started_game()
+    alice = game.players[0]
+
+    with game.menu_batch():
+        game.rebuild_player_menu(alice)
+        game.status_box(alice, ["Score: 0"])
+
+    menu_ids = [m.data["menu_id"] for m in users[0].messages if m.type == "show_menu"]
+    assert menu_ids == ["turn_menu", "status_box"]
+
+
+def test_executed_action_rebuilds_each_menu_once():
+    game, users = _started_game()
+    built_before = game.get_menu_stats()["built"]
+
+    game.execute_action(game.current_player, "roll")
+
+    for user in users:
+        assert len(_menu_messages(user)) <= 1
+    assert game.get_menu_stats()["built"] - built_before <= len(game.players)
+
+
+def test_spectators_share_one_resolved_menu_per_locale():
+    game, users = _started_game()
+    watchers = [MockUser("Carol"), MockUser("Dave"), MockUser("Erin", locale="de")]
+    for watcher in watchers:
+        game.add_spectator(watcher.username, watcher)
+    before = game.get_menu_stats()
+
+    with game.menu_batch():
+        game.rebuild_all_menus()
+
+    stats = {key: value - before[key] for key, value in game.get_menu_stats().items()}
+    # Two players, plus one build per spectator locale
+    assert stats["built"] == 4
+    assert stats["shared"] == 1
+    for watcher in watchers:
+        assert _menu_messages(watcher)[-1] == "show_menu"
+    carol, dave = (w.messages[-1].data["items"] for w in watchers[:2])
+    assert carol == dave
+
+
+def test_spectating_host_keeps_their_own_menu():
+    game = PigGame()
+    host, watcher = MockUser("Host"), MockUser("Watcher")
+    game.initialize_lobby(host.username, host)
+    game.players[0].is_spectator = True
+    game.add_spectator(watcher.username, watcher)
+
+    with game.menu_batch():
+        game.rebuild_all_menus()
+
+    def item_ids(user):
+        return {item.id for item in user.messages[-1].data["items"]}
+
+    assert "set_target_score" in item_ids(host)
+    assert "estimate_duration" in item_ids(watcher)
+    assert "set_target_score" not in item_ids(watcher)
+    assert game.get_menu_stats()["shared"] == 0
+
+
+def test_table_manager_sums_menu_stats():
+    manager = TableManager()
+    for name in ("Alice", "Bob"):
+        user = MockUser(name)
+        table = manager.create_table("pig", name, user)
+        table.game = PigGame()
+        table.game.initialize_lobby(name, user)
+
+    built = [table.game.get_menu_stats()["built"] for table in manager.get_all_tables()]
+    assert manager.get_menu_stats()["built"] == sum(built) > 0
@@ -1,7 +1,7 @@
 """Tests for the NetworkUser implementation."""
 
 from server.users.base import EscapeBehavior, MenuItem, TrustLevel
-from server.users.network_user import NetworkUser
+from server.users.network_user import NetworkUser, compute_menu_diff
 from server.users.preferences import UserPreferences
 
 
@@ -57,6 +57,61 @@ def test_network_user_show_and_update_menu_tracks_state():
     assert "lobby" not in user._current_menus
 
 
+def _dice_menu(labels: list[str]) -> list[MenuItem]:
+    return [MenuItem(text=label, id=f"die_{i}") for i, label in enumerate(labels)]
+
+
+def test_update_menu_sends_diff_for_small_changes():
+    user = NetworkUser("alice", "en", DummyConnection())
+    labels = ["1", "2", "3", "4", "5", "Roll", "Score"]
+    user.show_menu("turn_menu", _dice_menu(labels))
+    drain_messages(user)
+
+    labels[2] = "3 (kept)"
+    user.update_menu("turn_menu", _dice_menu(labels), selection_id="die_2")
+    packet = drain_messages(user)[0]
+    assert packet["type"] == "menu_diff"
+    assert packet["update"] == [{"text": "3 (kept)", "id": "die_2"}]
+    assert packet["count"] == 7
+    assert packet["selection_id"] == "die_2"
+    assert "insert" not in packet and "remove" not in packet
+    assert user._current_menus["turn_menu"]["items"][2]["text"] == "3 (kept)"
+
+    # Identical update with no focus change sends nothing
+    user.update_menu("turn_menu", _dice_menu(labels))
+    assert drain_messages(user) == []
+
+    # Replacing most items falls back to a full menu
+    user.update_menu("turn_menu", _dice_menu(["a", "b", "c", "d", "e", "f", "g"]))
+    assert drain_messages(user)[0]["type"] == "menu"
+
+
+def test_update_menu_sends_full_menu_when_client_shows_another():
+    user = NetworkUser("alice", "en", DummyConnection())
+    user.show_menu("turn_menu", _dice_menu(["1", "2", "3", "4"]))
+    user.show_menu("status_box", ["Score: 3"])
+    drain_messages(user)
+
+    user.update_menu("turn_menu", _dice_menu(["1", "2", "3", "4 (kept)"]))
+    assert drain_messages(user)[0]["type"] == "menu"
+
+
+def test_compute_menu_diff():
+    old = [{"text": "A", "id": "a"}, {"text": "B", "id": "b"}, {"text": "C", "id": "c"}]
+    new = [{"text": "A", "id": "a"}, {"text": "X", "id": "x"}, {"text": "C!", "id": "c"}]
+    diff = compute_menu_diff(old, new)
+    assert diff == {
+        "remove": ["b"],
+        "update": [{"text": "C!", "id": "c"}],
+        "insert": [[1, {"text": "X", "id": "x"}]],
+    }
+
+    # Reordered, id-less, or duplicate-id menus can't be diffed
+    assert compute_menu_diff(old, list(reversed(old))) is None
+    assert compute_menu_diff(["A"], ["A", "B"]) is None
+    assert compute_menu_diff(old, [{"text": "A", "id": "a"}, {"text": "A", "id": "a"}]) is None
+
+
 def test_network_user_audio_and_clear_ui_packets():
     user = NetworkUser("bob", "en", DummyConnection())
     user.show_menu("main", ["Play"])
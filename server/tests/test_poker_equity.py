@@ -0,0 +1,132 @@
+"""Tests for Monte Carlo poker equity."""
+
+import random
+
+import pytest
+
+from server.game_utils import poker_equity
+from server.game_utils.cards import Card
+from server.game_utils.poker_equity import estimate_equity, pot_odds
+from server.games.holdem.bot import _decide_postflop
+
+
+def _cards(*specs: tuple[int, int]) -> list[Card]:
+    return [Card(id=i, rank=rank, suit=suit) for i, (rank, suit) in enumerate(specs)]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    poker_equity.clear_cache()
+    yield
+    poker_equity.clear_cache()
+
+
+def _estimate(hand, board, opponents, **kwargs):
+    return estimate_equity(
+        hand, board, opponents, samples=4000, time_budget_s=None, rng=random.Random(3), **kwargs
+    )
+
+
+def test_preflop_aces_against_one_opponent():
+    assert _estimate(_cards((1, 1), (1, 2)), [], 1) == pytest.approx(0.85, abs=0.03)
+
+
+def test_preflop_seven_deuce_against_one_opponent():
+    assert _estimate(_cards((7, 1), (2, 2)), [], 1) == pytest.approx(0.35, abs=0.03)
+
+
+def test_equity_falls_with_more_opponents():
+    aces = _cards((1, 1), (1, 2))
+    assert _estimate(aces, [], 4) < _estimate(aces, [], 1)
+
+
+def test_complete_board_nuts_always_wins():
+    hand = _cards((1, 1), (13, 1))
+    board = _cards((12, 1), (11, 1), (10, 1), (2, 2), (3, 3))
+    assert _estimate(hand, board, 3) == 1.0
+
+
+def test_board_plays_for_everyone_splits():
+    hand = _cards((2, 1), (3, 2))
+    board = _cards((10, 3), (11, 3), (12, 3), (13, 3), (1, 3))
+    assert _estimate(hand, board, 1) == pytest.approx(0.5)
+
+
+def test_draw_hand_uses_kept_cards_and_dead_cards():
+    hand = _cards((1, 1), (1, 2), (1, 3), (5, 4), (9, 1))
+    trips = _estimate(hand[:3], None, 2, dead=hand[3:])
+    single_ace = _estimate(hand[:1], None, 2, dead=hand[1:])
+    assert trips > 0.9
+    assert single_ace < trips
+
+
+def test_results_are_cached():
+    hand = _cards((13, 1), (13, 2))
+    first = estimate_equity(hand, [], 1, samples=200, rng=random.Random(1))
+    # Same cards in another order hit the cache, whatever the rng would give
+    assert estimate_equity(list(reversed(hand)), [], 1, samples=200, rng=random.Random(2)) == first
+
+
+def test_time_budget_stops_sampling(monkeypatch):
+    clock = iter(range(1000))
+    monkeypatch.setattr(poker_equity.time, "perf_counter", lambda: next(clock))
+    played = []
+    real_sample = random.Random.sample
+
+    def counting_sample(self, population, k):
+        played.append(k)
+        return real_sample(self, population, k)
+
+    monkeypatch.setattr(random.Random, "sample", counting_sample)
+    estimate_equity(_cards((5, 1), (6, 1)), [], 1, samples=10000, time_budget_s=0.5, rng=random.Random(1))
+    assert len(played) == poker_equity._CLOCK_INTERVAL
+
+
+def test_no_opponents_and_unknown_cards():
+    assert estimate_equity(_cards((5, 1), (6, 1)), [], 0) == 1.0
+    assert estimate_equity([Card(id=1, rank=0, suit=0)], None, 1) == 0.0
+
+
+def test_pot_odds():
+    assert pot_odds(0, 100) == 0.0
+    assert pot_odds(50, 150) == 0.25
+
+
+def test_holdem_postflop_uses_equity_against_pot_odds():
+    args = dict(stack_bb=50, position=0, can_raise_amount=True, variance=1.0)
+    assert _decide_postflop(0.3, 1, 50, 150, False, **args) == "call"
+    assert _decide_postflop(0.2, 1, 50, 150, False, **args) == "fold"
+    assert _decide_postflop(0.9, 1, 50, 150, True, **args) == "raise"
+    assert _decide_postflop(0.1, 1, 0, 150, False, **args) == "call"
+
+
+def test_sampling_leaves_the_global_random_stream_alone():
+    hand = _cards((13, 1), (13, 2))
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    poker_equity.seed(1)
+    first = estimate_equity(hand, [], 1, samples=200, time_budget_s=None)
+    assert random.random() == expected
+
+    poker_equity.clear_cache()
+    poker_equity.seed(1)
+    assert estimate_equity(hand, [], 1, samples=200, time_budget_s=None) == first
+
+
+def test_time_budget_can_be_turned_off(monkeypatch):
+    clock = iter(range(100000))
+    monkeypatch.setattr(poker_equity.time, "perf_counter", lambda: next(clock))
+    monkeypatch.setattr(poker_equity, "_use_time_budget", True)
+    poker_equity.use_time_budget(False)
+    played = []
+    real_sample = random.Random.sample
+
+    def counting_sample(self, population, k):
+        played.append(k)
+        return real_sample(self, population, k)
+
+    monkeypatch.setattr(random.Random, "sample", counting_sample)
+    estimate_equity(_cards((5, 1), (6, 1)), [], 1, samples=300, time_budget_s=0.5)
+    assert len(played) == 300
@@ -1,3 +1,5 @@
+import random
+
 from server.game_utils.cards import (
     Card,
     SUIT_CLUBS,
@@ -19,6 +21,8 @@ from server.game_utils.poker_evaluator import (
     describe_best_hand,
     describe_hand,
     score_5_cards,
+    _best_hand_exhaustive,
+    _score_5_direct,
 )
 
 
@@ -200,3 +204,52 @@ def test_describe_hand_localized_zh():
     score = score_5_cards(hand)
     description = describe_hand(score, locale="zh")
     assert "同花顺" in description
+
+
+def _deck():
+    suits = (SUIT_DIAMONDS, SUIT_CLUBS, SUIT_HEARTS, SUIT_SPADES)
+    return _cards([(rank, suit) for suit in suits for rank in range(1, 14)])
+
+
+def _assert_matches_exhaustive(hand):
+    score, best = best_hand(hand)
+    expected_score, expected_best = _best_hand_exhaustive(hand)
+    assert score == expected_score
+    assert [card.id for card in best] == [card.id for card in expected_best]
+
+
+def test_lookup_matches_exhaustive_search_on_random_hands():
+    rng = random.Random(7)
+    deck = _deck()
+    for size in (5, 6, 7):
+        for _ in range(500):
+            hand = rng.sample(deck, size)
+            _assert_matches_exhaustive(hand)
+            if size == 5:
+                assert score_5_cards(hand) == _score_5_direct(hand)
+
+
+def test_lookup_matches_exhaustive_search_on_strong_hands():
+    hands = [
+        # Quads with a pair on the side
+        [(9, SUIT_SPADES), (9, SUIT_HEARTS), (9, SUIT_CLUBS), (9, SUIT_DIAMONDS), (4, SUIT_SPADES), (4, SUIT_HEARTS), (13, SUIT_CLUBS)],
+        # Two sets of trips
+        [(7, SUIT_SPADES), (7, SUIT_HEARTS), (7, SUIT_CLUBS), (12, SUIT_DIAMONDS), (12, SUIT_SPADES), (12, SUIT_HEARTS), (2, SUIT_CLUBS)],
+        # Three pairs
+        [(5, SUIT_SPADES), (5, SUIT_HEARTS), (8, SUIT_CLUBS), (8, SUIT_DIAMONDS), (11, SUIT_SPADES), (11, SUIT_HEARTS), (3, SUIT_CLUBS)],
+        # Wheel straight flush with a higher flush card
+        [(1, SUIT_HEARTS), (2, SUIT_HEARTS), (3, SUIT_HEARTS), (4, SUIT_HEARTS), (5, SUIT_HEARTS), (12, SUIT_HEARTS), (6, SUIT_CLUBS)],
+        # Six-card straight
+        [(6, SUIT_SPADES), (7, SUIT_HEARTS), (8, SUIT_CLUBS), (9, SUIT_DIAMONDS), (10, SUIT_SPADES), (11, SUIT_HEARTS), (11, SUIT_CLUBS)],
+        # Seven-card flush
+        [(2, SUIT_CLUBS), (4, SUIT_CLUBS), (6, SUIT_CLUBS), (8, SUIT_CLUBS), (10, SUIT_CLUBS), (12, SUIT_CLUBS), (1, SUIT_CLUBS)],
+    ]
+    for specs in hands:
+        _assert_matches_exhaustive(_cards(specs))
+
+
+def test_non_standard_cards_fall_back_to_exhaustive_search():
+    # Two decks: five of a rank can't be looked up
+    hand = _cards([(9, SUIT_SPADES), (9, SUIT_SPADES), (9, SUIT_HEARTS), (9, SUIT_CLUBS), (9, SUIT_DIAMONDS), (2, SUIT_CLUBS)])
+    _assert_matches_exhaustive(hand)
+    assert best_hand(hand)[0] == (FOUR_OF_A_KIND, (9, 2))
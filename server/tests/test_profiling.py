@@ -0,0 +1,111 @@
+"""Tests for per-table/action profiling and the metrics endpoint."""
+
+import asyncio
+import json
+
+import pytest
+
+from server.game_utils import profiling
+from server.game_utils.profiling import ACTION, BOT_THINK, MENU, TABLE_TICK, Profiler
+from server.games.pig.game import PigGame
+from server.network.metrics_server import MetricsServer
+from server.tables.manager import TableManager
+from server.users.bot import Bot
+from server.users.test_user import MockUser
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    fresh = Profiler()
+    monkeypatch.setattr(profiling, "_profiler", fresh)
+    return fresh
+
+
+def _pig_table(manager: TableManager):
+    host = MockUser("Host")
+    table = manager.create_table("pig", "Host", host)
+    game = PigGame()
+    table.game = game
+    game._table = table
+    game.add_player("Host", host)
+    game.add_player("Bot", Bot("Bot"))
+    game.players[1].is_bot = True
+    game.on_start()
+    return table, game
+
+
+def test_disabled_profiler_records_nothing(profiler):
+    manager = TableManager()
+    table, game = _pig_table(manager)
+    for _ in range(40):
+        manager.on_tick()
+    game.execute_action(game.players[0], "roll")
+
+    assert profiler.measure(ACTION, "pig") is profiling._NULL_TIMER
+    assert profiler.get_stats()["entries"] == []
+    assert profiler.get_stats()["tables"] == []
+
+
+def test_ticks_actions_bots_and_menus_are_timed_per_game_type(profiler):
+    profiler.enable()
+    manager = TableManager()
+    manager.sleep_idle_tables = False  # Count every tick
+    table, game = _pig_table(manager)
+
+    game.execute_action(game.players[0], "roll")
+    game.execute_action(game.players[0], "bank")
+    # Let the bot take its turn
+    for _ in range(200):
+        manager.on_tick()
+
+    recorded = {(e["category"], e["game_type"], e["name"]): e for e in profiler.top(100)}
+    assert recorded[(ACTION, "pig", "_action_roll")]["calls"] >= 1
+    assert recorded[(TABLE_TICK, "pig", "")]["calls"] == 200
+    assert recorded[(BOT_THINK, "pig", "")]["calls"] >= 1
+    assert recorded[(MENU, "pig", "turn_menu")]["calls"] >= 1
+
+    [table_entry] = profiler.top_tables()
+    assert table_entry["table_id"] == table.table_id
+    assert table_entry["calls"] == 200
+
+    manager.remove_table(table.table_id)
+    assert profiler.top_tables() == []
+    profiler.reset()
+    assert profiler.top() == []
+
+
+def test_entries_are_sorted_by_total_time(profiler):
+    profiler.enable()
+    profiler.record(ACTION, "pig", "fast", 0.001)
+    profiler.record(ACTION, "pig", "slow", 0.004)
+    profiler.record(ACTION, "pig", "fast", 0.002)
+
+    assert [entry["name"] for entry in profiler.top()] == ["slow", "fast"]
+    fast = profiler.top(category=ACTION)[1]
+    assert fast["calls"] == 2
+    assert fast["max_ms"] == pytest.approx(2.0)
+    assert fast["average_ms"] == pytest.approx(1.5)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_json():
+    server = MetricsServer(lambda: {"ticks": {"ticks": 3}}, port=0)
+    await server.start()
+    try:
+
+        async def get(path: str) -> tuple[str, bytes]:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            response = await reader.read()
+            writer.close()
+            head, _, body = response.partition(b"\r\n\r\n")
+            return head.split(b"\r\n")[0].decode(), body
+
+        status, body = await get("/metrics")
+        assert status == "HTTP/1.0 200 OK"
+        assert json.loads(body) == {"ticks": {"ticks": 3}}
+
+        status, _ = await get("/other")
+        assert status == "HTTP/1.0 404 Not Found"
+    finally:
+        await server.stop()
@@ -3,7 +3,11 @@
 from pathlib import Path
 
 from server.games.scopa.game import ScopaGame, ScopaPlayer, ScopaOptions
-from server.games.scopa.capture import find_captures, select_best_capture
+from server.games.scopa.capture import (
+    find_captures,
+    find_subsets_with_sum,
+    select_best_capture,
+)
 from server.games.scopa.bot import (
     find_best_combo_chain,
     check_combo_potential,
@@ -305,6 +309,34 @@ class TestScopaCaptureLogic:
         best = select_best_capture(captures)
         assert len(best) == 2
 
+    def test_sum_captures_in_table_order(self):
+        """Test that sum captures come back in table order with duplicate ranks."""
+        table_cards = [
+            Card(id=0, rank=4, suit=1),
+            Card(id=1, rank=2, suit=2),
+            Card(id=2, rank=4, suit=3),
+            Card(id=3, rank=2, suit=4),
+            Card(id=4, rank=6, suit=1),
+        ]
+
+        captures = find_subsets_with_sum(table_cards, 6)
+        assert [[c.id for c in capture] for capture in captures] == [
+            [0, 1],
+            [0, 3],
+            [1, 2],
+            [2, 3],
+            [4],
+        ]
+        # The same ranks in another order reuse the cached search
+        reordered = find_subsets_with_sum(list(reversed(table_cards)), 6)
+        assert sorted(sorted(c.id for c in capture) for capture in reordered) == [
+            [0, 1],
+            [0, 3],
+            [1, 2],
+            [2, 3],
+            [4],
+        ]
+
 
 class TestScopaGameFlow:
     """Tests for game flow."""
@@ -689,3 +721,23 @@ class TestScopaBotAI:
 
         assert score == 0, "No valid combo should be found"
         assert len(sequence) == 0
+
+    def test_combo_chain_transpositions_match_plain_search(self):
+        """Test that sharing chain results across cards gives the same scores."""
+        game = ScopaGame()
+        game.options.escoba = True
+        game.table_cards = [Card(id=0, rank=1, suit=1), Card(id=1, rank=2, suit=2)]
+        player = ScopaPlayer(id="p1", name="Bot", is_bot=True)
+        player.hand = [
+            Card(id=2, rank=3, suit=1),
+            Card(id=3, rank=4, suit=2),
+            Card(id=4, rank=5, suit=3),
+            Card(id=5, rank=6, suit=4),
+        ]
+
+        transpositions = {}
+        shared = [evaluate_card(game, card, player, transpositions) for card in player.hand]
+        plain = [evaluate_card(game, card, player) for card in player.hand]
+
+        assert shared == plain
+        assert transpositions
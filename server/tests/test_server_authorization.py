@@ -36,7 +36,16 @@ class DummyAuth:
         self.calls["register"].append((username, password))
         return self.register_result
 
-    def get_user(self, username):
+    async def authenticate_async(self, username, password, session_token=None):
+        return self.authenticate(username, password)
+
+    async def register_async(self, username, password):
+        return self.register(username, password)
+
+    async def create_session_async(self, username):
+        return f"token-{username}"
+
+    async def get_user_async(self, username):
         return self.user_record
 
 
@@ -190,3 +199,42 @@ async def test_register_rejects_duplicate_username(server):
         "text": "Username already taken. Please choose a different username.",
     }
     assert auth.calls["register"] == [("taken", "pw")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_concurrent_logins_to_one_account_admit_one(server):
+    record = SimpleNamespace(
+        username="twice",
+        locale="en",
+        uuid="uuid-3",
+        trust_level=TrustLevel.USER,
+        approved=False,
+        preferences_json="{}",
+    )
+
+    class SlowLookupAuth(DummyAuth):
+        async def get_user_async(self, username):
+            await asyncio.sleep(0)  # As if the database executor answered later
+            return self.user_record
+
+    server._db = SimpleNamespace(get_user_count=lambda: 5)
+    server._auth = SlowLookupAuth(authenticate_result=True, user_record=record)
+    server._tables = SimpleNamespace(find_user_table=lambda username: None)
+    server._show_main_menu = lambda user: None
+
+    async def fake_send_game_list(client):
+        pass
+
+    server._send_game_list = fake_send_game_list
+
+    clients = [DummyClient(), DummyClient()]
+    for client in clients:
+        client.address = "127.0.0.1"
+    packet = {"username": "twice", "password": "pw"}
+    await asyncio.gather(*(server._handle_authorize(client, packet) for client in clients))
+
+    assert server._users["twice"].connection is clients[0]
+    assert clients[0].authenticated
+    assert not clients[1].authenticated
+    assert clients[1].sent[-1]["type"] == "disconnect"
@@ -39,6 +39,9 @@ class DummyClient:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def send_frame(self, packets):
+        self.sent.extend(packets)
+
 
 class DummyWebSocketServer:
     def __init__(self, mapping):
@@ -196,3 +199,32 @@ def test_send_game_list_includes_all_games(server):
     games_payload = capture_send.sent[-1]
     assert games_payload["type"] == "update_options_lists"
     assert "games" in games_payload and games_payload["games"]
+
+
+@pytest.mark.slow
+def test_metrics_report_password_hashing(server):
+    from server.auth.auth import AuthManager
+
+    assert server.get_metrics()["auth"] is None
+    server._auth = AuthManager(server._db, hash_workers=3)
+    auth_stats = server.get_metrics()["auth"]
+    assert auth_stats["hash_workers"] == 3
+    assert auth_stats["hash_queue_depth"] == 0
+
+
+@pytest.mark.slow
+def test_missing_bot_tables_are_reported(server, monkeypatch, capsys):
+    from server.games.farkle import strategy as farkle_strategy
+    from server.games.yahtzee import strategy as yahtzee_strategy
+
+    monkeypatch.setattr(farkle_strategy, "warm_up", lambda: False)
+    monkeypatch.setattr(yahtzee_strategy, "get_strategy", lambda: None)
+    server._load_bot_tables()
+    output = capsys.readouterr().out
+    assert "build-strategy farkle" in output
+    assert "build-strategy yahtzee" in output
+
+    monkeypatch.setattr(farkle_strategy, "warm_up", lambda: True)
+    monkeypatch.setattr(yahtzee_strategy, "get_strategy", lambda: object())
+    server._load_bot_tables()
+    assert capsys.readouterr().out == ""
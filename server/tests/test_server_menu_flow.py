@@ -19,6 +19,10 @@ class DummyConnection:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def send_encoded(self, text):
+        self.sent.append(json.loads(text))
+        return True
+
 
 def make_network_user(name="Player", locale="en", trust=TrustLevel.USER, approved=True):
     user = NetworkUser(name, locale, DummyConnection(), approved=approved)
@@ -6,6 +6,7 @@ from types import SimpleNamespace
 import pytest
 
 from server.core.server import Server
+from server.tables.table import Table, TableMember
 
 
 class DummyTable:
@@ -28,6 +29,9 @@ class DummyTablesManager:
     def save_all(self):
         return list(self.saved)
 
+    def get_all_tables(self):
+        return list(self.saved)
+
     def on_tick(self):
         pass
 
@@ -67,23 +71,36 @@ def server(tmp_path):
 
 
 @pytest.mark.slow
-def test_save_tables_calls_db_and_manager(monkeypatch, server):
+@pytest.mark.asyncio
+async def test_save_tables_checkpoints_changed_tables(monkeypatch, server):
     tables_manager = DummyTablesManager()
-    tables_manager.saved = [DummyTable("t1", "pig"), DummyTable("t2", "farkle")]
+    tables_manager.saved = [
+        Table("t1", "pig", "host", members=[TableMember("host")]),
+        Table("t2", "farkle", "host", members=[TableMember("host")]),
+    ]
     server._tables = tables_manager
 
-    saved_to_db = []
-    server._db = SimpleNamespace(
-        save_all_tables=lambda tables: saved_to_db.extend(tables)
-    )
+    checkpoints = []
+
+    def checkpoint_tables(tables, live_ids):
+        checkpoints.append(([table.table_id for table in tables], set(live_ids)))
+        return 0
+
+    server._db = SimpleNamespace(checkpoint_tables=checkpoint_tables)
 
-    server._save_tables()
+    await server._save_tables()
+    await server._save_tables()
+    tables_manager.saved[0].status = "playing"
+    await server._save_tables()
 
-    assert saved_to_db == tables_manager.saved
+    assert checkpoints == [
+        (["t1", "t2"], {"t1", "t2"}),
+        (["t1"], {"t1", "t2"}),
+    ]
 
 
 @pytest.mark.slow
-def test_load_tables_restores_games_and_clears_db(monkeypatch, server):
+def test_load_tables_restores_games_and_keeps_rows(monkeypatch, server):
     dummy_game_json = json.dumps({"state": "dummy"})
     table_with_game = DummyTable("table-game", "test_game", game_json=dummy_game_json)
     plain_table = DummyTable("table-plain", "test_game")
@@ -111,4 +128,5 @@ def test_load_tables_restores_games_and_clears_db(monkeypatch, server):
     assert table_with_game.game.keybinds_setup
     assert table_with_game.game.rebuilt_players == ["BotOne"]
     assert table_with_game.game._table is table_with_game
-    assert called_delete == [True]
+    # Rows are kept until the first checkpoint replaces them
+    assert called_delete == []
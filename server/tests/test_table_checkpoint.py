@@ -0,0 +1,163 @@
+"""Tests for core.checkpoint.TableCheckpointer."""
+
+import asyncio
+
+import pytest
+
+from server.core.checkpoint import TableCheckpointer
+from server.games.pig.game import PigGame, PigOptions
+from server.persistence.database import Database
+from server.persistence.executor import run_database_job
+from server.tables.table import Table, TableMember
+from server.users.bot import Bot
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(db_path=tmp_path / "tables.db")
+    database.connect()
+    try:
+        yield database
+    finally:
+        database.close()
+
+
+def _make_table(table_id: str) -> Table:
+    table = Table(table_id, "pig", "Bot1", [TableMember("Bot1"), TableMember("Bot2")])
+    game = PigGame(options=PigOptions(target_score=30))
+    game.add_player("Bot1", Bot("Bot1"))
+    game.add_player("Bot2", Bot("Bot2"))
+    game.on_start()
+    table.game = game
+    table.status = "playing"
+    return table
+
+
+def _checkpointer(db: Database, tables: dict[str, Table], **kwargs) -> TableCheckpointer:
+    async def write(job, *args):
+        return run_database_job(db, job, *args)
+
+    return TableCheckpointer(lambda: list(tables.values()), write, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_only_changed_tables_are_written(db):
+    tables = {table_id: _make_table(table_id) for table_id in ("a", "b")}
+    checkpointer = _checkpointer(db, tables)
+
+    assert await checkpointer.checkpoint() == 2
+    assert await checkpointer.checkpoint() == 0
+
+    tables["a"].game.players[0].round_score = 12
+    tables["a"].mark_dirty()  # As a tick or action would
+    tables["b"].mark_dirty()  # Dirty but unchanged: serialized, not written
+    assert await checkpointer.checkpoint() == 1
+
+    stats = checkpointer.get_stats()
+    assert stats["checkpoints"] == 3
+    assert stats["tables_written"] == 3
+    assert stats["tables_unchanged"] == 3
+    assert stats["tables_clean"] == 2
+    assert stats["bytes_written"] > 0
+
+
+@pytest.mark.asyncio
+async def test_clean_tables_are_not_serialized(db):
+    tables = {"a": _make_table("a")}
+    checkpointer = _checkpointer(db, tables)
+    await checkpointer.checkpoint()
+    assert not tables["a"].dirty
+
+    serialized = []
+    game = tables["a"].game
+    to_json = game.to_json
+    game.to_json = lambda: serialized.append(1) or to_json()
+    await checkpointer.checkpoint()
+    assert serialized == []
+
+    # Events, wakes and ticks make a table dirty again
+    tables["a"].wake()
+    assert tables["a"].dirty
+    await checkpointer.checkpoint()
+    assert serialized == [1]
+    tables["a"].on_tick(idle=True)
+    assert not tables["a"].dirty
+    tables["a"].on_tick()
+    assert tables["a"].dirty
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_tables_dirty(db):
+    tables = {"a": _make_table("a")}
+
+    async def write(job, *args):
+        raise RuntimeError("disk full")
+
+    checkpointer = TableCheckpointer(lambda: list(tables.values()), write)
+    assert await checkpointer.checkpoint() == 0
+    assert tables["a"].dirty
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_survives_a_crash(db):
+    tables = {"a": _make_table("a")}
+    tables["a"].game.players[1].round_score = 21
+    await _checkpointer(db, tables).checkpoint()
+
+    # No shutdown save: the checkpoint alone restores the game
+    loaded = db.load_table("a")
+    game = PigGame.from_json(loaded.game_json)
+    assert loaded.status == "playing"
+    assert [player.round_score for player in game.players] == [0, 21]
+
+
+@pytest.mark.asyncio
+async def test_stale_rows_are_pruned(db):
+    db.save_table(Table("old", "pig", "host", [TableMember("host")]))
+    tables = {"a": _make_table("a")}
+    checkpointer = _checkpointer(db, tables)
+
+    await checkpointer.checkpoint()
+    assert [table.table_id for table in db.load_all_tables()] == ["a"]
+
+    del tables["a"]
+    await checkpointer.checkpoint()
+    assert db.load_all_tables() == []
+
+
+@pytest.mark.asyncio
+async def test_empty_server_still_prunes_on_first_checkpoint(db):
+    db.save_table(Table("old", "pig", "host", [TableMember("host")]))
+
+    assert await _checkpointer(db, {}).checkpoint() == 0
+    assert db.load_all_tables() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_retried(db):
+    tables = {"a": _make_table("a")}
+    calls = []
+
+    async def write(job, *args):
+        calls.append(job)
+        if len(calls) == 1:
+            raise RuntimeError("disk full")
+        return run_database_job(db, job, *args)
+
+    checkpointer = TableCheckpointer(lambda: list(tables.values()), write)
+    assert await checkpointer.checkpoint() == 0
+    assert await checkpointer.checkpoint() == 1
+    assert checkpointer.get_stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_periodic_checkpoints(db):
+    tables = {"a": _make_table("a")}
+    checkpointer = _checkpointer(db, tables, interval_s=0.01)
+
+    checkpointer.start()
+    await asyncio.sleep(0.05)
+    await checkpointer.stop()
+
+    assert checkpointer.get_stats()["checkpoints"] >= 2
+    assert db.load_table("a") is not None
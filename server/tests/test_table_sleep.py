@@ -0,0 +1,152 @@
+"""Tests for idle tables sleeping between ticks (TableManager.sleep_idle_tables)."""
+
+import random
+
+import pytest
+
+from server.games.farkle.game import FarkleGame
+from server.games.pig.game import PigGame
+from server.games.registry import get_game_class
+from server.tables.manager import TableManager
+from server.tables.table import Table
+from server.users.bot import Bot
+from server.users.test_user import MockUser
+
+
+def _lobby(manager: TableManager, game, host) -> Table:
+    table = manager.create_table(game.get_type(), host.username, host)
+    table.game = game
+    game.initialize_lobby(host.username, host)
+    return table
+
+
+def _play(game_type: str, bots: list[Bot], sleep: bool, ticks: int) -> list[str]:
+    """Play a bot-only game, returning snapshots of its state along the way."""
+    random.seed(7)
+    manager = TableManager()
+    manager.sleep_idle_tables = sleep
+    game = get_game_class(game_type)()
+    table = _lobby(manager, game, bots[0])
+    for bot in bots[1:]:
+        table.add_member(bot.username, bot, as_spectator=False)
+        game.add_player(bot.username, bot)
+    game.on_start()
+
+    snapshots = []
+    for tick in range(1, ticks + 1):
+        manager.on_tick()
+        if tick % 250 == 0:
+            manager.catch_up_sleeping_tables()
+            snapshots.append(game.to_json())
+    return snapshots
+
+
+@pytest.mark.parametrize(
+    "game_type", ["pig", "farkle", "scopa", "leftrightcenter", "milebymile", "threes"]
+)
+def test_sleeping_tables_play_out_the_same(game_type):
+    bots = [Bot(f"Bot{i}") for i in range(1, 4)]
+    assert _play(game_type, bots, True, 2000) == _play(game_type, bots, False, 2000)
+
+
+def test_lobby_sleeps_until_someone_joins():
+    manager = TableManager()
+    host = MockUser("host")
+    table = _lobby(manager, PigGame(), host)
+
+    manager.on_tick()
+    assert manager.get_sleeping_count() == 1
+
+    table.add_member("guest", MockUser("guest"), as_spectator=False)
+    assert manager.get_sleeping_count() == 0
+
+
+def test_max_sleep_ticks_still_ticks_sleeping_tables():
+    manager = TableManager()
+    manager.max_sleep_ticks = 10
+    table = _lobby(manager, PigGame(), MockUser("host"))
+    ticked = []
+    on_tick = table.on_tick
+    table.on_tick = lambda idle=False: (ticked.append(manager._wheel.now), on_tick(idle))
+
+    for _ in range(25):
+        manager.on_tick()
+    assert ticked == [1, 11, 21]
+
+    manager.max_sleep_ticks = 0
+    for _ in range(25):
+        manager.on_tick()
+    assert ticked == [1, 11, 21, 31]
+
+
+def test_scheduled_sound_wakes_the_table_on_time():
+    heard = {}
+    for sleep in (False, True):
+        manager = TableManager()
+        manager.sleep_idle_tables = sleep
+        host = MockUser("host")
+        game = FarkleGame()
+        _lobby(manager, game, host)
+        game.schedule_sound("game_farkle/roll.ogg", delay_ticks=30)
+
+        for tick in range(1, 60):
+            manager.on_tick()
+            if host.get_sounds_played():
+                heard[sleep] = tick
+                break
+        assert manager.get_sleeping_count() == int(sleep)
+    assert heard[True] == heard[False]
+
+
+def test_saving_catches_up_sleeping_tables():
+    manager = TableManager()
+    game = FarkleGame()
+    _lobby(manager, game, MockUser("host"))
+    for _ in range(40):
+        manager.on_tick()
+    assert manager.get_sleeping_count() == 1
+    assert game.sound_scheduler_tick < 40
+
+    assert manager.get_tables_to_save() == manager.get_all_tables()
+    assert game.sound_scheduler_tick == 40
+    assert manager.get_sleeping_count() == 1
+
+
+def test_removed_table_leaves_the_wheel():
+    manager = TableManager()
+    table = _lobby(manager, PigGame(), MockUser("host"))
+    manager.on_tick()
+    manager.remove_table(table.table_id)
+    assert manager.get_sleeping_count() == 0
+    assert table.table_id not in manager._wheel
+    for _ in range(150):
+        manager.on_tick()
+
+
+def test_safety_net_ticks_leave_tables_clean():
+    manager = TableManager()
+    manager.max_sleep_ticks = 10
+    table = _lobby(manager, PigGame(), MockUser("host"))
+    manager.on_tick()
+    table.mark_clean()
+
+    for _ in range(25):
+        manager.on_tick()
+    assert not table.dirty
+
+    table.wake()
+    assert table.dirty
+
+
+@pytest.mark.parametrize("game_type", ["pig", "farkle", "scopa", "crazyeights"])
+def test_work_off_the_tick_keeps_every_game_awake(game_type):
+    game = get_game_class(game_type)()
+    for i in range(1, 3):
+        game.add_player(f"Bot{i}", Bot(f"Bot{i}"))
+    assert game.ticks_until_wake() is None
+
+    game._bot_thinks["Bot1"] = object()
+    assert game.ticks_until_wake() == 1
+    game._bot_thinks.clear()
+    game._estimate_running = True
+    assert game.ticks_until_wake() == 1
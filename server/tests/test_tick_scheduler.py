@@ -4,7 +4,15 @@ import asyncio
 
 import pytest
 
-from server.core.tick import TickScheduler, load_server_config, DEFAULT_TICK_INTERVAL_MS
+import time
+
+from server.core.tick import (
+    TickScheduler,
+    TickOverrunPolicy,
+    TickStats,
+    load_server_config,
+    DEFAULT_TICK_INTERVAL_MS,
+)
 
 
 @pytest.mark.asyncio
@@ -47,6 +55,96 @@ async def test_tick_scheduler_swallows_callback_errors():
     assert calls["count"] >= 2  # continued after exception
 
 
+@pytest.mark.asyncio
+async def test_tick_scheduler_does_not_drift_with_slow_ticks():
+    """Time spent in the callback should not stretch the tick period."""
+
+    def on_tick():
+        time.sleep(0.01)
+
+    scheduler = TickScheduler(on_tick, tick_interval_ms=20)
+
+    await scheduler.start()
+    await asyncio.sleep(0.4)  # 20 deadlines; a drifting loop manages ~13
+    await scheduler.stop()
+
+    assert scheduler.stats.ticks >= 16
+    assert scheduler.stats.overruns == 0
+
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_counts_errors():
+    def on_tick():
+        raise RuntimeError("boom")
+
+    scheduler = TickScheduler(on_tick, tick_interval_ms=10)
+
+    await scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert scheduler.stats.errors == scheduler.stats.ticks > 0
+
+
+def test_next_deadline_on_schedule():
+    scheduler = TickScheduler(lambda: None, tick_interval_ms=50)
+    assert scheduler._next_deadline(10.0, now=10.01) == pytest.approx(10.05)
+    assert scheduler.stats.skipped_ticks == 0
+
+
+def test_next_deadline_catch_up_runs_missed_ticks():
+    scheduler = TickScheduler(
+        lambda: None, tick_interval_ms=50, overrun_policy="catch_up", max_catch_up_ticks=5
+    )
+    # 3 whole ticks missed beyond the one due: all are caught up
+    deadline = scheduler._next_deadline(10.0, now=10.2)
+    assert deadline == pytest.approx(10.05)
+    assert scheduler.stats.skipped_ticks == 0
+
+
+def test_next_deadline_catch_up_is_bounded():
+    scheduler = TickScheduler(
+        lambda: None, tick_interval_ms=50, overrun_policy="catch_up", max_catch_up_ticks=2
+    )
+    # 1 second stall: 19 ticks missed, only 2 may be caught up
+    deadline = scheduler._next_deadline(10.0, now=11.01)
+    assert scheduler.stats.skipped_ticks == 17
+    assert deadline == pytest.approx(10.05 + 17 * 0.05)
+
+
+def test_next_deadline_skip_drops_missed_ticks():
+    scheduler = TickScheduler(lambda: None, tick_interval_ms=50, overrun_policy="skip")
+    assert scheduler.overrun_policy == TickOverrunPolicy.SKIP
+    deadline = scheduler._next_deadline(10.0, now=10.22)
+    assert scheduler.stats.skipped_ticks == 3
+    assert deadline <= 10.22 < deadline + 0.05
+
+
+def test_overrun_policy_from_str_defaults_to_catch_up():
+    assert TickOverrunPolicy.from_str("skip") == TickOverrunPolicy.SKIP
+    assert TickOverrunPolicy.from_str("bogus") == TickOverrunPolicy.CATCH_UP
+    assert TickOverrunPolicy.from_str(None) == TickOverrunPolicy.CATCH_UP
+
+
+def test_tick_stats_histogram_and_overruns():
+    stats = TickStats(tick_interval_s=0.05, started_at=0.0)
+    stats.record(0.0, 0.0005)  # <=1ms
+    stats.record(0.05, 0.015)  # <=20ms
+    stats.record(0.10, 0.2)  # <=250ms, overrun
+    stats.record(0.15, 2.0)  # >500ms, overrun
+
+    data = stats.to_dict()
+    assert data["ticks"] == 4
+    assert data["overruns"] == 2
+    assert data["histogram"]["<=1ms"] == 1
+    assert data["histogram"]["<=20ms"] == 1
+    assert data["histogram"]["<=250ms"] == 1
+    assert data["histogram"][">500ms"] == 1
+    assert data["max_duration_ms"] == pytest.approx(2000.0)
+    assert stats.recent_tick_rate() == pytest.approx(20.0)
+    assert stats.achieved_tick_rate(now=1.0) == pytest.approx(4.0)
+
+
 def test_tick_scheduler_default_interval():
     """Test that default tick interval is used when not specified."""
     scheduler = TickScheduler(lambda: None)
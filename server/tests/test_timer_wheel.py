@@ -0,0 +1,59 @@
+"""Tests for the hierarchical timer wheel."""
+
+import random
+
+from server.game_utils.timer_wheel import TimerWheel
+
+
+def run(wheel: TimerWheel, ticks: int) -> dict[int, list]:
+    fired = {}
+    for _ in range(ticks):
+        due = wheel.advance()
+        if due:
+            fired[wheel.now] = due
+    return fired
+
+
+def test_items_come_due_on_their_tick_at_every_level():
+    # 4 slots over 2 levels: level 1 from 4 ticks out, overflow from 16
+    wheel = TimerWheel(slots=4, levels=2)
+    rng = random.Random(3)
+    ticks = [rng.randint(1, 100) for _ in range(300)]
+    expected = {}
+    for item, tick in enumerate(ticks):
+        wheel.schedule(item, tick)
+        expected.setdefault(tick, []).append(item)
+
+    assert len(wheel) == 300
+    assert [wheel.deadline(item) for item in range(300)] == ticks
+    fired = run(wheel, 100)
+    assert {tick: sorted(items) for tick, items in fired.items()} == expected
+    assert len(wheel) == 0
+
+
+def test_scheduling_from_a_later_tick():
+    wheel = TimerWheel(slots=4, levels=2, now=37)
+    wheel.schedule("soon", 38)
+    wheel.schedule("far", 37 + 50)
+    wheel.schedule("past", 5)  # Comes due on the next tick
+
+    fired = run(wheel, 60)
+    assert fired == {38: ["soon", "past"], 87: ["far"]}
+
+
+def test_cancel_and_reschedule():
+    wheel = TimerWheel(slots=4, levels=2)
+    wheel.schedule("a", 10)
+    wheel.schedule("b", 10)
+    wheel.schedule("c", 30)
+    assert wheel.cancel("b")
+    assert not wheel.cancel("b")
+    wheel.schedule("c", 3)  # Moves it
+
+    assert "c" in wheel
+    assert wheel.deadline("c") == 3
+    assert run(wheel, 40) == {3: ["c"], 10: ["a"]}
+
+    wheel.schedule("d", 45)
+    wheel.clear()
+    assert run(wheel, 10) == {}
@@ -1,5 +1,6 @@
 """Tests for the VirtualBotManager core behaviors."""
 
+import random
 from types import SimpleNamespace
 
 import pytest
@@ -25,9 +26,15 @@ class FakeTables:
     def remove_table(self, table_id):
         self.tables.pop(table_id, None)
 
-    def get_waiting_tables(self):
+    def get_joinable_tables(self):
         return list(self.waiting_tables)
 
+    def get_tables_by_type(self, game_type):
+        return [t for t in self.get_all_tables() if t.game.get_type() == game_type]
+
+    def get_all_tables(self):
+        return list(self.tables.values())
+
     def create_table(self, *args, **kwargs):
         raise AssertionError("Not expected in this test")
 
@@ -647,3 +654,80 @@ def test_try_create_game_picks_available_game_type(monkeypatch):
     assert created is True
     assert server._tables.created_game_types == ["ninetynine"]
     assert bot.state == VirtualBotState.IN_GAME
+
+
+def test_sleeping_bots_match_ticking_every_bot():
+    """Waking bots only at their deadlines gives the same timeline as ticking each one."""
+
+    def timeline(tick_every_bot: bool) -> tuple[list, VirtualBot]:
+        random.seed(11)
+        server = FakeServer()
+        manager = VirtualBotManager(server)
+        manager._config.min_online_ticks = 50
+        manager._config.max_online_ticks = 200
+        manager._config.min_offline_ticks = 30
+        manager._config.max_offline_ticks = 90
+        manager._config.min_idle_ticks = 5
+        manager._config.max_idle_ticks = 40
+        manager._config.go_offline_chance = 0.3
+        manager._config.create_game_chance = 0.0
+        manager._add_bot(VirtualBot("Solo", cooldown_ticks=7))
+
+        events = []
+        for tick in range(1, 3000):
+            if tick_every_bot:
+                for bot in manager._bots.values():
+                    manager._process_bot_tick(bot)
+            else:
+                manager.on_tick()
+            events.extend((tick, event) for event in server.broadcasts)
+            server.broadcasts.clear()
+        bot = manager._bots["Solo"]
+        if not tick_every_bot:
+            manager._sync(bot, 2999)
+        return events, bot
+
+    ticked_events, ticked = timeline(True)
+    woken_events, woken = timeline(False)
+
+    assert len(ticked_events) > 10
+    assert woken_events == ticked_events
+    assert (woken.state, woken.online_ticks, woken.cooldown_ticks, woken.think_ticks) == (
+        ticked.state,
+        ticked.online_ticks,
+        ticked.cooldown_ticks,
+        ticked.think_ticks,
+    )
+
+
+def test_in_game_host_wakes_to_start_the_game():
+    class HostedGame(DummyGameForJoin):
+        def __init__(self, host):
+            super().__init__(host)
+            self.players = [SimpleNamespace(name=host), SimpleNamespace(name="Guest")]
+            self.started_at = None
+
+        def get_player_by_name(self, name):
+            return self.players[0]
+
+        def execute_action(self, player, action_id):
+            assert action_id == "start_game"
+            self.started_at = manager._wheel.now
+            self.status = "playing"
+
+    server = FakeServer()
+    manager = VirtualBotManager(server)
+    game = HostedGame("Host")
+    server._tables.tables["T1"] = DummyTableForJoin("T1", game)
+    manager._add_bot(VirtualBot("Host", state=VirtualBotState.IN_GAME, table_id="T1"))
+
+    checks = []
+    process = manager._process_in_game_bot
+    manager._process_in_game_bot = lambda bot: (checks.append(bot.name), process(bot))
+
+    for _ in range(500):
+        manager.on_tick()
+
+    assert game.started_at == manager._config.start_game_delay_ticks
+    # The bot looked at its game about once a second rather than every tick
+    assert len(checks) == 500 // manager._config.in_game_check_ticks
@@ -1,5 +1,8 @@
 """Tests for WebSocket server helpers and client handling."""
 
+import asyncio
+import json
+
 import pytest
 
 from server.network.websocket_server import ClientConnection, WebSocketServer
@@ -33,6 +36,37 @@ async def test_client_connection_send_and_close():
     assert ws.closed
 
 
+@pytest.mark.asyncio
+async def test_client_connection_send_frame_batches_packets():
+    ws = DummyWebSocket()
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234")
+
+    conn.send_frame([{"type": "speak", "text": "a"}, {"type": "play_sound", "name": "b"}])
+    conn.send_frame([{"type": "speak", "text": "c"}])
+    sender = conn._sender
+    await sender
+
+    # Everything queued before the sender ran goes out as one frame
+    assert len(ws.sent) == 1
+    assert json.loads(ws.sent[0]) == {
+        "type": "frame",
+        "packets": [
+            {"type": "speak", "text": "a"},
+            {"type": "play_sound", "name": "b"},
+            {"type": "speak", "text": "c"},
+        ],
+    }
+
+    # A lone packet is sent unwrapped, reusing no stale task
+    conn.send_frame([{"type": "ping"}])
+    assert conn._sender is not sender
+    await conn._sender
+    assert ws.sent[-1] == '{"type": "ping"}'
+
+    conn.send_frame([])
+    assert conn._sender.done()
+
+
 @pytest.mark.asyncio
 async def test_websocket_server_broadcast_and_send_to_user():
     server = WebSocketServer()
@@ -53,8 +87,11 @@ async def test_websocket_server_broadcast_and_send_to_user():
         c2.address: c2,
         c3.address: c3,
     })
+    for client in (c1, c2, c3):
+        server.register_username(client)
 
-    await server.broadcast({"msg": "hello"}, exclude=c1)
+    assert server.broadcast({"msg": "hello"}, exclude=c1) == 1
+    await c3._sender
     assert c1.websocket.sent == []  # excluded
     assert c2.websocket.sent == []  # not authenticated
     assert c3.websocket.sent == ['{"msg": "hello"}']
@@ -65,3 +102,120 @@ async def test_websocket_server_broadcast_and_send_to_user():
     assert not await server.send_to_user("unknown", {"type": "noop"})
     assert server.get_client_by_username("carol") is c3
     assert server.get_client_by_username("nobody") is None
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_keeps_order_with_frames():
+    server = WebSocketServer()
+    clients = [ClientConnection(DummyWebSocket(), f"{i}:1") for i in range(3)]
+
+    clients[0].send_frame([{"type": "menu"}])
+    encoded = []
+    real_dumps = json.dumps
+
+    def counting_dumps(obj, *args, **kwargs):
+        encoded.append(obj)
+        return real_dumps(obj, *args, **kwargs)
+
+    import server.network.websocket_server as ws_module
+
+    ws_module.json.dumps = counting_dumps
+    try:
+        assert server.broadcast({"type": "chat", "message": "hi"}, recipients=clients) == 3
+    finally:
+        ws_module.json.dumps = real_dumps
+    assert encoded == [{"type": "chat", "message": "hi"}]
+
+    for client in clients:
+        await client._sender
+    # Queued behind the client's own packet, in one frame
+    assert json.loads(clients[0].websocket.sent[0]) == {
+        "type": "frame",
+        "packets": [{"type": "menu"}, {"type": "chat", "message": "hi"}],
+    }
+    assert clients[1].websocket.sent == ['{"type": "chat", "message": "hi"}']
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_drop_and_coalesce_policies():
+    dropping = ClientConnection(DummyWebSocket(), "a:1", max_outbox=2)
+    coalescing = ClientConnection(
+        DummyWebSocket(), "b:1", max_outbox=2, slow_consumer_policy="coalesce"
+    )
+    for client in (dropping, coalescing):
+        for n in range(4):
+            client.send_encoded(f'{{"n": {n}}}')
+        # The client's own packets are never dropped
+        client.send_frame([{"type": "menu"}])
+        await client._sender
+
+    assert json.loads(dropping.websocket.sent[0])["packets"] == [{"n": 0}, {"n": 1}, {"type": "menu"}]
+    assert dropping.dropped_broadcasts == 2
+    assert json.loads(coalescing.websocket.sent[0])["packets"] == [{"n": 2}, {"n": 3}, {"type": "menu"}]
+    assert coalescing.dropped_broadcasts == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_disconnect_policy():
+    client = ClientConnection(
+        DummyWebSocket(), "a:1", max_outbox=1, slow_consumer_policy="disconnect"
+    )
+    assert client.send_encoded('{"n": 0}')
+    assert not client.send_encoded('{"n": 1}')
+    await asyncio.sleep(0)
+
+    assert client.websocket.closed
+    assert not client.send_encoded('{"n": 2}')
+    client.send_frame([{"type": "menu"}])
+    assert client._outbox == []
+
+
+def test_unknown_slow_consumer_policy_is_rejected():
+    with pytest.raises(ValueError):
+        WebSocketServer(slow_consumer_policy="ignore")
+
+
+def test_username_index_register_and_unregister():
+    server = WebSocketServer()
+    old = ClientConnection(DummyWebSocket(), "a:1", username="alice")
+    server.register_username(old)
+    assert server.get_client_by_username("alice") is old
+
+    # A newer login for the same name replaces the older connection
+    new = ClientConnection(DummyWebSocket(), "a:2", username="alice")
+    server.register_username(new)
+    assert server.get_client_by_username("alice") is new
+
+    # The stale connection disconnecting must not evict the newer one
+    server.unregister_username("alice", old)
+    assert server.get_client_by_username("alice") is new
+
+    server.unregister_username("alice", new)
+    assert server.get_client_by_username("alice") is None
+
+
+@pytest.mark.asyncio
+async def test_handle_client_unindexes_username_on_disconnect():
+    disconnected = []
+
+    async def on_message(client, packet):
+        client.username = packet["username"]
+        client.authenticated = True
+        server.register_username(client)
+
+    async def on_disconnect(client):
+        disconnected.append(server.get_client_by_username(client.username))
+
+    server = WebSocketServer(on_message=on_message, on_disconnect=on_disconnect)
+
+    class ScriptedWebSocket(DummyWebSocket):
+        def __aiter__(self):
+            async def gen():
+                yield '{"type": "authorize", "username": "dave"}'
+                assert server.get_client_by_username("dave") is not None
+            return gen()
+
+    await server._handle_client(ScriptedWebSocket())
+
+    assert server.get_client_by_username("dave") is None
+    assert disconnected == [None]
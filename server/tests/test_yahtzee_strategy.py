@@ -0,0 +1,92 @@
+"""Tests for the Yahtzee optimal-strategy table."""
+
+import pytest
+
+from server.games.yahtzee import strategy
+from server.games.yahtzee.game import ALL_CATEGORIES, YahtzeeGame
+from server.games.yahtzee.strategy import FULL_MASK, YahtzeeStrategy
+from server.users.bot import Bot
+
+
+def _only_open(*categories: str) -> int:
+    """Filled mask with just these categories open."""
+    mask = FULL_MASK
+    for category in categories:
+        mask &= ~(1 << ALL_CATEGORIES.index(category))
+    return mask
+
+
+@pytest.fixture(scope="module")
+def endgame_table():
+    # Every state with at most one category left to fill
+    return strategy.build_table(min_filled=12)
+
+
+@pytest.fixture
+def restore_strategy():
+    saved = strategy._strategy, strategy._strategy_loaded
+    yield
+    strategy._strategy, strategy._strategy_loaded = saved
+
+
+def test_single_category_values_match_known_odds(endgame_table):
+    solver = YahtzeeStrategy(endgame_table)
+    # Optimal rerolling for Chance: 5 dice x 14/3
+    assert solver.expected_score(_only_open("chance")) == pytest.approx(70 / 3, abs=1e-4)
+    # Chance of a Yahtzee within three rolls is 4.6029%
+    assert solver.expected_score(_only_open("yahtzee")) == pytest.approx(50 * 0.046029, abs=1e-3)
+
+
+def test_upper_bonus_is_part_of_the_value(endgame_table):
+    solver = YahtzeeStrategy(endgame_table)
+    # Keep every six: each die ends as a six with p = 1 - (5/6)^3
+    p = 91 / 216
+    at_least_three = sum(
+        [10, 5, 1][k - 3] * p**k * (1 - p) ** (5 - k) for k in range(3, 6)
+    )
+    assert solver.expected_score(_only_open("sixes"), upper=45) == pytest.approx(
+        30 * p + 35 * at_least_three, abs=1e-3
+    )
+    # Already past 63: no bonus left to chase
+    assert solver.expected_score(_only_open("sixes"), upper=63) == pytest.approx(30 * p, abs=1e-3)
+
+
+def test_decisions(endgame_table):
+    solver = YahtzeeStrategy(endgame_table)
+    only_yahtzee = _only_open("yahtzee")
+    assert solver.best_keep(only_yahtzee, 0, False, [6, 2, 6, 1, 6], 2) == (6, 6, 6)
+    assert solver.best_keep(only_yahtzee, 0, False, [4, 4, 4, 4, 4], 2) == (4, 4, 4, 4, 4)
+    assert solver.best_category(only_yahtzee, 0, False, [4, 4, 4, 4, 4]) == "yahtzee"
+    # Chance: rerolling anything under 4 is worth it with one roll left
+    assert solver.best_keep(_only_open("chance"), 0, False, [6, 3, 5, 1, 4], 1) == (4, 5, 6)
+
+
+def test_table_round_trips_through_a_mapped_file(endgame_table, tmp_path):
+    path = tmp_path / "strategy.f32"
+    strategy.save_table(endgame_table, path)
+    mapped = strategy.load_table(path)
+    index = strategy.state_index(_only_open("chance"), 63, False)
+    assert mapped[index] == endgame_table[index]
+
+    path.write_bytes(b"YZST" + bytes(16))
+    assert strategy.load_table(path) is None
+    assert strategy.load_table(tmp_path / "missing.f32") is None
+
+
+def test_bot_keeps_dice_chosen_by_the_table(endgame_table, restore_strategy):
+    strategy.use_strategy(YahtzeeStrategy(endgame_table))
+    game = YahtzeeGame()
+    game.add_player("Bot", Bot("Bot"))
+    player = game.players[0]
+    for category in ALL_CATEGORIES:
+        player.scores[category] = 0 if category != "yahtzee" else None
+    player.dice.values = [6, 2, 6, 1, 6]
+    player.dice.kept = [4]
+    player.rolls_left = 2
+
+    assert game._bot_decide_keeps(player) == [True, False, True, False, True]
+    assert game._bot_pick_best_category(player) == "score_yahtzee"
+
+    strategy.use_strategy(None)
+    # Without a table the bot falls back to its heuristic
+    assert game._bot_decide_keeps(player) == [True, False, True, False, True]
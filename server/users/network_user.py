@@ -9,6 +9,61 @@ if TYPE_CHECKING:
     from ..network.websocket_server import ClientConnection
 
 
+def compute_menu_diff(
+    old_items: list[str | dict], new_items: list[str | dict]
+) -> dict[str, list] | None:
+    """
+    Compute an id-keyed diff that turns old_items into new_items.
+
+    Returns a dict with "remove" (ids), "update" (changed items, by id) and
+    "insert" ([index, item] pairs, ascending final indices), or None if the
+    menus can't be diffed: items without unique ids, or surviving items that
+    changed order.
+    """
+    old_by_id: dict[str, dict] = {}
+    for item in old_items:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None or item_id in old_by_id:
+            return None
+        old_by_id[item_id] = item
+
+    new_ids: set[str] = set()
+    kept: list[str] = []
+    update: list[dict] = []
+    insert: list[list] = []
+    for index, item in enumerate(new_items):
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None or item_id in new_ids:
+            return None
+        new_ids.add(item_id)
+        old_item = old_by_id.get(item_id)
+        if old_item is None:
+            insert.append([index, item])
+        else:
+            kept.append(item_id)
+            if old_item != item:
+                update.append(item)
+
+    remove = [item_id for item_id in old_by_id if item_id not in new_ids]
+    surviving_order = [item_id for item_id in old_by_id if item_id in new_ids]
+    if surviving_order != kept:
+        return None
+    return {"remove": remove, "update": update, "insert": insert}
+
+
+def speak_packet(text: str, buffer: str = "misc") -> dict[str, Any]:
+    """Build a speak packet (see NetworkUser.speak)."""
+    packet = {"type": "speak", "text": text}
+    if buffer != "misc":
+        packet["buffer"] = buffer
+    return packet
+
+
+def sound_packet(name: str, volume: int = 100, pan: int = 0, pitch: int = 100) -> dict[str, Any]:
+    """Build a play_sound packet (see NetworkUser.play_sound)."""
+    return {"type": "play_sound", "name": name, "volume": volume, "pan": pan, "pitch": pitch}
+
+
 class NetworkUser(User):
     """
     Network implementation of User for real players connected via websocket.
@@ -37,6 +92,8 @@ class NetworkUser(User):
 
         # Track current UI state for session resumption
         self._current_menus: dict[str, dict[str, Any]] = {}
+        # Menu the client is displaying, so updates to it can be sent as diffs
+        self._client_menu_id: str | None = None
         self._current_editboxes: dict[str, dict[str, Any]] = {}
         self._current_music: dict[str, Any] | None = None
 
@@ -99,23 +156,12 @@ class NetworkUser(User):
         return messages
 
     def speak(self, text: str, buffer: str = "misc") -> None:
-        packet = {"type": "speak", "text": text}
-        if buffer != "misc":
-            packet["buffer"] = buffer
-        self._queue_packet(packet)
+        self._queue_packet(speak_packet(text, buffer))
 
     def play_sound(
         self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100
     ) -> None:
-        self._queue_packet(
-            {
-                "type": "play_sound",
-                "name": name,
-                "volume": volume,
-                "pan": pan,
-                "pitch": pitch,
-            }
-        )
+        self._queue_packet(sound_packet(name, volume, pan, pitch))
 
     def play_music(self, name: str, looping: bool = True) -> None:
         self._current_music = {"name": name, "looping": looping}
@@ -190,6 +236,7 @@ class NetworkUser(User):
         if position is not None:
             # Convert 1-based to 0-based for client
             packet["position"] = position - 1
+        self._client_menu_id = menu_id
         self._queue_packet(packet)
 
     def update_menu(
@@ -201,24 +248,46 @@ class NetworkUser(User):
     ) -> None:
         converted_items = self._convert_items(items)
 
-        if menu_id in self._current_menus:
-            self._current_menus[menu_id]["items"] = converted_items
+        # If the client is showing this menu, send only what changed when
+        # that is smaller than the full list (e.g. one relabeled die)
+        diff = None
+        current = self._current_menus.get(menu_id)
+        if current is not None and self._client_menu_id == menu_id:
+            diff = compute_menu_diff(current["items"], converted_items)
+            if diff is not None:
+                changes = len(diff["remove"]) + len(diff["update"]) + len(diff["insert"])
+                if changes * 2 >= len(converted_items) and changes > 0:
+                    diff = None
+                elif changes == 0 and position is None and selection_id is None:
+                    return  # Client already shows exactly this menu
+
+        if current is not None:
+            current["items"] = converted_items
             if position is not None:
-                self._current_menus[menu_id]["position"] = position
-
-        packet: dict[str, Any] = {
-            "type": "menu",
-            "menu_id": menu_id,
-            "items": converted_items,
-        }
+                current["position"] = position
+
+        packet: dict[str, Any]
+        if diff is not None:
+            packet = {"type": "menu_diff", "menu_id": menu_id, "count": len(converted_items)}
+            for key, value in diff.items():
+                if value:
+                    packet[key] = value
+        else:
+            packet = {
+                "type": "menu",
+                "menu_id": menu_id,
+                "items": converted_items,
+            }
         if position is not None:
             packet["position"] = position - 1
         if selection_id is not None:
             packet["selection_id"] = selection_id
+        self._client_menu_id = menu_id
         self._queue_packet(packet)
 
     def remove_menu(self, menu_id: str) -> None:
         self._current_menus.pop(menu_id, None)
+        self._client_menu_id = menu_id
         # Send empty menu to clear it
         self._queue_packet(
             {
@@ -237,6 +306,7 @@ class NetworkUser(User):
         multiline: bool = False,
         read_only: bool = False,
     ) -> None:
+        self._client_menu_id = None  # The client leaves list mode
         self._current_editboxes[input_id] = {
             "prompt": prompt,
             "default_value": default_value,
@@ -260,5 +330,6 @@ class NetworkUser(User):
 
     def clear_ui(self) -> None:
         self._current_menus.clear()
+        self._client_menu_id = None
         self._current_editboxes.clear()
         self._queue_packet({"type": "clear_ui"})